@@ -8,11 +8,14 @@ class CalendarIntegrationConfig(AppConfig):
 
     def ready(self) -> None:
         # Import the notification contexts module so @register_context decorators
-        # run and register functions with vintasend's Contexts singleton on app load.
+        # run and register functions with vintasend's Contexts singleton on app load,
+        # and the change-tracking module so its post_save/post_delete receivers
+        # (which keep `Calendar.change_version` current for conditional reads) connect.
         #
         # Late, and it has to be: the import *is* the registration side effect, and
         # `ready()` is where Django guarantees it runs. At `apps.py` module scope it
         # would instead run while `django.setup()` is still populating the app
         # registry, which fails outright the moment a context reaches a model --
         # see `users/apps.py`, whose contexts module does.
+        import calendar_integration.change_tracking  # noqa: F401
         import calendar_integration.notification_contexts  # noqa: F401
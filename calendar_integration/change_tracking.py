@@ -0,0 +1,274 @@
+"""Per-calendar change versions, and the validators calendar reads derive from them.
+
+Calendar clients poll the event and availability reads every minute or so, and the
+overwhelming majority of those polls return exactly what the previous one did. Each
+of them still paid for a full expansion: the occurrence SQL function, the merge, the
+serializer. ``Calendar.change_version`` lets a read answer "nothing changed" before
+doing any of that.
+
+The version is bumped by every write that can change what a calendar read returns:
+
+- saves and deletes of ``CalendarEvent``, ``BlockedTime`` and ``AvailableTime`` rows,
+  through the ``post_save`` / ``post_delete`` receivers below (bundle events bump the
+  bundle calendar as well as the child that holds them);
+- saves of an event's attendances and resource allocations, which bump the event's
+  calendars (and, for an allocation, the resource's calendar), and
+  ``ExternalClientIdentifierService.replace_for_target`` for the identifiers event
+  reads carry (:func:`bump_identified_object_change_versions`). Their deletes are
+  left to the writes around them -- the event's own save or delete, and explicit
+  bumps of the resources' calendars -- rather than a ``post_delete`` receiver, which
+  would cost every cascading event delete its fast path;
+- bulk paths that bypass model signals (``bulk_create`` / ``bulk_update`` /
+  ``QuerySet.delete``), most importantly ``CalendarSyncService._apply_sync_changes``,
+  which call :func:`bump_calendar_change_versions` explicitly.
+
+The bump is a plain ``UPDATE ... change_version + 1`` issued inside the writer's own
+transaction, never deferred to ``on_commit``: if the write rolls back, so does the
+bump, and a client can never cache a version whose data was not committed. A sync
+that writes hundreds of rows wraps itself in :func:`batched_calendar_change_versions`
+so those hundreds of receiver calls collapse into one ``UPDATE`` per organization.
+
+Reads call :func:`get_calendar_change_state` for the calendars they would expand.
+A bundle calendar's reads surface its children's events and vice versa, so the state
+covers the calendars related through ``ChildrenCalendarRelationship`` too.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import dataclasses
+import datetime
+import hashlib
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from django.db.models import Model, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from calendar_integration.models import (
+    AvailableTime,
+    BlockedTime,
+    Calendar,
+    CalendarEvent,
+    ChildrenCalendarRelationship,
+    EventAttendance,
+    EventExternalAttendance,
+    ExternalAttendee,
+    ResourceAllocation,
+)
+
+
+# Pending ``organization_id -> calendar ids`` while a batch is open; ``None`` outside.
+_pending_bumps: contextvars.ContextVar[dict[int, set[int]] | None] = contextvars.ContextVar(
+    "calendar_change_version_pending_bumps", default=None
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class CalendarChangeState:
+    """Validators for a read over a set of calendars.
+
+    :param etag: Weak entity tag (``W/"..."``) over the read variant and every
+        relevant calendar's ``change_version``.
+    :param last_modified: The most recent ``changed_at`` among those calendars, or
+        ``None`` while none of them has recorded a tracked write yet.
+    """
+
+    etag: str
+    last_modified: datetime.datetime | None
+
+
+def bump_calendar_change_versions(organization_id: int, calendar_ids: Iterable[int | None]):
+    """Bump the change version of ``calendar_ids`` within ``organization_id``.
+
+    Inside :func:`batched_calendar_change_versions` the ids are only recorded, and the
+    batch bumps each calendar once when it closes. ``None`` ids (calendar-less rows)
+    are ignored.
+    """
+    ids = {calendar_id for calendar_id in calendar_ids if calendar_id is not None}
+    if not ids:
+        return
+    pending = _pending_bumps.get()
+    if pending is not None:
+        pending[organization_id].update(ids)
+        return
+    Calendar.objects.filter_by_organization(organization_id).filter(
+        id__in=ids
+    ).bump_change_version()
+
+
+@contextlib.contextmanager
+def batched_calendar_change_versions() -> Iterator[None]:
+    """Collapse the bumps issued inside the block into one ``UPDATE`` per organization.
+
+    Nested blocks join the outermost one, which flushes. The flush only happens when
+    the block exits normally: a block that raises is about to roll its writes back,
+    and bumping for them would just invalidate every poller's cache for nothing.
+    """
+    if _pending_bumps.get() is not None:
+        yield
+        return
+    pending: dict[int, set[int]] = defaultdict(set)
+    token = _pending_bumps.set(pending)
+    try:
+        yield
+    finally:
+        _pending_bumps.reset(token)
+    for organization_id, calendar_ids in pending.items():
+        bump_calendar_change_versions(organization_id, calendar_ids)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=CalendarEvent,
+    dispatch_uid="calendar_integration.change_tracking.calendar_event_changed",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=BlockedTime,
+    dispatch_uid="calendar_integration.change_tracking.blocked_time_changed",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=AvailableTime,
+    dispatch_uid="calendar_integration.change_tracking.available_time_changed",
+)
+def calendar_content_changed(
+    sender: type[Model], instance: Model, raw: bool = False, **kwargs: Any
+) -> None:
+    """Bump the calendar (and bundle calendar) a saved or deleted row lives on.
+
+    Fixture loading (``raw``) is skipped: it writes rows verbatim and the calendars it
+    loads carry whatever version the fixture says.
+    """
+    if raw:
+        return
+    bump_calendar_change_versions(
+        instance.organization_id,  # type: ignore[attr-defined]
+        (
+            getattr(instance, "calendar_fk_id", None),
+            getattr(instance, "bundle_calendar_fk_id", None),
+        ),
+    )
+
+
+def bump_event_change_versions(organization_id: int, event_ids: Iterable[int | None]) -> None:
+    """Bump the calendars (and bundle calendars) of ``event_ids``."""
+    ids = {event_id for event_id in event_ids if event_id is not None}
+    if not ids:
+        return
+    calendar_ids: set[int | None] = set()
+    for row in (
+        CalendarEvent.objects.filter_by_organization(organization_id)
+        .filter(id__in=ids)
+        .values_list("calendar_fk_id", "bundle_calendar_fk_id")
+    ):
+        calendar_ids.update(row)
+    bump_calendar_change_versions(organization_id, calendar_ids)
+
+
+def bump_identified_object_change_versions(organization_id: int, target: Model) -> None:
+    """Bump the calendars whose reads show ``target``'s external client identifiers.
+
+    An event's identifiers show on its own calendars; an external attendee's on the
+    calendars of every event it attends.
+    """
+    if isinstance(target, CalendarEvent):
+        bump_event_change_versions(organization_id, [target.pk])
+    elif isinstance(target, ExternalAttendee):
+        bump_event_change_versions(
+            organization_id,
+            EventExternalAttendance.objects.filter_by_organization(organization_id)
+            .filter(external_attendee_fk_id=target.pk)
+            .values_list("event_fk_id", flat=True),
+        )
+
+
+@receiver(
+    post_save,
+    sender=EventAttendance,
+    dispatch_uid="calendar_integration.change_tracking.event_attendance_changed",
+)
+@receiver(
+    post_save,
+    sender=EventExternalAttendance,
+    dispatch_uid="calendar_integration.change_tracking.event_external_attendance_changed",
+)
+@receiver(
+    post_save,
+    sender=ResourceAllocation,
+    dispatch_uid="calendar_integration.change_tracking.resource_allocation_changed",
+)
+def event_participation_changed(
+    sender: type[Model], instance: Model, raw: bool = False, **kwargs: Any
+) -> None:
+    """Bump the calendars of the event a saved attendance or allocation belongs to.
+
+    A resource allocation also shows on the resource's own calendar. Skipped for
+    fixture loading, as :func:`calendar_content_changed` is.
+    """
+    if raw:
+        return
+    organization_id = instance.organization_id  # type: ignore[attr-defined]
+    bump_event_change_versions(organization_id, [getattr(instance, "event_fk_id", None)])
+    if isinstance(instance, ResourceAllocation):
+        bump_calendar_change_versions(organization_id, [instance.calendar_fk_id])
+
+
+def _with_bundle_relatives(organization_id: int, calendar_ids: Iterable[int]) -> set[int]:
+    """Add the bundles of ``calendar_ids`` and the children of the bundles among them."""
+    ids = set(calendar_ids)
+    related = ChildrenCalendarRelationship.objects.filter_by_organization(organization_id).filter(
+        Q(bundle_calendar_fk_id__in=ids) | Q(child_calendar_fk_id__in=ids)
+    )
+    for bundle_id, child_id in related.values_list("bundle_calendar_fk_id", "child_calendar_fk_id"):
+        ids.update((bundle_id, child_id))
+    return ids
+
+
+def get_calendar_change_state(
+    organization_id: int, calendar_ids: Iterable[int], variant: str = ""
+) -> CalendarChangeState:
+    """Return the validators for a read over ``calendar_ids``.
+
+    :param organization_id: Organization the calendars belong to.
+    :param calendar_ids: Calendars the read would expand.
+    :param variant: Everything else the response depends on (path, query string, the
+        caller's identity). Two reads of the same calendars with different variants
+        never share an ETag.
+    """
+    rows = sorted(
+        Calendar.objects.filter_by_organization(organization_id)
+        .filter(id__in=_with_bundle_relatives(organization_id, calendar_ids))
+        .values_list("id", "change_version", "changed_at")
+    )
+    digest = hashlib.sha256(variant.encode())
+    for calendar_id, version, _ in rows:
+        digest.update(f"|{calendar_id}:{version}".encode())
+    changed = [changed_at for _, _, changed_at in rows if changed_at is not None]
+    return CalendarChangeState(
+        etag=f'W/"{digest.hexdigest()}"',
+        last_modified=max(changed) if changed else None,
+    )
+
+
+def calendars_unchanged_since(
+    organization_id: int, calendar_ids: Iterable[int], since: datetime.datetime
+) -> bool:
+    """Whether none of ``calendar_ids`` (or their bundle relatives) changed after ``since``.
+
+    A calendar that never recorded a tracked write (``changed_at`` is null) counts as
+    changed: its history predates tracking, so nothing can be promised about it.
+    """
+    ids = _with_bundle_relatives(organization_id, calendar_ids)
+    if not ids:
+        return False
+    return (
+        not Calendar.objects.filter_by_organization(organization_id)
+        .filter(id__in=ids)
+        .filter(Q(changed_at__isnull=True) | Q(changed_at__gt=since))
+        .exists()
+    )
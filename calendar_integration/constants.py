@@ -34,6 +34,7 @@ class CalendarSyncTriggerSource(TextChoices):
     MANUAL = "manual", "Manual"
     WEBHOOK = "webhook", "Webhook"
     ADMIN = "admin", "Admin"
+    SCHEDULED = "scheduled", "Scheduled"
 
 
 class CalendarOrganizationResourceImportStatus(TextChoices):
@@ -1,5 +1,5 @@
 from django.contrib.postgres.fields import ArrayField
-from django.db.models import BooleanField, ExpressionWrapper, Func, JSONField, Value
+from django.db.models import BooleanField, DateTimeField, ExpressionWrapper, Func, JSONField, Value
 
 
 def _with_overlap(args, overlap: bool):
@@ -176,3 +176,17 @@ class GetAvailableTimeOccurrencesWithBulkModificationsJSON(Func):
 
     function = "get_available_time_occurrences_with_bulk_modifications_json"
     output_field = ArrayField(JSONField())  # PostgreSQL function returns TEXT[] with JSON strings
+
+
+class ClockTimestamp(Func):
+    """Postgres' ``clock_timestamp()``: the wall clock at the moment it is evaluated.
+
+    ``Now()`` is ``STATEMENT_TIMESTAMP()``, fixed when the statement was received.
+    An ``UPDATE`` that then waits on a row lock still stamps that earlier time, even
+    though it commits after the write it waited for. ``clock_timestamp()`` is read
+    when the row is actually written.
+    """
+
+    function = "clock_timestamp"
+    template = "%(function)s()"
+    output_field = DateTimeField()
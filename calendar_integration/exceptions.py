@@ -1,8 +1,14 @@
+from typing import TYPE_CHECKING
+
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
 
 from calendar_integration.constants import GroupScopedRuleType
 
 
+if TYPE_CHECKING:
+    from calendar_integration.services.write_fan_out import ChildWriteResult
+
+
 # API Validation Errors
 class CalendarServiceNotInjectedError(ImproperlyConfigured):
     pass
@@ -70,6 +76,20 @@ class CalendarUnavailableError(BundleCalendarError):
         super().__init__(f"No availability in child calendar {calendar_name}")
 
 
+class BundleEventWriteError(BundleCalendarError):
+    """Raised when a bundle event's provider copies could not all be written.
+
+    ``results`` holds one ``ChildWriteResult`` per child calendar written to; the
+    copies that did go out were deleted again.
+    """
+
+    default_message = "Could not write the bundle event to every child calendar"
+
+    def __init__(self, results: "list[ChildWriteResult]", message: str | None = None):
+        super().__init__(message)
+        self.results = results
+
+
 class EventManagementError(CalendarIntegrationError):
     """Base class for event management errors"""
 
@@ -167,6 +187,55 @@ class WebhookOperationError(CalendarAPIError):
     pass
 
 
+class SyncTokenExpiredError(CalendarAPIError):
+    """Raised when the provider no longer accepts an incremental sync token (410 Gone).
+
+    The caller falls back to a full sync, which yields a fresh token.
+    """
+
+    default_message = "The provider rejected the sync token; a full sync is required."
+
+
+class ProviderRetryableError(CalendarAPIError):
+    """Base class for provider failures worth retrying later rather than now.
+
+    ``retry_after`` is the number of seconds to wait before the next attempt; sync
+    tasks turn it into a deferred Celery retry instead of holding the worker.
+    """
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ProviderQuotaExceededError(ProviderRetryableError):
+    """Raised when a provider API call cannot get a quota permit in time.
+
+    Retryable: ``retry_after`` is the number of seconds after which the exhausted
+    quota has refilled.
+    """
+
+    def __init__(self, quota_name: str, retry_after: float):
+        super().__init__(
+            f"Provider quota '{quota_name}' exhausted; retry in {retry_after:.0f} seconds",
+            retry_after,
+        )
+        self.quota_name = quota_name
+
+
+class ProviderUnavailableError(ProviderRetryableError):
+    """Raised when a provider keeps failing transiently (5xx, connection errors) and
+    the next attempt is further away than a worker should sleep for.
+    """
+
+    def __init__(self, provider_name: str, reason: str, retry_after: float):
+        super().__init__(
+            f"{provider_name} unavailable ({reason}); retry in {retry_after:.0f} seconds",
+            retry_after,
+        )
+        self.provider_name = provider_name
+
+
 class RequiredParameterError(CalendarAPIError):
     """Raised when required parameters are missing"""
 
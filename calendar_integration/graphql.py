@@ -189,6 +189,7 @@ class CalendarGraphQLType:
     capacity: strawberry.auto
     manage_available_windows: strawberry.auto
     sync_enabled: strawberry.auto
+    changed_at: datetime.datetime | None
     created: datetime.datetime
     modified: datetime.datetime
 
@@ -376,6 +377,14 @@ class CalendarEventGraphQLType:
         read-only, and untouched by this field."""
         return list(self.external_client_identifiers.all())  # type: ignore[attr-defined]
 
+    @strawberry.field
+    def expansion_cursor(self) -> str | None:
+        """Opaque keyset cursor of this event within a ``calendarEvents`` date-range
+        read; pass it as ``after`` to continue after this event. ``null`` for events not
+        read through a range expansion (``eventId`` / identifier lookups)."""
+        cursor = getattr(self, "_expansion_cursor", None)
+        return cursor.encode() if cursor is not None else None
+
     @strawberry_django.field(prefetch_related=["attendances__membership"])
     def attendee_memberships(self) -> list["AttendanceMembershipGraphQLType"]:
         """Return the membership identities of internal attendees.
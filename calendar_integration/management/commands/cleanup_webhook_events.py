@@ -1,4 +1,10 @@
-"""Django management command for cleaning up old webhook events."""
+"""Django management command for cleaning up old webhook events.
+
+Without ``--organization-id`` it applies the deployment's retention by dropping the
+daily partitions of ``CalendarWebhookEvent`` older than the cutoff
+(``calendar_integration.webhook_event_partitions``); with it, it deletes that one
+organization's old events row by row, since a partition holds every organization's.
+"""
 
 import datetime
 from typing import Any
@@ -6,6 +12,7 @@ from typing import Any
 from django.core.management.base import BaseCommand, CommandParser
 
 from calendar_integration.services.webhook_analytics_service import WebhookAnalyticsService
+from calendar_integration.webhook_event_partitions import apply_webhook_event_retention
 from common.organization_context import organization_context
 from organizations.models import Organization
 
@@ -40,15 +47,16 @@ class Command(BaseCommand):
         days_to_keep = options["days_to_keep"]
         dry_run = options["dry_run"]
 
-        if organization_id:
-            try:
-                organization = Organization.objects.get(id=organization_id)
-                organizations = [organization]
-            except Organization.DoesNotExist:
-                self.stdout.write(self.style.ERROR(f"Organization {organization_id} not found"))
-                return
-        else:
-            organizations = list(Organization.objects.all())
+        if not organization_id:
+            self._drop_expired_partitions(days_to_keep, dry_run)
+            return
+
+        try:
+            organization = Organization.objects.get(id=organization_id)
+            organizations = [organization]
+        except Organization.DoesNotExist:
+            self.stdout.write(self.style.ERROR(f"Organization {organization_id} not found"))
+            return
 
         total_deleted = 0
 
@@ -101,3 +109,37 @@ class Command(BaseCommand):
             self.stdout.write(
                 self.style.SUCCESS(f"Successfully deleted {total_deleted} webhook events in total")
             )
+
+    def _drop_expired_partitions(self, days_to_keep: int, dry_run: bool) -> None:
+        """Drop every organization's events older than ``days_to_keep``, a day at a time."""
+        cutoff = datetime.datetime.now(tz=datetime.UTC) - datetime.timedelta(days=days_to_keep)
+        retention = apply_webhook_event_retention(cutoff, dry_run=dry_run)
+
+        verb = "Would drop" if dry_run else "Dropped"
+        about = "about " if retention.estimated else ""
+        for partition, events in retention.dropped_partitions:
+            self.stdout.write(f"{verb} partition {partition} ({about}{events} events)")
+        if retention.deleted_default_events:
+            verb = "Would delete" if dry_run else "Deleted"
+            self.stdout.write(
+                f"{verb} {retention.deleted_default_events} events older than "
+                f"{days_to_keep} days from the default partition"
+            )
+        for partition in retention.skipped_partitions:
+            self.stdout.write(
+                self.style.WARNING(f"Could not drop partition {partition}; retry later")
+            )
+
+        if dry_run:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"DRY RUN: Would delete {retention.deleted_events} webhook events in total"
+                )
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Successfully deleted {about}{retention.deleted_events} webhook events "
+                    "in total"
+                )
+            )
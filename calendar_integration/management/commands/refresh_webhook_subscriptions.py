@@ -5,8 +5,8 @@ from typing import Any
 
 from django.core.management.base import BaseCommand, CommandParser
 
-from calendar_integration.models import CalendarWebhookSubscription
-from common.organization_context import organization_context
+from calendar_integration.tasks import renew_account_webhook_subscriptions_task
+from calendar_integration.webhook_renewal import plan_webhook_renewals
 from organizations.models import Organization
 
 
@@ -46,103 +46,78 @@ class Command(BaseCommand):
         provider = options.get("provider")
         dry_run = options["dry_run"]
 
-        # Calculate expiry threshold
-        now = datetime.datetime.now(tz=datetime.UTC)
-        expiry_threshold = now + datetime.timedelta(hours=hours_before_expiry)
-
-        # Get subscriptions to refresh. `original_manager` (the unscoped
-        # manager `SingleOrganizationModelMixin` attaches) rather than the tenant-scoped
-        # `objects` -- this driving scan is intentionally cross-organization
-        # by design (mirroring `organizations/admin.py`'s explicit
-        # `original_manager` usage): it is what makes the unfiltered "refresh
-        # everything expiring soon" default (no `--organization-id`) work at
-        # all. Each subscription's own organization is bound per-iteration
-        # below instead.
-        subscriptions_qs = CalendarWebhookSubscription.original_manager.filter(
-            is_active=True,
-            expires_at__lte=expiry_threshold,
-            expires_at__gt=now,  # Not yet expired
-        )
-
-        if organization_id:
-            try:
-                organization = Organization.objects.get(id=organization_id)
-                subscriptions_qs = subscriptions_qs.filter(organization=organization)
-            except Organization.DoesNotExist:
-                self.stdout.write(self.style.ERROR(f"Organization {organization_id} not found"))
-                return
-
-        if provider:
-            subscriptions_qs = subscriptions_qs.filter(provider=provider)
+        if organization_id and not Organization.objects.filter(id=organization_id).exists():
+            self.stdout.write(self.style.ERROR(f"Organization {organization_id} not found"))
+            return
 
-        subscriptions = list(subscriptions_qs.select_related("calendar", "organization"))
+        # The same plan the renewal beat (`renew_webhook_subscriptions_task`) runs:
+        # the expiring subscriptions of every organization -- unless
+        # --organization-id narrows it to one -- grouped per syncing account.
+        plan = plan_webhook_renewals(
+            datetime.datetime.now(tz=datetime.UTC),
+            lead_time=datetime.timedelta(hours=hours_before_expiry),
+            organization_id=organization_id,
+            provider=provider,
+        )
+        found = plan.subscription_count + len(plan.unresolved_subscription_ids)
 
-        if not subscriptions:
+        if not found:
             self.stdout.write(self.style.SUCCESS("No webhook subscriptions need refreshing"))
             return
 
         self.stdout.write(
-            f"Found {len(subscriptions)} webhook subscriptions expiring within "
-            f"{hours_before_expiry} hours"
+            f"Found {found} webhook subscriptions expiring within {hours_before_expiry} hours"
         )
 
         if dry_run:
             self.stdout.write(self.style.WARNING("DRY RUN MODE - No changes will be made"))
 
-        # Deferred import, and it has to be: `di_core.containers.container` is
-        # only assigned in `DICoreConfig.ready()`, so a module-level
-        # `from ... import container` binds the `None` the module starts with
-        # and never sees the wired container.
-        from di_core.containers import container
-
-        if not container:
-            raise RuntimeError("DI container is not initialized")
-
-        refreshed_count = 0
         failed_count = 0
+        if plan.unresolved_subscription_ids:
+            self.stdout.write(
+                self.style.ERROR(
+                    f"  ✗ No linked account can refresh subscriptions "
+                    f"{plan.unresolved_subscription_ids}"
+                )
+            )
+            failed_count += len(plan.unresolved_subscription_ids)
 
-        for subscription in subscriptions:
-            # `subscriptions_qs` above spans every organization (unless
-            # --organization-id narrowed it), so each iteration binds its own
-            # subscription's organization rather than binding once outside
-            # the loop -- one iteration's failure/binding never leaks into
-            # the next organization's.
+        refreshed_count = 0
+        for batch_organization_id, social_account_id, subscription_ids in plan.batches:
+            self.stdout.write(
+                f"Processing {len(subscription_ids)} subscriptions of organization "
+                f"{batch_organization_id} as account {social_account_id}"
+            )
+            if dry_run:
+                self.stdout.write("  → Would refresh these subscriptions")
+                refreshed_count += len(subscription_ids)
+                continue
+
+            # Run inline, one account at a time: the task binds the organization,
+            # checks its restriction and authenticates as the account, then renews
+            # the account's subscriptions concurrently.
             try:
-                with organization_context(subscription.organization):
-                    # Get calendar service for this organization
-                    calendar_service = container.calendar_service()
-                    calendar_service.organization = subscription.organization
-
-                    self.stdout.write(
-                        f"Processing subscription {subscription.id} for "
-                        f"{subscription.organization.name} / {subscription.calendar.name} "
-                        f"({subscription.provider}) - expires {subscription.expires_at}"
-                    )
-
-                    if not dry_run:
-                        refreshed_subscription = calendar_service.refresh_webhook_subscription(
-                            subscription_id=subscription.id
-                        )
-
-                        if refreshed_subscription:
-                            self.stdout.write(
-                                self.style.SUCCESS(
-                                    f"  ✓ Refreshed - new expiry: {refreshed_subscription.expires_at}"
-                                )
-                            )
-                            refreshed_count += 1
-                        else:
-                            self.stdout.write(
-                                self.style.ERROR("  ✗ Failed to refresh - subscription not found")
-                            )
-                            failed_count += 1
-                    else:
-                        self.stdout.write("  → Would refresh this subscription")
-                        refreshed_count += 1
-
+                summary = renew_account_webhook_subscriptions_task(
+                    batch_organization_id, social_account_id, subscription_ids
+                )
             except Exception as e:  # noqa: BLE001
                 self.stdout.write(self.style.ERROR(f"  ✗ Failed to refresh: {e!s}"))
-                failed_count += 1
+                failed_count += len(subscription_ids)
+                continue
+
+            if summary is None:
+                self.stdout.write(
+                    self.style.ERROR("  ✗ Skipped - organization restricted or account unavailable")
+                )
+                failed_count += len(subscription_ids)
+                continue
+
+            self.stdout.write(
+                self.style.SUCCESS(f"  ✓ Refreshed {summary['renewed']}")
+                + (self.style.ERROR(f", failed {summary['failed']}") if summary["failed"] else "")
+            )
+            refreshed_count += summary["renewed"]
+            failed_count += summary["failed"]
 
         if dry_run:
             self.stdout.write(
@@ -155,7 +130,7 @@ class Command(BaseCommand):
                 )
             )
 
-            if failed_count > 0:
-                self.stdout.write(
-                    self.style.ERROR(f"Failed to refresh {failed_count} webhook subscriptions")
-                )
+        if failed_count > 0:
+            self.stdout.write(
+                self.style.ERROR(f"Failed to refresh {failed_count} webhook subscriptions")
+            )
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.5 on 2026-10-18 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendar_integration', '0048_externalclientidentifier'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendar',
+            name='change_version',
+            field=models.PositiveBigIntegerField(db_default=0, default=0, editable=False, help_text='Monotonic counter bumped whenever an event, blocked time or available time on this calendar is written (including by provider syncs). Calendar reads derive their ETag from it, so an unchanged calendar answers a conditional GET with 304 without expanding anything. See ``calendar_integration.change_tracking``.'),
+        ),
+        migrations.AddField(
+            model_name='calendar',
+            name='changed_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='When ``change_version`` was last bumped; served as Last-Modified. Null until the first tracked write.', null=True),
+        ),
+    ]
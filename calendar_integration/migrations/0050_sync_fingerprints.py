@@ -0,0 +1,38 @@
+# Generated by Django 6.0.5 on 2026-10-18 23:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendar_integration', '0049_calendar_change_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blockedtime',
+            name='sync_fingerprint',
+            field=models.CharField(blank=True, editable=False, help_text='Hash of the normalized provider data this row was last synced from. A sync skips incoming events whose fingerprint matches without loading the row. Empty for rows never written by a sync.', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='calendarevent',
+            name='sync_fingerprint',
+            field=models.CharField(blank=True, editable=False, help_text='Hash of the normalized provider data this row was last synced from. A sync skips incoming events whose fingerprint matches without loading the row. Empty for rows never written by a sync.', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='calendarsync',
+            name='events_created',
+            field=models.PositiveIntegerField(default=0, help_text='Provider events this sync stored as new rows.'),
+        ),
+        migrations.AddField(
+            model_name='calendarsync',
+            name='events_skipped',
+            field=models.PositiveIntegerField(default=0, help_text='Provider events this sync skipped because their content fingerprint matched the stored row.'),
+        ),
+        migrations.AddField(
+            model_name='calendarsync',
+            name='events_updated',
+            field=models.PositiveIntegerField(default=0, help_text='Existing rows this sync rewrote with changed provider data.'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.5 on 2026-10-18 23:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendar_integration', '0050_sync_fingerprints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendar',
+            name='next_scheduled_sync_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, help_text='When the sync scheduler should next sync this calendar. Null until the scheduler or a successful sync first sets it; null calendars are due.', null=True),
+        ),
+        migrations.AddField(
+            model_name='calendar',
+            name='sync_change_rate',
+            field=models.FloatField(db_default=0.0, default=0.0, editable=False, help_text='Smoothed estimate of provider-side changes per hour, updated after every successful sync. Drives how often the sync scheduler polls this calendar. See ``calendar_integration.sync_scheduling``.'),
+        ),
+        migrations.AlterField(
+            model_name='calendarsync',
+            name='trigger_source',
+            field=models.CharField(choices=[('import', 'Import'), ('manual', 'Manual'), ('webhook', 'Webhook'), ('admin', 'Admin'), ('scheduled', 'Scheduled')], default='manual', help_text='What kicked off this sync: import, manual, webhook, or admin.', max_length=20),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.5 on 2026-10-19 02:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendar_integration', '0051_sync_scheduling'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendarorganizationresourcesimport',
+            name='calendars_created',
+            field=models.PositiveIntegerField(default=0, help_text='Resource calendars the import created.'),
+        ),
+        migrations.AddField(
+            model_name='calendarorganizationresourcesimport',
+            name='calendars_unchanged',
+            field=models.PositiveIntegerField(default=0, help_text='Existing resource calendars the import found already up to date.'),
+        ),
+        migrations.AddField(
+            model_name='calendarorganizationresourcesimport',
+            name='calendars_updated',
+            field=models.PositiveIntegerField(default=0, help_text='Existing resource calendars the import changed.'),
+        ),
+    ]
@@ -0,0 +1,166 @@
+"""Range-partition ``CalendarWebhookEvent`` by day on ``created``.
+
+The webhook event log is append-only, written on every provider notification and
+read almost only over recent windows (``created >= now - N hours``, per
+organization). Its retention -- ``cleanup_webhook_events`` -- was a per-organization
+``DELETE ... WHERE created < cutoff``: a row-by-row delete of a large fraction of the
+table, every run, with the WAL, the dead tuples and the vacuum debt that come with
+it, competing with the very inserts the table exists for.
+
+This migration rebuilds the table as ``PARTITION BY RANGE (created)``:
+
+- one partition per UTC day, ``<table>_pYYYYMMDD``, from the day it runs to
+  ``PARTITIONS_AHEAD`` days ahead; ``maintain_webhook_event_partitions_task`` keeps
+  that horizon moving (``calendar_integration.webhook_event_partitions``);
+- ``<table>_legacy``, ``FROM (MINVALUE) TO (<today>)``, holding every row that
+  predates the migration. Retention drops it whole once its newest row is past the
+  cutoff, like any day's partition;
+- ``<table>_default``, the ``DEFAULT`` partition, so a row no partition covers (the
+  beat fell more than a week behind, or ``created`` was set by hand) is still
+  stored rather than rejected. Creating a day's partition moves that day's rows out
+  of it.
+
+Retention becomes ``DROP TABLE`` of the partitions older than the cutoff: catalog
+work, however many rows they hold. Queries bounded on ``created`` -- the
+``(organization, created)`` reads of the analytics, the health check and the
+debounce -- only scan the partitions their window overlaps.
+
+Schema
+------
+The partition key has to be part of every unique constraint, so the primary key
+becomes ``(id, created)`` in the database. Django keeps ``id`` as the model's
+primary key: ids still come from one identity sequence shared by every partition,
+so ``id`` stays unique on its own, and nothing references this table (it has no
+incoming foreign key), so nothing needs the narrower constraint. Every column,
+index and foreign key keeps its name, so later migrations generated against the
+model state apply unchanged; the identity sequence keeps its name and carries on
+from the highest copied id. ``AddIndex`` then adds ``(organization, created)``,
+the index those reads use inside each partition.
+
+Lock / downtime audit
+---------------------
+Atomic: the rebuild holds ``ACCESS EXCLUSIVE`` on the table from the rename to the
+commit, so webhook deliveries queue (and, past the provider's timeout, are retried
+by it) while the rows are copied. The copy is bounded by the retention period;
+running ``cleanup_webhook_events`` just before deploying keeps it short. A failure
+anywhere rolls the whole rebuild back and leaves the original table in place.
+
+Reverse
+-------
+Rebuilds the plain table, primary key ``(id)``, with every row of every partition,
+the same names and the sequence position; the partitions are dropped with the
+partitioned table.
+"""
+
+import datetime
+import re
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+TABLE = "calendar_integration_calendarwebhookevent"
+#: Days of partitions created past today, matching
+#: ``webhook_event_partitions.WEBHOOK_EVENT_PARTITIONS_AHEAD`` at the time of writing.
+PARTITIONS_AHEAD = 7
+
+_INDEX_TABLE = re.compile(r" ON (?:ONLY )?\S+ USING ")
+
+
+def _day_start(day: datetime.date) -> str:
+    return f"'{day.isoformat()} 00:00:00+00'"
+
+
+def _rebuild(cursor, *, partitioned: bool) -> None:
+    """Move every row of ``TABLE`` into a new table of the same shape.
+
+    ``partitioned`` picks the new table's layout: daily range partitions with a
+    ``(id, created)`` primary key, or a plain table with ``(id)``.
+    """
+    old = f"{TABLE}_old"
+    cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {old}")
+    cursor.execute(f"ALTER TABLE {old} RENAME CONSTRAINT {TABLE}_pkey TO {old}_pkey")
+
+    # Everything to recreate under its own name once the old table is gone.
+    cursor.execute(
+        "SELECT indexname, indexdef FROM pg_indexes "
+        "WHERE schemaname = current_schema() AND tablename = %s AND indexname <> %s",
+        [old, f"{old}_pkey"],
+    )
+    indexes = cursor.fetchall()
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = %s::regclass AND contype = 'f'",
+        [old],
+    )
+    foreign_keys = cursor.fetchall()
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [old])
+    (old_sequence,) = cursor.fetchone()
+
+    primary_key = "id, created" if partitioned else "id"
+    cursor.execute(
+        f"CREATE TABLE {TABLE} ("
+        f"LIKE {old} INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING STORAGE, "
+        f"CONSTRAINT {TABLE}_pkey PRIMARY KEY ({primary_key}))"
+        + (" PARTITION BY RANGE (created)" if partitioned else "")
+    )
+    if partitioned:
+        today = timezone.now().date()
+        cursor.execute(
+            f"CREATE TABLE {TABLE}_legacy PARTITION OF {TABLE} "
+            f"FOR VALUES FROM (MINVALUE) TO ({_day_start(today)})"
+        )
+        for offset in range(PARTITIONS_AHEAD + 1):
+            day = today + datetime.timedelta(days=offset)
+            cursor.execute(
+                f"CREATE TABLE {TABLE}_p{day:%Y%m%d} PARTITION OF {TABLE} "
+                f"FOR VALUES FROM ({_day_start(day)}) "
+                f"TO ({_day_start(day + datetime.timedelta(days=1))})"
+            )
+        cursor.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+
+    # ``LIKE`` keeps the column order, so the rows copy positionally.
+    cursor.execute(f"INSERT INTO {TABLE} SELECT * FROM {old}")
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [TABLE])
+    (new_sequence,) = cursor.fetchone()
+    cursor.execute(
+        f"SELECT setval(%s, COALESCE(MAX(id), 0) + 1, false) FROM {TABLE}", [new_sequence]
+    )
+    cursor.execute(f"DROP TABLE {old}")
+    cursor.execute(f"ALTER SEQUENCE {new_sequence} RENAME TO {old_sequence.rsplit('.', 1)[-1]}")
+
+    # Built after the copy: one sort per index rather than an update per row.
+    for _, definition in indexes:
+        cursor.execute(_INDEX_TABLE.sub(f" ON {TABLE} USING ", definition, count=1))
+    for name, definition in foreign_keys:
+        cursor.execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}")
+
+
+def partition_webhook_events(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        _rebuild(cursor, partitioned=True)
+
+
+def unpartition_webhook_events(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        _rebuild(cursor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+    """Rebuild the webhook event log as daily range partitions on ``created``."""
+
+    dependencies = [
+        ("calendar_integration", "0052_resources_import_counts"),
+        migrations.swappable_dependency(settings.ORGANIZATION_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_webhook_events, unpartition_webhook_events),
+        migrations.AddIndex(
+            model_name="calendarwebhookevent",
+            index=models.Index(
+                fields=["organization", "created"], name="calendar_in_organiz_2376b8_idx"
+            ),
+        ),
+    ]
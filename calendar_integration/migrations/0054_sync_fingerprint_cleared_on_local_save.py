@@ -0,0 +1,23 @@
+# Generated by Django 6.0.5 on 2026-10-19 05:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendar_integration', '0053_partition_calendarwebhookevent'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='blockedtime',
+            name='sync_fingerprint',
+            field=models.CharField(blank=True, editable=False, help_text='Hash of the normalized provider data this row was last synced from. A sync skips incoming events whose fingerprint matches without loading the row. Empty for rows never written by a sync, or saved locally since.', max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='calendarevent',
+            name='sync_fingerprint',
+            field=models.CharField(blank=True, editable=False, help_text='Hash of the normalized provider data this row was last synced from. A sync skips incoming events whose fingerprint matches without loading the row. Empty for rows never written by a sync, or saved locally since.', max_length=64),
+        ),
+    ]
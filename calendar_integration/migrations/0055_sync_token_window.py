@@ -0,0 +1,23 @@
+# Generated by Django 6.0.5 on 2026-10-19 05:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendar_integration', '0054_sync_fingerprint_cleared_on_local_save'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendarsync',
+            name='sync_token_window_end',
+            field=models.DateTimeField(blank=True, help_text='End of the window of that delta round.', null=True),
+        ),
+        migrations.AddField(
+            model_name='calendarsync',
+            name='sync_token_window_start',
+            field=models.DateTimeField(blank=True, help_text="Start of the window of the delta round next_sync_token continues, for providers whose tokens are bound to one (Microsoft's calendarView delta). Empty for tokens bound to none.", null=True),
+        ),
+    ]
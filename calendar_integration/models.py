@@ -148,6 +148,47 @@ class Calendar(SingleOrganizationModelMixin, SafeRelationNullInitMixin, BaseMode
             "calendars syncing as before."
         ),
     )
+    change_version = models.PositiveBigIntegerField(
+        default=0,
+        db_default=0,
+        editable=False,
+        help_text=(
+            "Monotonic counter bumped whenever an event, blocked time or available time "
+            "on this calendar is written (including by provider syncs). Calendar reads "
+            "derive their ETag from it, so an unchanged calendar answers a conditional "
+            "GET with 304 without expanding anything. See "
+            "``calendar_integration.change_tracking``."
+        ),
+    )
+    changed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=(
+            "When ``change_version`` was last bumped; served as Last-Modified. Null "
+            "until the first tracked write."
+        ),
+    )
+    sync_change_rate = models.FloatField(
+        default=0.0,
+        db_default=0.0,
+        editable=False,
+        help_text=(
+            "Smoothed estimate of provider-side changes per hour, updated after every "
+            "successful sync. Drives how often the sync scheduler polls this calendar. "
+            "See ``calendar_integration.sync_scheduling``."
+        ),
+    )
+    next_scheduled_sync_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text=(
+            "When the sync scheduler should next sync this calendar. Null until the "
+            "scheduler or a successful sync first sets it; null calendars are due."
+        ),
+    )
 
     memberships: "models.ManyToManyField[OrganizationMembership, CalendarOwnership]" = (
         models.ManyToManyField(
@@ -836,6 +877,119 @@ class RecurrenceRule(SingleOrganizationModelMixin, SafeRelationNullInitMixin, Ba
         super().save(*args, **kwargs)
 
 
+class RecurringOccurrence:
+    """A generated occurrence of a recurring row, as a read-only view over its master.
+
+    ``RecurringMixin.create_instance_from_occurrence`` builds a full unsaved model
+    instance per occurrence -- a ``ZoneInfo`` lookup, two ``astimezone`` conversions
+    and the whole Django ``Model.__init__``. Read-only consumers (slot spans,
+    unavailable windows, webhook payloads) only read the instants and a handful of
+    fields the occurrence shares with its master, so this keeps just the two
+    instants and a reference to the master.
+
+    Reads mirror the unsaved instance ``create_instance_from_occurrence`` would
+    return:
+
+    - the fields that method copies (``title``, ``reason``, ``timezone``,
+      ``calendar``, ``organization``, ``recurrence_rule``, ...) are read from the
+      master;
+    - the per-row fields it leaves at their defaults (``id``, ``external_id``,
+      ``meta``, the parent/bundle links) read as those defaults;
+    - the local wall-clock ``*_tz_unaware`` values are only computed when read.
+
+    Anything else raises ``AttributeError``: a view is not a row, so it has no
+    ``save``/``delete`` and no related managers. Call :meth:`to_instance` where a
+    model instance is actually needed, e.g. to persist a modified occurrence as a
+    recurrence exception.
+    """
+
+    __slots__ = ("end_time", "master", "start_time")
+
+    # Fields ``create_instance_from_occurrence`` copies from the master, read
+    # through to it rather than copied.
+    _MASTER_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "calendar",
+            "calendar_fk",
+            "calendar_fk_id",
+            "description",
+            "organization",
+            "organization_id",
+            "reason",
+            "recurrence_rule",
+            "recurrence_rule_fk",
+            "recurrence_rule_fk_id",
+            "timezone",
+            "title",
+        }
+    )
+
+    pk = None
+    id = None
+    external_id = ""
+    is_recurring_exception = False
+    is_recurring_instance = False
+    parent_recurring_object = None
+    parent_recurring_object_fk_id = None
+    is_bundle_primary = False
+    is_bundle_representation = False
+    bundle_calendar = None
+    bundle_primary_event = None
+
+    def __init__(
+        self,
+        master: "RecurringMixin",
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+    ):
+        self.master = master
+        self.start_time, self.end_time = _normalize_occurrence_instants(start_time, end_time)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names not defined above.
+        if name in RecurringOccurrence._MASTER_FIELDS:
+            return getattr(self.master, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __repr__(self) -> str:
+        return (
+            f"<RecurringOccurrence of {type(self.master).__name__} {self.master.pk}: "
+            f"{self.start_time.isoformat()} - {self.end_time.isoformat()}>"
+        )
+
+    @property
+    def meta(self) -> dict[str, Any]:
+        return {}
+
+    @property
+    def recurrence_id(self) -> datetime.datetime:
+        return self.start_time
+
+    @property
+    def is_recurring(self) -> bool:
+        return self.master.is_recurring
+
+    @property
+    def duration(self) -> datetime.timedelta:
+        return self.end_time - self.start_time
+
+    @property
+    def start_time_tz_unaware(self) -> datetime.datetime:
+        return self.start_time.astimezone(zoneinfo.ZoneInfo(self.master.timezone)).replace(
+            tzinfo=None
+        )
+
+    @property
+    def end_time_tz_unaware(self) -> datetime.datetime:
+        return self.end_time.astimezone(zoneinfo.ZoneInfo(self.master.timezone)).replace(
+            tzinfo=None
+        )
+
+    def to_instance(self) -> "RecurringMixin":
+        """Build the unsaved model instance for this occurrence."""
+        return self.master.create_instance_from_occurrence(self.start_time, self.end_time)
+
+
 def validate_not_empty(value):
     if value == "":
         raise ValidationError("%(value)s is empty!", params={"value": value})
@@ -935,6 +1089,32 @@ class RecurringMixin(SingleOrganizationModelMixin, SafeRelationNullInitMixin, Ba
         overlap=False,
     ) -> list[Self]:
         """Get occurrences of this recurring available time in a date range."""
+        return [
+            occurrence.to_instance() if isinstance(occurrence, RecurringOccurrence) else occurrence  # type: ignore[misc]
+            for occurrence in self._get_occurrence_views_in_range(
+                modified_instance_id_field_name,
+                start_date,
+                end_date,
+                include_self=include_self,
+                include_exceptions=include_exceptions,
+                max_occurrences=max_occurrences,
+                overlap=overlap,
+            )
+        ]
+
+    def _get_occurrence_views_in_range(
+        self,
+        modified_instance_id_field_name: str,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        include_self=True,
+        include_exceptions=True,
+        max_occurrences=10000,
+        overlap=False,
+    ) -> list["Self | RecurringOccurrence"]:
+        """Like ``_get_occurrences_in_range``, but generated occurrences are
+        ``RecurringOccurrence`` views; ``self`` and exception rows stay model instances.
+        """
         if not self.is_recurring:
             return []
 
@@ -985,7 +1165,7 @@ class RecurringMixin(SingleOrganizationModelMixin, SafeRelationNullInitMixin, Ba
             )
         }
 
-        instances: list[Self] = []
+        instances: list[Self | RecurringOccurrence] = []
         for occurrence in occurrences:
             occurrence_start_time = datetime.datetime.fromisoformat(occurrence["start_time"])
             occurrence_end_time = datetime.datetime.fromisoformat(occurrence["end_time"])
@@ -1009,12 +1189,7 @@ class RecurringMixin(SingleOrganizationModelMixin, SafeRelationNullInitMixin, Ba
                     instances.append(exception_event)
                 continue
 
-            instances.append(
-                self.create_instance_from_occurrence(
-                    occurrence_start_time,
-                    occurrence_end_time,
-                )
-            )
+            instances.append(RecurringOccurrence(self, occurrence_start_time, occurrence_end_time))
 
         return instances
 
@@ -1029,6 +1204,17 @@ class RecurringMixin(SingleOrganizationModelMixin, SafeRelationNullInitMixin, Ba
     ) -> list[Self]:
         raise NotImplementedError("Subclasses must implement get_occurrences_in_range")
 
+    def get_occurrence_views_in_range(
+        self,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        include_self=True,
+        include_exceptions=True,
+        max_occurrences=10000,
+        overlap=False,
+    ) -> list["Self | RecurringOccurrence"]:
+        raise NotImplementedError("Subclasses must implement get_occurrence_views_in_range")
+
     def create_instance_from_occurrence(
         self, occurrence_start_time: datetime.datetime, occurrence_end_time: datetime.datetime
     ) -> Self:
@@ -1212,7 +1398,26 @@ class RecurringMixin(SingleOrganizationModelMixin, SafeRelationNullInitMixin, Ba
         raise NotImplementedError("Subclasses must implement _create_recurring_instance")
 
 
-class CalendarEvent(RecurringMixin):
+class SyncFingerprintMixin:
+    """Forgets ``sync_fingerprint`` on every ``save()``.
+
+    The fingerprint says the row still holds what the provider last sent, so a sync
+    can skip an incoming event that matches it. Syncs write these rows through
+    ``bulk_create`` / ``bulk_update`` only, so any ``save()`` is a local write:
+    an API edit, a change-request approval, a rebind. After one of those the row may
+    no longer match the provider, and the next sync has to reconcile it even if the
+    provider payload is unchanged. Empty is the "never synced" value.
+    """
+
+    def save(self, *args, **kwargs):
+        self.sync_fingerprint = ""
+        update_fields = kwargs.get("update_fields")
+        if update_fields:
+            kwargs["update_fields"] = {*update_fields, "sync_fingerprint"}
+        super().save(*args, **kwargs)
+
+
+class CalendarEvent(SyncFingerprintMixin, RecurringMixin):
     """
     Represents an event in a calendar.
     """
@@ -1226,6 +1431,14 @@ class CalendarEvent(RecurringMixin):
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     external_id = models.CharField(max_length=255, unique=True, blank=True)
+    sync_fingerprint = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        help_text="Hash of the normalized provider data this row was last synced from. A "
+        "sync skips incoming events whose fingerprint matches without loading the row. "
+        "Empty for rows never written by a sync, or saved locally since.",
+    )
 
     # Bundle calendar fields
     bundle_calendar = OrganizationSafeForeignKey(
@@ -1368,6 +1581,25 @@ class CalendarEvent(RecurringMixin):
             overlap=overlap,
         )
 
+    def get_occurrence_views_in_range(
+        self,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        include_self=True,
+        include_exceptions=True,
+        max_occurrences=10000,
+        overlap=False,
+    ) -> list["Self | RecurringOccurrence"]:
+        return self._get_occurrence_views_in_range(
+            modified_instance_id_field_name="modified_event_id",
+            start_date=start_date,
+            end_date=end_date,
+            include_self=include_self,
+            include_exceptions=include_exceptions,
+            max_occurrences=max_occurrences,
+            overlap=overlap,
+        )
+
     def create_instance_from_occurrence(self, occurrence_start_time, occurrence_end_time):
         occurrence_start_time, occurrence_end_time = _normalize_occurrence_instants(
             occurrence_start_time, occurrence_end_time
@@ -1487,7 +1719,7 @@ class EventRecurrenceException(RecurrenceExceptionMixin):
         self.modified_event_fk = modified_object
 
 
-class BlockedTime(RecurringMixin):
+class BlockedTime(SyncFingerprintMixin, RecurringMixin):
     """
     Represents a blocked time period in a calendar.
     """
@@ -1500,6 +1732,14 @@ class BlockedTime(RecurringMixin):
     )
     reason = models.CharField(max_length=255, blank=True)
     external_id = models.CharField(max_length=255, blank=True)
+    sync_fingerprint = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        help_text="Hash of the normalized provider data this row was last synced from. A "
+        "sync skips incoming events whose fingerprint matches without loading the row. "
+        "Empty for rows never written by a sync, or saved locally since.",
+    )
 
     # Bundle calendar fields
     bundle_calendar = OrganizationSafeForeignKey(
@@ -1590,6 +1830,25 @@ class BlockedTime(RecurringMixin):
             overlap=overlap,
         )
 
+    def get_occurrence_views_in_range(
+        self,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        include_self=True,
+        include_exceptions=True,
+        max_occurrences=10000,
+        overlap=False,
+    ) -> list["Self | RecurringOccurrence"]:
+        return self._get_occurrence_views_in_range(
+            modified_instance_id_field_name="modified_blocked_time_id",
+            start_date=start_date,
+            end_date=end_date,
+            include_self=include_self,
+            include_exceptions=include_exceptions,
+            max_occurrences=max_occurrences,
+            overlap=overlap,
+        )
+
     def create_instance_from_occurrence(self, occurrence_start_time, occurrence_end_time):
         occurrence_start_time, occurrence_end_time = _normalize_occurrence_instants(
             occurrence_start_time, occurrence_end_time
@@ -1686,6 +1945,25 @@ class AvailableTime(RecurringMixin):
             overlap=overlap,
         )
 
+    def get_occurrence_views_in_range(
+        self,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        include_self=True,
+        include_exceptions=True,
+        max_occurrences=10000,
+        overlap=False,
+    ) -> list["Self | RecurringOccurrence"]:
+        return self._get_occurrence_views_in_range(
+            modified_instance_id_field_name="modified_available_time_id",
+            start_date=start_date,
+            end_date=end_date,
+            include_self=include_self,
+            include_exceptions=include_exceptions,
+            max_occurrences=max_occurrences,
+            overlap=overlap,
+        )
+
     def create_instance_from_occurrence(self, occurrence_start_time, occurrence_end_time):
         occurrence_start_time, occurrence_end_time = _normalize_occurrence_instants(
             occurrence_start_time, occurrence_end_time
@@ -1871,6 +2149,16 @@ class CalendarSync(SingleOrganizationModelMixin, SafeRelationNullInitMixin, Base
         related_name="syncs",
     )
     next_sync_token = models.CharField(max_length=255, blank=True)
+    sync_token_window_start = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Start of the window of the delta round next_sync_token continues, for "
+        "providers whose tokens are bound to one (Microsoft's calendarView delta). Empty "
+        "for tokens bound to none.",
+    )
+    sync_token_window_end = models.DateTimeField(
+        null=True, blank=True, help_text="End of the window of that delta round."
+    )
     start_datetime = models.DateTimeField()
     end_datetime = models.DateTimeField()
     should_update_events = models.BooleanField()
@@ -1886,6 +2174,17 @@ class CalendarSync(SingleOrganizationModelMixin, SafeRelationNullInitMixin, Base
         help_text="What kicked off this sync: import, manual, webhook, or admin.",
     )
     error_message = models.TextField(blank=True)
+    events_created = models.PositiveIntegerField(
+        default=0, help_text="Provider events this sync stored as new rows."
+    )
+    events_updated = models.PositiveIntegerField(
+        default=0, help_text="Existing rows this sync rewrote with changed provider data."
+    )
+    events_skipped = models.PositiveIntegerField(
+        default=0,
+        help_text="Provider events this sync skipped because their content fingerprint "
+        "matched the stored row.",
+    )
 
     objects: ClassVar[CalendarSyncManager] = CalendarSyncManager()
 
@@ -1911,6 +2210,16 @@ class CalendarOrganizationResourcesImport(
         default=CalendarOrganizationResourceImportStatus.NOT_STARTED,
     )
     error_message = models.TextField(blank=True)
+    calendars_created = models.PositiveIntegerField(
+        default=0, help_text="Resource calendars the import created."
+    )
+    calendars_updated = models.PositiveIntegerField(
+        default=0, help_text="Existing resource calendars the import changed."
+    )
+    calendars_unchanged = models.PositiveIntegerField(
+        default=0,
+        help_text="Existing resource calendars the import found already up to date.",
+    )
 
     def __str__(self):
         return f"Resources Import for {self.organization} from {self.start_time} to {self.end_time}"
@@ -2154,6 +2463,10 @@ class CalendarWebhookEvent(SingleOrganizationModelMixin, SafeRelationNullInitMix
             models.Index(fields=["provider", "created"]),
             models.Index(fields=["processing_status", "created"]),
             models.Index(fields=["external_calendar_id", "created"]),
+            # The table is range-partitioned by day on ``created`` (migration 0053,
+            # ``calendar_integration.webhook_event_partitions``): a window on
+            # ``created`` picks the partitions, this finds the organization in them.
+            models.Index(fields=["organization", "created"]),
         )
 
     def __str__(self):
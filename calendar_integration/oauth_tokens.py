@@ -0,0 +1,155 @@
+"""Stampede-free OAuth access-token refresh.
+
+Access tokens of connected Google and Microsoft accounts expire about hourly. Every
+adapter built with an expired token used to refresh it on construction and write the
+``SocialToken`` back, so when a webhook burst or a resync fan-out started a dozen
+tasks for one account, all of them refreshed at once -- a dozen grants for one
+expiry window, and for Microsoft, which rotates refresh tokens, a race over which
+rotated refresh token was stored last.
+
+:func:`fresh_social_token` is the broker every adapter token goes through
+(``CalendarService.get_calendar_adapter_for_account``). The ``SocialToken`` row is
+the cache shared by every worker: a token that stays valid for more than
+``TOKEN_REFRESH_MARGIN`` is used as stored. An expiring one is refreshed under a
+per-token ``resilient_lock`` (a Redis lock; an in-process lock without Redis), and
+whoever waited on the lock re-reads the row and picks up the token the holder just
+stored instead of refreshing again. One account costs one refresh per expiry window,
+however many workers use it.
+
+That only holds if the refreshed token is committed before the lock is released.
+Adapters are mostly built inside a request's transaction (``ATOMIC_REQUESTS``), which
+commits long after; so the token is written on a connection of its own and committed
+there, whatever transaction the caller is in.
+"""
+
+import datetime
+import logging
+from collections.abc import Callable
+
+from django.db import DatabaseError, connections, router
+from django.utils import timezone
+
+from allauth.socialaccount.models import SocialToken
+
+from calendar_integration.services.dataclasses import RefreshedOAuthToken
+from common.redis import resilient_lock
+
+
+logger = logging.getLogger(__name__)
+
+# Tokens this close to expiry are refreshed before use, so a request started with
+# one does not see it expire midway. Longer than google-auth's own refresh threshold
+# (under four minutes), so a token the broker hands out is never refreshed again by
+# the Google client.
+TOKEN_REFRESH_MARGIN = datetime.timedelta(minutes=5)
+# Seconds the refresh lock outlives a holder that died mid-refresh.
+TOKEN_REFRESH_LOCK_TIMEOUT = 30
+# Seconds a caller waits on another worker's refresh before refreshing itself.
+TOKEN_REFRESH_LOCK_WAIT = 15
+# How long storing a refreshed token waits on a lock of the caller's own transaction
+# on the row (see ``_store_refreshed_token``).
+REFRESHED_ROW_LOCK_TIMEOUT = "2s"
+
+
+def _is_fresh(expires_at: datetime.datetime | None) -> bool:
+    # A token without a known expiry is trusted, as the providers' clients do.
+    return expires_at is None or expires_at > timezone.now() + TOKEN_REFRESH_MARGIN
+
+
+def fresh_social_token(
+    social_token: SocialToken, refresh: Callable[[str], RefreshedOAuthToken]
+) -> SocialToken:
+    """Make ``social_token`` carry an access token valid beyond ``TOKEN_REFRESH_MARGIN``.
+
+    :param social_token: The token row; updated in place (and in the database) when
+        its access token is refreshed.
+    :param refresh: The provider's refresh-token grant (the adapter class's
+        ``refresh_access_token``); called at most once per expiry window across every
+        worker sharing the lock.
+    :return: ``social_token``. Returned untouched when it is fresh or carries no
+        refresh token -- the adapter then reports the expired credentials.
+    """
+    if _is_fresh(social_token.expires_at) or not social_token.token_secret:
+        return social_token
+
+    with resilient_lock(
+        f"oauth-token-refresh:{social_token.id}",
+        timeout=TOKEN_REFRESH_LOCK_TIMEOUT,
+        blocking_timeout=TOKEN_REFRESH_LOCK_WAIT,
+    ) as acquired:
+        if not acquired:
+            logger.warning(
+                "Timed out waiting on the refresh of social token %s; refreshing it here.",
+                social_token.id,
+            )
+        # Whoever held the lock before us may have refreshed the token already.
+        stored = SocialToken.objects.filter(id=social_token.id).first()
+        if stored is not None and stored.token and _is_fresh(stored.expires_at):
+            social_token.token = stored.token
+            social_token.token_secret = stored.token_secret
+            social_token.expires_at = stored.expires_at
+            return social_token
+
+        refreshed = refresh(social_token.token_secret)
+        social_token.token = refreshed.token
+        social_token.expires_at = refreshed.expires_at
+        update_fields = ["token", "expires_at"]
+        if refreshed.refresh_token:
+            social_token.token_secret = refreshed.refresh_token
+            update_fields.append("token_secret")
+        _store_refreshed_token(social_token, update_fields)
+        logger.info(
+            "Refreshed social token %s (expires_at=%s)",
+            social_token.id,
+            refreshed.expires_at.isoformat() if refreshed.expires_at else None,
+        )
+    return social_token
+
+
+def _store_refreshed_token(social_token: SocialToken, update_fields: list[str]) -> None:
+    """Write ``update_fields`` of ``social_token`` and commit them now.
+
+    Outside a transaction that is a plain ``save()``. Inside one, the row is updated
+    on a new connection in autocommit mode, so workers waiting on the refresh lock
+    see the token as soon as it is released. The caller's transaction falls back to
+    storing it itself when that connection cannot: the row is not committed yet (it
+    was created in that transaction, so no other worker can see it either), or the
+    transaction holds a lock on it.
+    """
+    alias = router.db_for_write(SocialToken)
+    if not connections[alias].in_atomic_block:
+        social_token.save(update_fields=update_fields)
+        return
+
+    opts = SocialToken._meta
+    own_connection = connections.create_connection(alias)
+    try:
+        fields = [opts.get_field(name) for name in update_fields]
+        quote = own_connection.ops.quote_name
+        assignments = ", ".join(f"{quote(field.column)} = %s" for field in fields)
+        params = [
+            field.get_db_prep_save(getattr(social_token, field.attname), own_connection)
+            for field in fields
+        ]
+        with own_connection.cursor() as cursor:
+            if own_connection.vendor == "postgresql":
+                cursor.execute(f"SET lock_timeout = '{REFRESHED_ROW_LOCK_TIMEOUT}'")
+            cursor.execute(
+                f"UPDATE {quote(opts.db_table)} SET {assignments} "  # noqa: S608
+                f"WHERE {quote(opts.pk.column)} = %s",
+                [*params, social_token.pk],
+            )
+            stored = cursor.rowcount == 1
+    except DatabaseError:
+        logger.warning(
+            "Could not commit social token %s on its own connection; storing it with "
+            "the caller's transaction.",
+            social_token.id,
+            exc_info=True,
+        )
+        stored = False
+    finally:
+        own_connection.close()
+
+    if not stored:
+        social_token.save(update_fields=update_fields)
@@ -0,0 +1,87 @@
+"""Fan-out plan of an organization-wide calendar resync.
+
+``resync_organization_calendars_task`` (the resync after a billing root recovers out
+of ``RESTRICTED``) used to walk the organization's calendars one by one in a single
+task: two lookups per calendar to find who syncs it, and an ``authenticate`` -- an
+adapter build, possibly a token refresh -- per calendar, even when one account owned
+them all. A large tenant held a worker for as long as that took.
+
+:func:`plan_organization_resync` resolves every calendar's syncing account in two
+queries (``sync_scheduling.resolve_owner_accounts``), groups the calendars per
+account, and spreads the accounts over at most :data:`RESYNC_MAX_PARALLEL_TASKS`
+batches, heaviest account first onto the lightest batch. The task fans the batches
+out as a Celery chord of ``resync_account_calendars_task`` -- one authentication per
+account, which requests the account's calendars' syncs -- and
+``summarize_organization_resync_task`` logs what the resync requested once every
+batch is done.
+
+Batching bounds the requesting, not the syncing: each requested sync is its own
+``sync_calendar_task``, so an account's syncs may run side by side. Their provider
+calls are paced by the account's quota bucket (``calendar_integration.provider_quota``),
+which defers a sync that finds it exhausted.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import heapq
+from collections import defaultdict
+
+from calendar_integration.models import Calendar
+from calendar_integration.sync_scheduling import resolve_owner_accounts
+
+
+#: Most batches one organization resync runs in parallel.
+RESYNC_MAX_PARALLEL_TASKS = 8
+
+
+@dataclasses.dataclass(frozen=True)
+class OrganizationResyncPlan:
+    """The batches an organization resync fans out to.
+
+    :param batches: One list per child task of ``(social_account_id, calendar_ids)``
+        pairs; an account's calendars are all in one pair.
+    :param unresolved_calendar_ids: Calendars without an owner, or whose owner has no
+        linked account for the calendar's provider: nothing can resync them.
+    """
+
+    batches: list[list[tuple[int, list[int]]]]
+    unresolved_calendar_ids: list[int]
+
+    @property
+    def calendar_count(self) -> int:
+        """Calendars the batches cover."""
+        return sum(len(calendar_ids) for batch in self.batches for _, calendar_ids in batch)
+
+
+def plan_organization_resync(
+    organization_id: int, max_parallel: int = RESYNC_MAX_PARALLEL_TASKS
+) -> OrganizationResyncPlan:
+    """Group the organization's active calendars per syncing account, in batches.
+
+    Three queries whatever the organization's size: its calendars, their ownerships,
+    and the owners' accounts.
+    """
+    calendars = list(Calendar.objects.filter_by_organization(organization_id).exclude_inactive())
+    accounts = resolve_owner_accounts(calendars)
+
+    by_account: dict[int, list[int]] = defaultdict(list)
+    unresolved: list[int] = []
+    for calendar in calendars:
+        social_account = accounts.get(calendar.id)
+        if social_account is None:
+            unresolved.append(calendar.id)
+        else:
+            by_account[social_account.id].append(calendar.id)
+
+    batch_count = min(max_parallel, len(by_account))
+    batches: list[list[tuple[int, list[int]]]] = [[] for _ in range(batch_count)]
+    # (calendars in the batch, batch index): the lightest batch takes the next account.
+    loads = [(0, index) for index in range(batch_count)]
+    for social_account_id, calendar_ids in sorted(
+        by_account.items(), key=lambda item: (-len(item[1]), item[0])
+    ):
+        load, index = heapq.heappop(loads)
+        batches[index].append((social_account_id, calendar_ids))
+        heapq.heappush(loads, (load + len(calendar_ids), index))
+    return OrganizationResyncPlan(batches=batches, unresolved_calendar_ids=unresolved)
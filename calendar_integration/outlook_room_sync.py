@@ -0,0 +1,216 @@
+"""Concurrent delta syncs of an organization's Outlook rooms.
+
+Outlook room calendars used to sync one per ``sync_calendar_task``: one task, one
+authentication and one delta round read page after page per room, with nothing
+planning them together, so a tenant with hundreds of rooms queued hundreds of tasks
+that each spent most of their time waiting on Graph. A room sync never resumed from
+a token either: the adapter dropped the room's delta link, so every sync listed the
+whole window again.
+
+``CalendarSyncService.sync_outlook_rooms`` (``sync_outlook_rooms_task``) syncs every
+live, sync-enabled Outlook room of the organization from one task, in chunks of
+:data:`OUTLOOK_ROOM_SYNC_CHUNK_SIZE` rooms:
+
+- the chunk's ``CalendarSync`` rows are created in one statement, after every room's
+  resumable delta token was read in one query (:func:`latest_room_sync_tokens`);
+- :func:`fetch_room_deltas` runs the rooms' delta rounds
+  (``MSOutlookCalendarAdapter.get_room_events_delta``) on up to
+  :data:`OUTLOOK_ROOM_SYNC_MAX_CONCURRENCY` threads. The threads only talk to Graph;
+  a room whose token expired, or whose token's round does not span the sync's
+  window, starts a fresh round over the window right there;
+- back on the task's thread, ``sync_events`` applies each room's events under the
+  room's single-flight lock and stores the round's delta link on its
+  ``CalendarSync``: the token the room's next sync, from here or from its own task,
+  resumes.
+
+One chunk's events are held at a time. A room whose lock is held is left queued for
+the running sync's re-run, which fetches afresh; a room Graph throttled or kept
+failing for is handed to its own ``sync_calendar_task``, for when Graph says to come
+back.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from calendar_integration.constants import CalendarProvider, CalendarSyncStatus, CalendarType
+from calendar_integration.exceptions import SyncTokenExpiredError
+from calendar_integration.models import Calendar, CalendarSync
+from calendar_integration.services.dataclasses import (
+    PrefetchedCalendarEvents,
+    ResumableSyncToken,
+)
+from calendar_integration.sync_scheduling import resolve_owner_accounts
+
+
+if TYPE_CHECKING:
+    from allauth.socialaccount.models import SocialAccount
+
+    from calendar_integration.querysets import CalendarQuerySet
+    from calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter import (
+        MSOutlookCalendarAdapter,
+    )
+
+
+logger = logging.getLogger(__name__)
+
+#: Rooms whose delta rounds run at once. Graph serves at most four concurrent requests
+#: per app and mailbox, and a room reads its pages one after the other, so rooms stay
+#: well under that; what this bounds is the worker's share of Graph -- its pooled
+#: connections (``GRAPH_POOL_MAXSIZE``) and the account's quota bucket every thread
+#: draws from.
+OUTLOOK_ROOM_SYNC_MAX_CONCURRENCY = 8
+#: Rooms fetched, then applied, together. Bounds the events held in memory at once.
+OUTLOOK_ROOM_SYNC_CHUNK_SIZE = 2 * OUTLOOK_ROOM_SYNC_MAX_CONCURRENCY
+
+
+@dataclasses.dataclass(frozen=True)
+class RoomDelta:
+    """The outcome of one room's delta fetch.
+
+    :param calendar_sync: The room's sync the fetch was made for.
+    :param prefetched: The room's events, ``None`` when the fetch failed.
+    :param error: Why it failed.
+    """
+
+    calendar_sync: CalendarSync
+    prefetched: PrefetchedCalendarEvents | None = None
+    error: Exception | None = None
+
+
+@dataclasses.dataclass
+class OutlookRoomSyncSummary:
+    """What an Outlook rooms sync did, one count per room."""
+
+    synced: int = 0
+    failed: int = 0
+    # Left queued for another sync of the room, or handed to its own task for later.
+    deferred: int = 0
+
+
+def outlook_rooms(organization_id: int) -> CalendarQuerySet:
+    """The organization's live, sync-enabled Outlook rooms, in id order."""
+    return (
+        Calendar.objects.filter_by_organization(organization_id)
+        .live_of_type(CalendarType.RESOURCE)
+        .filter(provider=CalendarProvider.MICROSOFT, sync_enabled=True)
+        .order_by("id")
+    )
+
+
+def outlook_rooms_sync_account(organization_id: int) -> SocialAccount | None:
+    """The Microsoft account the organization's Outlook rooms sync as.
+
+    The linked account of whoever owns the most rooms, resolved as a scheduled sync
+    resolves a calendar's (``sync_scheduling.resolve_owner_accounts``); ``None`` when
+    no room has an owner with one.
+    """
+    accounts = resolve_owner_accounts(list(outlook_rooms(organization_id)))
+    rooms_per_account = Counter(accounts.values())
+    if not rooms_per_account:
+        return None
+    return rooms_per_account.most_common(1)[0][0]
+
+
+def latest_room_sync_tokens(
+    organization_id: int, calendar_ids: Sequence[int]
+) -> dict[int, ResumableSyncToken]:
+    """The token each room's next incremental sync resumes, in one query.
+
+    Picked as ``CalendarSyncService._get_resumable_sync_token`` picks it for one
+    calendar: from the latest successful sync that updated events and stored one.
+    Whether it spans the sync's window is for :func:`fetch_room_deltas` to check.
+    """
+    rows = (
+        CalendarSync.objects.filter_by_organization(organization_id)
+        .filter(
+            calendar_fk_id__in=calendar_ids,
+            status=CalendarSyncStatus.SUCCESS,
+            should_update_events=True,
+        )
+        .exclude(next_sync_token="")
+        .order_by("calendar_fk_id", "-created")
+        .distinct("calendar_fk_id")
+        .values_list(
+            "calendar_fk_id",
+            "next_sync_token",
+            "sync_token_window_start",
+            "sync_token_window_end",
+        )
+    )
+    return {
+        calendar_id: ResumableSyncToken(token, window_start, window_end)
+        for calendar_id, token, window_start, window_end in rows
+    }
+
+
+def fetch_room_deltas(
+    adapter: MSOutlookCalendarAdapter,
+    rooms: Sequence[tuple[CalendarSync, str, ResumableSyncToken | None]],
+    max_concurrency: int = OUTLOOK_ROOM_SYNC_MAX_CONCURRENCY,
+) -> list[RoomDelta]:
+    """Run the delta round of every room, up to ``max_concurrency`` at once.
+
+    :param rooms: ``(calendar_sync, room_external_id, sync_token)`` triples; the round
+        resumes from ``sync_token`` when its round spans the sync's window, and
+        otherwise starts afresh over that window. A resumed round's window is carried
+        onto ``calendar_sync``, to be stored with the round's next token.
+    :return: One ``RoomDelta`` per room, in order. A failed fetch is reported in its
+        ``RoomDelta`` rather than raised, so it does not cost the others theirs.
+
+    Touches no database: the threads it runs on hold no connection.
+    """
+
+    def fetch(room: tuple[CalendarSync, str, ResumableSyncToken | None]) -> RoomDelta:
+        calendar_sync, room_external_id, sync_token = room
+        try:
+            prefetched = _fetch_room_delta(adapter, calendar_sync, room_external_id, sync_token)
+        except Exception as exc:  # noqa: BLE001
+            return RoomDelta(calendar_sync=calendar_sync, error=exc)
+        return RoomDelta(calendar_sync=calendar_sync, prefetched=prefetched)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(rooms)))) as executor:
+        return list(executor.map(fetch, rooms))
+
+
+def _fetch_room_delta(
+    adapter: MSOutlookCalendarAdapter,
+    calendar_sync: CalendarSync,
+    room_external_id: str,
+    sync_token: ResumableSyncToken | None,
+) -> PrefetchedCalendarEvents:
+    start_date = calendar_sync.start_datetime
+    end_date = calendar_sync.end_datetime
+    if sync_token is not None and not sync_token.covers(start_date, end_date):
+        logger.info(
+            "Sync token for room %s was issued for another window; fetching its whole window.",
+            room_external_id,
+        )
+    elif sync_token is not None:
+        try:
+            result = adapter.get_room_events_delta(
+                room_external_id, start_date, end_date, sync_token.token
+            )
+        except SyncTokenExpiredError:
+            # As ``CalendarSyncService._execute_calendar_sync`` does: a fresh round
+            # over the window, whose token the room resumes from next time.
+            logger.info(
+                "Sync token for room %s expired; fetching its whole window.", room_external_id
+            )
+        else:
+            calendar_sync.sync_token_window_start = sync_token.window_start
+            calendar_sync.sync_token_window_end = sync_token.window_end
+            return PrefetchedCalendarEvents(
+                events=list(result["events"]),
+                sync_token=sync_token.token,
+                next_sync_token=result["next_sync_token"],
+            )
+    result = adapter.get_room_events_delta(room_external_id, start_date, end_date)
+    return PrefetchedCalendarEvents(
+        events=list(result["events"]), sync_token=None, next_sync_token=result["next_sync_token"]
+    )
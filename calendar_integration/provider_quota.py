@@ -0,0 +1,159 @@
+"""Provider API quotas: per-project and per-account token buckets.
+
+Google Calendar and Microsoft Graph both meter requests twice: once for the whole
+application (Google's per-project queries per minute, Graph's per-app limit) and once
+per user or mailbox. The adapters used to call ``try_acquire`` on a single shared
+limiter and ignore its answer, so nothing was ever throttled and a busy sync ran
+straight into ``403 rateLimitExceeded`` / ``429``.
+
+A :class:`ProviderQuota` holds both buckets for one API. :meth:`ProviderQuota.acquire`
+takes a permit from the project bucket and then from the calling account's bucket,
+waiting up to ``max_delay`` milliseconds on each (the ``ResilientLimiter`` blocking
+mode). The project goes first: a call the project refuses never reaches the
+account's bucket, so an account is not charged for calls it never made. When either stays empty it raises ``ProviderQuotaExceededError`` carrying
+``retry_after``, the shortest window of the quota's rates: by then the bucket has
+refilled at least one permit. ``sync_calendar_task`` turns that into a Celery
+``retry(countdown=retry_after)`` instead of a failed sync; interactive callers see
+the error.
+
+Each quota counts what it does (:class:`ProviderQuotaMetrics`): permits granted,
+calls throttled, and callers currently waiting on a bucket -- the in-process queue
+depth. :func:`provider_quota_metrics` snapshots every quota in the process, and each
+throttled call is logged with the running count.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from pyrate_limiter import Rate
+
+from calendar_integration.exceptions import ProviderQuotaExceededError
+from common.redis import ResilientLimiter, build_resilient_limiter
+
+
+logger = logging.getLogger(__name__)
+
+_quotas: dict[str, ProviderQuota] = {}
+
+#: Account buckets a quota keeps in this process, least recently used evicted first.
+#: The counts of an evicted bucket live on in Redis; only the in-memory fallback
+#: forgets them, and then at most one window's worth.
+ACCOUNT_LIMITER_CACHE_SIZE = 1024
+
+
+@dataclasses.dataclass(frozen=True)
+class ProviderQuotaMetrics:
+    """Counters of one :class:`ProviderQuota` in this process.
+
+    :param granted: Calls that got a permit.
+    :param throttled: Calls refused a permit (``ProviderQuotaExceededError`` raised).
+    :param waiting: Calls currently blocked on one of the buckets.
+    """
+
+    granted: int
+    throttled: int
+    waiting: int
+
+
+class ProviderQuota:
+    """Per-project and per-account token buckets for one provider API.
+
+    :param name: Names the quota in logs, metrics and Redis bucket keys.
+    :param project_rates: Limits shared by every account of the application.
+    :param account_rates: Limits of each account (user, mailbox) on its own.
+    :param max_delay: Milliseconds a call may wait on each bucket before giving up.
+    :param max_accounts: Account buckets kept in this process.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        project_rates: Iterable[Rate],
+        account_rates: Iterable[Rate],
+        max_delay: int,
+        max_accounts: int = ACCOUNT_LIMITER_CACHE_SIZE,
+    ):
+        self.name = name
+        project_rates = list(project_rates)
+        self._account_rates = list(account_rates)
+        self._max_delay = max_delay
+        self._project_limiter = build_resilient_limiter(
+            project_rates, bucket_key=f"{name}_limiter", max_delay=max_delay, name=name
+        )
+        #: The shortest window among the rates: retrying any sooner meets the same
+        #: empty bucket.
+        self.retry_after = (
+            min(rate.interval for rate in [*project_rates, *self._account_rates]) / 1000
+        )
+        self._account_limiters: OrderedDict[str, ResilientLimiter] = OrderedDict()
+        self._max_accounts = max_accounts
+        self._lock = threading.Lock()
+        self._granted = 0
+        self._throttled = 0
+        self._waiting = 0
+        _quotas[name] = self
+
+    def _account_limiter(self, account_key: str) -> ResilientLimiter:
+        with self._lock:
+            limiter = self._account_limiters.get(account_key)
+            if limiter is not None:
+                self._account_limiters.move_to_end(account_key)
+                return limiter
+            limiter = build_resilient_limiter(
+                self._account_rates,
+                bucket_key=f"{self.name}_limiter:{account_key}",
+                max_delay=self._max_delay,
+                name=f"{self.name}:{account_key}",
+            )
+            self._account_limiters[account_key] = limiter
+            if len(self._account_limiters) > self._max_accounts:
+                self._account_limiters.popitem(last=False)
+            return limiter
+
+    def acquire(self, account_key: str, weight: int = 1) -> None:
+        """Take ``weight`` permits for ``account_key``, waiting briefly if needed.
+
+        :raises ProviderQuotaExceededError: when the account's or the project's bucket
+            stays empty for ``max_delay``.
+        """
+        account_limiter = self._account_limiter(account_key)
+        with self._lock:
+            self._waiting += 1
+        try:
+            granted = self._project_limiter.try_acquire(
+                self.name, weight
+            ) and account_limiter.try_acquire(account_key, weight)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+        with self._lock:
+            if granted:
+                self._granted += 1
+            else:
+                self._throttled += 1
+            throttled = self._throttled
+        if not granted:
+            logger.warning(
+                "Provider quota '%s' exhausted for account %s (%d throttled calls so far).",
+                self.name,
+                account_key,
+                throttled,
+            )
+            raise ProviderQuotaExceededError(self.name, self.retry_after)
+
+    def metrics(self) -> ProviderQuotaMetrics:
+        with self._lock:
+            return ProviderQuotaMetrics(
+                granted=self._granted, throttled=self._throttled, waiting=self._waiting
+            )
+
+
+def provider_quota_metrics() -> dict[str, ProviderQuotaMetrics]:
+    """Snapshot the counters of every quota built in this process, by name."""
+    return {name: quota.metrics() for name, quota in _quotas.items()}
@@ -18,7 +18,7 @@ from django.db.models import (
     Value,
     When,
 )
-from django.db.models.functions import Coalesce
+from django.db.models.functions import Coalesce, Greatest
 from django.utils import timezone
 
 from calendar_integration.constants import (
@@ -28,6 +28,7 @@ from calendar_integration.constants import (
     ExternalEventChangeRequestStatus,
 )
 from calendar_integration.database_functions import (
+    ClockTimestamp,
     GetAvailableTimeOccurrencesJSON,
     GetAvailableTimeOccurrencesWithBulkModificationsJSON,
     GetBlockedTimeOccurrencesJSON,
@@ -272,6 +273,25 @@ class CalendarQuerySet(OrganizationScopedQuerySet):
             .values_list("external_id", flat=True)
         )
 
+    def bump_change_version(self) -> int:
+        """Bump ``change_version`` (and stamp ``changed_at``) on every calendar here.
+
+        A single ``UPDATE ... SET change_version = change_version + 1``: concurrent
+        writers never lose an increment, and the bump commits or rolls back with the
+        write that caused it. Returns the number of calendars bumped.
+
+        ``changed_at`` is the wall clock when the row is written (``clock_timestamp()``),
+        and never earlier than the value already stored. ``Now()`` is fixed when the
+        statement is received. A bump that waited on another transaction's lock on
+        the same calendar would then commit after that transaction but carry an
+        earlier ``changed_at``, and an ``ifChangedSince`` client that read in between
+        would skip the change.
+        """
+        return self.update(
+            change_version=F("change_version") + 1,
+            changed_at=Greatest(F("changed_at"), ClockTimestamp()),
+        )
+
     def only_listed(self):
         """Return only calendars visible in booking/public queries (visibility=active)."""
         return self.filter(visibility=CalendarVisibility.ACTIVE)
@@ -165,12 +165,18 @@ class CalendarSyncSerializer(serializers.ModelSerializer):
             "should_update_events",
             "trigger_source",
             "error_message",
+            "events_created",
+            "events_updated",
+            "events_skipped",
         )
         read_only_fields = (
             "id",
             "status",
             "trigger_source",
             "error_message",
+            "events_created",
+            "events_updated",
+            "events_skipped",
         )
 
 
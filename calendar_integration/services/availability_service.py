@@ -52,6 +52,7 @@ from vinta_billing.exceptions import OverLimitError
 
 from audit.constants import AuditAction
 from audit.diff import compute_diff
+from calendar_integration.change_tracking import bump_calendar_change_versions
 from calendar_integration.constants import CalendarType
 from calendar_integration.models import (
     AvailableTime,
@@ -88,10 +89,11 @@ from payments.seams.resource_keys import AVAILABILITY_WINDOWS
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
     from calendar_integration.services.calendar_service_context import CalendarServiceContext
-    from calendar_integration.services.dataclasses import CalendarEventData
+    from calendar_integration.services.dataclasses import CalendarEventData, ExpandedEventCursor
+    from calendar_integration.services.event_expansion import ExpandedEvent
     from calendar_integration.services.recurrence_manager import RecurrenceManager
 
 
@@ -101,7 +103,7 @@ class AvailabilityServiceHost(Protocol):
     Three concerns are not part of the availability concern's extracted surface and
     stay on the facade:
 
-    - **event reads** (``get_calendar_events_expanded``) — the event concern;
+    - **event reads** (``iter_calendar_events_expanded``) — the event concern;
       reached through the host to keep one implementation and the call graph the
       existing test suite patches via the facade;
     - **blocked-time bulk creation** (``bulk_create_manual_blocked_times``) — a
@@ -115,12 +117,14 @@ class AvailabilityServiceHost(Protocol):
     later without changing this service's call sites.
     """
 
-    def get_calendar_events_expanded(
+    def iter_calendar_events_expanded(
         self,
         calendar: Calendar,
         start_date: datetime.datetime,
         end_date: datetime.datetime,
-    ) -> list[CalendarEvent]: ...
+        *,
+        materialize: bool = True,
+    ) -> Iterator[tuple[ExpandedEventCursor, ExpandedEvent]]: ...
 
     def bulk_create_manual_blocked_times(
         self,
@@ -296,19 +300,24 @@ class AvailabilityService:
             raise
 
         # Get expanded calendar events (including recurring instances)
-        # This handles both master events and their generated instances
-        calendar_events = self._host.get_calendar_events_expanded(
-            calendar=calendar,
-            start_date=start_datetime,
-            end_date=end_datetime,
-        )
+        # This handles both master events and their generated instances. Nothing here
+        # writes them, so generated occurrences stay ``RecurringOccurrence`` views.
+        calendar_events = [
+            event
+            for _, event in self._host.iter_calendar_events_expanded(
+                calendar=calendar,
+                start_date=start_datetime,
+                end_date=end_datetime,
+                materialize=False,
+            )
+        ]
 
         # Get expanded blocked times (including recurring instances)
-        # Replace the current blocked_times query with:
         blocked_times = self.get_blocked_times_expanded(
             calendar=calendar,
             start_date=start_datetime,
             end_date=end_datetime,
+            materialize=False,
         )
 
         # If this calendar is part of any bundles, include bundle events
@@ -317,7 +326,7 @@ class AvailabilityService:
             bundle_children=calendar,
         )
 
-        bundle_events: list[CalendarEvent] = []
+        bundle_events: list[ExpandedEvent] = []
         for bundle_calendar in bundle_calendars:
             # Get bundle events from the bundle calendar directly
             bundle_calendar_events = CalendarEvent.objects.filter_by_organization(
@@ -392,6 +401,7 @@ class AvailabilityService:
                 calendar=calendar,
                 start_date=start_datetime,
                 end_date=end_datetime,
+                materialize=False,
             )
 
             # Net availability = declared windows minus busy (events + blocked times).
@@ -521,7 +531,10 @@ class AvailabilityService:
             )
             availability_windows_to_create.append(available_time)
 
-        return AvailableTime.objects.bulk_create(availability_windows_to_create)
+        created = AvailableTime.objects.bulk_create(availability_windows_to_create)
+        # bulk_create sends no post_save, so the change-tracking receiver never sees these.
+        bump_calendar_change_versions(calendar.organization_id, [calendar.id])
+        return created
 
     @transaction.atomic()
     def batch_modify_available_times(
@@ -706,8 +719,13 @@ class AvailabilityService:
         calendar: Calendar,
         start_date: datetime.datetime,
         end_date: datetime.datetime,
+        materialize: bool = True,
     ) -> list[AvailableTime]:
-        """Get all available times in a date range with recurring available times expanded to instances."""
+        """Get all available times in a date range with recurring available times expanded to instances.
+
+        With ``materialize=False`` generated occurrences are returned as read-only
+        ``RecurringOccurrence`` views instead of unsaved model instances.
+        """
         if not is_initialized_or_authenticated_calendar_service(
             cast("BaseCalendarService", self._context)
         ):
@@ -748,10 +766,15 @@ class AvailabilityService:
         times: list[AvailableTime] = list(non_recurring_times)
 
         for master_time in recurring_times:
-            instances = master_time.get_occurrences_in_range(
+            expand = (
+                master_time.get_occurrences_in_range
+                if materialize
+                else master_time.get_occurrence_views_in_range
+            )
+            instances = expand(
                 start_date, end_date, include_self=False, include_exceptions=True, overlap=True
             )
-            times.extend(instances)
+            times.extend(instances)  # type: ignore[arg-type]
 
         # Sort by start time
         times.sort(key=lambda x: x.start_time)
@@ -889,8 +912,13 @@ class AvailabilityService:
         calendar: Calendar,
         start_date: datetime.datetime,
         end_date: datetime.datetime,
+        materialize: bool = True,
     ) -> list[BlockedTime]:
-        """Get all blocked times in a date range with recurring blocked times expanded to instances."""
+        """Get all blocked times in a date range with recurring blocked times expanded to instances.
+
+        With ``materialize=False`` generated occurrences are returned as read-only
+        ``RecurringOccurrence`` views instead of unsaved model instances.
+        """
         if not is_initialized_or_authenticated_calendar_service(
             cast("BaseCalendarService", self._context)
         ):
@@ -936,10 +964,15 @@ class AvailabilityService:
         times: list[BlockedTime] = list(non_recurring_times)
 
         for master_time in recurring_times:
-            instances = master_time.get_occurrences_in_range(
+            expand = (
+                master_time.get_occurrences_in_range
+                if materialize
+                else master_time.get_occurrence_views_in_range
+            )
+            instances = expand(
                 start_date, end_date, include_self=False, include_exceptions=True, overlap=True
             )
-            times.extend(instances)
+            times.extend(instances)  # type: ignore[arg-type]
 
         # Sort by start time
         times.sort(key=lambda x: x.start_time)
@@ -1,9 +1,15 @@
+import contextlib
 import datetime
+import itertools
 import logging
 import re
+import threading
+import time
 import uuid
-from collections.abc import Iterable
-from typing import Any, Literal, NotRequired, TypedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, ClassVar, Literal, NotRequired, TypedDict
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
@@ -13,11 +19,22 @@ from allauth.socialaccount.models import SocialToken
 from google.auth.transport.requests import Request
 from google.oauth2 import service_account as google_service_account
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from pyrate_limiter import Duration, Rate
 
 from calendar_integration.constants import CalendarProvider
-from calendar_integration.exceptions import WebhookIgnoredError, WebhookProcessingFailedError
+from calendar_integration.exceptions import (
+    ProviderQuotaExceededError,
+    SyncTokenExpiredError,
+    WebhookIgnoredError,
+    WebhookProcessingFailedError,
+)
+from calendar_integration.provider_quota import ProviderQuota
+from calendar_integration.services.calendar_adapters.write_batches import OpenWriteBatches
+from calendar_integration.services.calendar_clients.google_api_clients import (
+    authorized_http,
+    build_google_client,
+)
 from calendar_integration.services.dataclasses import (
     ApplicationCalendarData,
     CalendarEventAdapterInputData,
@@ -25,9 +42,9 @@ from calendar_integration.services.dataclasses import (
     CalendarEventsSyncTypedDict,
     CalendarResourceData,
     EventAttendeeData,
+    RefreshedOAuthToken,
 )
 from calendar_integration.services.protocols.calendar_adapter import CalendarAdapter
-from common.redis import build_resilient_limiter
 
 
 logger = logging.getLogger(__name__)
@@ -35,28 +52,57 @@ logger = logging.getLogger(__name__)
 # Precompiled regex for extracting calendar ID from Google Calendar resource URIs
 _CALENDAR_ID_RE = re.compile(r"/calendars/([^/]+)/events")
 
-read_quote_limiter = build_resilient_limiter(
-    [
-        Rate(240, Duration.MINUTE),  # 240 requests per minute
-    ],
-    bucket_key="google_calendar_read_limiter",
-    max_delay=1000,  # Allow a maximum delay of 1 second for read operations
+# Project-wide budgets, with a per-account share so one busy account cannot take the
+# whole project's minute. A call waits up to ``max_delay`` ms on each bucket, then
+# raises ``ProviderQuotaExceededError`` (see ``calendar_integration.provider_quota``).
+read_quote_limiter = ProviderQuota(
+    "google_calendar_read",
+    project_rates=[Rate(240, Duration.MINUTE)],
+    account_rates=[Rate(120, Duration.MINUTE)],
+    max_delay=1000,
 )
 
-write_quote_limiter = build_resilient_limiter(
-    [
-        Rate(120, Duration.MINUTE),  # 120 requests per minute
-    ],
-    bucket_key="google_calendar_write_limiter",
-    max_delay=2000,  # Allow a maximum delay of 2 seconds for write operations
+write_quote_limiter = ProviderQuota(
+    "google_calendar_write",
+    project_rates=[Rate(120, Duration.MINUTE)],
+    account_rates=[Rate(60, Duration.MINUTE)],
+    max_delay=2000,
 )
 
+# Google Calendar accepts at most 50 calls in one batch request.
+GOOGLE_BATCH_MAX_SIZE = 50
+
+# Room availability (``get_available_calendar_resources``) asks freebusy about at most
+# this many calendars per query -- the API's limit -- over windows of at most this many
+# days, with this many queries in flight at once (each still taking a read permit).
+GOOGLE_FREEBUSY_MAX_ITEMS = 50
+GOOGLE_FREEBUSY_MAX_DAYS = 90
+GOOGLE_FREEBUSY_MAX_CONCURRENCY = 4
+# Seconds a Workspace's resource list is reused by room-availability lookups before
+# the Directory API is listed again: rooms are rarely added, and one import or search
+# used to list them once per freebusy window.
+GOOGLE_RESOURCE_LIST_TTL = 300
+
+# ``{resource cache key: (expires at, resources)}``, per process. See
+# ``GoogleCalendarAdapter._cached_calendar_resources``.
+_resource_lists: dict[str, tuple[float, list[CalendarResourceData]]] = {}
+_resource_lists_lock = threading.Lock()
+
 _SA_SCOPES = [
     "https://www.googleapis.com/auth/admin.directory.resource.calendar.readonly",
     "https://www.googleapis.com/auth/calendar.readonly",
 ]
 
 
+def _is_rate_limit_error(error: HttpError) -> bool:
+    """Whether ``error`` is Google throttling us (429, or 403 ``(user)RateLimitExceeded``)."""
+    if error.resp.status == HTTPStatus.TOO_MANY_REQUESTS:
+        return True
+    return error.resp.status == HTTPStatus.FORBIDDEN and b"ratelimitexceeded" in (
+        (error.content or b"").lower()
+    )
+
+
 class GoogleCredentialTypedDict(TypedDict):
     token: str
     refresh_token: str
@@ -100,6 +146,13 @@ class GoogleCalendarAdapter(CalendarAdapter):
     NON_BUSY_EVENT_TYPES: frozenset[str] = frozenset(  # noqa: RUF012
         {"workingLocation", "birthday"}
     )
+    # Event writes queued by the open ``batch_writes()`` blocks, per adapter and thread.
+    _write_batches: ClassVar[OpenWriteBatches[Any]] = OpenWriteBatches()
+    # What a worker thread needs to authorize its own transport (``authorized_http``).
+    _credentials: Any
+    _transport_key: str
+    # Keys the cached resource list; only service-account adapters list resources.
+    _resource_cache_key: str | None = None
 
     @classmethod
     def _is_busy_event(cls, event: dict[str, Any]) -> bool:
@@ -115,14 +168,20 @@ class GoogleCalendarAdapter(CalendarAdapter):
             return False
         return True
 
-    def __init__(self, credentials_dict: GoogleCredentialTypedDict):
-        self.account_id = credentials_dict["account_id"]
+    @staticmethod
+    def _oauth_client() -> tuple[str, str]:
+        """The app's OAuth client ID and secret."""
         GOOGLE_CLIENT_ID = getattr(settings, "GOOGLE_CLIENT_ID", None)  # noqa: N806
         GOOGLE_CLIENT_SECRET = getattr(settings, "GOOGLE_CLIENT_SECRET", None)  # noqa: N806
         if not GOOGLE_CLIENT_ID or not GOOGLE_CLIENT_SECRET:
             raise ImproperlyConfigured(
                 "Google Calendar integration requires GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET settings."
             )
+        return GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET
+
+    def __init__(self, credentials_dict: GoogleCredentialTypedDict):
+        self.account_id = credentials_dict["account_id"]
+        GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET = self._oauth_client()  # noqa: N806
 
         # google-auth tracks expiry as a naive UTC datetime; convert the
         # (tz-aware) SocialToken expiry so credentials.valid/expired is accurate
@@ -157,7 +216,38 @@ class GoogleCalendarAdapter(CalendarAdapter):
             )
             raise ValueError("Invalid or expired Google credentials provided.")
 
-        self.client = build("calendar", "v3", credentials=credentials)
+        self._credentials = credentials
+        self._transport_key = f"oauth:{self.account_id}"
+        self.client = build_google_client(
+            "calendar", "v3", credentials=credentials, cache_key=self._transport_key
+        )
+
+    @staticmethod
+    def refresh_access_token(refresh_token: str) -> RefreshedOAuthToken:
+        """Exchange ``refresh_token`` for a new access token.
+
+        The refresh ``calendar_integration.oauth_tokens.fresh_social_token`` runs once
+        per expiry window for every worker; ``__init__`` only refreshes itself when
+        handed credentials that did not go through it.
+        """
+        client_id, client_secret = GoogleCalendarAdapter._oauth_client()
+        credentials = Credentials(
+            token=None,
+            refresh_token=refresh_token,
+            token_uri="https://oauth2.googleapis.com/token",  # noqa: S106
+            client_id=client_id,
+            client_secret=client_secret,
+        )
+        try:
+            credentials.refresh(Request())
+        except Exception as e:
+            raise ValueError(f"Google token refresh failed: {e}") from e
+        return RefreshedOAuthToken(
+            token=credentials.token,
+            expires_at=(
+                credentials.expiry.replace(tzinfo=datetime.UTC) if credentials.expiry else None
+            ),
+        )
 
     @staticmethod
     def _persist_refreshed_token(credentials: Credentials, social_token_id: int | None) -> None:
@@ -201,8 +291,16 @@ class GoogleCalendarAdapter(CalendarAdapter):
         ).with_subject(credentials["admin_email"])
         adapter = cls.__new__(cls)
         adapter.account_id = f"service-{credentials['account_id']}"
-        adapter.client = build("calendar", "v3", credentials=sa_creds)
-        adapter.admin_client = build("admin", "directory_v1", credentials=sa_creds)
+        # Both clients act as the same delegated identity: one transport serves them.
+        cache_key = f"{adapter.account_id}:{credentials['admin_email']}"
+        adapter._credentials = sa_creds
+        adapter._transport_key = adapter._resource_cache_key = cache_key
+        adapter.client = build_google_client(
+            "calendar", "v3", credentials=sa_creds, cache_key=cache_key
+        )
+        adapter.admin_client = build_google_client(
+            "admin", "directory_v1", credentials=sa_creds, cache_key=cache_key
+        )
         return adapter
 
     @staticmethod
@@ -220,7 +318,7 @@ class GoogleCalendarAdapter(CalendarAdapter):
         return request.headers.get("X-Goog-Resource-ID", "")
 
     def get_account_calendars(self) -> Iterable[CalendarResourceData]:
-        read_quote_limiter.try_acquire(f"google_calendar_read_{self.account_id}")
+        read_quote_limiter.acquire(self.account_id)
         # Use calendarList (the user's list of calendars), NOT calendars() — the
         # latter is single-calendar CRUD by id and has no .list() method
         # ("'Resource' object has no attribute 'list'").
@@ -252,7 +350,7 @@ class GoogleCalendarAdapter(CalendarAdapter):
         """
         Creates a new calendar for the application.
         """
-        write_quote_limiter.try_acquire(f"google_calendar_write_{self.account_id}")
+        write_quote_limiter.acquire(self.account_id)
         calendar_result = (
             self.client.calendars()
             .insert(
@@ -315,12 +413,22 @@ class GoogleCalendarAdapter(CalendarAdapter):
         if event_data.recurrence_rule and not event_data.is_recurring_instance:
             event["recurrence"] = [f"RRULE:{event_data.recurrence_rule}"]
 
-        write_quote_limiter.try_acquire(f"google_calendar_write_{self.account_id}")
-        created_event = (
-            self.client.events()
-            .insert(calendarId=event_data.calendar_external_id, body=event)
-            .execute()
-        )
+        write_quote_limiter.acquire(self.account_id)
+        if self._write_batch is not None:
+            # Deferred until the batch runs, so the event id is chosen here (Google
+            # accepts client ids in base32hex, which hex digits are a subset of) and the
+            # sent body stands in for the response.
+            event["id"] = uuid.uuid4().hex
+            self._write_batch.append(
+                self.client.events().insert(calendarId=event_data.calendar_external_id, body=event)
+            )
+            created_event = event
+        else:
+            created_event = (
+                self.client.events()
+                .insert(calendarId=event_data.calendar_external_id, body=event)
+                .execute()
+            )
 
         # Extract recurrence rule from response if present
         recurrence_rule = None
@@ -379,13 +487,24 @@ class GoogleCalendarAdapter(CalendarAdapter):
                     recurrence_rule = rule[6:]  # Remove "RRULE:" prefix
                     break
 
+        # Incremental syncs return deleted events as ``cancelled`` tombstones without
+        # times (a cancelled occurrence keeps its ``originalStartTime``); the sync only
+        # reads their id and status.
+        start_node = event.get("start") or event.get("originalStartTime")
+        start_time = (
+            self._parse_google_datetime(start_node)
+            if start_node
+            else datetime.datetime.fromtimestamp(0, tz=datetime.UTC)
+        )
+        end_time = self._parse_google_datetime(event["end"]) if "end" in event else start_time
+
         return CalendarEventAdapterOutputData(
             calendar_external_id=calendar_id,
             external_id=event["id"],
             title=event.get("summary", ""),
             description=event.get("description", ""),
-            start_time=self._parse_google_datetime(event["start"]),
-            end_time=self._parse_google_datetime(event["end"]),
+            start_time=start_time,
+            end_time=end_time,
             timezone=event.get("start", {}).get("timeZone")
             or event.get("end", {}).get("timeZone")
             or "UTC",
@@ -412,36 +531,61 @@ class GoogleCalendarAdapter(CalendarAdapter):
         sync_token: str | None = None,
         max_results_per_page: int = 250,
     ) -> CalendarEventsSyncTypedDict:
-        extra_kwargs: dict[str, Any] = {"maxResults": max_results_per_page}
+        """List a calendar's events, one API page at a time.
+
+        Without ``sync_token`` this lists the ``start_date``..``end_date`` window; with
+        it, only what changed since the token was issued (deleted events included,
+        as ``cancelled``). Google rejects a sync token combined with ``timeMin`` /
+        ``timeMax`` / ``orderBy``, so incremental requests omit them.
+
+        ``next_sync_token`` is only known once Google serves the last page: it is
+        ``None`` in the returned dict until ``events`` has been exhausted, and is
+        filled in then.
+
+        :raises SyncTokenExpiredError: While iterating, if Google answers
+            ``410 Gone`` for ``sync_token``.
+        """
+        list_kwargs: dict[str, Any] = {
+            "calendarId": calendar_id,
+            "maxResults": max_results_per_page,
+        }
 
         if sync_token:
-            extra_kwargs["syncToken"] = sync_token
-            extra_kwargs["showDeleted"] = True
+            list_kwargs["syncToken"] = sync_token
+            list_kwargs["showDeleted"] = True
+        else:
+            list_kwargs["timeMin"] = start_date.isoformat()
+            list_kwargs["timeMax"] = end_date.isoformat()
+            list_kwargs["orderBy"] = "startTime"
+
+        result = CalendarEventsSyncTypedDict(events=(), next_sync_token=None)
 
         # Create a generator that yields events one page at a time
         def events_iterator():
             page_token = None
-            nonlocal next_sync_token
-            next_sync_token = None
 
             while True:
-                current_extra_kwargs = extra_kwargs.copy()
+                current_list_kwargs = list_kwargs.copy()
                 if page_token:
-                    current_extra_kwargs["pageToken"] = page_token
-
-                read_quote_limiter.try_acquire(f"google_calendar_read_{self.account_id}")
-                events_result = (
-                    self.client.events()
-                    .list(
-                        calendarId=calendar_id,
-                        timeMin=start_date.isoformat(),
-                        timeMax=end_date.isoformat(),
-                        singleEvents=True,
-                        orderBy="startTime",
-                        **current_extra_kwargs,
+                    current_list_kwargs["pageToken"] = page_token
+
+                read_quote_limiter.acquire(self.account_id)
+                try:
+                    events_result = (
+                        self.client.events()
+                        .list(singleEvents=True, **current_list_kwargs)
+                        .execute()
                     )
-                    .execute()
-                )
+                except HttpError as e:
+                    if sync_token and e.resp.status == HTTPStatus.GONE:
+                        raise SyncTokenExpiredError() from e
+                    if _is_rate_limit_error(e):
+                        # Google's own meter ran out before ours did: retry later
+                        # rather than fail the sync.
+                        raise ProviderQuotaExceededError(
+                            read_quote_limiter.name, read_quote_limiter.retry_after
+                        ) from e
+                    raise
 
                 # Yield events from current page, skipping non-busy markers
                 # (working-location/birthday/free) so they don't block availability.
@@ -451,20 +595,16 @@ class GoogleCalendarAdapter(CalendarAdapter):
                     yield self._convert_google_calendar_event_to_event_data(event, calendar_id)
 
                 page_token = events_result.get("nextPageToken")
-                next_sync_token = events_result.get("nextSyncToken")
-
                 if not page_token:
+                    # Only the last page carries the token for the next incremental sync.
+                    result["next_sync_token"] = events_result.get("nextSyncToken")
                     break
 
-        next_sync_token = None
-
-        return CalendarEventsSyncTypedDict(
-            events=events_iterator(),
-            next_sync_token=next_sync_token,
-        )
+        result["events"] = events_iterator()
+        return result
 
     def get_event(self, calendar_id: str, event_id: str) -> CalendarEventAdapterOutputData:
-        read_quote_limiter.try_acquire(f"google_calendar_read_{self.account_id}")
+        read_quote_limiter.acquire(self.account_id)
         event = self.client.events().get(calendarId=calendar_id, eventId=event_id).execute()
         return CalendarEventAdapterOutputData(
             calendar_external_id=calendar_id,
@@ -508,12 +648,14 @@ class GoogleCalendarAdapter(CalendarAdapter):
         if hasattr(event_data, "recurrence_rule") and event_data.recurrence_rule:
             event["recurrence"] = [f"RRULE:{event_data.recurrence_rule}"]
 
-        write_quote_limiter.try_acquire(f"google_calendar_write_{self.account_id}")
-        updated_event = (
-            self.client.events()
-            .update(calendarId=calendar_id, eventId=event_id, body=event)
-            .execute()
-        )
+        write_quote_limiter.acquire(self.account_id)
+        request = self.client.events().update(calendarId=calendar_id, eventId=event_id, body=event)
+        if self._write_batch is not None:
+            # Deferred until the batch runs: the sent body stands in for the response.
+            self._write_batch.append(request)
+            updated_event = {"id": event_id, **event}
+        else:
+            updated_event = request.execute()
 
         # Extract recurrence rule from response if present
         recurrence_rule = None
@@ -546,8 +688,84 @@ class GoogleCalendarAdapter(CalendarAdapter):
         )
 
     def delete_event(self, calendar_id: str, event_id: str):
-        write_quote_limiter.try_acquire(f"google_calendar_write_{self.account_id}")
-        self.client.events().delete(calendarId=calendar_id, eventId=event_id).execute()
+        write_quote_limiter.acquire(self.account_id)
+        request = self.client.events().delete(calendarId=calendar_id, eventId=event_id)
+        if self._write_batch is not None:
+            self._write_batch.append(request)
+        else:
+            request.execute()
+
+    @contextlib.contextmanager
+    def batch_writes(self) -> Iterator[None]:
+        """Send the event inserts, updates and deletes made inside the block as
+        ``BatchHttpRequest``s of up to ``GOOGLE_BATCH_MAX_SIZE`` calls each.
+
+        The calls are queued and sent when the block exits, so they return what was
+        sent rather than Google's response: ``create_event`` picks the new event's id
+        itself. Each call still takes its own write-quota permit when it is queued.
+        A nested block joins the outer one. The block only collects the writes made on
+        the thread that opened it; the adapter's other threads keep writing directly.
+
+        :raises HttpError: On exit, the first call Google rejected, once every queued
+            call has been sent. ``ProviderQuotaExceededError`` instead when it was
+            throttled. When the block itself raised, the queued calls are still sent
+            (they would have run before the error without batching) but their
+            failures are only logged; ``discard_writes()`` drops them instead.
+        """
+        if self._write_batch is not None:
+            yield
+            return
+
+        with self._write_batches.collect(self) as pending:
+            try:
+                yield
+            except BaseException:
+                self._execute_write_batch(pending, raise_errors=False)
+                raise
+        self._execute_write_batch(pending, raise_errors=True)
+
+    def discard_writes(self) -> int:
+        """Drop the writes queued by the ``batch_writes()`` block open on this thread."""
+        return self._write_batches.discard(self)
+
+    @property
+    def _write_batch(self) -> list[Any] | None:
+        """The queue of the ``batch_writes()`` block open on this thread, if any."""
+        return self._write_batches.current(self)
+
+    def _execute_write_batch(self, requests: list[Any], *, raise_errors: bool) -> None:
+        if not requests:
+            return
+        errors: list[HttpError] = []
+
+        def _collect(request_id: str, response: Any, exception: Exception | None) -> None:
+            if exception is not None:
+                errors.append(exception)
+
+        # A write fan-out flushes and compensates on pool threads.
+        http = authorized_http(self._credentials, self._transport_key)
+        for chunk in itertools.batched(requests, GOOGLE_BATCH_MAX_SIZE, strict=False):
+            batch = self.client.new_batch_http_request(callback=_collect)
+            for request in chunk:
+                batch.add(request)
+            batch.execute(http=http)
+
+        if not errors:
+            return
+        logger.warning(
+            "%d of %d batched Google Calendar writes failed for account_id=%s: %s",
+            len(errors),
+            len(requests),
+            self.account_id,
+            errors[0],
+        )
+        if not raise_errors:
+            return
+        if isinstance(errors[0], HttpError) and _is_rate_limit_error(errors[0]):
+            raise ProviderQuotaExceededError(
+                write_quote_limiter.name, write_quote_limiter.retry_after
+            ) from errors[0]
+        raise errors[0]
 
     def get_calendar_resources(self) -> Iterable[CalendarResourceData]:
         """List all Google Workspace resource calendars via the Admin SDK Directory API.
@@ -567,7 +785,7 @@ class GoogleCalendarAdapter(CalendarAdapter):
     def _iter_calendar_resources(self) -> Iterable[CalendarResourceData]:
         page_token: str | None = None
         while True:
-            read_quote_limiter.try_acquire(f"google_calendar_read_{self.account_id}")
+            read_quote_limiter.acquire(self.account_id)
             kwargs: dict[str, Any] = {"customer": "my_customer", "maxResults": 500}
             if page_token:
                 kwargs["pageToken"] = page_token
@@ -597,7 +815,7 @@ class GoogleCalendarAdapter(CalendarAdapter):
             raise NotImplementedError(
                 "get_calendar_resource requires a service-account adapter with admin_client."
             )
-        read_quote_limiter.try_acquire(f"google_calendar_read_{self.account_id}")
+        read_quote_limiter.acquire(self.account_id)
         resource = (
             self.admin_client.resources()
             .calendars()
@@ -614,87 +832,96 @@ class GoogleCalendarAdapter(CalendarAdapter):
             provider=self.provider,
         )
 
-    def _get_paginated_resources(self, page_size=50) -> Iterable[list[CalendarResourceData]]:
-        resources = self.get_calendar_resources()
-        accumulated_resources = []
-        for resource in resources:
-            accumulated_resources.append(resource)
-            if len(accumulated_resources) >= page_size:
-                yield accumulated_resources
-                accumulated_resources = []
+    def _cached_calendar_resources(self) -> list[CalendarResourceData]:
+        """The Workspace's resource list, listed at most once per
+        ``GOOGLE_RESOURCE_LIST_TTL`` per process for a service account.
 
-        # If there are any remaining resources, yield them
-        yield accumulated_resources
+        Adapters without a resource cache key (OAuth ones) list every time.
+        """
+        key = self._resource_cache_key
+        if key is None:
+            return list(self.get_calendar_resources())
+        now = time.monotonic()
+        with _resource_lists_lock:
+            cached = _resource_lists.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        resources = list(self.get_calendar_resources())
+        with _resource_lists_lock:
+            _resource_lists[key] = (now + GOOGLE_RESOURCE_LIST_TTL, resources)
+        return resources
 
     def get_available_calendar_resources(
         self, start_time: datetime.datetime, end_time: datetime.datetime
     ) -> Iterable[CalendarResourceData]:
-        # For very long date ranges, split into smaller chunks to avoid API limits
-        max_days_per_query = 90  # Google's freebusy API works better with smaller ranges
+        """The Workspace's resource calendars that are free over the whole range.
 
-        # Get all resources first
-        all_resources = list(self.get_calendar_resources())
-        if not all_resources:
+        The resource list is read once (``_cached_calendar_resources``). Freebusy is
+        then asked about every ``GOOGLE_FREEBUSY_MAX_ITEMS`` resources for every
+        ``GOOGLE_FREEBUSY_MAX_DAYS`` of the range, up to
+        ``GOOGLE_FREEBUSY_MAX_CONCURRENCY`` queries at a time; a resource busy in any
+        of them is left out.
+        """
+        resources_by_email = {
+            resource.email: resource
+            for resource in self._cached_calendar_resources()
+            if resource.email
+        }
+        if not resources_by_email:
             return
 
-        # Track which resources are consistently available across all time chunks
-        consistently_available_resources = set(
-            resource.email for resource in all_resources if resource.email
-        )
-
-        # Split the date range into manageable chunks
-        for time_chunk_start, time_chunk_end in self._split_date_range(
-            start_time, end_time, max_days_per_query
-        ):
-            paginated_resources = self._get_paginated_resources()
-
-            for resources_page in paginated_resources:
-                resources_page_by_email = {
-                    resource.email: resource for resource in resources_page if resource.email
-                }
-
-                if not resources_page_by_email:
-                    continue
-
-                # Only check resources that are still potentially available
-                resources_to_check = {
-                    email: resource
-                    for email, resource in resources_page_by_email.items()
-                    if email in consistently_available_resources
+        # Built here, sent from the worker threads.
+        queries = [
+            self.client.freebusy().query(
+                body={
+                    "timeMin": chunk_start.isoformat(),
+                    "timeMax": chunk_end.isoformat(),
+                    "items": [{"id": email} for email in emails],
                 }
+            )
+            for chunk_start, chunk_end in self._split_date_range(
+                start_time, end_time, GOOGLE_FREEBUSY_MAX_DAYS
+            )
+            for emails in itertools.batched(
+                resources_by_email, GOOGLE_FREEBUSY_MAX_ITEMS, strict=False
+            )
+        ]
+        if not queries:
+            # An empty range: nothing to be busy in.
+            yield from resources_by_email.values()
+            return
 
-                if not resources_to_check:
-                    continue
-
-                free_busy_page = (
-                    self.client.freebusy()
-                    .query(
-                        body={
-                            "timeMin": time_chunk_start.isoformat(),
-                            "timeMax": time_chunk_end.isoformat(),
-                            "items": [
-                                {"id": resource_email}
-                                for resource_email in resources_to_check.keys()
-                            ],
-                        }
-                    )
-                    .execute()
-                )
-
-                # Remove resources that are busy in this time chunk
-                for resource_email, free_busy_data in free_busy_page.get("calendars", {}).items():
-                    busy_times = free_busy_data.get("busy", [])
-                    if busy_times:
-                        # Resource is busy in this chunk, remove from available set
-                        consistently_available_resources.discard(resource_email)
-
-        # Yield resources that are available across the entire date range
-        resources_by_email = {
-            resource.email: resource for resource in all_resources if resource.email
-        }
-        for resource_email in consistently_available_resources:
-            if resource_email in resources_by_email:
-                yield resources_by_email[resource_email]
+        busy_emails: set[str] = set()
+        with ThreadPoolExecutor(
+            max_workers=min(GOOGLE_FREEBUSY_MAX_CONCURRENCY, len(queries)),
+            thread_name_prefix="google-freebusy",
+        ) as executor:
+            for busy in executor.map(self._busy_calendars, queries):
+                busy_emails.update(busy)
+
+        for email, resource in resources_by_email.items():
+            if email not in busy_emails:
+                yield resource
+
+    def _busy_calendars(self, freebusy_query: Any) -> list[str]:
+        """Send one freebusy query on this thread's transport; the calendars it found
+        busy."""
+        read_quote_limiter.acquire(self.account_id)
+        try:
+            result = freebusy_query.execute(
+                http=authorized_http(self._credentials, self._transport_key)
+            )
+        except HttpError as e:
+            if _is_rate_limit_error(e):
+                raise ProviderQuotaExceededError(
+                    read_quote_limiter.name, read_quote_limiter.retry_after
+                ) from e
+            raise
+        return [
+            email
+            for email, free_busy in result.get("calendars", {}).items()
+            if free_busy.get("busy")
+        ]
 
     def _split_date_range(
         self, start_time: datetime.datetime, end_time: datetime.datetime, max_days: int
@@ -720,7 +947,7 @@ class GoogleCalendarAdapter(CalendarAdapter):
                 "ttl": 3600,  # Time to live for the subscription in seconds
             },
         }
-        write_quote_limiter.try_acquire(f"google_calendar_write_{self.account_id}")
+        write_quote_limiter.acquire(self.account_id)
         self.client.events().watch(calendarId=resource_id, body=body).execute()
 
     def unsubscribe_from_calendar_events(self, resource_id: str) -> None:
@@ -728,7 +955,7 @@ class GoogleCalendarAdapter(CalendarAdapter):
         Unsubscribes from calendar events for a specific resource.
         This method deletes the push notification channel for the calendar events.
         """
-        write_quote_limiter.try_acquire(f"google_calendar_write_{self.account_id}")
+        write_quote_limiter.acquire(self.account_id)
         try:
             self.client.channels().stop(body={"id": f"{resource_id}-subscription"}).execute()
         except Exception as e:  # noqa: BLE001
@@ -856,8 +1083,13 @@ class GoogleCalendarAdapter(CalendarAdapter):
             },
         }
 
-        write_quote_limiter.try_acquire(f"google_calendar_write_{self.account_id}")
-        response = self.client.events().watch(calendarId=resource_id, body=body).execute()
+        write_quote_limiter.acquire(self.account_id)
+        # On this thread's transport: ``renew_subscriptions`` renews on several threads.
+        response = (
+            self.client.events()
+            .watch(calendarId=resource_id, body=body)
+            .execute(http=authorized_http(self._credentials, self._transport_key))
+        )
 
         return {
             "channel_id": response.get("id"),
@@ -867,3 +1099,44 @@ class GoogleCalendarAdapter(CalendarAdapter):
             "calendar_id": resource_id,
             "callback_url": callback_url,
         }
+
+    def renew_webhook_subscription(
+        self,
+        subscription_id: str,
+        resource_id: str,
+        callback_url: str,
+        provider_resource_id: str = "",
+        tracking_params: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Renew a push notification channel.
+
+        Google channels cannot be extended: a new channel is opened on the calendar
+        first, so no notification falls between the two, then the old one is stopped.
+        A failed stop is only logged -- the old channel lapses at its own expiration,
+        and its notifications until then find no subscription to match. Both requests
+        run on the calling thread's transport, so renewals can run concurrently.
+
+        Args:
+            subscription_id: ID of the channel to replace
+            resource_id: Google Calendar ID the channel watches
+            callback_url: URL to receive webhook notifications
+            provider_resource_id: Google's ``resourceId`` of the old channel
+            tracking_params: As ``create_webhook_subscription_with_tracking``'s
+
+        Returns:
+            The new channel's details, as ``create_webhook_subscription_with_tracking``
+        """
+        renewed = self.create_webhook_subscription_with_tracking(
+            resource_id=resource_id,
+            callback_url=callback_url,
+            tracking_params=tracking_params,
+        )
+        write_quote_limiter.acquire(self.account_id)
+        try:
+            self.client.channels().stop(
+                body={"id": subscription_id, "resourceId": provider_resource_id}
+            ).execute(http=authorized_http(self._credentials, self._transport_key))
+        except HttpError as e:
+            logger.warning("Could not stop renewed Google channel %s: %s", subscription_id, e)
+        return renewed
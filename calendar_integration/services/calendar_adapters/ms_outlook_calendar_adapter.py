@@ -16,14 +16,17 @@ Implementation Notes:
 - Handles both primary calendar ("primary") and specific calendar IDs
 - Logs subscription creation/deletion for monitoring
 - Raises ValueError on subscription failures with meaningful error messages
+- batch_writes() defers event updates and deletes into Graph JSON batches
 """
 
+import contextlib
 import datetime
 import json
 import logging
 import re
 import uuid
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from http import HTTPStatus
 from typing import Any, ClassVar, Literal, TypedDict, TypeGuard
 
 from django.conf import settings
@@ -31,9 +34,15 @@ from django.core.exceptions import ImproperlyConfigured
 from django.http import HttpHeaders, HttpRequest
 
 from calendar_integration.constants import CalendarProvider
-from calendar_integration.exceptions import WebhookProcessingFailedError
+from calendar_integration.exceptions import (
+    ProviderQuotaExceededError,
+    SyncTokenExpiredError,
+    WebhookProcessingFailedError,
+)
+from calendar_integration.services.calendar_adapters.write_batches import OpenWriteBatches
 from calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client import (
     MSGraphAPIError,
+    MSGraphBatchRequest,
     MSGraphEvent,
     MSOutlookCalendarAPIClient,
 )
@@ -44,6 +53,7 @@ from calendar_integration.services.dataclasses import (
     CalendarEventsSyncTypedDict,
     CalendarResourceData,
     EventAttendeeData,
+    RefreshedOAuthToken,
 )
 from calendar_integration.services.protocols.calendar_adapter import CalendarAdapter
 
@@ -140,6 +150,8 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
         "declined": "declined",
         "notResponded": "pending",
     }
+    # Event writes queued by the open ``batch_writes()`` blocks, per adapter and thread.
+    _write_batches: ClassVar[OpenWriteBatches[MSGraphBatchRequest]] = OpenWriteBatches()
 
     def __init__(self, credentials_dict: MSOutlookCredentialTypedDict):
         ms_client_id = getattr(settings, "MS_CLIENT_ID", None)
@@ -151,7 +163,9 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
             )
 
         # Initialize the API client with the access token
-        self.client = MSOutlookCalendarAPIClient(access_token=credentials_dict["token"])
+        self.client = MSOutlookCalendarAPIClient(
+            access_token=credentials_dict["token"], quota_key=credentials_dict["account_id"]
+        )
 
         # Store refresh token for potential token refresh
         self.refresh_token = credentials_dict["refresh_token"]
@@ -160,6 +174,34 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
         if not self.client.test_connection():
             raise ValueError("Invalid or expired Microsoft Graph credentials provided.")
 
+    @staticmethod
+    def refresh_access_token(refresh_token: str) -> RefreshedOAuthToken:
+        """
+        Exchange a refresh token for a new access token.
+
+        Called through ``calendar_integration.oauth_tokens.fresh_social_token``, once
+        per expiry window for every worker. Microsoft rotates refresh tokens: the new
+        one is returned for the broker to store.
+        """
+        ms_client_id = getattr(settings, "MS_CLIENT_ID", None)
+        ms_client_secret = getattr(settings, "MS_CLIENT_SECRET", None)
+        if not ms_client_id or not ms_client_secret:
+            raise ImproperlyConfigured(
+                "Microsoft Calendar integration requires MS_CLIENT_ID and MS_CLIENT_SECRET settings."
+            )
+        try:
+            response = MSOutlookCalendarAPIClient.refresh_access_token(
+                ms_client_id, ms_client_secret, refresh_token
+            )
+        except MSGraphAPIError as e:
+            raise ValueError(f"Microsoft token refresh failed: {e}") from e
+        return RefreshedOAuthToken(
+            token=response["access_token"],
+            expires_at=datetime.datetime.now(datetime.UTC)
+            + datetime.timedelta(seconds=int(response.get("expires_in", 3600))),
+            refresh_token=response.get("refresh_token"),
+        )
+
     @staticmethod
     def parse_webhook_headers(headers: HttpHeaders) -> dict[str, str]:
         """
@@ -492,21 +534,28 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
         sync_token: str | None = None,
         max_results_per_page: int = 250,
     ) -> CalendarEventsSyncTypedDict:
-        """Get events from the calendar with optional sync token for incremental sync."""
+        """Get events from the calendar with optional sync token for incremental sync.
+
+        ``next_sync_token`` is ``None`` in the returned dict until ``events`` has been
+        exhausted; the iterator fills it in as it finishes, so a sync that stops half
+        way never sees (and never persists) a token for changes it did not apply.
+        The token lives on the returned dict, never on the adapter, so concurrent
+        listings through one adapter cannot hand each other their tokens.
+
+        :raises SyncTokenExpiredError: While iterating, if Graph answers ``410 Gone``
+            for ``sync_token``.
+        """
         try:
             if calendar_is_resource:
                 return self._get_room_events_sync_result(
                     calendar_id, start_date, end_date, sync_token, max_results_per_page
                 )
 
-            events_iterator = self._create_calendar_events_iterator(
-                calendar_id, start_date, end_date, sync_token, max_results_per_page
-            )
-
-            return CalendarEventsSyncTypedDict(
-                events=events_iterator,
-                next_sync_token=getattr(self, "_next_sync_token", None),
+            result = CalendarEventsSyncTypedDict(events=(), next_sync_token=None)
+            result["events"] = self._create_calendar_events_iterator(
+                calendar_id, start_date, end_date, sync_token, max_results_per_page, result
             )
+            return result
 
         except MSGraphAPIError as e:
             raise ValueError(f"Failed to get events: {e}") from e
@@ -519,12 +568,19 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
         sync_token: str | None,
         max_results_per_page: int,
     ) -> CalendarEventsSyncTypedDict:
-        """Handle room events and return sync result."""
+        """Handle room events and return sync result.
+
+        An incremental sync reads the delta round ``sync_token`` resumes and carries
+        the token of the next one; a full sync lists the window and carries none.
+        """
+        if sync_token:
+            return self.get_room_events_delta(
+                calendar_id, start_date, end_date, sync_token, max_results_per_page
+            )
         room_events = self._get_room_events(
             room_email=calendar_id,
             start_time=start_date,
             end_time=end_date,
-            sync_token=sync_token,
             max_results_per_page=max_results_per_page,
         )
         return CalendarEventsSyncTypedDict(
@@ -532,6 +588,68 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
             next_sync_token=None,
         )
 
+    def get_room_events_delta(
+        self,
+        room_email: str,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        sync_token: str | None = None,
+        max_results_per_page: int = 250,
+    ) -> CalendarEventsSyncTypedDict:
+        """Read one delta round of a room's calendar view to its end.
+
+        Without ``sync_token`` the round starts over ``start_date`` .. ``end_date``:
+        every event of the window, and a token for the changes after it. Unlike
+        ``get_events`` the events come back as a list, already fetched, and the token
+        is set on return; ``calendar_integration.outlook_room_sync`` runs these rounds
+        on worker threads and applies them afterwards.
+
+        :param sync_token: A ``$deltatoken=``-prefixed token of a finished round, as
+            this returns it, or a bare skip token of a round still in progress.
+        :raises SyncTokenExpiredError: If Graph answers ``410 Gone`` for ``sync_token``.
+        """
+        events: list[CalendarEventAdapterOutputData] = []
+        page_token = sync_token
+        while True:
+            try:
+                if not page_token:
+                    delta_result = self.client.get_room_events_delta(
+                        room_email=room_email,
+                        start_time=start_date,
+                        end_time=end_date,
+                        max_page_size=max_results_per_page,
+                    )
+                elif page_token.startswith("$deltatoken="):
+                    delta_result = self.client.get_room_events_delta(
+                        room_email=room_email,
+                        start_time=start_date,
+                        end_time=end_date,
+                        delta_token=page_token.removeprefix("$deltatoken="),
+                        max_page_size=max_results_per_page,
+                    )
+                else:
+                    delta_result = self.client.get_room_events_delta(
+                        room_email=room_email,
+                        start_time=start_date,
+                        end_time=end_date,
+                        skip_token=page_token,
+                        max_page_size=max_results_per_page,
+                    )
+            except MSGraphAPIError as e:
+                if e.status_code == HTTPStatus.GONE:
+                    raise SyncTokenExpiredError() from e
+                raise ValueError(f"Failed to get room events: {e}") from e
+
+            events.extend(
+                self._convert_ms_graph_event_to_calendar_event_data(event)
+                for event in delta_result["events"]
+            )
+            page_token = self._extract_next_page_token(delta_result)
+            if not page_token:
+                return CalendarEventsSyncTypedDict(
+                    events=events, next_sync_token=self._extract_next_sync_token(delta_result)
+                )
+
     def _create_calendar_events_iterator(
         self,
         calendar_id: str,
@@ -539,38 +657,45 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
         end_date: datetime.datetime,
         sync_token: str | None,
         max_results_per_page: int,
+        result: CalendarEventsSyncTypedDict,
     ):
-        """Create a memory-efficient iterator that paginates through calendar events."""
-        # This will be set by the iterator methods
-        self._next_sync_token: str | None = None
+        """Create a memory-efficient iterator that paginates through calendar events.
 
+        The iterator stores the token for the next incremental sync in
+        ``result["next_sync_token"]`` once it is exhausted.
+        """
         if sync_token:
             return self._create_delta_events_iterator(
-                calendar_id, start_date, end_date, sync_token, max_results_per_page
-            )
-        else:
-            iterator = self._create_initial_sync_events_iterator(
-                calendar_id, start_date, end_date, max_results_per_page
+                calendar_id, start_date, end_date, sync_token, max_results_per_page, result
             )
-            # For initial sync, try to get a delta token for future syncs
-            self._set_initial_sync_token(calendar_id, start_date, end_date)
-            return iterator
+        # For initial sync, get a delta token for future syncs before listing, so
+        # changes made while the listing runs are replayed by the next delta sync.
+        initial_sync_token = self._get_initial_sync_token(calendar_id, start_date, end_date)
+        iterator = self._create_initial_sync_events_iterator(
+            calendar_id, start_date, end_date, max_results_per_page
+        )
+
+        def publish_token_when_exhausted():
+            yield from iterator
+            result["next_sync_token"] = initial_sync_token
 
-    def _set_initial_sync_token(
+        return publish_token_when_exhausted()
+
+    def _get_initial_sync_token(
         self,
         calendar_id: str,
         start_date: datetime.datetime,
         end_date: datetime.datetime,
-    ) -> None:
-        """Set the sync token for initial sync."""
+    ) -> str | None:
+        """Get the sync token a future incremental sync of this window starts from."""
         try:
             initial_delta = self.client.get_events_delta(
                 start_time=start_date, end_time=end_date, calendar_id=calendar_id
             )
-            self._next_sync_token = self._extract_next_sync_token(initial_delta)
+            return self._extract_next_sync_token(initial_delta)
         except MSGraphAPIError:
             # Delta queries might not be available for all calendars
-            self._next_sync_token = None
+            return None
 
     def _create_delta_events_iterator(
         self,
@@ -579,28 +704,40 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
         end_date: datetime.datetime,
         sync_token: str,
         max_results_per_page: int,
+        result: CalendarEventsSyncTypedDict | None = None,
     ):
-        """Create iterator for delta query (incremental sync) events."""
+        """Create iterator for delta query (incremental sync) events.
+
+        ``sync_token`` is either a ``$deltatoken=``-prefixed delta token (a finished
+        round, as ``_extract_next_sync_token`` returns it) or a bare skip token (a
+        round still in progress). The final delta token is stored in
+        ``result["next_sync_token"]`` once the last page has been read.
+        """
         page_token: str | None = sync_token
 
         while page_token:
             # Get delta result based on token type
-            if "$deltatoken=" in page_token:
-                delta_result = self.client.get_events_delta(
-                    start_time=start_date,
-                    end_time=end_date,
-                    delta_token=page_token,
-                    calendar_id=calendar_id,
-                    max_page_size=max_results_per_page,
-                )
-            else:
-                delta_result = self.client.get_events_delta(
-                    start_time=start_date,
-                    end_time=end_date,
-                    skip_token=page_token,
-                    calendar_id=calendar_id,
-                    max_page_size=max_results_per_page,
-                )
+            try:
+                if page_token.startswith("$deltatoken="):
+                    delta_result = self.client.get_events_delta(
+                        start_time=start_date,
+                        end_time=end_date,
+                        delta_token=page_token.removeprefix("$deltatoken="),
+                        calendar_id=calendar_id,
+                        max_page_size=max_results_per_page,
+                    )
+                else:
+                    delta_result = self.client.get_events_delta(
+                        start_time=start_date,
+                        end_time=end_date,
+                        skip_token=page_token,
+                        calendar_id=calendar_id,
+                        max_page_size=max_results_per_page,
+                    )
+            except MSGraphAPIError as e:
+                if e.status_code == HTTPStatus.GONE:
+                    raise SyncTokenExpiredError() from e
+                raise
 
             # Yield events from current page
             for event in delta_result["events"]:
@@ -612,7 +749,8 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
                 page_token = next_page_token
             else:
                 # No more pages, extract final sync token
-                self._next_sync_token = self._extract_next_sync_token(delta_result)
+                if result is not None:
+                    result["next_sync_token"] = self._extract_next_sync_token(delta_result)
                 page_token = None
 
     def _create_initial_sync_events_iterator(
@@ -659,13 +797,17 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
         return None
 
     def _extract_next_sync_token(self, delta_result: dict[str, Any]) -> str | None:
-        """Extract the next sync token from delta query result."""
+        """Extract the next sync token from delta query result.
+
+        Delta tokens keep their ``$deltatoken=`` prefix so ``_create_delta_events_iterator``
+        can tell them from skip tokens when the stored token comes back.
+        """
         # Check for delta link (indicates end of sync)
         if delta_result.get("delta_link"):
             delta_link = delta_result["delta_link"]
             # Extract deltatoken parameter from the URL
             if "$deltatoken=" in delta_link:
-                return delta_link.split("$deltatoken=")[1].split("&")[0]
+                return "$deltatoken=" + delta_link.split("$deltatoken=")[1].split("&")[0]
 
         # Check for next link (indicates more pages)
         if delta_result.get("next_link"):
@@ -702,6 +844,30 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
                     }
                 )
 
+            if self._write_batch is not None:
+                request = self.client.update_event_request(
+                    event_id=event_id,
+                    calendar_id=calendar_id,
+                    subject=event_data.title,
+                    body=event_data.description,
+                    start_time=event_data.start_time,
+                    end_time=event_data.end_time,
+                    attendees=attendees,
+                )
+                self._queue_write(self._write_batch, request)
+                # Deferred until the batch runs: what was sent stands in for the response.
+                return CalendarEventAdapterOutputData(
+                    calendar_external_id=calendar_id,
+                    external_id=event_id,
+                    title=event_data.title,
+                    description=event_data.description,
+                    start_time=event_data.start_time,
+                    end_time=event_data.end_time,
+                    timezone=event_data.timezone,
+                    attendees=list(event_data.attendees),
+                    original_payload=request.body,
+                )
+
             ms_event = self.client.update_event(
                 event_id=event_id,
                 calendar_id=calendar_id,
@@ -719,11 +885,91 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
 
     def delete_event(self, calendar_id: str, event_id: str) -> None:
         """Delete an event from the calendar."""
+        if self._write_batch is not None:
+            self._queue_write(
+                self._write_batch, self.client.delete_event_request(event_id, calendar_id)
+            )
+            return
         try:
             self.client.delete_event(event_id, calendar_id)
         except MSGraphAPIError as e:
             raise ValueError(f"Failed to delete event: {e}") from e
 
+    @contextlib.contextmanager
+    def batch_writes(self) -> Iterator[None]:
+        """Send the event updates and deletes made inside the block through Graph JSON
+        batching (``MSOutlookCalendarAPIClient.batch_request``) when the block exits.
+
+        Queued updates return what was sent rather than Graph's response. Creates still
+        run immediately: Graph assigns the new event's id, which callers bind at once.
+        Writes to the same event are chained with ``dependsOn`` so Graph applies them in
+        order. A nested block joins the outer one. The block only collects the writes
+        made on the thread that opened it; the adapter's other threads keep writing
+        directly.
+
+        Raises ValueError on exit for the first write Graph refused, once every queued
+        write has been sent (``ProviderQuotaExceededError`` when it was throttled). When
+        the block itself raised, the queued writes are still sent (they would have run
+        before the error without batching) but their failures are only logged;
+        ``discard_writes()`` drops them instead.
+        """
+        if self._write_batch is not None:
+            yield
+            return
+
+        with self._write_batches.collect(self) as pending:
+            try:
+                yield
+            except BaseException:
+                self._send_write_batch(pending, raise_errors=False)
+                raise
+        self._send_write_batch(pending, raise_errors=True)
+
+    def discard_writes(self) -> int:
+        """Drop the writes queued by the ``batch_writes()`` block open on this thread."""
+        return self._write_batches.discard(self)
+
+    @property
+    def _write_batch(self) -> list[MSGraphBatchRequest] | None:
+        """The queue of the ``batch_writes()`` block open on this thread, if any."""
+        return self._write_batches.current(self)
+
+    @staticmethod
+    def _queue_write(batch: list[MSGraphBatchRequest], request: MSGraphBatchRequest) -> None:
+        request.id = str(len(batch) + 1)
+        previous = next((queued for queued in reversed(batch) if queued.url == request.url), None)
+        if previous is not None:
+            request.depends_on = [previous.id]
+        batch.append(request)
+
+    def _send_write_batch(self, requests: list[MSGraphBatchRequest], *, raise_errors: bool) -> None:
+        if not requests:
+            return
+        try:
+            results = self.client.batch_request(requests)
+        except MSGraphAPIError as e:
+            if not raise_errors:
+                logger.warning("Batched MS Graph event writes failed: %s", e)
+                return
+            if isinstance(e, ProviderQuotaExceededError):
+                raise
+            raise ValueError(f"Failed to write batched events: {e}") from e
+
+        errors = [result for result in results.values() if isinstance(result, Exception)]
+        if not errors:
+            return
+        logger.warning(
+            "%d of %d batched MS Graph event writes failed: %s",
+            len(errors),
+            len(requests),
+            errors[0],
+        )
+        if not raise_errors:
+            return
+        if isinstance(errors[0], ProviderQuotaExceededError):
+            raise errors[0]
+        raise ValueError(f"Failed to write batched events: {errors[0]}") from errors[0]
+
     def get_calendar_resources(self) -> Iterable[CalendarResourceData]:
         """Get all calendar resources (calendars)."""
         try:
@@ -1049,39 +1295,11 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
 
             if sync_token:
                 # Use delta query for incremental sync - handles its own pagination
-                page_token = sync_token
-                while True:
-                    if "$deltatoken=" in page_token:
-                        delta_result = self.client.get_room_events_delta(
-                            room_email=room_email,
-                            start_time=start_time,
-                            end_time=end_time,
-                            delta_token=page_token,
-                            max_page_size=max_results_per_page,
-                        )
-                    else:
-                        delta_result = self.client.get_room_events_delta(
-                            room_email=room_email,
-                            start_time=start_time,
-                            end_time=end_time,
-                            skip_token=page_token,
-                            max_page_size=max_results_per_page,
-                        )
-
-                    # Process current page
-                    for event in delta_result["events"]:
-                        calendar_event = self._convert_ms_graph_event_to_calendar_event_data(event)
-                        calendar_events.append(calendar_event)
-
-                    # Check for next page
-                    if delta_result.get("next_link"):
-                        next_link = delta_result["next_link"]
-                        if "$skiptoken=" in next_link:
-                            page_token = next_link.split("$skiptoken=")[1].split("&")[0]
-                        else:
-                            break
-                    else:
-                        break
+                return list(
+                    self.get_room_events_delta(
+                        room_email, start_time, end_time, sync_token, max_results_per_page
+                    )["events"]
+                )
             else:
                 # For room events without sync token, we need to implement pagination manually
                 # Since get_room_events doesn't support pagination parameters directly,
@@ -1161,6 +1379,49 @@ class MSOutlookCalendarAdapter(CalendarAdapter):
         except MSGraphAPIError as e:
             raise ValueError(f"Failed to create Microsoft webhook subscription: {e}") from e
 
+    def renew_webhook_subscription(
+        self,
+        subscription_id: str,
+        resource_id: str,
+        callback_url: str,
+        provider_resource_id: str = "",
+        tracking_params: dict | None = None,
+    ) -> dict[str, Any]:
+        """
+        Renew a webhook subscription by pushing its expiration back.
+
+        Graph extends a subscription in place, so it keeps its id and client state.
+
+        Args:
+            subscription_id: ID of the subscription to renew
+            resource_id: ID of the calendar resource it watches
+            callback_url: URL it delivers notifications to
+            provider_resource_id: Unused; Graph subscriptions are addressed by id alone
+            tracking_params: Optional dictionary of tracking parameters
+                - expiration_hours: Hours until subscription expires (max 70)
+
+        Returns:
+            Dictionary containing subscription details
+        """
+        expiration_hours = min((tracking_params or {}).get("expiration_hours", 24), 70)
+        expiration = datetime.datetime.now(datetime.UTC) + datetime.timedelta(
+            hours=expiration_hours
+        )
+
+        try:
+            subscription = self.client.update_subscription(subscription_id, expiration)
+        except MSGraphAPIError as e:
+            raise ValueError(f"Failed to renew Microsoft webhook subscription: {e}") from e
+
+        return {
+            "subscription_id": subscription.get("id") or subscription_id,
+            "resource": subscription.get("resource"),
+            "calendar_id": resource_id,
+            "callback_url": callback_url,
+            # Graph rejects an expiration past its limit rather than trimming it.
+            "expiration": expiration.isoformat().replace("+00:00", "Z"),
+        }
+
     def validate_webhook_notification(
         self,
         headers: dict[str, str],
@@ -0,0 +1,53 @@
+"""The write queues of the adapters' open ``batch_writes()`` blocks.
+
+An adapter instance can be used from several threads at once: a cached owner
+adapter, or the sending threads of ``ProviderWriteFanOut``. So a block's queue is
+not kept on the adapter but registered for the thread that opened the block, and
+only that thread's writes join it. A write made on another thread meanwhile runs
+immediately, and its caller sees its outcome.
+"""
+
+import contextlib
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+
+class OpenWriteBatches[T]:
+    """The queue of every open ``batch_writes()`` block, per adapter and thread."""
+
+    def __init__(self) -> None:
+        self._queues: dict[tuple[int, int], list[T]] = {}
+        self._lock = threading.Lock()
+
+    def current(self, adapter: Any) -> list[T] | None:
+        """The queue of the block the calling thread has open on ``adapter``, if any."""
+        with self._lock:
+            return self._queues.get((id(adapter), threading.get_ident()))
+
+    def discard(self, adapter: Any) -> int:
+        """Empty the queue the calling thread has open on ``adapter``; return its size."""
+        with self._lock:
+            queue = self._queues.get((id(adapter), threading.get_ident()))
+            if queue is None:
+                return 0
+            discarded = len(queue)
+            queue.clear()
+            return discarded
+
+    @contextlib.contextmanager
+    def collect(self, adapter: Any) -> Iterator[list[T]]:
+        """Register a new queue for the calling thread until the block exits.
+
+        The block may exit on another thread (``ProviderWriteFanOut`` sends its
+        batches from worker threads); the queue it drops is still the opener's.
+        """
+        key = (id(adapter), threading.get_ident())
+        queue: list[T] = []
+        with self._lock:
+            self._queues[key] = queue
+        try:
+            yield queue
+        finally:
+            with self._lock:
+                self._queues.pop(key, None)
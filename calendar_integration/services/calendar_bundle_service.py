@@ -54,6 +54,7 @@ from vinta_billing.exceptions import OverLimitError
 from audit.constants import AuditAction, AuditActorType
 from audit.diff import compute_diff
 from calendar_integration.constants import CalendarProvider, CalendarType
+from calendar_integration.exceptions import BundleEventWriteError
 from calendar_integration.models import (
     BlockedTime,
     Calendar,
@@ -82,10 +83,12 @@ from users.models import User
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from contextlib import AbstractContextManager
 
     from calendar_integration.services.calendar_service_context import CalendarServiceContext
     from calendar_integration.services.dataclasses import AvailableTimeWindow
     from calendar_integration.services.protocols.calendar_adapter import CalendarAdapter
+    from calendar_integration.services.write_fan_out import ProviderWriteFanOut
 
 
 class BundleServiceHost(Protocol):
@@ -136,6 +139,8 @@ class BundleServiceHost(Protocol):
 
     def _get_write_adapter_for_calendar(self, calendar: Calendar) -> CalendarAdapter | None: ...
 
+    def _fan_out_provider_writes(self) -> AbstractContextManager[ProviderWriteFanOut]: ...
+
     def _grant_calendar_owner_permissions(self, calendar: Calendar) -> None: ...
 
 
@@ -425,11 +430,17 @@ class CalendarBundleService:
         4. Creating CalendarEvent entries in INTERNAL calendars
         5. Adding users from non-primary calendars as attendees
 
+        The provider writes -- the primary's copy, as the other children get rows --
+        go through ``host._fan_out_provider_writes``: queued until every row is
+        written, then sent. A failure on the way discards them unsent.
+
         :param bundle_calendar: The bundle Calendar instance.
         :param event_data: Event creation data.
         :return: The created primary CalendarEvent.
         :raises ValueError: If the calendar is not a bundle, has no children, or
             any child has no availability in the requested time window.
+        :raises BundleEventWriteError: If a provider rejected some of the copies. The
+            copies that went out are deleted again; the error rolls the rows back.
         """
         context = cast("BaseCalendarService", self._context)
         if not is_initialized_or_authenticated_calendar_service(context):
@@ -500,68 +511,86 @@ class CalendarBundleService:
             recurrence_rule=event_data.recurrence_rule,
         )
 
-        # Policy was already enforced once at the top-level CalendarService.create_event
-        # entry (using resolve_for_bundle). Skip re-enforcement for all child creates to
-        # avoid: (a) N redundant policy resolutions and buffer fetches, and (b) false
-        # rejections when a child has its own stricter individual policy that would block
-        # a booking the bundle policy (and slot discovery) correctly permits.
-        primary_event = self._host.create_event(
-            primary_calendar.id,
-            primary_event_data,
-            _enforce_policy=False,
-            _check_postpaid_allowance=False,
-        )
-
-        # Mark primary event as part of bundle
-        primary_event.bundle_calendar = bundle_calendar
-        primary_event.is_bundle_primary = True
-        primary_event.save()
-
-        # Create representations in other calendars
-        for child_calendar in child_calendars:
-            if child_calendar.id == primary_calendar.id:
-                continue
-
-            if self._child_gets_full_event(child_calendar):
-                # Create full CalendarEvent for internal calendars
-                child_event_data = CalendarEventInputData(
-                    title=f"[Bundle] {event_title}",
-                    description=f"Bundle event from {bundle_calendar.name}\n\n{event_description}",
-                    start_time=event_data.start_time,
-                    end_time=event_data.end_time,
-                    timezone=event_data.timezone,
-                    attendances=[],  # No direct attendances for linked events
-                    external_attendances=[],
-                    resource_allocations=[],
-                )
-
-                child_event = self._host.create_event(
-                    child_calendar.id,
-                    child_event_data,
+        # Each provider copy is queued in its account's batch as its row is written;
+        # the batches only go out once every row is, when the block exits.
+        created_events: list[CalendarEvent] = []
+        try:
+            with self._host._fan_out_provider_writes() as fan_out:
+                # Policy was already enforced once at the top-level
+                # CalendarService.create_event entry (using resolve_for_bundle). Skip
+                # re-enforcement for all child creates to avoid: (a) N redundant policy
+                # resolutions and buffer fetches, and (b) false rejections when a child
+                # has its own stricter individual policy that would block a booking the
+                # bundle policy (and slot discovery) correctly permits.
+                primary_event = self._host.create_event(
+                    primary_calendar.id,
+                    primary_event_data,
                     _enforce_policy=False,
                     _check_postpaid_allowance=False,
                 )
-
-                # Link to primary event and bundle
-                child_event.bundle_calendar = bundle_calendar
-                child_event.bundle_primary_event = primary_event
-                child_event.save()
-
-            else:
-                # Create BlockedTime for other PROVIDER calendars
-                BlockedTime.objects.create(
-                    calendar=child_calendar,
-                    start_time_tz_unaware=_convert_naive_utc_datetime_to_timezone(
-                        event_data.start_time, event_data.timezone
-                    ),
-                    end_time_tz_unaware=_convert_naive_utc_datetime_to_timezone(
-                        event_data.end_time, event_data.timezone
-                    ),
-                    reason=f"Bundle event: {event_title}",
-                    organization=child_calendar.organization,
-                    bundle_calendar=bundle_calendar,
-                    bundle_primary_event=primary_event,
-                )
+                created_events.append(primary_event)
+
+                # Mark primary event as part of bundle
+                primary_event.bundle_calendar = bundle_calendar
+                primary_event.is_bundle_primary = True
+                primary_event.save()
+
+                # Create representations in other calendars
+                for child_calendar in child_calendars:
+                    if child_calendar.id == primary_calendar.id:
+                        continue
+
+                    if self._child_gets_full_event(child_calendar):
+                        # Create full CalendarEvent for internal calendars
+                        child_event_data = CalendarEventInputData(
+                            title=f"[Bundle] {event_title}",
+                            description=(
+                                f"Bundle event from {bundle_calendar.name}\n\n{event_description}"
+                            ),
+                            start_time=event_data.start_time,
+                            end_time=event_data.end_time,
+                            timezone=event_data.timezone,
+                            attendances=[],  # No direct attendances for linked events
+                            external_attendances=[],
+                            resource_allocations=[],
+                        )
+
+                        child_event = self._host.create_event(
+                            child_calendar.id,
+                            child_event_data,
+                            _enforce_policy=False,
+                            _check_postpaid_allowance=False,
+                        )
+                        created_events.append(child_event)
+
+                        # Link to primary event and bundle
+                        child_event.bundle_calendar = bundle_calendar
+                        child_event.bundle_primary_event = primary_event
+                        child_event.save()
+
+                    else:
+                        # Create BlockedTime for other PROVIDER calendars
+                        BlockedTime.objects.create(
+                            calendar=child_calendar,
+                            start_time_tz_unaware=_convert_naive_utc_datetime_to_timezone(
+                                event_data.start_time, event_data.timezone
+                            ),
+                            end_time_tz_unaware=_convert_naive_utc_datetime_to_timezone(
+                                event_data.end_time, event_data.timezone
+                            ),
+                            reason=f"Bundle event: {event_title}",
+                            organization=child_calendar.organization,
+                            bundle_calendar=bundle_calendar,
+                            bundle_primary_event=primary_event,
+                        )
+        except Exception:
+            # Leaving the block discarded what had been queued; only a write the
+            # provider could not defer went out, and is taken back.
+            fan_out.compensate(created_events)
+            raise
+        if failures := fan_out.failures:
+            fan_out.compensate(created_events)
+            raise BundleEventWriteError(fan_out.results) from failures[0].error
 
         self._audit_bundle_write(AuditAction.CREATE, primary_event)
 
@@ -628,23 +657,29 @@ class CalendarBundleService:
             bundle_primary_event=bundle_event,
         )
 
-        for representation_event in representation_events:
-            representation_data = CalendarEventInputData(
-                title=f"[Bundle] {effective_title}",
-                description=f"Bundle event from {bundle_calendar.name}\n\n{effective_description}",
-                start_time=event_data.start_time,
-                end_time=event_data.end_time,
-                timezone=event_data.timezone,
-                attendances=[],
-                external_attendances=[],
-                resource_allocations=[],
-            )
+        # One batch per account the representations are written through, the batches
+        # sent concurrently, rather than one request per child calendar.
+        with self._host._fan_out_provider_writes() as fan_out:
+            for representation_event in representation_events:
+                representation_data = CalendarEventInputData(
+                    title=f"[Bundle] {effective_title}",
+                    description=(
+                        f"Bundle event from {bundle_calendar.name}\n\n{effective_description}"
+                    ),
+                    start_time=event_data.start_time,
+                    end_time=event_data.end_time,
+                    timezone=event_data.timezone,
+                    attendances=[],
+                    external_attendances=[],
+                    resource_allocations=[],
+                )
 
-            self._host.update_event(
-                representation_event.calendar.id,
-                representation_event.id,
-                representation_data,
-            )
+                self._host.update_event(
+                    representation_event.calendar.id,
+                    representation_event.id,
+                    representation_data,
+                )
+        fan_out.raise_for_failures()
 
         # Update all blocked time representations
         blocked_time_representations = BlockedTime.objects.filter_by_organization(
@@ -700,8 +735,10 @@ class CalendarBundleService:
             bundle_primary_event=bundle_event,
         )
 
-        for representation_event in representation_events:
-            self._host.delete_event(representation_event.calendar.id, representation_event.id)
+        with self._host._fan_out_provider_writes() as fan_out:
+            for representation_event in representation_events:
+                self._host.delete_event(representation_event.calendar.id, representation_event.id)
+        fan_out.raise_for_failures()
 
         # Delete all blocked time representations
         BlockedTime.objects.filter_by_organization(context.organization.id).filter(
@@ -0,0 +1,103 @@
+"""Google API client construction shared across adapters.
+
+``googleapiclient.discovery.build`` reads and parses the API's discovery document and
+opens a fresh HTTP transport on every call, and ``GoogleCalendarAdapter`` is built per
+request and per task -- parsing the Calendar document alone costs several
+milliseconds each time, and every adapter started over with cold connections.
+
+:func:`build_google_client` parses each bundled discovery document once per process
+and builds the client from it (``build_from_document`` is cheap: resources are created
+lazily). Its HTTP transport is keyed by ``cache_key`` -- one per credential -- so the
+adapters of one account keep reusing the same ``httplib2.Http`` and its open
+connections. ``httplib2.Http`` is not thread-safe, so transports are cached per thread,
+each thread keeping the ``GOOGLE_TRANSPORT_CACHE_SIZE`` most recently used; a request
+sent from a worker thread goes through that thread's (:func:`authorized_http`).
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+
+import httplib2
+from google.auth.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
+from googleapiclient.http import build_http
+
+
+GOOGLE_TRANSPORT_CACHE_SIZE = 64
+
+_discovery_documents: dict[tuple[str, str], dict[str, Any]] = {}
+_discovery_documents_lock = threading.Lock()
+_transports = threading.local()
+
+
+def _discovery_document(service_name: str, version: str) -> dict[str, Any]:
+    """The parsed discovery document of an API, loaded on first use.
+
+    The documents ship with ``googleapiclient``; they are only read, never modified,
+    so every thread shares them.
+    """
+    key = (service_name, version)
+    document = _discovery_documents.get(key)
+    if document is None:
+        with _discovery_documents_lock:
+            document = _discovery_documents.get(key)
+            if document is None:
+                content = discovery_cache.get_static_doc(service_name, version)
+                if content is None:
+                    raise ImproperlyConfigured(
+                        f"No bundled discovery document for Google API {service_name} {version}."
+                    )
+                document = json.loads(content)
+                _discovery_documents[key] = document
+    return document
+
+
+def _transport(cache_key: str) -> httplib2.Http:
+    """This thread's HTTP transport for ``cache_key``, least recently used evicted."""
+    cache: OrderedDict[str, httplib2.Http] | None = getattr(_transports, "cache", None)
+    if cache is None:
+        cache = _transports.cache = OrderedDict()
+    http = cache.get(cache_key)
+    if http is None:
+        http = cache[cache_key] = build_http()
+        if len(cache) > GOOGLE_TRANSPORT_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(cache_key)
+    return http
+
+
+def build_google_client(
+    service_name: str, version: str, *, credentials: Credentials, cache_key: str
+) -> Any:
+    """Build a Google API client from the cached discovery document.
+
+    :param service_name: The API, e.g. ``"calendar"``.
+    :param version: The API version, e.g. ``"v3"``.
+    :param credentials: Authorizes the client's requests; refreshed by the transport
+        when they expire.
+    :param cache_key: Identifies the credential. Clients built with the same key on
+        the same thread share one pooled HTTP transport.
+    :return: The API's ``Resource``, as ``googleapiclient.discovery.build`` returns.
+    """
+    return build_from_document(
+        _discovery_document(service_name, version), http=authorized_http(credentials, cache_key)
+    )
+
+
+def authorized_http(credentials: Credentials, cache_key: str) -> AuthorizedHttp:
+    """This thread's transport for ``cache_key``, authorized with ``credentials``.
+
+    A client's requests run on the transport of the thread that built it. A request
+    executed on another thread must be given this instead
+    (``request.execute(http=authorized_http(...))``).
+    """
+    return AuthorizedHttp(credentials, http=_transport(cache_key))
@@ -24,6 +24,12 @@ Key Features:
 - Comprehensive error handling and logging
 - Resource-specific subscription management
 - Client state validation support
+- JSON batching (batch_request(): up to 20 requests per POST /$batch), used for
+  multi-room subscriptions, room lists and room events, and batched event writes
+- Non-blocking retries: 429 and transient failures honour Retry-After and the
+  RateLimit-Reset throttling header; waits up to MAX_INLINE_RETRY_WAIT seconds are
+  slept in place, longer ones raise ProviderRetryableError for a deferred retry
+- One pooled requests.Session per process, shared by every client instance
 
 Microsoft Graph Requirements:
 - Webhook endpoint must be publicly accessible via HTTPS
@@ -47,33 +53,102 @@ client.unsubscribe_from_calendar_events(subscription["id"])
 """
 
 import datetime
+import email.utils
 import logging
+import threading
 import time
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
+from http import HTTPStatus
 from typing import Any
 
 import requests
 from pyrate_limiter import Duration, Rate
+from requests.adapters import HTTPAdapter
 
-from common.redis import build_resilient_limiter
+from calendar_integration.exceptions import (
+    ProviderQuotaExceededError,
+    ProviderRetryableError,
+    ProviderUnavailableError,
+)
+from calendar_integration.provider_quota import ProviderQuota
 
 
 logger = logging.getLogger(__name__)
 
 
-quote_limiter = build_resilient_limiter(
-    [
-        Rate(10000, Duration.MINUTE * 10),  # 10000 requests every 10 minutes
-        Rate(130000, Duration.SECOND * 10),  # 1000 requests every minute
-    ],
-    bucket_key="ms_outlook_calendar_limiter",
-    max_delay=1000,  # Allow a maximum delay of 1 second for read operations
+# Graph's own two meters: per app across every tenant, and per app per mailbox. A call
+# waits up to ``max_delay`` ms on each bucket, then raises
+# ``ProviderQuotaExceededError`` (see ``calendar_integration.provider_quota``).
+quote_limiter = ProviderQuota(
+    "ms_outlook_calendar",
+    project_rates=[Rate(130000, Duration.SECOND * 10)],  # 130000 requests every 10 seconds
+    account_rates=[Rate(10000, Duration.MINUTE * 10)],  # 10000 requests every 10 minutes
+    max_delay=1000,
 )
 
 
 RETRIES_ON_ERROR = 5
 STATUS_TO_RETRY = {500, 502, 503, 504}  # HTTP status codes to retry on
+# Longest wait, in seconds, a worker sleeps between two attempts. Anything longer is
+# handed back as ``ProviderRetryableError`` so the caller (a Celery retry for syncs)
+# waits without holding the worker slot.
+MAX_INLINE_RETRY_WAIT = 5
+
+# Connection pools of the process-wide session: one pool per host (Graph and the
+# login endpoint), each keeping up to ``GRAPH_POOL_MAXSIZE`` connections alive for
+# the threads of a worker.
+GRAPH_POOL_CONNECTIONS = 4
+GRAPH_POOL_MAXSIZE = 32
+
+# Graph JSON batching takes at most 20 requests per ``POST /$batch``.
+GRAPH_BATCH_MAX_SIZE = 20
+
+_shared_session: requests.Session | None = None
+_shared_session_lock = threading.Lock()
+
+
+def _graph_session() -> requests.Session:
+    """The process-wide pooled session every client sends its requests through.
+
+    Built on first use. It carries no credentials: each client sends its own
+    ``Authorization`` header per request, so clients of different accounts can share
+    connections safely.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=GRAPH_POOL_CONNECTIONS, pool_maxsize=GRAPH_POOL_MAXSIZE
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _shared_session = session
+        return _shared_session
+
+
+def _retry_after_seconds(headers: Mapping[str, Any]) -> float | None:
+    """Seconds Graph asked us to wait, from ``Retry-After`` (delta-seconds or an
+    HTTP date) or the ``RateLimit-Reset`` throttling header; ``None`` when neither is
+    usable.
+    """
+    retry_after = str(headers.get("Retry-After") or "").strip()
+    if retry_after.isdigit():
+        return float(retry_after)
+    if retry_after:
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            retry_at = None
+        if retry_at is not None:
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=datetime.UTC)
+            return max((retry_at - datetime.datetime.now(datetime.UTC)).total_seconds(), 0.0)
+    rate_limit_reset = str(headers.get("RateLimit-Reset") or "").strip()
+    if rate_limit_reset.isdigit():
+        return float(rate_limit_reset)
+    return None
 
 
 @dataclass
@@ -123,6 +198,22 @@ class MSGraphRoom:
     original_payload: dict[str, Any] | None = None
 
 
+@dataclass
+class MSGraphBatchRequest:
+    """One request of a Graph JSON batch (``POST /$batch``).
+
+    ``id`` names the request within its batch. Graph runs a request only after every
+    request in ``depends_on`` succeeded, and only resolves dependencies inside one
+    batch, so ``MSOutlookCalendarAPIClient.batch_request`` never splits a chain.
+    """
+
+    id: str  # noqa: A003
+    method: str
+    url: str
+    body: dict[str, Any] | None = None
+    depends_on: list[str] | None = None
+
+
 class MSGraphAPIError(Exception):
     """Exception raised for Microsoft Graph API errors"""
 
@@ -134,6 +225,32 @@ class MSGraphAPIError(Exception):
         self.response_data = response_data
 
 
+class MSGraphUnavailableError(MSGraphAPIError, ProviderUnavailableError):
+    """Graph kept failing transiently (5xx, connection errors) past the inline retries.
+
+    An ``MSGraphAPIError`` for the adapter's handlers, and a ``ProviderUnavailableError``
+    for callers that defer the retry (the sync tasks).
+    """
+
+    def __init__(self, reason: str, retry_after: float, status_code: int | None = None):
+        ProviderUnavailableError.__init__(self, "MS Graph API", reason, retry_after)
+        self.status_code = status_code
+        self.response_data = None
+
+
+class MSGraphQuotaExceededError(MSGraphAPIError, ProviderQuotaExceededError):
+    """Graph throttled the request (429), or our own Graph bucket is exhausted.
+
+    An ``MSGraphAPIError`` for the adapter's handlers, and a
+    ``ProviderQuotaExceededError`` for callers that defer the retry (the sync tasks).
+    """
+
+    def __init__(self, quota_name: str, retry_after: float, status_code: int | None = None):
+        ProviderQuotaExceededError.__init__(self, quota_name, retry_after)
+        self.status_code = status_code
+        self.response_data = None
+
+
 class MSOutlookCalendarAPIClient:
     """
     Microsoft Graph Calendar API Client for Microsoft Outlook integration.
@@ -144,25 +261,27 @@ class MSOutlookCalendarAPIClient:
     """
 
     BASE_URL = "https://graph.microsoft.com/v1.0"
+    TOKEN_URL = "https://login.microsoftonline.com/common/oauth2/v2.0/token"  # noqa: S105
 
-    def __init__(self, access_token: str, user_id: str | None = None):
+    def __init__(self, access_token: str, user_id: str | None = None, quota_key: str | None = None):
         """
         Initialize the MS Outlook Calendar API client.
 
         Args:
             access_token: OAuth2 access token for Microsoft Graph API
             user_id: Optional user ID. If not provided, 'me' will be used
+            quota_key: Key of the per-account quota bucket this client's calls draw
+                from. Defaults to the user ID.
         """
         self.access_token = access_token
         self.user_id = user_id or "me"
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            }
-        )
+        self.quota_key = quota_key or self.user_id
+        self.session = _graph_session()
+        self.headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
 
     def _make_request(
         self,
@@ -171,6 +290,7 @@ class MSOutlookCalendarAPIClient:
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        quota_weight: int = 1,
     ) -> dict[str, Any]:
         """
         Make HTTP request to Microsoft Graph API with retry logic.
@@ -181,24 +301,32 @@ class MSOutlookCalendarAPIClient:
             params: Query parameters
             data: Request body data
             headers: Additional headers
+            quota_weight: Quota permits the request takes; a batch takes one per
+                request it carries, as Graph meters them individually
 
         Returns:
             Response data as dictionary
 
         Raises:
-            MSGraphAPIError: If the API request fails after all retries
+            MSGraphAPIError: If the API request fails with a non-retryable error
+            ProviderRetryableError: If Graph throttled the request or kept failing
+                transiently and the next attempt is more than MAX_INLINE_RETRY_WAIT
+                seconds away: MSGraphQuotaExceededError for a 429 or an exhausted
+                quota bucket, MSGraphUnavailableError otherwise. Also raised once
+                RETRIES_ON_ERROR retries have been spent in place
         """
         url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
 
-        request_headers = dict(self.session.headers)
+        request_headers = dict(self.headers)
         if headers:
             request_headers.update(headers)
 
-        last_exception = None
-
         for attempt in range(RETRIES_ON_ERROR + 1):  # +1 for the initial attempt
             try:
-                quote_limiter.try_acquire("ms_outlook_calendar")
+                quote_limiter.acquire(self.quota_key, quota_weight)
+            except ProviderQuotaExceededError as e:
+                raise MSGraphQuotaExceededError(e.quota_name, e.retry_after) from e
+            try:
                 response = self.session.request(
                     method=method,
                     url=url,
@@ -207,65 +335,214 @@ class MSOutlookCalendarAPIClient:
                     headers=request_headers,
                     timeout=30,
                 )
+            except requests.RequestException as e:
+                self._wait_before_retry(attempt, None, f"request error: {e!s}")
+                continue
 
-                if response.status_code == 204:  # No Content
-                    return {}
+            if response.status_code == 204:  # No Content
+                return {}
+
+            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                # Graph throttled us despite our own buckets: wait as long as it asks,
+                # in place when that is short, otherwise through the caller.
+                retry_after = _retry_after_seconds(response.headers)
+                self._wait_before_retry(
+                    attempt,
+                    quote_limiter.retry_after if retry_after is None else retry_after,
+                    "throttled",
+                    throttled=True,
+                )
+                continue
 
-                response_data = response.json() if response.content else {}
+            response_data = response.json() if response.content else {}
 
-                if not response.ok:
-                    # Check if this is a retryable status code and we have attempts left
-                    if response.status_code in STATUS_TO_RETRY and attempt < RETRIES_ON_ERROR:
-                        wait_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
-                        logger.warning(
-                            "MS Graph API returned %s (attempt %d/%d). Retrying in %ds...",
-                            response.status_code,
-                            attempt + 1,
-                            RETRIES_ON_ERROR + 1,
-                            wait_time,
-                        )
-                        time.sleep(wait_time)
-                        continue
+            if not response.ok:
+                if response.status_code in STATUS_TO_RETRY:
+                    self._wait_before_retry(
+                        attempt,
+                        _retry_after_seconds(response.headers),
+                        f"status {response.status_code}",
+                        status_code=response.status_code,
+                    )
+                    continue
 
-                    # Not retryable or out of attempts
-                    error_msg = f"MS Graph API error: {response.status_code}"
-                    if "error" in response_data:
-                        error_msg += f" - {response_data['error'].get('message', 'Unknown error')}"
+                error_msg = f"MS Graph API error: {response.status_code}"
+                if "error" in response_data:
+                    error_msg += f" - {response_data['error'].get('message', 'Unknown error')}"
 
-                    logger.error("%s. Response: %s", error_msg, response_data)
-                    raise MSGraphAPIError(error_msg, response.status_code, response_data)
+                logger.error("%s. Response: %s", error_msg, response_data)
+                raise MSGraphAPIError(error_msg, response.status_code, response_data)
 
-                return response_data
+            return response_data
 
-            except requests.RequestException as e:
-                last_exception = e
-                # Retry on request exceptions if we have attempts left
-                if attempt < RETRIES_ON_ERROR:
-                    wait_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
-                    logger.warning(
-                        "Request exception occurred (attempt %d/%d): %s. Retrying in %ds...",
-                        attempt + 1,
-                        RETRIES_ON_ERROR + 1,
-                        e,
-                        wait_time,
-                    )
-                    time.sleep(wait_time)
-                    continue
+        # Fallback raise - ``_wait_before_retry`` raises on the last attempt
+        raise MSGraphAPIError("Unexpected error: request loop completed without returning")
 
-                # Out of attempts, raise the exception
-                logger.error("Request error after %d attempts: %s", RETRIES_ON_ERROR + 1, e)
-                raise MSGraphAPIError(
-                    f"Request failed after {RETRIES_ON_ERROR + 1} attempts: {e!s}"
-                ) from e
+    @staticmethod
+    def _wait_before_retry(
+        attempt: int,
+        retry_after: float | None,
+        reason: str,
+        *,
+        throttled: bool = False,
+        status_code: int | None = None,
+    ) -> None:
+        """
+        Sleep before retrying a failed attempt, or hand the wait to the caller.
 
-        # This should not be reached, but just in case
-        if last_exception:
-            raise MSGraphAPIError(
-                f"Request failed after {RETRIES_ON_ERROR + 1} attempts: {last_exception!s}"
-            ) from last_exception
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            retry_after: Seconds Graph asked us to wait, if it said; exponential
+                backoff (1s, 2s, 4s, ...) otherwise
+            reason: What went wrong, for logs and the raised error
+            throttled: Whether Graph throttled the request (429), which is raised
+                as MSGraphQuotaExceededError
+            status_code: The 5xx status Graph answered with, if it answered
 
-        # Fallback return - should never be reached
-        raise MSGraphAPIError("Unexpected error: request loop completed without returning")
+        Raises:
+            ProviderRetryableError: When the wait is longer than MAX_INLINE_RETRY_WAIT
+                or no retries are left
+        """
+        wait_time = float(2**attempt) if retry_after is None else retry_after
+        if wait_time > MAX_INLINE_RETRY_WAIT or attempt >= RETRIES_ON_ERROR:
+            logger.warning(
+                "MS Graph API %s (attempt %d/%d). Deferring retry by %.0fs.",
+                reason,
+                attempt + 1,
+                RETRIES_ON_ERROR + 1,
+                wait_time,
+            )
+            error: ProviderRetryableError
+            if throttled:
+                error = MSGraphQuotaExceededError(
+                    quote_limiter.name, wait_time, HTTPStatus.TOO_MANY_REQUESTS
+                )
+            else:
+                error = MSGraphUnavailableError(reason, wait_time, status_code)
+            raise error
+        logger.warning(
+            "MS Graph API %s (attempt %d/%d). Retrying in %.0fs...",
+            reason,
+            attempt + 1,
+            RETRIES_ON_ERROR + 1,
+            wait_time,
+        )
+        time.sleep(wait_time)
+
+    def batch_request(
+        self, batch_requests: Iterable[MSGraphBatchRequest]
+    ) -> dict[str, dict[str, Any] | Exception]:
+        """
+        Send requests through Graph JSON batching, up to GRAPH_BATCH_MAX_SIZE per
+        ``POST /$batch``.
+
+        Requests chained through ``depends_on`` always share a batch, in their given
+        order; otherwise requests are packed in the order given.
+
+        Args:
+            batch_requests: The requests, with ids unique among them
+
+        Returns:
+            Each request id mapped to its response body, or to the error it failed
+            with: MSGraphAPIError carrying the item's status and body, or
+            MSGraphQuotaExceededError when Graph throttled the item
+
+        Raises:
+            ValueError: If a request depends on an unknown id, or a dependency chain
+                holds more than GRAPH_BATCH_MAX_SIZE requests
+            MSGraphAPIError: If a ``POST /$batch`` itself fails
+        """
+        batch_requests = list(batch_requests)
+        chains = self._batch_dependency_chains(batch_requests)
+
+        results: dict[str, dict[str, Any] | Exception] = {}
+        chunk: list[MSGraphBatchRequest] = []
+        for chain in chains:
+            if len(chain) > GRAPH_BATCH_MAX_SIZE:
+                raise ValueError(
+                    f"A dependency chain of {len(chain)} requests does not fit in one "
+                    f"Graph batch (max {GRAPH_BATCH_MAX_SIZE})"
+                )
+            if len(chunk) + len(chain) > GRAPH_BATCH_MAX_SIZE:
+                results.update(self._send_batch(chunk))
+                chunk = []
+            chunk.extend(chain)
+        if chunk:
+            results.update(self._send_batch(chunk))
+        return results
+
+    @staticmethod
+    def _batch_dependency_chains(
+        batch_requests: list[MSGraphBatchRequest],
+    ) -> list[list[MSGraphBatchRequest]]:
+        """Group requests linked through ``depends_on``, keeping the given order."""
+        root_by_id = {request.id: request.id for request in batch_requests}
+
+        def _root(request_id: str) -> str:
+            while root_by_id[request_id] != request_id:
+                request_id = root_by_id[request_id]
+            return request_id
+
+        for request in batch_requests:
+            for dependency in request.depends_on or []:
+                if dependency not in root_by_id:
+                    raise ValueError(
+                        f"Batch request {request.id} depends on unknown request {dependency}"
+                    )
+                root_by_id[_root(request.id)] = _root(dependency)
+
+        chains: dict[str, list[MSGraphBatchRequest]] = {}
+        for request in batch_requests:
+            chains.setdefault(_root(request.id), []).append(request)
+        return list(chains.values())
+
+    def _send_batch(
+        self, chunk: list[MSGraphBatchRequest]
+    ) -> dict[str, dict[str, Any] | Exception]:
+        payload = []
+        for request in chunk:
+            item: dict[str, Any] = {"id": request.id, "method": request.method, "url": request.url}
+            if request.body is not None:
+                item["body"] = request.body
+                item["headers"] = {"Content-Type": "application/json"}
+            if request.depends_on:
+                item["dependsOn"] = request.depends_on
+            payload.append(item)
+
+        response = self._make_request(
+            "POST", "/$batch", data={"requests": payload}, quota_weight=len(chunk)
+        )
+        responses = {item.get("id"): item for item in response.get("responses", [])}
+
+        results: dict[str, dict[str, Any] | Exception] = {}
+        for request in chunk:
+            item = responses.get(request.id)
+            if item is None:
+                results[request.id] = MSGraphAPIError(
+                    f"MS Graph batch returned no response for request {request.id}"
+                )
+            else:
+                results[request.id] = self._batch_item_result(item)
+        return results
+
+    @staticmethod
+    def _batch_item_result(item: dict[str, Any]) -> dict[str, Any] | Exception:
+        """Map one ``$batch`` response item the way ``_make_request`` maps a response."""
+        status = item.get("status", 0)
+        body = item.get("body") or {}
+        if HTTPStatus.OK <= status < HTTPStatus.MULTIPLE_CHOICES:
+            return body
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            retry_after = _retry_after_seconds(item.get("headers") or {})
+            return MSGraphQuotaExceededError(
+                quote_limiter.name,
+                quote_limiter.retry_after if retry_after is None else retry_after,
+                status,
+            )
+        error_msg = f"MS Graph API error: {status}"
+        if isinstance(body, dict) and "error" in body:
+            error_msg += f" - {body['error'].get('message', 'Unknown error')}"
+        return MSGraphAPIError(error_msg, status, body)
 
     def _parse_datetime(self, dt_dict: dict[str, str]) -> datetime.datetime:
         """
@@ -582,11 +859,45 @@ class MSOutlookCalendarAPIClient:
         Returns:
             Updated MSGraphEvent object
         """
-        if calendar_id:
-            endpoint = f"/users/{self.user_id}/calendars/{calendar_id}/events/{event_id}"
-        else:
-            endpoint = f"/users/{self.user_id}/events/{event_id}"
+        request = self.update_event_request(
+            event_id,
+            subject=subject,
+            start_time=start_time,
+            end_time=end_time,
+            body=body,
+            location=location,
+            attendees=attendees,
+            calendar_id=calendar_id,
+            timezone=timezone,
+            **kwargs,
+        )
+        response = self._make_request(request.method, request.url, data=request.body)
+        return self._parse_event(response)
+
+    def update_event_request(
+        self,
+        event_id: str,
+        subject: str | None = None,
+        start_time: datetime.datetime | None = None,
+        end_time: datetime.datetime | None = None,
+        body: str | None = None,
+        location: str | None = None,
+        attendees: list[dict[str, Any]] | None = None,
+        calendar_id: str | None = None,
+        timezone: str = "UTC",
+        request_id: str = "1",
+        **kwargs,
+    ) -> MSGraphBatchRequest:
+        """
+        Build the request update_event sends, for batch_request.
+
+        Args:
+            request_id: Id of the request within its batch
+            (the rest as in update_event)
 
+        Returns:
+            The PATCH request
+        """
         event_data: dict[str, Any] = {}
 
         if subject is not None:
@@ -610,8 +921,12 @@ class MSOutlookCalendarAPIClient:
         # Add any additional properties
         event_data.update(kwargs)
 
-        response = self._make_request("PATCH", endpoint, data=event_data)
-        return self._parse_event(response)
+        return MSGraphBatchRequest(
+            id=request_id,
+            method="PATCH",
+            url=self._event_endpoint(event_id, calendar_id),
+            body=event_data,
+        )
 
     def delete_event(self, event_id: str, calendar_id: str | None = None) -> None:
         """
@@ -621,12 +936,30 @@ class MSOutlookCalendarAPIClient:
             event_id: Event ID to delete
             calendar_id: Calendar ID. If None, uses default calendar
         """
-        if calendar_id:
-            endpoint = f"/users/{self.user_id}/calendars/{calendar_id}/events/{event_id}"
-        else:
-            endpoint = f"/users/{self.user_id}/events/{event_id}"
+        self._make_request("DELETE", self._event_endpoint(event_id, calendar_id))
+
+    def delete_event_request(
+        self, event_id: str, calendar_id: str | None = None, request_id: str = "1"
+    ) -> MSGraphBatchRequest:
+        """
+        Build the request delete_event sends, for batch_request.
+
+        Args:
+            event_id: Event ID to delete
+            calendar_id: Calendar ID. If None, uses default calendar
+            request_id: Id of the request within its batch
+
+        Returns:
+            The DELETE request
+        """
+        return MSGraphBatchRequest(
+            id=request_id, method="DELETE", url=self._event_endpoint(event_id, calendar_id)
+        )
 
-        self._make_request("DELETE", endpoint)
+    def _event_endpoint(self, event_id: str, calendar_id: str | None) -> str:
+        if calendar_id:
+            return f"/users/{self.user_id}/calendars/{calendar_id}/events/{event_id}"
+        return f"/users/{self.user_id}/events/{event_id}"
 
     def cancel_event(
         self, event_id: str, comment: str | None = None, calendar_id: str | None = None
@@ -730,7 +1063,7 @@ class MSOutlookCalendarAPIClient:
         Returns:
             Dictionary with 'events', 'next_link', 'delta_link'
         """
-        endpoint = f"/places/{room_email}/calendarView/delta"
+        endpoint = f"/users/{room_email}/calendarView/delta"
 
         params: dict[str, Any] = {}
 
@@ -852,22 +1185,7 @@ class MSOutlookCalendarAPIClient:
         endpoint = f"/places/{room_list_email}/microsoft.graph.roomlist/rooms"
         response = self._make_request("GET", endpoint)
 
-        rooms = []
-        for room_data in response.get("value", []):
-            room = MSGraphRoom(
-                id=room_data["id"],
-                display_name=room_data["displayName"],
-                email_address=room_data["emailAddress"],
-                capacity=room_data.get("capacity"),
-                building=room_data.get("building"),
-                floor_number=room_data.get("floorNumber"),
-                phone=room_data.get("phone"),
-                is_wheelchair_accessible=room_data.get("isWheelChairAccessible", False),
-                original_payload=room_data,
-            )
-            rooms.append(room)
-
-        return rooms
+        return [self._parse_room(room_data) for room_data in response.get("value", [])]
 
     def get_room(self, room_id: str) -> MSGraphRoom:
         """
@@ -881,17 +1199,7 @@ class MSOutlookCalendarAPIClient:
         """
         response = self._make_request("GET", f"/places/{room_id}")
 
-        return MSGraphRoom(
-            id=response["id"],
-            display_name=response["displayName"],
-            email_address=response["emailAddress"],
-            capacity=response.get("capacity"),
-            building=response.get("building"),
-            floor_number=response.get("floorNumber"),
-            phone=response.get("phone"),
-            is_wheelchair_accessible=response.get("isWheelChairAccessible", False),
-            original_payload=response,
-        )
+        return self._parse_room(response)
 
     def find_meeting_times(
         self,
@@ -989,6 +1297,28 @@ class MSOutlookCalendarAPIClient:
             original_payload=event_data,
         )
 
+    def _parse_room(self, room_data: dict[str, Any]) -> MSGraphRoom:
+        """
+        Parse Microsoft Graph place data into MSGraphRoom object.
+
+        Args:
+            room_data: Raw room data from API
+
+        Returns:
+            MSGraphRoom object
+        """
+        return MSGraphRoom(
+            id=room_data["id"],
+            display_name=room_data["displayName"],
+            email_address=room_data["emailAddress"],
+            capacity=room_data.get("capacity"),
+            building=room_data.get("building"),
+            floor_number=room_data.get("floorNumber"),
+            phone=room_data.get("phone"),
+            is_wheelchair_accessible=room_data.get("isWheelChairAccessible", False),
+            original_payload=room_data,
+        )
+
     def _format_attendees(self, attendees: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
         Format attendees for Microsoft Graph API.
@@ -1026,6 +1356,48 @@ class MSOutlookCalendarAPIClient:
         """
         return self._make_request("GET", f"/users/{self.user_id}")
 
+    @classmethod
+    def refresh_access_token(
+        cls, client_id: str, client_secret: str, refresh_token: str
+    ) -> dict[str, Any]:
+        """
+        Redeem a refresh token at the Microsoft identity platform.
+
+        Args:
+            client_id: The app's client ID
+            client_secret: The app's client secret
+            refresh_token: The account's refresh token
+
+        Returns:
+            The token response: access_token, expires_in (seconds) and, as Microsoft
+            rotates them, a new refresh_token
+
+        Raises:
+            MSGraphAPIError: If the refresh token was refused or the request failed
+        """
+        try:
+            response = _graph_session().post(
+                cls.TOKEN_URL,
+                data={
+                    "client_id": client_id,
+                    "client_secret": client_secret,
+                    "grant_type": "refresh_token",
+                    "refresh_token": refresh_token,
+                },
+                timeout=30,
+            )
+        except requests.RequestException as e:
+            raise MSGraphAPIError(f"Token refresh request failed: {e!s}") from e
+        response_data = response.json() if response.content else {}
+        if not response.ok:
+            raise MSGraphAPIError(
+                f"Token refresh failed: {response.status_code} - "
+                f"{response_data.get('error_description', 'Unknown error')}",
+                response.status_code,
+                response_data,
+            )
+        return response_data
+
     def test_connection(self) -> bool:
         """
         Test the API connection.
@@ -1060,6 +1432,19 @@ class MSOutlookCalendarAPIClient:
         Returns:
             Created subscription data
         """
+        subscription_data = self._subscription_payload(
+            resource, change_type, notification_url, expiration_datetime, client_state
+        )
+        return self._make_request("POST", "/subscriptions", data=subscription_data)
+
+    @staticmethod
+    def _subscription_payload(
+        resource: str,
+        change_type: str,
+        notification_url: str,
+        expiration_datetime: datetime.datetime | None,
+        client_state: str | None,
+    ) -> dict[str, Any]:
         if expiration_datetime is None:
             # Default to 3 days from now (maximum for user resources)
             expiration_datetime = datetime.datetime.now(datetime.UTC) + datetime.timedelta(days=3)
@@ -1074,7 +1459,7 @@ class MSOutlookCalendarAPIClient:
         if client_state:
             subscription_data["clientState"] = client_state
 
-        return self._make_request("POST", "/subscriptions", data=subscription_data)
+        return subscription_data
 
     def list_subscriptions(self) -> list[dict[str, Any]]:
         """
@@ -1247,22 +1632,41 @@ class MSOutlookCalendarAPIClient:
 
         Returns:
             List of created subscription data
+
+        The subscriptions are created through batch_request. A room Graph refuses
+        (throttling included) is logged and left out of the result.
         """
+        if change_types is None:
+            change_types = ["created", "updated", "deleted"]
+        change_type = ",".join(change_types)
+
+        if not all(room_emails):
+            raise ValueError("room_email is required for room event subscriptions")
+
+        results = self.batch_request(
+            MSGraphBatchRequest(
+                id=str(index),
+                method="POST",
+                url="/subscriptions",
+                body=self._subscription_payload(
+                    f"/users/{room_email}/events",
+                    change_type,
+                    notification_url,
+                    expiration_datetime,
+                    client_state,
+                ),
+            )
+            for index, room_email in enumerate(room_emails)
+        )
+
         subscriptions = []
         errors = []
-
-        for room_email in room_emails:
-            try:
-                subscription = self.subscribe_to_room_events(
-                    room_email=room_email,
-                    notification_url=notification_url,
-                    change_types=change_types,
-                    expiration_datetime=expiration_datetime,
-                    client_state=client_state,
-                )
-                subscriptions.append(subscription)
-            except MSGraphAPIError as e:
-                errors.append({"room_email": room_email, "error": str(e)})
+        for index, room_email in enumerate(room_emails):
+            result = results[str(index)]
+            if isinstance(result, Exception):
+                errors.append({"room_email": room_email, "error": str(result)})
+            else:
+                subscriptions.append(result)
 
         if errors:
             logger.warning("Failed to create subscriptions for some rooms: %s", errors)
@@ -1288,6 +1692,18 @@ class MSOutlookCalendarAPIClient:
         Returns:
             List of MSGraphEvent objects
         """
+        endpoint, params = self._room_events_query(room_email, start_time, end_time, timezone)
+        response = self._make_request("GET", endpoint, params=params)
+
+        return [self._parse_event(event_data) for event_data in response.get("value", [])]
+
+    def _room_events_query(
+        self,
+        room_email: str,
+        start_time: datetime.datetime | None,
+        end_time: datetime.datetime | None,
+        timezone: str,
+    ) -> tuple[str, dict[str, str]]:
         params = {"$orderby": "start/dateTime"}
 
         if start_time and end_time:
@@ -1298,18 +1714,8 @@ class MSOutlookCalendarAPIClient:
                     "endDateTime": self._format_datetime(end_time, timezone)["dateTime"],
                 }
             )
-            endpoint = f"/users/{room_email}/calendarView"
-        else:
-            endpoint = f"/users/{room_email}/events"
-
-        response = self._make_request("GET", endpoint, params=params)
-
-        events = []
-        for event_data in response.get("value", []):
-            event = self._parse_event(event_data)
-            events.append(event)
-
-        return events
+            return f"/users/{room_email}/calendarView", params
+        return f"/users/{room_email}/events", params
 
     def unsubscribe_from_room_events(self, room_email: str) -> None:
         """
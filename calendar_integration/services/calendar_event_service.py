@@ -44,6 +44,7 @@ from vinta_billing.services.subscription_service import resolve_billing_period
 
 from audit.constants import AuditAction, AuditActorType
 from audit.diff import compute_diff
+from calendar_integration.change_tracking import bump_calendar_change_versions
 from calendar_integration.constants import CalendarType
 from calendar_integration.exceptions import NoAvailableTimeWindowsError
 from calendar_integration.models import (
@@ -94,11 +95,17 @@ from calendar_integration.services.dataclasses import (
     EventExternalAttendanceInputData,
     EventExternalAttendeeData,
     EventInternalAttendeeData,
+    ExpandedEventCursor,
     ExternalAttendeeInputData,
     ExternalClientIdentifierData,
     ResourceAllocationInputData,
     ResourceData,
 )
+from calendar_integration.services.event_expansion import (
+    ExpandedEvent,
+    drop_bundle_duplicates,
+    iter_expanded_events,
+)
 from calendar_integration.services.protocols.base_calendar_service import BaseCalendarService
 from calendar_integration.services.type_guards import (
     is_authenticated_calendar_service,
@@ -133,7 +140,7 @@ def _resolve_token_audit_actor(
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Iterable, Iterator
 
     from vinta_billing.models import Subscription
     from vinta_billing.services.entitlement_service import EntitlementService
@@ -819,6 +826,10 @@ class CalendarEventService:
                 for resource_allocation_data in event_data.resource_allocations
             ]
         )
+        bump_calendar_change_versions(
+            context.organization.id,
+            [allocation.resource_id for allocation in event_data.resource_allocations],
+        )
 
         # Grant permissions to event attendees
         self._host._grant_event_attendee_permissions(event)
@@ -1392,6 +1403,12 @@ class CalendarEventService:
         ResourceAllocation.objects.filter_by_organization(context.organization.id).filter(
             calendar_fk_id__in=resources_to_delete
         ).delete()
+        # The event's save bumped its own calendars; the resources' are read on their own.
+        bump_calendar_change_versions(
+            context.organization.id,
+            [allocation.calendar_fk_id for allocation in resource_allocations_to_create]
+            + list(resources_to_delete),
+        )
 
         def call_side_effects():
             if not context.calendar_side_effects_service:
@@ -1911,6 +1928,9 @@ class CalendarEventService:
         External providers (Google, Microsoft) only store master recurring events and sync
         exceptions, so we generate instances on our side while respecting their exceptions.
 
+        This is the whole of ``iter_calendar_events_expanded`` collected into a list;
+        callers that render a page should consume the stream instead.
+
         :param calendar: The calendar to get events from
         :param start_date: Start of the date range
         :param end_date: End of the date range
@@ -1921,6 +1941,37 @@ class CalendarEventService:
             result serializes without per-event N+1s.
         :return: List of all event instances in the range
         """
+        return [
+            cast("CalendarEvent", event)
+            for _, event in self.iter_calendar_events_expanded(
+                calendar, start_date, end_date, optimize_queryset
+            )
+        ]
+
+    def iter_calendar_events_expanded(
+        self,
+        calendar: Calendar,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        optimize_queryset: Callable[[CalendarEventQuerySet], CalendarEventQuerySet] | None = None,
+        after: ExpandedEventCursor | None = None,
+        materialize: bool = True,
+    ) -> Iterator[tuple[ExpandedEventCursor, ExpandedEvent]]:
+        """
+        Stream the expansion of ``get_calendar_events_expanded`` in cursor order.
+
+        Events are yielded lazily as ``(cursor, event)`` pairs ordered by
+        ``(start_time, master id, occurrence start)`` -- see ``ExpandedEventCursor`` --
+        so a consumer that stops early never builds the occurrences past where it
+        stopped. For a bundle calendar, bundle representations are dropped and each
+        bundle primary is yielded once.
+
+        :param after: Resume strictly after this cursor (keyset pagination).
+        :param materialize: When ``False``, generated occurrences are yielded as
+            read-only ``RecurringOccurrence`` views instead of unsaved model instances.
+            For consumers that only read them (unavailable windows, payloads).
+        :return: Iterator of ``(cursor, event)`` pairs.
+        """
         if not is_initialized_or_authenticated_calendar_service(
             cast("BaseCalendarService", self._context)
         ):
@@ -1931,7 +1982,6 @@ class CalendarEventService:
             # queryset, so the calendar's own organization is the scope and no ambient
             # binding is required.
             CalendarEvent.objects.filter_by_organization(calendar.organization_id)
-            .annotate_recurring_occurrences_on_date_range(start_date, end_date)
             .select_related("recurrence_rule")
             .filter(
                 parent_recurring_object__isnull=True,  # Master events only
@@ -1947,71 +1997,20 @@ class CalendarEventService:
                 calendar=calendar,
             )
 
-        # Get non-recurring events within the date range. Apply the optimize_queryset
-        # callable here too -- these are real, already-persisted rows returned as-is
-        # (not generated occurrences), so they need their own prefetch/select applied;
-        # they can't inherit it from a master the way recurring instances do below.
-        non_recurring_events = base_qs.filter(
-            Q(start_time__range=(start_date, end_date)) | Q(end_time__range=(start_date, end_date)),
-            recurrence_rule__isnull=True,  # Non-recurring only
-            is_recurring_exception=False,  # Exclude exception objects
-        )
-        if optimize_queryset is not None:
-            non_recurring_events = optimize_queryset(non_recurring_events)
-
-        # Get recurring master events and generate their instances. Apply the
-        # serializer optimization here so generated occurrences inherit prefetched
-        # relations from their master (real events are optimized by the caller).
-        recurring_events = base_qs.filter(
-            recurrence_rule__isnull=False,  # Recurring only
-        ).filter(
-            Q(recurrence_rule__until__isnull=True) | Q(recurrence_rule__until__gte=start_date),
-            start_time__lte=end_date,
+        stream = self._iter_expanded_events(
+            base_qs,
+            calendar.organization_id,
+            start_date,
+            end_date,
+            optimize_queryset,
+            after,
+            materialize=materialize,
         )
-        if optimize_queryset is not None:
-            recurring_events = optimize_queryset(recurring_events)
-
-        events: list[CalendarEvent] = list(non_recurring_events)
-
-        for master_event in recurring_events:
-            instances = master_event.get_occurrences_in_range(
-                start_date, end_date, include_self=False, include_exceptions=True
-            )
-            # Occurrences are in-memory copies of the master (pk=None). Reuse the
-            # master's prefetched relations so each occurrence serializes without
-            # re-querying attendances/resources (occurrences inherit them by design).
-            master_cache = getattr(master_event, "_prefetched_objects_cache", None)
-            if master_cache:
-                for instance in instances:
-                    instance._prefetched_objects_cache = master_cache
-            events.extend(instances)
-
-        # Sort by start time
-        events.sort(key=lambda x: x.start_time)
 
         # If this is a bundle calendar, filter out bundle representations to avoid duplicates
         if calendar.calendar_type == CalendarType.BUNDLE:
-            # Remove duplicates (keep primary events, remove representations)
-            seen_primary_events = set()
-            unique_events = []
-
-            for event in events:
-                if event.is_bundle_representation:
-                    # Skip representations - we want to show the primary event instead
-                    continue
-                elif event.is_bundle_primary:
-                    # For bundle primary events, check if we've already seen this one
-                    if event.id not in seen_primary_events:
-                        seen_primary_events.add(event.id)
-                        unique_events.append(event)
-                else:
-                    # For non-bundle events, include them normally
-                    unique_events.append(event)
-
-            events = unique_events
-            events.sort(key=lambda x: x.start_time)
-
-        return events
+            stream = drop_bundle_duplicates(stream)
+        return stream
 
     def get_calendar_events_expanded_for_calendars(
         self,
@@ -2024,14 +2023,15 @@ class CalendarEventService:
         Get all calendar events in a date range across multiple calendars, with recurring
         events expanded to instances and occurrences deduped by (event id, start_time).
 
-        This is the multi-calendar generalisation of ``get_calendar_events_expanded``.
-        It filters by ``organization_id`` defensively so a caller cannot cross tenant
-        boundaries by passing calendar ids from another organisation.
+        This is the multi-calendar generalisation of ``get_calendar_events_expanded``,
+        and the whole of ``iter_calendar_events_expanded_for_calendars`` collected into
+        a list. It filters by ``organization_id`` defensively so a caller cannot cross
+        tenant boundaries by passing calendar ids from another organisation.
 
-        Dedup rules (applied after expansion and sort):
+        Dedup rules (applied to the sorted stream):
         - Events where ``is_bundle_representation`` is True are dropped entirely.
         - Events where ``is_bundle_primary`` is True are kept only once per ``event.id``
-          (the first occurrence encountered after sorting by start_time).
+          (the first occurrence encountered in start-time order).
         - Real persisted rows (``event.id is not None``) are deduped by ``event.id``;
           a persisted row is unique by id.
         - Generated recurring occurrences (``event.id is None``) are kept unconditionally:
@@ -2049,6 +2049,30 @@ class CalendarEventService:
             prefetch and generated occurrences inherit it from their master.
         :return: Deduplicated, sorted list of event instances in the range.
         """
+        return [
+            cast("CalendarEvent", event)
+            for _, event in self.iter_calendar_events_expanded_for_calendars(
+                calendar_ids, start_date, end_date, optimize_queryset
+            )
+        ]
+
+    def iter_calendar_events_expanded_for_calendars(
+        self,
+        calendar_ids: Iterable[int],
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        optimize_queryset: Callable[[CalendarEventQuerySet], CalendarEventQuerySet] | None = None,
+        after: ExpandedEventCursor | None = None,
+        materialize: bool = True,
+    ) -> Iterator[tuple[ExpandedEventCursor, ExpandedEvent]]:
+        """
+        Stream the expansion of ``get_calendar_events_expanded_for_calendars`` in cursor
+        order, with the same dedup rules, as ``(cursor, event)`` pairs.
+
+        :param after: Resume strictly after this cursor (keyset pagination).
+        :param materialize: See ``iter_calendar_events_expanded``.
+        :return: Iterator of ``(cursor, event)`` pairs; empty for no calendar ids.
+        """
         if not is_initialized_or_authenticated_calendar_service(
             cast("BaseCalendarService", self._context)
         ):
@@ -2058,14 +2082,13 @@ class CalendarEventService:
         # iteration over a generator.
         id_set: set[int] = set(calendar_ids) if calendar_ids is not None else set()
         if not id_set:
-            return []
+            return iter(())
 
         org_id = self._context.organization.id
 
         base_qs = (
-            # See ``get_calendar_events_expanded`` on the ordering.
+            # See ``iter_calendar_events_expanded`` on the ordering.
             CalendarEvent.objects.filter_by_organization(org_id)
-            .annotate_recurring_occurrences_on_date_range(start_date, end_date)
             .select_related("recurrence_rule")
             .filter(
                 parent_recurring_object__isnull=True,  # Master events only
@@ -2073,10 +2096,35 @@ class CalendarEventService:
             )
         )
 
+        return drop_bundle_duplicates(
+            self._iter_expanded_events(
+                base_qs,
+                org_id,
+                start_date,
+                end_date,
+                optimize_queryset,
+                after,
+                materialize=materialize,
+            ),
+            dedupe_persisted=True,
+        )
+
+    def _iter_expanded_events(
+        self,
+        base_qs: CalendarEventQuerySet,
+        organization_id: int,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        optimize_queryset: Callable[[CalendarEventQuerySet], CalendarEventQuerySet] | None,
+        after: ExpandedEventCursor | None,
+        materialize: bool = True,
+    ) -> Iterator[tuple[ExpandedEventCursor, ExpandedEvent]]:
+        """Split ``base_qs`` (scoped master-level events) into its non-recurring rows and
+        its recurring masters for the range, and stream their merged expansion."""
         # Get non-recurring events within the date range. Apply the optimize_queryset
         # callable here too -- these are real, already-persisted rows returned as-is
         # (not generated occurrences), so they need their own prefetch/select applied;
-        # they can't inherit it from a master the way recurring instances do below.
+        # they can't inherit it from a master the way recurring instances do.
         non_recurring_events = base_qs.filter(
             Q(start_time__range=(start_date, end_date)) | Q(end_time__range=(start_date, end_date)),
             recurrence_rule__isnull=True,  # Non-recurring only
@@ -2085,65 +2133,30 @@ class CalendarEventService:
         if optimize_queryset is not None:
             non_recurring_events = optimize_queryset(non_recurring_events)
 
-        # Get recurring master events and generate their instances.
-        recurring_events = base_qs.filter(
-            recurrence_rule__isnull=False,  # Recurring only
-        ).filter(
-            Q(recurrence_rule__until__isnull=True) | Q(recurrence_rule__until__gte=start_date),
-            start_time__lte=end_date,
+        # Get recurring master events; only these need the occurrence annotation. Apply
+        # the serializer optimization here so generated occurrences inherit prefetched
+        # relations from their master.
+        recurring_events = (
+            base_qs.filter(
+                recurrence_rule__isnull=False,  # Recurring only
+            )
+            .filter(
+                Q(recurrence_rule__until__isnull=True) | Q(recurrence_rule__until__gte=start_date),
+                start_time__lte=end_date,
+            )
+            .annotate_recurring_occurrences_on_date_range(start_date, end_date)
         )
         if optimize_queryset is not None:
             recurring_events = optimize_queryset(recurring_events)
 
-        events: list[CalendarEvent] = list(non_recurring_events)
-
-        for master_event in recurring_events:
-            instances = master_event.get_occurrences_in_range(
-                start_date, end_date, include_self=False, include_exceptions=True
-            )
-            # Occurrences are in-memory copies of the master (pk=None). Reuse the
-            # master's prefetched relations so each occurrence serializes without
-            # re-querying attendances/resources.
-            master_cache = getattr(master_event, "_prefetched_objects_cache", None)
-            if master_cache:
-                for instance in instances:
-                    instance._prefetched_objects_cache = master_cache
-            events.extend(instances)
-
-        # Sort by start time before dedup so the "first seen" for bundle-primary events
-        # is deterministic (earliest occurrence).
-        events.sort(key=lambda x: x.start_time)
-
-        # General dedup:
-        #   - is_bundle_representation → drop (representation of a bundle primary event)
-        #   - is_bundle_primary        → keep first occurrence per event.id
-        #   - persisted rows (id set)  → dedup by event.id (unique by id)
-        #   - generated occurrences    → keep all (distinct by construction, see docstring)
-        seen_bundle_primary_ids: set[int] = set()
-        seen_event_ids: set[int] = set()
-        unique_events: list[CalendarEvent] = []
-
-        for event in events:
-            if event.is_bundle_representation:
-                # Drop representations — the primary event carries the canonical copy.
-                continue
-            elif event.is_bundle_primary:
-                if event.id not in seen_bundle_primary_ids:
-                    seen_bundle_primary_ids.add(event.id)
-                    unique_events.append(event)
-            elif event.id is not None:
-                # Persisted row — unique by id; collapse repeats reached via the union.
-                if event.id not in seen_event_ids:
-                    seen_event_ids.add(event.id)
-                    unique_events.append(event)
-            else:
-                # Generated recurring occurrence (pk=None) — distinct by construction;
-                # never collapse, so two series producing occurrences at the same
-                # start_time both survive.
-                unique_events.append(event)
-
-        # Already sorted above; preserve sort order (unique_events retains it).
-        return unique_events
+        return iter_expanded_events(
+            non_recurring_events,
+            recurring_events,
+            organization_id,
+            after=after,
+            optimize_queryset=optimize_queryset,
+            materialize=materialize,
+        )
 
     @transaction.atomic()
     def delete_event(self, calendar_id: int, event_id: int, delete_series: bool = False) -> None:
@@ -13,6 +13,7 @@ from vinta_billing.exceptions import OverLimitError
 
 from audit.constants import AuditAction
 from audit.diff import compute_diff
+from calendar_integration.change_tracking import bump_calendar_change_versions
 from calendar_integration.constants import (
     CalendarProvider,
     CalendarType,
@@ -40,6 +41,7 @@ from calendar_integration.models import (
     CalendarGroupSlotQuotaRule,
     CalendarOwnership,
     RecurrenceRule,
+    RecurringOccurrence,
 )
 from calendar_integration.querysets import CalendarEventQuerySet
 from calendar_integration.services import slot_engine
@@ -658,7 +660,7 @@ class CalendarGroupService:
         group_slot_id: int,
         start_date: datetime.datetime,
         end_date: datetime.datetime,
-    ) -> list[AvailableTime]:
+    ) -> list[AvailableTime | RecurringOccurrence]:
         """Expand every group-scoped ``AvailableTime`` for ``(calendar, group_slot)``
         that overlaps ``[start_date, end_date)``, recurrence included.
 
@@ -669,7 +671,7 @@ class CalendarGroupService:
         discovery-side fetch uses. Occurrence
         expansion for group-scoped masters is safe because (a) no write path
         creates a group-scoped recurrence exception yet, and (b)
-        ``RecurringMixin._get_occurrences_in_range`` now routes the
+        ``RecurringMixin._get_occurrence_views_in_range`` routes the
         exception-instance lookup through ``_base_manager`` when the master is
         group-scoped, ensuring group-scoped exception rows are found if one ever
         becomes reachable.
@@ -1256,7 +1258,7 @@ class CalendarGroupService:
         group_slot_id: int,
         start_date: datetime.datetime,
         end_date: datetime.datetime,
-    ) -> list[BlockedTime]:
+    ) -> list[BlockedTime | RecurringOccurrence]:
         """Expand every group-scoped ``BlockedTime`` for ``(calendar, group_slot)``
         that overlaps ``[start_date, end_date)``, recurrence included.
 
@@ -2934,10 +2936,15 @@ class CalendarGroupService:
             bt.start_time_tz_unaware = new_start_tz_unaware
             bt.end_time_tz_unaware = new_end_tz_unaware
             bt.timezone = tz
+            bt.sync_fingerprint = ""
 
         if blocked_times:
             BlockedTime.objects.bulk_update(
-                blocked_times, ["start_time_tz_unaware", "end_time_tz_unaware", "timezone"]
+                blocked_times,
+                ["start_time_tz_unaware", "end_time_tz_unaware", "timezone", "sync_fingerprint"],
+            )
+            bump_calendar_change_versions(
+                self.organization.id, {bt.calendar_fk_id for bt in blocked_times}
             )
 
         return updated_event
@@ -29,9 +29,10 @@ services such as ``CalendarGroupService``.
 * ``RecurrenceManager`` — stateless template-method engine for all recurrence families.
 """
 
+import contextlib
 import datetime
 import logging
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from typing import TYPE_CHECKING, Annotated
 
 from django.db import transaction
@@ -45,6 +46,7 @@ from vinta_billing.exceptions import OverLimitError
 
 from audit.constants import AuditAction
 from audit.diff import compute_diff
+from calendar_integration.change_tracking import bump_calendar_change_versions
 from calendar_integration.constants import (
     CalendarProvider,
     CalendarSyncTriggerSource,
@@ -71,6 +73,8 @@ from calendar_integration.models import (
     GoogleCalendarServiceAccount,
     RecurrenceRule,
 )
+from calendar_integration.oauth_tokens import fresh_social_token
+from calendar_integration.outlook_room_sync import OutlookRoomSyncSummary
 from calendar_integration.querysets import CalendarEventQuerySet
 from calendar_integration.services import slot_engine
 from calendar_integration.services.availability_service import AvailabilityService
@@ -122,6 +126,7 @@ from calendar_integration.services.dataclasses import (
     CalendarEventAdapterOutputData,
     CalendarEventData,
     CalendarEventInputData,
+    CalendarImportCounts,
     CalendarResourceData,
     EffectivePolicy,
     EventAttendanceInputData,
@@ -129,9 +134,11 @@ from calendar_integration.services.dataclasses import (
     EventExternalAttendeeData,
     EventInternalAttendeeData,
     EventsSyncChanges,
+    ExpandedEventCursor,
     ResourceAllocationInputData,
     UnavailableTimeWindow,
 )
+from calendar_integration.services.event_expansion import ExpandedEvent
 from calendar_integration.services.external_client_identifier_service import (
     ExternalClientIdentifierService,
 )
@@ -142,6 +149,8 @@ from calendar_integration.services.type_guards import (
     is_authenticated_calendar_service,
     is_initialized_or_authenticated_calendar_service,
 )
+from calendar_integration.services.write_fan_out import ProviderWriteFanOut
+from calendar_integration.webhook_renewal import WebhookRenewalSummary
 from organizations.models import Organization, OrganizationMembership
 from payments.seams.resource_keys import (
     EXTERNAL_CALENDAR_GOOGLE,
@@ -266,6 +275,8 @@ class CalendarService(BaseCalendarService):
         # Stateless recurrence engine shared by event/blocked-time/available-time methods.
         # Constructed once; it holds no auth state (everything arrives as method params).
         self._recurrence_manager = RecurrenceManager()
+        # The open provider-write fan-out, while ``_fan_out_provider_writes`` runs.
+        self._write_fan_out: ProviderWriteFanOut | None = None
 
     def _audit_calendar_write(
         self,
@@ -382,8 +393,8 @@ class CalendarService(BaseCalendarService):
             ), account
 
         # Do NOT exclude expired tokens here: an expired access token that still
-        # carries a refresh_token (token_secret) is refreshed by the adapter on
-        # construction. Filtering on expires_at would hide exactly those tokens
+        # carries a refresh_token (token_secret) is refreshed below, before the
+        # adapter is built. Filtering on expires_at would hide exactly those tokens
         # (and any with a NULL expiry), producing a false "reauthenticate" error.
         token_qs = SocialToken.objects.select_related("account").filter(
             account__provider__in=[CalendarProvider.GOOGLE, CalendarProvider.MICROSOFT],
@@ -436,6 +447,9 @@ class CalendarService(BaseCalendarService):
         calendar_adapter_cls = CalendarService._get_calendar_adapter_cls_for_provider(
             token.account.provider
         )
+        # One refresh per expiry window for the account, however many workers
+        # build an adapter for it at once.
+        token = fresh_social_token(token, calendar_adapter_cls.refresh_access_token)
 
         return calendar_adapter_cls(
             credentials_dict={
@@ -852,7 +866,7 @@ class CalendarService(BaseCalendarService):
         """
         return self._get_sync_service().request_calendars_import(sync_after_import)
 
-    def import_account_calendars(self, sync_after_import: bool = True):
+    def import_account_calendars(self, sync_after_import: bool = True) -> CalendarImportCounts:
         """
         Import calendars associated with the authenticated account and create them as Calendar
         records.
@@ -860,6 +874,8 @@ class CalendarService(BaseCalendarService):
         :param sync_after_import: When True (default), enqueue an event sync for each
             imported calendar that has sync enabled. The per-calendar ``sync_enabled``
             flag still gates whether a sync actually runs.
+        :return: How many of the account's calendars were created, updated and left
+            unchanged.
         """
         return self._get_sync_service().import_account_calendars(sync_after_import)
 
@@ -1423,12 +1439,50 @@ class CalendarService(BaseCalendarService):
             if ownership and ownership.membership_user_id:
                 owner = User.objects.filter(id=ownership.membership_user_id).first()
                 if owner:
-                    return CalendarService.get_calendar_adapter_for_account(owner)[0]
+                    if self._write_fan_out is None:
+                        return CalendarService.get_calendar_adapter_for_account(owner)[0]
+                    # One adapter per owner for the fan-out, so the owner's writes
+                    # meet in one batch instead of one adapter (and batch) per write.
+                    return self._write_fan_out.enlist(
+                        calendar.id,
+                        self._write_fan_out.cached_adapter(
+                            owner.id,
+                            lambda: CalendarService.get_calendar_adapter_for_account(owner)[0],
+                        ),
+                    )
 
             # if the calendar doesn't have a valid owner, try to use self.calendar_adapter
 
+        if self._write_fan_out is not None and self.calendar_adapter is not None:
+            return self._write_fan_out.enlist(calendar.id, self.calendar_adapter)
         return self.calendar_adapter
 
+    @contextlib.contextmanager
+    def _fan_out_provider_writes(self) -> Iterator[ProviderWriteFanOut]:
+        """Batch the provider writes made inside the block per account, and send the
+        batches concurrently when it exits.
+
+        Every adapter ``_get_write_adapter_for_calendar`` resolves inside the block is
+        enlisted in the yielded :class:`ProviderWriteFanOut`; its ``results`` hold the
+        outcome per calendar once the block is done -- they are reported, not raised,
+        so the caller decides what a failure costs. A block that raises sends nothing:
+        its queued writes are discarded. A nested block joins the outer one.
+        See ``services/write_fan_out.py``.
+        """
+        if self._write_fan_out is not None:
+            yield self._write_fan_out
+            return
+
+        fan_out = self._write_fan_out = ProviderWriteFanOut()
+        try:
+            yield fan_out
+        except BaseException as exc:
+            self._write_fan_out = None
+            fan_out.discard(exc)
+            raise
+        self._write_fan_out = None
+        fan_out.flush()
+
     def convert_naive_utc_datetime_to_timezone(
         self, datetime_obj: datetime.datetime, iana_tz: str
     ) -> datetime.datetime:
@@ -1756,6 +1810,43 @@ class CalendarService(BaseCalendarService):
             calendar_ids, start_date, end_date, optimize_queryset
         )
 
+    def iter_calendar_events_expanded(
+        self,
+        calendar: Calendar,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        optimize_queryset: Callable[[CalendarEventQuerySet], CalendarEventQuerySet] | None = None,
+        after: ExpandedEventCursor | None = None,
+        materialize: bool = True,
+    ) -> Iterator[tuple[ExpandedEventCursor, ExpandedEvent]]:
+        """
+        Stream a calendar's expanded events in cursor order, optionally after a cursor.
+
+        See ``CalendarEventService.iter_calendar_events_expanded`` for full semantics.
+        """
+        return self._get_event_service().iter_calendar_events_expanded(
+            calendar, start_date, end_date, optimize_queryset, after, materialize=materialize
+        )
+
+    def iter_calendar_events_expanded_for_calendars(
+        self,
+        calendar_ids: Iterable[int],
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        optimize_queryset: Callable[[CalendarEventQuerySet], CalendarEventQuerySet] | None = None,
+        after: ExpandedEventCursor | None = None,
+        materialize: bool = True,
+    ) -> Iterator[tuple[ExpandedEventCursor, ExpandedEvent]]:
+        """
+        Stream expanded events across several calendars in cursor order, deduped.
+
+        See ``CalendarEventService.iter_calendar_events_expanded_for_calendars`` for full
+        semantics.
+        """
+        return self._get_event_service().iter_calendar_events_expanded_for_calendars(
+            calendar_ids, start_date, end_date, optimize_queryset, after, materialize=materialize
+        )
+
     def _delete_bundle_event(self, bundle_event: CalendarEvent) -> None:
         """Delete a bundle event — delegates to ``CalendarBundleService``.
 
@@ -1836,6 +1927,25 @@ class CalendarService(BaseCalendarService):
         """
         return self._get_sync_service().sync_events(calendar_sync)
 
+    def request_outlook_rooms_sync(self) -> None:
+        """Queue a sync of every Outlook room of the organization, as the current
+        Microsoft account. See ``calendar_integration.outlook_room_sync``."""
+        return self._get_sync_service().request_outlook_rooms_sync()
+
+    def sync_outlook_rooms(
+        self,
+        start_datetime: datetime.datetime,
+        end_datetime: datetime.datetime,
+    ) -> OutlookRoomSyncSummary:
+        """
+        Sync every live, sync-enabled Outlook room of the organization, fetching their
+        delta rounds concurrently.
+        :param start_datetime: Window start of the rooms that have no delta token yet.
+        :param end_datetime: Window end of those rooms.
+        :return: How many rooms synced, failed, or were left for another sync.
+        """
+        return self._get_sync_service().sync_outlook_rooms(start_datetime, end_datetime)
+
     def _execute_calendar_sync(
         self,
         calendar_sync: CalendarSync,
@@ -1854,6 +1964,7 @@ class CalendarService(BaseCalendarService):
         start_date: datetime.datetime,
         end_date: datetime.datetime,
         incoming_external_ids: set[str] | None = None,
+        include_window: bool = True,
     ):
         """Delegation: get existing calendar events and blocked times to reconcile against.
 
@@ -1862,7 +1973,7 @@ class CalendarService(BaseCalendarService):
         ``CalendarSyncService``.
         """
         return self._get_sync_service()._get_existing_calendar_data(
-            calendar_id, start_date, end_date, incoming_external_ids
+            calendar_id, start_date, end_date, incoming_external_ids, include_window
         )
 
     def _process_existing_event(
@@ -1922,9 +2033,10 @@ class CalendarService(BaseCalendarService):
     def _handle_deletions_for_full_sync(
         self,
         calendar_id: int,
-        calendar_events_by_external_id: dict,
-        matched_event_ids: set[str],
+        seen_external_ids: set[str],
         start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        stale_external_ids: set[str] | None = None,
     ):
         """Delegation: handle deletions when doing a full sync (no sync_token).
 
@@ -1932,7 +2044,7 @@ class CalendarService(BaseCalendarService):
         to ``CalendarSyncService``.
         """
         return self._get_sync_service()._handle_deletions_for_full_sync(
-            calendar_id, calendar_events_by_external_id, matched_event_ids, start_date
+            calendar_id, seen_external_ids, start_date, end_date, stale_external_ids
         )
 
     def _apply_sync_changes(self, calendar_id: int, changes: EventsSyncChanges):
@@ -2120,7 +2232,10 @@ class CalendarService(BaseCalendarService):
             )
             blocked_times_to_create.append(blocked_time)
 
-        return BlockedTime.objects.bulk_create(blocked_times_to_create)
+        created = BlockedTime.objects.bulk_create(blocked_times_to_create)
+        # bulk_create sends no post_save, so the change-tracking receiver never sees these.
+        bump_calendar_change_versions(calendar.organization_id, [calendar.id])
+        return created
 
     # Convenience methods for single object creation
     def create_blocked_time(
@@ -2467,6 +2582,7 @@ class CalendarService(BaseCalendarService):
         external_calendar_id: str,
         webhook_event: CalendarWebhookEvent,
         sync_window_hours: int = 24,
+        first_notified_at: datetime.datetime | None = None,
     ) -> CalendarSync | None:
         """Request calendar sync triggered by webhook notification.
 
@@ -2480,6 +2596,7 @@ class CalendarService(BaseCalendarService):
             external_calendar_id=external_calendar_id,
             webhook_event=webhook_event,
             sync_window_hours=sync_window_hours,
+            first_notified_at=first_notified_at,
         )
 
     def create_calendar_webhook_subscription(
@@ -2514,26 +2631,25 @@ class CalendarService(BaseCalendarService):
 
     def handle_webhook(
         self, provider: CalendarProvider, request: HttpRequest
-    ) -> CalendarWebhookEvent | None:
-        """Handle calendar webhook processing with organization context.
+    ) -> list[CalendarWebhookEvent]:
+        """Record an incoming calendar webhook with organization context.
 
         Extracts the organization from the HTTP request and writes it to
-        ``self.organization`` so that :meth:`_build_context_snapshot` picks it
-        up when the webhook sub-service calls back through the host
-        (``request_webhook_triggered_sync`` → ``request_calendar_sync``).
-        The header parsing and notification dispatching are delegated to
-        :class:`CalendarWebhookService`.
+        ``self.organization`` so that :meth:`_build_context_snapshot` hands it to
+        the webhook sub-service. Validating and recording the notification are
+        delegated to :class:`CalendarWebhookService`; the sync it triggers is
+        requested in the background (``process_webhook_events_task``).
 
         Args:
             provider: Calendar provider enum
             request: HttpRequest object containing webhook data
 
         Returns:
-            CalendarWebhookEvent if processed successfully, None for sync notifications
+            The recorded events, pending processing; empty for sync notifications
 
         Raises:
-            ValueError: If webhook validation fails or organization not found
-            Exception: If processing fails
+            ValueError: If the organization is not found
+            WebhookProcessingFailedError: If the notification is malformed
         """
         if not request.resolver_match:
             raise ValueError("Invalid request object")
@@ -2550,8 +2666,7 @@ class CalendarService(BaseCalendarService):
             raise ValueError(f"Organization not found: {organization_id}") from exc
 
         # Set organization context on the facade so that _build_context_snapshot()
-        # includes it in any subsequent sub-service constructions (e.g. the
-        # request_webhook_triggered_sync callback through the host seam).
+        # includes it in the webhook sub-service built below.
         self.organization = organization
 
         return self._get_webhook_service().handle_webhook(provider, request)
@@ -2570,6 +2685,11 @@ class CalendarService(BaseCalendarService):
         """Refresh a webhook subscription. Delegates to :class:`CalendarWebhookService`."""
         return self._get_webhook_service().refresh_webhook_subscription(subscription_id)
 
+    def renew_webhook_subscriptions(self, subscription_ids: Sequence[int]) -> WebhookRenewalSummary:
+        """Renew webhook subscriptions with their provider. Delegates to
+        :class:`CalendarWebhookService`."""
+        return self._get_webhook_service().renew_webhook_subscriptions(subscription_ids)
+
     def get_webhook_health_status(self) -> WebhookHealthStatus:
         """Get webhook health status. Delegates to :class:`CalendarWebhookService`."""
         return self._get_webhook_service().get_webhook_health_status()
@@ -29,21 +29,48 @@ The sync diff/merge machine (``_process_events_for_sync`` / ``_apply_sync_change
 the existing-data lookup, the full-sync deletion pass, and the orphan-linking pass
 are moved verbatim — no added queries inside loops, no changed query structure or
 bulk-operation ordering, no algorithmic-complexity change.
+
+Since then one thing did change: ``_execute_calendar_sync`` runs that machine over
+the adapter stream one page (``SYNC_PAGE_SIZE`` events) at a time instead of over
+the whole window at once, so a sync's memory no longer grows with the calendar;
+and ``_apply_sync_changes`` writes blocked times as one upsert on
+``(calendar_fk_id, external_id)`` and diffs attendees in a fixed number of queries
+per event. Events whose content fingerprint (``_sync_fingerprint``) matches the
+stored row are skipped before any row is loaded. A successful ``sync_events`` also
+feeds the calendar's change-rate estimate (``calendar_integration.sync_scheduling``).
+
+Both imports write the calendars they discover set-based (``_upsert_calendars``):
+one query for the rows already stored, one upsert for the new ones and one update
+for the changed ones, instead of an ``update_or_create`` per calendar; the account
+import writes its ownership rows the same way.
+
+``sync_outlook_rooms`` syncs an organization's Outlook rooms from one task: their
+delta rounds are fetched concurrently, a chunk of rooms at a time
+(``calendar_integration.outlook_room_sync``), and each room's events go through
+``sync_events`` as ``prefetched`` -- the same pass, without its own fetch.
 """
 
 from __future__ import annotations
 
 import datetime
+import hashlib
+import itertools
+import json
 import logging
 from typing import TYPE_CHECKING, Literal, Protocol, cast
 
 from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
 from django.db.models import Q
+from django.utils import timezone
 
 from allauth.socialaccount.models import SocialAccount
 from vinta_billing.exceptions import OverLimitError
 
+from calendar_integration.change_tracking import (
+    batched_calendar_change_versions,
+    bump_calendar_change_versions,
+)
 from calendar_integration.constants import (
     CalendarOrganizationResourceImportStatus,
     CalendarProvider,
@@ -53,6 +80,7 @@ from calendar_integration.constants import (
     CalendarVisibility,
     ExternalEventChangeKind,
 )
+from calendar_integration.exceptions import ProviderRetryableError, SyncTokenExpiredError
 from calendar_integration.models import (
     BlockedTime,
     Calendar,
@@ -66,27 +94,55 @@ from calendar_integration.models import (
     GoogleCalendarServiceAccount,
     RecurrenceRule,
 )
+from calendar_integration.outlook_room_sync import (
+    OUTLOOK_ROOM_SYNC_CHUNK_SIZE,
+    OUTLOOK_ROOM_SYNC_MAX_CONCURRENCY,
+    OutlookRoomSyncSummary,
+    RoomDelta,
+    fetch_room_deltas,
+    latest_room_sync_tokens,
+    outlook_rooms,
+)
 from calendar_integration.services.calendar_service_utils import (
     convert_naive_utc_datetime_to_timezone as _convert_naive_utc_datetime_to_timezone,
 )
-from calendar_integration.services.dataclasses import EventsSyncChanges
+from calendar_integration.services.dataclasses import (
+    CalendarEventsSyncTypedDict,
+    CalendarImportCounts,
+    EventsSyncChanges,
+    ResumableSyncToken,
+)
 from calendar_integration.services.protocols.base_calendar_service import BaseCalendarService
 from calendar_integration.services.protocols.initializer_or_authenticated_calendar_service import (
     InitializedOrAuthenticatedCalendarService,
 )
 from calendar_integration.services.type_guards import is_authenticated_calendar_service
+from calendar_integration.sync_scheduling import record_sync_outcome
+from calendar_integration.sync_single_flight import (
+    FoldedCalendarSync,
+    calendar_sync_lock,
+    claim_calendar_sync,
+    fold_queued_calendar_syncs,
+    has_queued_calendar_syncs,
+    requeue_folded_calendar_syncs,
+    settle_folded_calendar_syncs,
+)
 from organizations.models import ExternalEventUpdatePolicy, OrganizationMembership
 from payments.seams.resource_keys import RESOURCE_CALENDARS
-from users.models import User
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
 
+    from calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter import (
+        MSOutlookCalendarAdapter,
+    )
     from calendar_integration.services.calendar_service_context import CalendarServiceContext
     from calendar_integration.services.dataclasses import (
         CalendarEventAdapterOutputData,
         CalendarResourceData,
+        EventAttendeeData,
+        PrefetchedCalendarEvents,
     )
     from calendar_integration.services.external_event_change_request_service import (
         ExternalEventChangeRequestService,
@@ -102,6 +158,39 @@ logger = logging.getLogger(__name__)
 #: to the database on every capped import.
 MAX_SKIPPED_EXTERNAL_IDS_IN_WARNING = 20
 
+#: Provider events reconciled and written per page of a calendar sync. Bounds the
+#: adapter events, existing rows and pending changes held at any one time; the only
+#: state that grows with the calendar is the set of external ids already seen.
+SYNC_PAGE_SIZE = 500
+
+
+def _sync_fingerprint(event: CalendarEventAdapterOutputData) -> str:
+    """Hash the provider data a sync writes a row from, normalized so equal content
+    always hashes equal.
+
+    Covers every field the diff/merge machine reads -- times as UTC instants, status,
+    recurrence, attendees regardless of order -- and nothing of ``original_payload``,
+    whose etags and update stamps also move on edits the sync does not store.
+    """
+
+    def instant(value: datetime.datetime) -> str:
+        return value.astimezone(datetime.UTC).isoformat() if value.tzinfo else value.isoformat()
+
+    normalized = {
+        "title": event.title,
+        "description": event.description,
+        "start_time": instant(event.start_time),
+        "end_time": instant(event.end_time),
+        "timezone": event.timezone,
+        "status": event.status,
+        "recurrence_rule": event.recurrence_rule,
+        "recurring_event_id": event.recurring_event_id,
+        "attendees": sorted(
+            (attendee.email, attendee.name, attendee.status) for attendee in event.attendees
+        ),
+    }
+    return hashlib.sha256(json.dumps(normalized, sort_keys=True).encode()).hexdigest()
+
 
 def _summarize_external_ids(resources: list[CalendarResourceData]) -> str:
     """Render at most ``MAX_SKIPPED_EXTERNAL_IDS_IN_WARNING`` ids, eliding the rest."""
@@ -319,15 +408,15 @@ class CalendarSyncService:
         """Cap ``resources`` to the organization's remaining ``resource_calendars`` headroom.
 
         The bulk room-import writer is a request-scoped check's blind spot --
-        it loops ``Calendar.objects.update_or_create`` with no per-row check, so it is
+        it upserts every discovered room at once with no per-row check, so it is
         the single most likely place for an unmetered path to survive. This is checked
         and capped *before* the bulk write, not per-row after it.
 
         The rule is **"will this write increase**
         ``vinta_billing.services.entitlement_service._count_resource_calendars``**?"** -- not
         "does a ``Calendar`` row already exist for this org + external_id?". Those two
-        differ, and in the permissive direction: the write loop below puts
-        ``calendar_type=RESOURCE`` in ``update_or_create``'s ``defaults``, so matching a
+        differ, and in the permissive direction: the upsert below writes
+        ``calendar_type=RESOURCE`` over existing rows too, so matching a
         *non*-RESOURCE row (a PERSONAL calendar imported by ``import_account_calendars``,
         which keys on the very same ``(organization, external_id)``) **promotes** that row
         into the counted set. Treating it as "already imported" therefore consumed no
@@ -370,9 +459,7 @@ class CalendarSyncService:
         # A provider that returns the same external_id twice in one discovery must not
         # be charged twice for it: ``chargeable_resources`` below is built by membership
         # in ``resources``, so an undeduplicated list inflates ``delta`` and can produce
-        # a false partial cap. First occurrence wins, matching the write loop's
-        # ``update_or_create`` semantics (later duplicates would just re-write the same
-        # row anyway).
+        # a false partial cap. First occurrence wins, as in ``_upsert_calendars``.
         resources = list({resource.external_id: resource for resource in resources}.values())
 
         # Take the guard lock before the split read below -- see the docstring.
@@ -417,6 +504,69 @@ class CalendarSyncService:
         logger.warning(warning)
         return resources_to_import, warning
 
+    def _upsert_calendars(
+        self, calendars: Iterable[Calendar], update_fields: Sequence[str]
+    ) -> tuple[list[Calendar], CalendarImportCounts]:
+        """Write discovered ``calendars`` in a fixed number of statements.
+
+        ``calendars`` are unsaved instances keyed on ``external_id`` within the
+        context's organization, as the ``update_or_create`` calls they replace were --
+        a row stored under another provider is rewritten, not duplicated -- the first
+        of each key winning. One query loads the rows already stored under those keys; a row
+        whose ``update_fields`` all match is left alone, a changed one gets those fields
+        in one ``bulk_update``, and the new ones are inserted by one ``bulk_create``
+        that updates ``update_fields`` on conflict, so a row another import created
+        since the lookup is updated rather than failing the whole import. The other
+        fields of a new instance (its type, its sync flag...) are only written on
+        insert, the way ``update_or_create``'s ``create_defaults`` were.
+
+        :return: The stored calendar for each key, in discovery order, and what the
+            write did to them.
+        """
+        organization_id = self._context.organization.id
+        discovered: dict[str, Calendar] = {}
+        for calendar in calendars:
+            discovered.setdefault(calendar.external_id, calendar)
+
+        stored = {
+            calendar.external_id: calendar
+            for calendar in Calendar.objects.filter_by_organization(organization_id).filter(
+                external_id__in=discovered
+            )
+        }
+        counts = CalendarImportCounts()
+        to_create: list[Calendar] = []
+        to_update: list[Calendar] = []
+        now = timezone.now()
+        for key, calendar in discovered.items():
+            existing = stored.get(key)
+            if existing is None:
+                to_create.append(calendar)
+                stored[key] = calendar
+                counts.created += 1
+            elif any(
+                getattr(existing, field) != getattr(calendar, field) for field in update_fields
+            ):
+                for field in update_fields:
+                    setattr(existing, field, getattr(calendar, field))
+                # ``bulk_update`` does not touch auto-now fields on its own.
+                existing.modified = now
+                to_update.append(existing)
+                counts.updated += 1
+            else:
+                counts.unchanged += 1
+
+        if to_create:
+            Calendar.objects.bulk_create(
+                to_create,
+                update_conflicts=True,
+                unique_fields=["external_id", "provider", "organization"],
+                update_fields=list(update_fields),
+            )
+        if to_update:
+            Calendar.objects.bulk_update(to_update, [*update_fields, "modified"])
+        return [stored[key] for key in discovered], counts
+
     @transaction.atomic()
     def _execute_organization_calendar_resources_import(
         self,
@@ -438,8 +588,8 @@ class CalendarSyncService:
         and is tracked as a follow-up rather than
         implemented here. As shipped, the cost is real for a reseller billing root --
         every checked creation path in its subtree serializes for the duration of a
-        large import -- and is bounded deliberately: the loop does database work only
-        (an upsert plus a ``CalendarSync`` row per resource; the provider call and
+        large import -- and is bounded deliberately: the write does database work only
+        (one set-based upsert plus a ``CalendarSync`` row per resource; the provider call and
         every Celery dispatch happen outside it, the former before the lock is taken
         and the latter on commit), and this runs from a background import task rather
         than a request hot path.
@@ -450,6 +600,7 @@ class CalendarSyncService:
             exhausted on ``resource_calendars``) is recorded on its ``error_message``
             and its status set to ``PARTIAL``, both persisted immediately -- the import
             is not failed, following the "partial import over unmetered creation" rule.
+            The created / updated / unchanged calendar counts are recorded on it too.
         :param bypass_limits: When True, skips the ``resource_calendars`` headroom check.
             Only management commands and one-off repair scripts should pass this.
         :return: The resources actually imported -- the provider's discovery minus
@@ -479,19 +630,41 @@ class CalendarSyncService:
             import_workflow_state.status = CalendarOrganizationResourceImportStatus.PARTIAL
             import_workflow_state.save(update_fields=["error_message", "status"])
 
-        for resource in resources_to_import:
-            self._host.request_calendar_sync(
-                calendar=Calendar.objects.update_or_create(
-                    external_id=resource.external_id,
+        calendars, counts = self._upsert_calendars(
+            (
+                Calendar(
                     organization=context.organization,
-                    defaults={
-                        "name": resource.name,
-                        "description": resource.description,
-                        "provider": CalendarProvider(resource.provider),
-                        "email": resource.email,
-                        "calendar_type": CalendarType.RESOURCE,
-                    },
-                )[0],
+                    external_id=resource.external_id,
+                    provider=CalendarProvider(resource.provider),
+                    name=resource.name,
+                    description=resource.description,
+                    email=resource.email,
+                    calendar_type=CalendarType.RESOURCE,
+                )
+                for resource in resources_to_import
+            ),
+            update_fields=["name", "description", "email", "provider", "calendar_type"],
+        )
+        logger.info(
+            "Imported %d resource calendars for organization %s: %d created, %d updated, "
+            "%d unchanged.",
+            len(calendars),
+            context.organization.id,
+            counts.created,
+            counts.updated,
+            counts.unchanged,
+        )
+        if import_workflow_state is not None:
+            import_workflow_state.calendars_created = counts.created
+            import_workflow_state.calendars_updated = counts.updated
+            import_workflow_state.calendars_unchanged = counts.unchanged
+            import_workflow_state.save(
+                update_fields=["calendars_created", "calendars_updated", "calendars_unchanged"]
+            )
+
+        for calendar in calendars:
+            self._host.request_calendar_sync(
+                calendar=calendar,
                 start_datetime=start_time,
                 end_datetime=end_time,
                 should_update_events=True,
@@ -554,24 +727,24 @@ class CalendarSyncService:
         return access_role.lower() in ("owner", "writer")
 
     @transaction.atomic()
-    def import_account_calendars(self, sync_after_import: bool = True):
+    def import_account_calendars(self, sync_after_import: bool = True) -> CalendarImportCounts:
         """
         Import calendars associated with the authenticated account and create them as Calendar
         records.
 
         This is **not** subject to a limit check. Every calendar this method creates is
-        seeded with ``calendar_type=PERSONAL`` (``create_defaults`` below); it never sets
-        ``calendar_type=RESOURCE``, so it never creates anything counted by the
+        seeded with ``calendar_type=PERSONAL`` (set on the new instances only, below); it
+        never sets ``calendar_type=RESOURCE``, so it never creates anything counted by the
         ``resource_calendars`` resource key (see ``payments.seams.resources``, the
         registration site).
         A pre-existing RESOURCE calendar that also shows up in this account's calendar list
-        (e.g. a domain-wide account listing a room mailbox) is matched by ``update_or_create``
-        and only *updated* -- ``calendar_type`` is not in ``defaults`` below, so its type is
-        left untouched and it is skipped just below (the ``calendar_type == RESOURCE:
-        continue`` branch) without consuming headroom.
+        (e.g. a domain-wide account listing a room mailbox) is matched by the upsert and
+        only *updated* -- ``calendar_type`` is not among the fields it updates, so its type
+        is left untouched and it is skipped just below (the ``calendar_type == RESOURCE``
+        filter) without consuming headroom.
 
         What this method must **not** be read as claiming is that the rows it creates can
-        never become metered ones. It keys ``update_or_create`` on ``(organization,
+        never become metered ones. It keys the upsert on ``(organization,
         external_id)`` -- the exact key the room-import writer keys on -- and for Microsoft
         both providers' listings share one id space (``get_account_calendars`` and
         ``get_calendar_resources`` both enumerate ``client.list_calendars()``), so a
@@ -584,118 +757,65 @@ class CalendarSyncService:
         :param sync_after_import: When True (default), enqueue an event sync for each
             imported calendar that has sync enabled. The per-calendar ``sync_enabled``
             flag still gates whether a sync actually runs.
+        :return: How many of the account's calendars were created, updated and left
+            unchanged.
         """
         context = cast("BaseCalendarService", self._context)
         if not is_authenticated_calendar_service(context):
             raise
 
-        calendars = context.calendar_adapter.get_account_calendars()
-
-        for calendar_data in calendars:
-            calendar, _ = Calendar.objects.update_or_create(
-                external_id=calendar_data.external_id,
-                organization=context.organization,
-                defaults={
-                    "name": calendar_data.name,
-                    "description": calendar_data.description,
-                    "email": calendar_data.email,
-                    "provider": CalendarProvider(calendar_data.provider),
-                    "meta": {
-                        "latest_original_payload": calendar_data.original_payload or {},
-                    },
-                },
-                # calendar_type, sync_enabled and visibility are seeded only on first import
-                # (create), never on re-import. calendar_type must stay out of the lookup so
-                # that resource calendars returned by the provider's calendarList (rooms visible
-                # to the user) don't collide with the unique (external_id, provider, org)
-                # constraint — and don't accidentally get re-typed as PERSONAL.
-                create_defaults={
-                    "name": calendar_data.name,
-                    "description": calendar_data.description,
-                    "email": calendar_data.email,
-                    "provider": CalendarProvider(calendar_data.provider),
-                    "meta": {
-                        "latest_original_payload": calendar_data.original_payload or {},
-                    },
-                    "calendar_type": CalendarType.PERSONAL,
-                    "sync_enabled": self._sync_enabled_default_for_access_role(
+        calendars_data: dict[str, CalendarResourceData] = {}
+        for calendar_data in context.calendar_adapter.get_account_calendars():
+            calendars_data.setdefault(calendar_data.external_id, calendar_data)
+        calendars, counts = self._upsert_calendars(
+            (
+                Calendar(
+                    organization=context.organization,
+                    external_id=calendar_data.external_id,
+                    provider=CalendarProvider(calendar_data.provider),
+                    name=calendar_data.name,
+                    description=calendar_data.description,
+                    email=calendar_data.email,
+                    meta={"latest_original_payload": calendar_data.original_payload or {}},
+                    # calendar_type, sync_enabled and visibility are seeded only on first
+                    # import (insert), never on re-import: they are not among the updated
+                    # fields below, so resource calendars returned by the provider's
+                    # calendarList (rooms visible to the user) don't get re-typed as
+                    # PERSONAL.
+                    calendar_type=CalendarType.PERSONAL,
+                    sync_enabled=self._sync_enabled_default_for_access_role(
                         calendar_data.access_role
                     ),
-                    "visibility": CalendarVisibility.ACTIVE,
+                    visibility=CalendarVisibility.ACTIVE,
                     # Imported calendars manage their own availability windows by
-                    # default. Seeded on create only (create_defaults), so a later
-                    # user toggle via PATCH /calendars/{id}/ is never clobbered on
-                    # re-import.
-                    "manage_available_windows": True,
-                },
-            )
-
-            # Resource calendars are owned and synced via the rooms-sync path; skip
-            # personal ownership and sync for them here.
-            if calendar.calendar_type == CalendarType.RESOURCE:
-                continue
-
-            owner_user = context.account.user if context.account else None
-            # Ownership is membership-scoped: the lookup key is the
-            # denormalized `membership_user_id`, matched by the partial unique
-            # constraint (calendar_fk, membership_user_id). A non-NULL
-            # `membership_user_id` is enforced by the raw-SQL composite FK to
-            # OrganizationMembership(user_id, organization_id) — so it must point
-            # at a real membership. The sync owner (context.account.user) is the
-            # account that imported the calendar and is normally a member of the
-            # organization; if no matching membership exists we fall back to
-            # membership_user_id=NULL (an orphan ownership, excluded from
-            # membership reads) rather than risk an FK RESTRICT violation.
-            owner_membership_user_id = None
-            if (
-                owner_user is not None
-                and OrganizationMembership.objects.filter(
-                    user_id=owner_user.id,
-                    organization_id=context.organization.id,
-                ).exists()
-            ):
-                owner_membership_user_id = owner_user.id
-
-            if owner_membership_user_id is not None:
-                # Member owner: the partial unique (calendar_fk, membership_user_id)
-                # guarantees at most one row for this key, so update_or_create is
-                # safe to upsert on it.
-                CalendarOwnership.objects.update_or_create(
-                    organization=context.organization,
-                    calendar=calendar,
-                    membership_user_id=owner_membership_user_id,
-                    defaults={
-                        "is_default": calendar_data.is_default,
-                    },
+                    # default. Seeded on insert only, so a later user toggle via
+                    # PATCH /calendars/{id}/ is never clobbered on re-import.
+                    manage_available_windows=True,
                 )
-            else:
-                # Owner-less (NULL membership): the partial unique constraint
-                # EXCLUDES NULLs, so a calendar may already hold ≥2 orphan
-                # ownership rows. Keying update_or_create on membership_user_id=None
-                # would call .get() on a multi-row match and raise
-                # MultipleObjectsReturned. Match the pre-cutover intent of a single
-                # owner-less ownership per calendar: reuse any existing orphan row,
-                # otherwise create one.
-                ownership = (
-                    CalendarOwnership.objects.filter_by_organization(context.organization)
-                    .filter(
-                        calendar=calendar,
-                        membership_user_id__isnull=True,
-                    )
-                    .order_by("pk")
-                    .first()
-                )
-                if ownership is None:
-                    CalendarOwnership.objects.create(
-                        organization=context.organization,
-                        calendar=calendar,
-                        membership_user_id=None,
-                        is_default=calendar_data.is_default,
-                    )
-                elif ownership.is_default != calendar_data.is_default:
-                    ownership.is_default = calendar_data.is_default
-                    ownership.save(update_fields=["is_default"])
+                for calendar_data in calendars_data.values()
+            ),
+            update_fields=["name", "description", "email", "provider", "meta"],
+        )
+        logger.info(
+            "Imported %d account calendars for organization %s: %d created, %d updated, "
+            "%d unchanged.",
+            len(calendars),
+            context.organization.id,
+            counts.created,
+            counts.updated,
+            counts.unchanged,
+        )
 
+        # Resource calendars are owned and synced via the rooms-sync path; skip
+        # personal ownership and sync for them here.
+        calendars = [
+            calendar for calendar in calendars if calendar.calendar_type != CalendarType.RESOURCE
+        ]
+        self._write_account_calendar_ownerships(
+            {calendar: calendars_data[calendar.external_id].is_default for calendar in calendars}
+        )
+
+        for calendar in calendars:
             # Grant permissions to calendar owners
             self._host._grant_calendar_owner_permissions(calendar)
 
@@ -707,6 +827,79 @@ class CalendarSyncService:
                     should_update_events=True,
                     trigger_source=CalendarSyncTriggerSource.IMPORT,
                 )
+        return counts
+
+    def _write_account_calendar_ownerships(self, is_default_by_calendar: dict[Calendar, bool]):
+        """Make the importing account's user own each calendar, in bulk.
+
+        ``is_default_by_calendar`` maps each imported calendar to whether it is the
+        account's default one. Existing ownerships are loaded in one query; the missing
+        ones are inserted by one ``bulk_create`` and the ones whose ``is_default``
+        changed are updated by one ``bulk_update``.
+        """
+        if not is_default_by_calendar:
+            return
+        context = cast("BaseCalendarService", self._context)
+        owner_user = context.account.user if context.account else None
+        # Ownership is membership-scoped: the lookup key is the
+        # denormalized `membership_user_id`, matched by the partial unique
+        # constraint (calendar_fk, membership_user_id). A non-NULL
+        # `membership_user_id` is enforced by the raw-SQL composite FK to
+        # OrganizationMembership(user_id, organization_id) — so it must point
+        # at a real membership. The sync owner (context.account.user) is the
+        # account that imported the calendar and is normally a member of the
+        # organization; if no matching membership exists we fall back to
+        # membership_user_id=NULL (an orphan ownership, excluded from
+        # membership reads) rather than risk an FK RESTRICT violation.
+        owner_membership_user_id = None
+        if (
+            owner_user is not None
+            and OrganizationMembership.objects.filter(
+                user_id=owner_user.id,
+                organization_id=context.organization.id,
+            ).exists()
+        ):
+            owner_membership_user_id = owner_user.id
+
+        # Owner-less (NULL membership): the partial unique constraint EXCLUDES NULLs,
+        # so a calendar may already hold ≥2 orphan ownership rows. Match the
+        # pre-cutover intent of a single owner-less ownership per calendar: reuse the
+        # first existing orphan row, otherwise create one.
+        ownerships: dict[int, CalendarOwnership] = {}
+        for ownership in (
+            CalendarOwnership.objects.filter_by_organization(context.organization)
+            .filter(
+                calendar_fk_id__in=[calendar.id for calendar in is_default_by_calendar],
+                membership_user_id=owner_membership_user_id,
+            )
+            .order_by("-pk")
+        ):
+            ownerships[ownership.calendar_fk_id] = ownership
+
+        to_create: list[CalendarOwnership] = []
+        to_update: list[CalendarOwnership] = []
+        for calendar, is_default in is_default_by_calendar.items():
+            ownership = ownerships.get(calendar.id)
+            if ownership is None:
+                to_create.append(
+                    CalendarOwnership(
+                        organization=context.organization,
+                        calendar=calendar,
+                        membership_user_id=owner_membership_user_id,
+                        is_default=is_default,
+                    )
+                )
+            elif ownership.is_default != is_default:
+                ownership.is_default = is_default
+                to_update.append(ownership)
+
+        if to_create:
+            # A member ownership another import created since the lookup is left as
+            # it is (the partial unique constraint makes the conflict visible);
+            # orphan rows have no unique key to conflict on.
+            CalendarOwnership.objects.bulk_create(to_create, ignore_conflicts=True)
+        if to_update:
+            CalendarOwnership.objects.bulk_update(to_update, ["is_default"])
 
     # ------------------------------------------------------------------
     # Sync request + execution
@@ -729,9 +922,6 @@ class CalendarSyncService:
         :param trigger_source: What kicked off this sync (import/manual/webhook/admin).
         :return: Created CalendarSync instance, or None if the calendar has sync disabled.
         """
-        # Late for the cycle stated in ``request_organization_calendar_resources_import``.
-        from calendar_integration.tasks import sync_calendar_task
-
         context = cast("BaseCalendarService", self._context)
         if not is_authenticated_calendar_service(context):
             raise
@@ -757,6 +947,18 @@ class CalendarSyncService:
             should_update_events=should_update_events,
             trigger_source=trigger_source,
         )
+        self._enqueue_calendar_sync(calendar_sync)
+        return calendar_sync
+
+    def _enqueue_calendar_sync(
+        self, calendar_sync: CalendarSync, countdown: float | None = None
+    ) -> None:
+        """Queue ``sync_calendar_task`` for ``calendar_sync`` as the current account,
+        once the enclosing transaction commits."""
+        # Late for the cycle stated in ``request_organization_calendar_resources_import``.
+        from calendar_integration.tasks import sync_calendar_task
+
+        context = cast("BaseCalendarService", self._context)
         account_type: Literal["social_account", "google_service_account"] = (
             "social_account"
             if isinstance(context.account, SocialAccount)
@@ -767,44 +969,105 @@ class CalendarSyncService:
             raise NotImplementedError("Account is not set for the current service instance.")
 
         # Capture ids by value so the closure is independent of mutable self state.
-        _account_type = account_type
-        _account_id = context.account.id
-        _calendar_sync_id = calendar_sync.id
-        _organization_id = calendar.organization_id
+        args = (account_type, context.account.id, calendar_sync.id, calendar_sync.organization_id)
 
-        transaction.on_commit(
-            lambda: sync_calendar_task.delay(  # type: ignore
-                _account_type, _account_id, _calendar_sync_id, _organization_id
+        if countdown is None:
+            transaction.on_commit(lambda: sync_calendar_task.delay(*args))  # type: ignore
+        else:
+            transaction.on_commit(
+                lambda: sync_calendar_task.apply_async(args, countdown=countdown)  # type: ignore
             )
-        )
-        return calendar_sync
 
     def sync_events(
         self,
         calendar_sync: CalendarSync,
+        prefetched: PrefetchedCalendarEvents | None = None,
     ) -> None:
         """
         Synchronize events for a calendar within a specified date range.
-        :param calendar: The calendar to synchronize.
-        :param start_date: Start date for the event search.
-        :param end_date: End date for the event search.
-        :param update_events: Whether to update existing events.
-        :param sync_token: Token for incremental sync, if available.
+
+        Single-flight per calendar (``calendar_integration.sync_single_flight``): when
+        another sync of the calendar is running, ``calendar_sync`` is left queued and
+        this returns at once; the running sync re-runs once for every sync queued
+        behind it. Once its own pass is done, this does the same for the syncs queued
+        behind it.
+
+        :param calendar_sync: The sync to run. Skipped when another sync's re-run
+            already runs it or ran it successfully.
+        :param prefetched: The calendar's events, already fetched for
+            ``calendar_sync`` (``calendar_integration.outlook_room_sync``); its pass
+            applies them instead of asking the adapter. Dropped when the sync is left
+            queued: the re-run standing for it fetches afresh.
         """
         if not is_authenticated_calendar_service(cast("BaseCalendarService", self._context)):
             raise
 
-        latest_sync = calendar_sync.calendar.latest_sync
+        organization_id = calendar_sync.organization_id
+        calendar_id = calendar_sync.calendar_fk_id
+        pending: CalendarSync | None = calendar_sync
+        while True:
+            with calendar_sync_lock(calendar_id) as acquired:
+                if not acquired:
+                    logger.info(
+                        "Calendar %s is already syncing; sync %s waits for its re-run.",
+                        calendar_id,
+                        calendar_sync.id,
+                    )
+                    return
+                if pending is not None and claim_calendar_sync(pending):
+                    self._run_calendar_sync(pending, prefetched)
+                pending = None
+
+                folded = fold_queued_calendar_syncs(organization_id, calendar_id)
+                if folded is not None and not self._run_folded_calendar_sync(folded):
+                    return
+            # A sync that found the lock held after the fold above has nobody left to
+            # run it but us.
+            if not has_queued_calendar_syncs(organization_id, calendar_id):
+                return
 
-        calendar_sync.status = CalendarSyncStatus.IN_PROGRESS
-        calendar_sync.save(update_fields=["status"])
+    def _run_folded_calendar_sync(self, folded: FoldedCalendarSync) -> bool:
+        """Run the re-run standing for the syncs queued behind the last one.
 
+        :return: ``False`` when the provider asked to come back later: the re-run is
+            queued again for then, the syncs it folded back in the queue with it.
+        """
         try:
-            with transaction.atomic():
-                self._execute_calendar_sync(
-                    calendar_sync,
-                    latest_sync.next_sync_token if latest_sync else None,
-                )
+            self._run_calendar_sync(folded.rerun)
+        except ProviderRetryableError as exc:
+            requeue_folded_calendar_syncs(folded)
+            self._enqueue_calendar_sync(folded.rerun, countdown=exc.retry_after)
+            return False
+        settle_folded_calendar_syncs(folded)
+        return True
+
+    def _run_calendar_sync(
+        self, calendar_sync: CalendarSync, prefetched: PrefetchedCalendarEvents | None = None
+    ) -> None:
+        """Run a claimed ``calendar_sync`` and record its outcome."""
+        if prefetched is not None:
+            sync_token = prefetched.sync_token
+        else:
+            resumable = self._get_resumable_sync_token(calendar_sync)
+            sync_token = resumable.token if resumable is not None else None
+            if resumable is not None:
+                # The round it continues; stored along with the round's next token.
+                calendar_sync.sync_token_window_start = resumable.window_start
+                calendar_sync.sync_token_window_end = resumable.window_end
+
+        try:
+            # One change-version bump per touched calendar for the whole pass, issued
+            # inside the transaction so it rolls back with the sync if the sync fails.
+            with transaction.atomic(), batched_calendar_change_versions():
+                self._execute_calendar_sync(calendar_sync, sync_token, prefetched)
+        except ProviderRetryableError:
+            # Not a failure: the provider quota ran dry or the provider asked us to
+            # come back later. Whatever the pass wrote has rolled back; put the sync
+            # back in the queue state so the task's retry (``sync_calendar_task``) can
+            # pick it up again.
+            calendar_sync.status = CalendarSyncStatus.NOT_STARTED
+            calendar_sync.save(update_fields=["status"])
+            raise
         except Exception as e:  # noqa: BLE001
             # Handle exceptions during synchronization
             # This could include logging the error or re-raising it
@@ -815,11 +1078,94 @@ class CalendarSyncService:
 
         calendar_sync.status = CalendarSyncStatus.SUCCESS
         calendar_sync.save(update_fields=["status"])
+        # Whatever triggered it, a successful sync is an observation of how fast the
+        # calendar changes; the adaptive scheduler plans its next poll from it.
+        record_sync_outcome(calendar_sync, timezone.now())
+
+    def _get_resumable_sync_token(self, calendar_sync: CalendarSync) -> ResumableSyncToken | None:
+        """The provider token an incremental ``calendar_sync`` resumes from, if any.
+
+        Taken from the calendar's most recent successful sync that updated events and
+        stored one. Syncs that do not update events neither consume nor seed tokens:
+        resuming from a token skips every change before it, and those would never
+        be applied. Import and admin syncs exist to rebuild a calendar's state, so
+        they always run full.
+
+        A Microsoft token continues a calendarView delta round, which reports nothing
+        outside the window it was started over: one whose round does not span
+        ``calendar_sync``'s window is dropped, and the sync starts a fresh round.
+        """
+        if not calendar_sync.should_update_events or calendar_sync.trigger_source in (
+            CalendarSyncTriggerSource.IMPORT,
+            CalendarSyncTriggerSource.ADMIN,
+        ):
+            return None
+        latest = (
+            CalendarSync.objects.filter_by_organization(calendar_sync.organization_id)
+            .filter(
+                calendar_fk_id=calendar_sync.calendar_fk_id,
+                status=CalendarSyncStatus.SUCCESS,
+                should_update_events=True,
+            )
+            .exclude(pk=calendar_sync.pk)
+            .exclude(next_sync_token="")
+            .order_by("-created")
+            .values_list("next_sync_token", "sync_token_window_start", "sync_token_window_end")
+            .first()
+        )
+        if latest is None:
+            return None
+        resumable = ResumableSyncToken(*latest)
+        if calendar_sync.calendar.provider == CalendarProvider.MICROSOFT and not (
+            resumable.covers(calendar_sync.start_datetime, calendar_sync.end_datetime)
+        ):
+            logger.info(
+                "Sync token for calendar %s was issued for another window; running a full sync.",
+                calendar_sync.calendar_fk_id,
+            )
+            return None
+        return resumable
 
     def _execute_calendar_sync(
         self,
         calendar_sync: CalendarSync,
         sync_token: str | None = None,
+        prefetched: PrefetchedCalendarEvents | None = None,
+    ) -> None:
+        """Run ``calendar_sync``, incrementally from ``sync_token`` when one is given.
+
+        A token the provider no longer accepts (``SyncTokenExpiredError``, HTTP 410)
+        falls back to a full sync of the window, which stores a fresh token: the
+        calendar recovers its incremental syncs on the same pass instead of running
+        full forever. ``prefetched`` events were fetched from ``sync_token`` by a fetch
+        that has done that fallback already; they are applied as they are.
+        """
+        if prefetched is not None:
+            self._execute_calendar_sync_pass(calendar_sync, sync_token, prefetched)
+            return
+        if sync_token:
+            try:
+                # A savepoint: if the token expires after some pages were applied,
+                # they roll back before the full pass rewrites the window.
+                with transaction.atomic():
+                    self._execute_calendar_sync_pass(calendar_sync, sync_token)
+            except SyncTokenExpiredError:
+                logger.info(
+                    "Sync token for calendar %s expired; falling back to a full sync.",
+                    calendar_sync.calendar_fk_id,
+                )
+            else:
+                return
+            calendar_sync.events_created = 0
+            calendar_sync.events_updated = 0
+            calendar_sync.events_skipped = 0
+        self._execute_calendar_sync_pass(calendar_sync, None)
+
+    def _execute_calendar_sync_pass(
+        self,
+        calendar_sync: CalendarSync,
+        sync_token: str | None,
+        prefetched: PrefetchedCalendarEvents | None = None,
     ) -> None:
         context = cast("BaseCalendarService", self._context)
         if not is_authenticated_calendar_service(context):
@@ -828,51 +1174,120 @@ class CalendarSyncService:
         calendar: Calendar = calendar_sync.calendar
         start_date = calendar_sync.start_datetime
         end_date = calendar_sync.end_datetime
-        should_update_events = calendar_sync.should_update_events
 
-        events_dict = context.calendar_adapter.get_events(
-            calendar.external_id, calendar.is_resource, start_date, end_date, sync_token
+        if prefetched is not None:
+            events_dict = CalendarEventsSyncTypedDict(
+                events=prefetched.events, next_sync_token=prefetched.next_sync_token
+            )
+        else:
+            events_dict = context.calendar_adapter.get_events(
+                calendar.external_id, calendar.is_resource, start_date, end_date, sync_token
+            )
+
+        # Paged pipeline: the adapter iterator is consumed ``SYNC_PAGE_SIZE`` events
+        # at a time, and each page is reconciled against, and written, on its own. A
+        # 365-day resync of a busy room calendar used to hold every provider event,
+        # every existing row of the window and every pending change in memory at
+        # once; now it holds one page of each. What survives across pages is only
+        # what the full-sync deletion pass needs: the external ids seen so far.
+        seen_external_ids: set[str] = set()
+        stale_external_ids: set[str] = set()
+        for page in itertools.batched(events_dict["events"], SYNC_PAGE_SIZE, strict=False):
+            unmatched = self._sync_events_page(calendar_sync, page, seen_external_ids)
+            stale_external_ids.update(unmatched)
+
+        # Handle deletions for full sync
+        if not sync_token:
+            self._handle_deletions_for_full_sync(
+                calendar.id,
+                seen_external_ids,
+                start_date,
+                end_date,
+                stale_external_ids - seen_external_ids,
+            )
+
+        if not sync_token:
+            # A fresh round: a Microsoft token is good for this window only. A resumed
+            # round's window was carried over from the token it resumed.
+            windowed = calendar.provider == CalendarProvider.MICROSOFT
+            calendar_sync.sync_token_window_start = start_date if windowed else None
+            calendar_sync.sync_token_window_end = end_date if windowed else None
+        # Read only now: adapters publish the token once the stream is exhausted.
+        calendar_sync.next_sync_token = events_dict["next_sync_token"] or ""
+        calendar_sync.save(
+            update_fields=[
+                "next_sync_token",
+                "sync_token_window_start",
+                "sync_token_window_end",
+                "events_created",
+                "events_updated",
+                "events_skipped",
+            ]
+        )
+
+    def _sync_events_page(
+        self,
+        calendar_sync: CalendarSync,
+        events: Sequence[CalendarEventAdapterOutputData],
+        seen_external_ids: set[str],
+    ) -> set[str]:
+        """Reconcile and write one page of provider events.
+
+        Existing rows are looked up by the page's external ids only, regardless of the
+        sync window: an event whose stored instant falls outside the window
+        (boundary/multi-day events, timezone shifts) must still update its existing
+        row instead of re-inserting it and colliding with the
+        ``(calendar_fk_id, external_id)`` unique constraint.
+
+        Events whose content fingerprint matches the stored row's are skipped first,
+        before any row is loaded (``_get_unchanged_external_ids``): a webhook-triggered
+        sync re-reads a whole window in which usually one event changed.
+
+        The page's created / updated / skipped counts are added to ``calendar_sync``
+        (saved by ``_execute_calendar_sync``).
+
+        :param seen_external_ids: Updated in place with the ids the page matched, for
+            the full-sync deletion pass.
+        :return: External ids of existing events the page reached but did not match
+            (e.g. not updated because ``should_update_events`` is off). The full-sync
+            deletion pass treats them like unmatched in-window rows.
+        """
+        context = cast("InitializedOrAuthenticatedCalendarService", self._context)
+        calendar: Calendar = calendar_sync.calendar
+        unchanged_external_ids = self._get_unchanged_external_ids(
+            calendar.id,
+            {e.external_id: _sync_fingerprint(e) for e in events if e.external_id},
+            calendar_sync.should_update_events,
         )
-        # Materialize so we can collect the incoming external ids up front; the
-        # batch is already held fully in memory while building `changes` below.
-        events = list(events_dict["events"])
-        next_sync_token = events_dict["next_sync_token"]
-
-        # Match existing rows by the external ids actually being synced, regardless
-        # of the sync window. An event whose stored instant falls outside this
-        # window (boundary/multi-day events, timezone shifts) must still update its
-        # existing row instead of re-inserting it and colliding with the
-        # (calendar_fk_id, external_id) unique constraint.
+        if unchanged_external_ids:
+            seen_external_ids.update(unchanged_external_ids)
+            changed_events = [e for e in events if e.external_id not in unchanged_external_ids]
+            calendar_sync.events_skipped += len(events) - len(changed_events)
+            events = changed_events
         incoming_external_ids = {e.external_id for e in events if e.external_id}
 
-        # Prepare existing data mappings
         (
             calendar_events_by_external_id,
             blocked_times_by_external_id,
         ) = self._get_existing_calendar_data(
-            calendar.id, start_date, end_date, incoming_external_ids
+            calendar.id,
+            calendar_sync.start_datetime,
+            calendar_sync.end_datetime,
+            incoming_external_ids,
+            include_window=False,
         )
 
-        # Process events and collect changes
         changes = self._process_events_for_sync(
             events,
             calendar_events_by_external_id,
             blocked_times_by_external_id,
             calendar,
-            should_update_events,
+            calendar_sync.should_update_events,
         )
-
-        # Handle deletions for full sync
-        if not sync_token:
-            self._handle_deletions_for_full_sync(
-                calendar.id,
-                calendar_events_by_external_id,
-                changes.matched_event_ids,
-                start_date,
-            )
-        else:
-            calendar_sync.next_sync_token = next_sync_token or ""
-            calendar_sync.save(update_fields=["next_sync_token"])
+        seen_external_ids.update(changes.matched_event_ids)
+        unmatched_external_ids = set(calendar_events_by_external_id) - changes.matched_event_ids
+        if not changes.has_changes():
+            return unmatched_external_ids
 
         # Postpaid ``event_occurrences`` allowance check -- checked *before* the bulk
         # write, not per-row after it, exactly like ``_cap_resources_to_resource_calendar_headroom``
@@ -885,7 +1300,8 @@ class CalendarSyncService:
         # ``try/except Exception`` and records the sync as FAILED with this error's
         # message, and the next scheduled sync retries the same window -- a half-applied
         # recurring master (some occurrences visible, some not) would be a worse outcome
-        # than a deferred sync.
+        # than a deferred sync. The check runs per page, but every page runs in the one
+        # transaction ``sync_events`` opens, so a refusal rolls earlier pages back too.
         #
         # That retry behaviour is also why this logs before it raises. ``sync_events``
         # stores ``str(exc)`` on the ``CalendarSync`` row and nothing distinguishes an
@@ -923,6 +1339,12 @@ class CalendarSyncService:
 
         # Apply all changes to database
         self._apply_sync_changes(calendar.id, changes)
+        calendar_sync.events_created += len(changes.events_to_create) + len(
+            changes.blocked_times_to_create
+        )
+        calendar_sync.events_updated += len(changes.events_to_update) + len(
+            changes.blocked_times_to_update
+        )
 
         # Update available time windows if needed
         if calendar.manage_available_windows:
@@ -930,33 +1352,76 @@ class CalendarSyncService:
                 calendar.id,
                 changes.blocked_times_to_create + changes.blocked_times_to_update,
                 changes.events_to_update,
-                start_date,
-                end_date,
+                calendar_sync.start_datetime,
+                calendar_sync.end_datetime,
             )
 
+        return unmatched_external_ids
+
+    def _get_unchanged_external_ids(
+        self,
+        calendar_id: int,
+        fingerprints: dict[str, str],
+        update_events: bool,
+    ) -> set[str]:
+        """External ids in ``fingerprints`` whose stored rows all carry that fingerprint.
+
+        Reads ``(external_id, sync_fingerprint)`` pairs only; no row is instantiated.
+        An id also stored as a ``CalendarEvent`` is never skipped when
+        ``update_events`` is off: that path leaves the event unmatched on purpose, and
+        skipping would mark it seen.
+        """
+        context = cast("InitializedOrAuthenticatedCalendarService", self._context)
+        if not context.organization or not fingerprints:
+            return set()
+
+        matching: set[str] = set()
+        differing: set[str] = set()
+        for model in (CalendarEvent, BlockedTime):
+            rows = (
+                model.objects.filter_by_organization(context.organization.id)
+                .filter(calendar_fk_id=calendar_id, external_id__in=fingerprints)
+                .values_list("external_id", "sync_fingerprint")
+            )
+            for external_id, fingerprint in rows:
+                if fingerprint == fingerprints[external_id] and (
+                    update_events or model is BlockedTime
+                ):
+                    matching.add(external_id)
+                else:
+                    differing.add(external_id)
+        return matching - differing
+
     def _get_existing_calendar_data(
         self,
         calendar_id: int,
         start_date: datetime.datetime,
         end_date: datetime.datetime,
         incoming_external_ids: set[str] | None = None,
+        include_window: bool = True,
     ):
         """Get existing calendar events and blocked times to reconcile against.
 
-        Loads rows that are either (a) inside the sync window — needed so the
-        full-sync deletion pass can spot rows that vanished from the provider — or
-        (b) carry one of the ``incoming_external_ids`` being synced now, even if
-        their stored instant sits outside the window. Without (b), an out-of-window
-        event is treated as new and re-inserted, colliding with the
-        ``(calendar_fk_id, external_id)`` unique constraint.
+        Loads rows that are either (a) inside the sync window, or (b) carry one of the
+        ``incoming_external_ids`` being synced now, even if their stored instant sits
+        outside the window. Without (b), an out-of-window event is treated as new and
+        re-inserted, colliding with the ``(calendar_fk_id, external_id)`` unique
+        constraint.
+
+        The paged sync pipeline passes ``include_window=False`` and loads (b) only: it
+        reconciles one page at a time, and the full-sync deletion pass finds vanished
+        in-window rows in SQL (``_handle_deletions_for_full_sync``) instead.
         """
         context = cast("InitializedOrAuthenticatedCalendarService", self._context)
         if not context.organization:
             return ({}, {})
 
-        window = Q(start_time__gte=start_date, end_time__lte=end_date)
+        window = Q(start_time__gte=start_date, end_time__lte=end_date) if include_window else None
         if incoming_external_ids:
-            window |= Q(external_id__in=incoming_external_ids)
+            by_external_id = Q(external_id__in=incoming_external_ids)
+            window = by_external_id if window is None else window | by_external_id
+        if window is None:
+            return ({}, {})
 
         calendar_events_by_external_id = {
             e.external_id: e
@@ -994,6 +1459,123 @@ class CalendarSyncService:
             1 for event in changes.events_to_create if event.parent_recurring_object_fk_id is None
         )
 
+    # ------------------------------------------------------------------
+    # Outlook rooms
+    # ------------------------------------------------------------------
+
+    def request_outlook_rooms_sync(self) -> None:
+        """Queue a sync of every Outlook room of the organization, as the current
+        account. See ``calendar_integration.outlook_room_sync``."""
+        # Late for the cycle stated in ``request_organization_calendar_resources_import``.
+        from calendar_integration.tasks import sync_outlook_rooms_task
+
+        context = cast("BaseCalendarService", self._context)
+        if not is_authenticated_calendar_service(context):
+            raise
+        self._check_not_restricted()
+
+        if (
+            not isinstance(context.account, SocialAccount)
+            or context.account.provider != CalendarProvider.MICROSOFT
+        ):
+            raise NotImplementedError("Outlook rooms sync through a Microsoft social account.")
+
+        # Capture ids by value so the closure is independent of mutable self state.
+        _social_account_id = context.account.id
+        _organization_id = context.organization.id
+
+        transaction.on_commit(
+            lambda: sync_outlook_rooms_task.delay(  # type: ignore
+                social_account_id=_social_account_id,
+                organization_id=_organization_id,
+            )
+        )
+
+    def sync_outlook_rooms(
+        self,
+        start_datetime: datetime.datetime,
+        end_datetime: datetime.datetime,
+        chunk_size: int = OUTLOOK_ROOM_SYNC_CHUNK_SIZE,
+        max_concurrency: int = OUTLOOK_ROOM_SYNC_MAX_CONCURRENCY,
+    ) -> OutlookRoomSyncSummary:
+        """Sync every live, sync-enabled Outlook room of the organization.
+
+        Rooms are fetched concurrently, ``chunk_size`` at a time, and applied one by
+        one through ``sync_events``. See ``calendar_integration.outlook_room_sync``.
+
+        :param start_datetime: Window of the rooms that have no delta token yet.
+        :param end_datetime: End of that window.
+        :return: How many rooms synced, failed, or were left for another sync.
+        """
+        context = cast("BaseCalendarService", self._context)
+        if not is_authenticated_calendar_service(context):
+            raise
+        if context.calendar_adapter.provider != CalendarProvider.MICROSOFT:
+            raise NotImplementedError("Outlook rooms sync through a Microsoft account.")
+
+        organization_id = context.organization.id
+        rooms = list(outlook_rooms(organization_id))
+        sync_tokens = latest_room_sync_tokens(organization_id, [room.id for room in rooms])
+
+        summary = OutlookRoomSyncSummary()
+        for chunk in itertools.batched(rooms, chunk_size, strict=False):
+            calendar_syncs = CalendarSync.objects.bulk_create(
+                [
+                    CalendarSync(
+                        calendar=room,
+                        organization_id=organization_id,
+                        start_datetime=start_datetime,
+                        end_datetime=end_datetime,
+                        should_update_events=True,
+                        trigger_source=CalendarSyncTriggerSource.SCHEDULED,
+                    )
+                    for room in chunk
+                ]
+            )
+            deltas = fetch_room_deltas(
+                cast("MSOutlookCalendarAdapter", context.calendar_adapter),
+                [
+                    (calendar_sync, room.external_id, sync_tokens.get(room.id))
+                    for calendar_sync, room in zip(calendar_syncs, chunk, strict=True)
+                ],
+                max_concurrency,
+            )
+            for delta in deltas:
+                self._apply_room_delta(delta, summary)
+
+        logger.info(
+            "Outlook rooms sync of organization %s: %s synced, %s failed, %s deferred.",
+            organization_id,
+            summary.synced,
+            summary.failed,
+            summary.deferred,
+        )
+        return summary
+
+    def _apply_room_delta(self, delta: RoomDelta, summary: OutlookRoomSyncSummary) -> None:
+        """Apply one room's fetched delta, and count its outcome in ``summary``."""
+        calendar_sync = delta.calendar_sync
+        if isinstance(delta.error, ProviderRetryableError):
+            # Graph asked to come back later: the room's own task does, and resumes
+            # from the same token.
+            self._enqueue_calendar_sync(calendar_sync, countdown=delta.error.retry_after)
+            summary.deferred += 1
+            return
+        if delta.error is not None:
+            calendar_sync.status = CalendarSyncStatus.FAILED
+            calendar_sync.error_message = str(delta.error)
+            calendar_sync.save(update_fields=["status", "error_message"])
+            summary.failed += 1
+            return
+
+        self.sync_events(calendar_sync, prefetched=delta.prefetched)
+        if calendar_sync.status == CalendarSyncStatus.SUCCESS:
+            summary.synced += 1
+        elif calendar_sync.status == CalendarSyncStatus.NOT_STARTED:
+            summary.deferred += 1
+        else:
+            summary.failed += 1
+
     # ------------------------------------------------------------------
     # Diff/merge machine
     # ------------------------------------------------------------------
@@ -1006,7 +1588,12 @@ class CalendarSyncService:
         calendar: Calendar,
         update_events: bool,
     ) -> EventsSyncChanges:
-        """Process events and determine what changes need to be made."""
+        """Process events and determine what changes need to be made.
+
+        Under the FORBIDDEN policy each inbound edit is undone on the provider through
+        the sync's adapter. Those undos are not batched: the change request records an
+        undo only once the provider has taken it.
+        """
         changes = EventsSyncChanges()
 
         for event in events:
@@ -1017,9 +1604,14 @@ class CalendarSyncService:
                 self._process_existing_event(event, existing_event, changes, update_events)
             elif existing_blocked_time:
                 self._process_existing_blocked_time(event, existing_blocked_time, changes)
+            elif event.status == "cancelled":
+                # The deletion of something never stored here (incremental syncs
+                # replay every deletion since the token): nothing to do.
+                continue
             else:
                 self._process_new_event(event, calendar, changes)
 
+        self._process_page_attendees(changes.attendee_diffs, changes)
         return changes
 
     def _process_existing_event(
@@ -1233,16 +1825,27 @@ class CalendarSyncService:
             return
 
         # ALLOW (default): apply the incoming changes directly to the local event.
+        # ``start_time`` / ``end_time`` are generated columns: the write goes through
+        # the local wall-clock fields, and the instants are mirrored in memory for the
+        # available-window pruning that runs before the rows are re-read.
         existing_event.title = event.title
         existing_event.description = event.description
+        existing_event.start_time_tz_unaware = self.convert_naive_utc_datetime_to_timezone(
+            event.start_time, event.timezone
+        )
+        existing_event.end_time_tz_unaware = self.convert_naive_utc_datetime_to_timezone(
+            event.end_time, event.timezone
+        )
+        existing_event.timezone = event.timezone
         existing_event.start_time = event.start_time
         existing_event.end_time = event.end_time
+        existing_event.sync_fingerprint = _sync_fingerprint(event)
         existing_event.meta["latest_original_payload"] = event.original_payload or {}
         changes.events_to_update.append(existing_event)
         changes.matched_event_ids.add(existing_event.external_id)
 
-        # Process attendees
-        self._process_event_attendees(event, existing_event, changes)
+        # Attendees are diffed for the whole page by ``_process_events_for_sync``.
+        changes.attendee_diffs.append((event, existing_event))
 
     def _process_existing_blocked_time(
         self,
@@ -1257,10 +1860,18 @@ class CalendarSyncService:
             return
 
         # Update existing blocked time
+        existing_blocked_time.start_time_tz_unaware = self.convert_naive_utc_datetime_to_timezone(
+            event.start_time, event.timezone
+        )
+        existing_blocked_time.end_time_tz_unaware = self.convert_naive_utc_datetime_to_timezone(
+            event.end_time, event.timezone
+        )
+        existing_blocked_time.timezone = event.timezone
         existing_blocked_time.start_time = event.start_time
         existing_blocked_time.end_time = event.end_time
         existing_blocked_time.reason = event.title
         existing_blocked_time.external_id = event.external_id
+        existing_blocked_time.sync_fingerprint = _sync_fingerprint(event)
         existing_blocked_time.meta["latest_original_payload"] = event.original_payload or {}
         changes.blocked_times_to_update.append(existing_blocked_time)
         changes.matched_event_ids.add(existing_blocked_time.external_id)
@@ -1291,6 +1902,7 @@ class CalendarSyncService:
                     title=event.title,
                     description=event.description,
                     external_id=event.external_id,
+                    sync_fingerprint=_sync_fingerprint(event),
                     meta={"latest_original_payload": event.original_payload or {}},
                     organization_id=calendar.organization_id,
                     parent_recurring_object_fk=parent_event,
@@ -1313,6 +1925,7 @@ class CalendarSyncService:
                         timezone=event.timezone,
                         reason=event.title,
                         external_id=event.external_id,
+                        sync_fingerprint=_sync_fingerprint(event),
                         meta={
                             "latest_original_payload": event.original_payload or {},
                             "pending_parent_external_id": event.recurring_event_id,
@@ -1340,6 +1953,7 @@ class CalendarSyncService:
                 title=event.title,
                 description=event.description,
                 external_id=event.external_id,
+                sync_fingerprint=_sync_fingerprint(event),
                 meta={"latest_original_payload": event.original_payload or {}},
                 organization_id=calendar.organization_id,
                 recurrence_rule_fk=recurrence_rule,
@@ -1361,6 +1975,7 @@ class CalendarSyncService:
                     timezone=event.timezone,
                     reason=event.title,
                     external_id=event.external_id,
+                    sync_fingerprint=_sync_fingerprint(event),
                     meta={"latest_original_payload": event.original_payload or {}},
                     organization_id=calendar.organization_id,
                 )
@@ -1374,99 +1989,186 @@ class CalendarSyncService:
         existing_event: CalendarEvent,
         changes: EventsSyncChanges,
     ):
-        """Process attendees for an existing event."""
-        for attendee in event.attendees:
-            user = User.objects.filter(email=attendee.email).first()
-
-            # Resolve the membership-backed identity for the synced attendee;
-            # a non-member (orphan) stays NULL so the composite PROTECT FK holds.
-            membership_user_id = (
-                user.id
-                if user
-                and OrganizationMembership.objects.filter(
-                    organization_id=existing_event.organization_id,
-                    user_id=user.id,
-                ).exists()
-                else None
-            )
+        """Diff one existing event's attendees against the provider's.
 
-            # A member attendance is deduped by ``membership_user_id``.
-            member_attendance_exists = (
-                membership_user_id is not None
-                and existing_event.attendances.filter(
-                    membership_user_id=membership_user_id
-                ).exists()
-            )
+        A page of one; see ``_process_page_attendees``.
+        """
+        self._process_page_attendees([(event, existing_event)], changes)
 
-            # A synced attendee whose email matches a ``User`` who is NOT an org member
-            # is treated as an EXTERNAL attendee (deduped by email) — internal
-            # attendances are membership-only post-cutover, so a non-member has no
-            # membership-backed identity to dedupe on.
-            if membership_user_id is not None and not member_attendance_exists:
-                changes.attendances_to_create.append(
-                    EventAttendance(
-                        organization_id=existing_event.organization_id,
-                        event=existing_event,
-                        membership_user_id=membership_user_id,
-                        status=attendee.status,
-                    )
+    def _process_page_attendees(
+        self,
+        attendee_diffs: Sequence[tuple[CalendarEventAdapterOutputData, CalendarEvent]],
+        changes: EventsSyncChanges,
+    ):
+        """Diff the attendees of a page of existing events against the provider's.
+
+        The diff costs a fixed handful of queries per page however many events and
+        attendees it has: one resolves which attendee emails belong to organization
+        members, one loads the page's member attendances and one its external
+        attendances, and one more loads (plus one bulk-creates) the
+        ``ExternalAttendee`` rows new external attendances point at.
+
+        A synced attendee whose email matches a ``User`` who is NOT an org member is
+        treated as an EXTERNAL attendee (deduped by email) -- internal attendances are
+        membership-only post-cutover, so a non-member has no membership-backed
+        identity to dedupe on; a non-member (orphan) stays out of ``EventAttendance``
+        so its composite PROTECT FK holds.
+
+        Existing attendances whose status changed are queued in
+        ``attendances_to_update`` / ``external_attendances_to_update``.
+        """
+        # Last occurrence wins when the provider repeats an email within an event.
+        page = [
+            (existing_event, {attendee.email: attendee for attendee in event.attendees})
+            for event, existing_event in attendee_diffs
+            if event.attendees
+        ]
+        if not page:
+            return
+        organization_id = page[0][0].organization_id
+        event_ids = [existing_event.id for existing_event, _ in page]
+        emails = {email for _, attendees_by_email in page for email in attendees_by_email}
+
+        member_user_ids_by_email = dict(
+            OrganizationMembership.objects.filter(
+                organization_id=organization_id,
+                user__email__in=emails,
+            ).values_list("user__email", "user_id")
+        )
+        member_attendances = (
+            {
+                (attendance.event_fk_id, attendance.membership_user_id): attendance
+                for attendance in EventAttendance.objects.filter_by_organization(
+                    organization_id
+                ).filter(
+                    event_fk_id__in=event_ids,
+                    membership_user_id__in=member_user_ids_by_email.values(),
                 )
-            elif (
-                membership_user_id is None
-                and not existing_event.external_attendances.filter(
-                    external_attendee__email=attendee.email
-                ).exists()
-            ):
-                external_attendee, _created = ExternalAttendee.objects.get_or_create(
-                    email=attendee.email,
-                    organization_id=existing_event.calendar.organization_id,
-                    defaults={"name": attendee.name},
+            }
+            if member_user_ids_by_email
+            else {}
+        )
+        external_emails = emails - set(member_user_ids_by_email)
+        external_attendances = (
+            {
+                (attendance.event_fk_id, attendance.external_attendee.email): attendance
+                for attendance in EventExternalAttendance.objects.filter_by_organization(
+                    organization_id
                 )
-                changes.external_attendances_to_create.append(
-                    EventExternalAttendance(
-                        event=existing_event,
-                        external_attendee=external_attendee,
-                        status=attendee.status,
-                        organization_id=existing_event.calendar.organization_id,
-                    )
+                .filter(event_fk_id__in=event_ids, external_attendee__email__in=external_emails)
+                .select_related("external_attendee")
+            }
+            if external_emails
+            else {}
+        )
+
+        new_external_attendances: list[tuple[CalendarEvent, str, EventAttendeeData]] = []
+        for existing_event, attendees_by_email in page:
+            for email, attendee in attendees_by_email.items():
+                membership_user_id = member_user_ids_by_email.get(email)
+                if membership_user_id is not None:
+                    attendance = member_attendances.get((existing_event.id, membership_user_id))
+                    if attendance is None:
+                        changes.attendances_to_create.append(
+                            EventAttendance(
+                                organization_id=organization_id,
+                                event=existing_event,
+                                membership_user_id=membership_user_id,
+                                status=attendee.status,
+                            )
+                        )
+                    elif attendance.status != attendee.status:
+                        attendance.status = attendee.status
+                        changes.attendances_to_update.append(attendance)
+                    continue
+                external_attendance = external_attendances.get((existing_event.id, email))
+                if external_attendance is None:
+                    new_external_attendances.append((existing_event, email, attendee))
+                elif external_attendance.status != attendee.status:
+                    external_attendance.status = attendee.status
+                    changes.external_attendances_to_update.append(external_attendance)
+        if not new_external_attendances:
+            return
+
+        new_external_emails = {email for _, email, _ in new_external_attendances}
+        external_attendees_by_email = {
+            external_attendee.email: external_attendee
+            for external_attendee in ExternalAttendee.objects.filter_by_organization(
+                organization_id
+            ).filter(email__in=new_external_emails)
+        }
+        names_by_email = {email: attendee.name for _, email, attendee in new_external_attendances}
+        missing_emails = new_external_emails - set(external_attendees_by_email)
+        if missing_emails:
+            created = ExternalAttendee.objects.bulk_create(
+                ExternalAttendee(
+                    email=email,
+                    name=names_by_email[email],
+                    organization_id=organization_id,
                 )
-            else:
-                # Update existing attendance status if needed. Reached when the
-                # attendee is an existing member attendance (matched by
-                # membership_user_id) or an existing external attendance (matched by
-                # email).
-                attendance = (
-                    existing_event.attendances.filter(membership_user_id=membership_user_id).first()
-                    if membership_user_id is not None
-                    else None
-                ) or existing_event.external_attendances.filter(
-                    external_attendee__email=attendee.email
-                ).first()
-                if attendance:
-                    attendance.status = attendee.status
+                for email in sorted(missing_emails)
+            )
+            external_attendees_by_email.update(
+                (external_attendee.email, external_attendee) for external_attendee in created
+            )
+        for existing_event, email, attendee in sorted(
+            new_external_attendances, key=lambda item: (item[0].id, item[1])
+        ):
+            changes.external_attendances_to_create.append(
+                EventExternalAttendance(
+                    event=existing_event,
+                    external_attendee=external_attendees_by_email[email],
+                    status=attendee.status,
+                    organization_id=organization_id,
+                )
+            )
 
     def _handle_deletions_for_full_sync(
         self,
         calendar_id: int,
-        calendar_events_by_external_id: dict,
-        matched_event_ids: set[str],
+        seen_external_ids: set[str],
         start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        stale_external_ids: set[str] | None = None,
     ):
-        """Handle deletions when doing a full sync (no sync_token)."""
+        """Handle deletions when doing a full sync (no sync_token).
+
+        Deletes the calendar's events inside the sync window that the provider no
+        longer returned -- those whose external id is not in ``seen_external_ids`` --
+        plus the ``stale_external_ids`` the pages reached outside the window without
+        matching them. Found in SQL, so the pass never loads the window's rows.
+        """
         context = cast("InitializedOrAuthenticatedCalendarService", self._context)
         if not context.organization:
             return
 
-        deleted_ids = set(calendar_events_by_external_id.keys()) - matched_event_ids
+        candidates = Q(end_time__lte=end_date)
+        if stale_external_ids:
+            candidates |= Q(external_id__in=stale_external_ids)
         CalendarEvent.objects.filter_by_organization(context.organization.id).filter(
+            candidates,
             calendar_fk_id=calendar_id,
-            external_id__in=deleted_ids,
             start_time__gte=start_date,
-        ).delete()
+        ).exclude(external_id__in=seen_external_ids).delete()
 
     def _apply_sync_changes(self, calendar_id: int, changes: EventsSyncChanges):
-        """Apply all the collected changes to the database."""
+        """Apply all the collected changes to the database.
+
+        Blocked times are written with a single upsert on their
+        ``(calendar_fk_id, external_id)`` unique key: new and changed rows go through
+        the same ``INSERT ... ON CONFLICT DO UPDATE``, so a row the page did not
+        know existed (a webhook-triggered sync racing this one, or an instance
+        re-delivered under a new page) updates in place instead of failing the whole
+        sync on the unique constraint. Calendar events keep insert + ``bulk_update``:
+        their only unique key is the global ``external_id``, and an upsert on it could
+        overwrite another calendar's (or organization's) row.
+
+        ``bulk_create`` / ``bulk_update`` send no model signals, so the calendar's
+        change version is bumped here explicitly whenever anything is written.
+        """
         context = cast("InitializedOrAuthenticatedCalendarService", self._context)
+        if changes.has_changes():
+            bump_calendar_change_versions(context.organization.id, [calendar_id])
         # Create recurrence rules first
         if changes.recurrence_rules_to_create:
             RecurrenceRule.objects.bulk_create(changes.recurrence_rules_to_create)
@@ -1475,12 +2177,37 @@ class CalendarSyncService:
         if changes.events_to_create:
             CalendarEvent.objects.bulk_create(changes.events_to_create)
 
-        if changes.blocked_times_to_create:
-            BlockedTime.objects.bulk_create(changes.blocked_times_to_create)
-
         if changes.events_to_update:
             CalendarEvent.objects.bulk_update(
-                changes.events_to_update, ["title", "description", "start_time", "end_time"]
+                changes.events_to_update,
+                [
+                    "title",
+                    "description",
+                    "start_time_tz_unaware",
+                    "end_time_tz_unaware",
+                    "timezone",
+                    "sync_fingerprint",
+                    "meta",
+                ],
+            )
+
+        blocked_times = {
+            blocked_time.external_id: blocked_time
+            for blocked_time in changes.blocked_times_to_update + changes.blocked_times_to_create
+        }
+        if blocked_times:
+            BlockedTime.objects.bulk_create(
+                list(blocked_times.values()),
+                update_conflicts=True,
+                unique_fields=["calendar_fk", "external_id"],
+                update_fields=[
+                    "start_time_tz_unaware",
+                    "end_time_tz_unaware",
+                    "timezone",
+                    "reason",
+                    "sync_fingerprint",
+                    "meta",
+                ],
             )
 
         if changes.attendances_to_create:
@@ -1489,10 +2216,12 @@ class CalendarSyncService:
         if changes.external_attendances_to_create:
             EventExternalAttendance.objects.bulk_create(changes.external_attendances_to_create)
 
-        if changes.blocked_times_to_update:
-            BlockedTime.objects.bulk_update(
-                changes.blocked_times_to_update,
-                ["start_time_tz_unaware", "end_time_tz_unaware", "reason", "external_id"],
+        if changes.attendances_to_update:
+            EventAttendance.objects.bulk_update(changes.attendances_to_update, ["status"])
+
+        if changes.external_attendances_to_update:
+            EventExternalAttendance.objects.bulk_update(
+                changes.external_attendances_to_update, ["status"]
             )
 
         if changes.events_to_delete:
@@ -1514,66 +2243,85 @@ class CalendarSyncService:
         """
         Link recurring event instances that were created before their parent events
         were synced. This happens when webhook events come out of order.
+
+        Runs in a fixed number of queries however many orphans a burst of
+        out-of-order webhooks left behind: one load each for orphaned events and
+        blocked times, one lookup of every pending parent external id at once, and one
+        ``bulk_update`` per model for the rows whose parent now exists.
         """
         context = cast("InitializedOrAuthenticatedCalendarService", self._context)
         if not context.organization:
             return
 
         # Find events that have a pending parent external ID in their meta
-        orphaned_instances = CalendarEvent.objects.filter_by_organization(
-            context.organization.id
-        ).filter(
-            calendar_fk_id=calendar_id,
-            parent_recurring_object__isnull=True,
-            meta__pending_parent_external_id__isnull=False,
+        orphaned_instances = list(
+            CalendarEvent.objects.filter_by_organization(context.organization.id).filter(
+                calendar_fk_id=calendar_id,
+                parent_recurring_object__isnull=True,
+                meta__pending_parent_external_id__isnull=False,
+            )
         )
 
         # Also find blocked times that might be orphaned instances
-        orphaned_blocked_times = BlockedTime.objects.filter_by_organization(
-            context.organization.id
-        ).filter(
-            calendar_fk_id=calendar_id,
-            meta__pending_parent_external_id__isnull=False,
+        orphaned_blocked_times = list(
+            BlockedTime.objects.filter_by_organization(context.organization.id).filter(
+                calendar_fk_id=calendar_id,
+                meta__pending_parent_external_id__isnull=False,
+            )
+        )
+
+        pending_parent_external_ids = {
+            orphan.meta.get("pending_parent_external_id")
+            for orphan in (*orphaned_instances, *orphaned_blocked_times)
+        } - {None, ""}
+        if not pending_parent_external_ids:
+            return
+        # Parents still not synced are simply absent here; their orphans are left for
+        # the next sync.
+        parent_ids_by_external_id = dict(
+            CalendarEvent.objects.filter_by_organization(context.organization.id)
+            .filter(external_id__in=pending_parent_external_ids)
+            .values_list("external_id", "id")
         )
 
-        # Link orphaned CalendarEvent instances
+        # Link orphaned CalendarEvent instances to their parent and clear the pending
+        # parent ID
+        linked_instances = []
         for instance in orphaned_instances:
-            parent_external_id = instance.meta.get("pending_parent_external_id")
-            if parent_external_id:
-                try:
-                    parent_event = CalendarEvent.objects.filter_by_organization(
-                        context.organization.id
-                    ).get(
-                        external_id=parent_external_id,
-                    )
-                    # Link the instance to its parent
-                    instance.parent_recurring_object_fk = parent_event
-                    instance.recurrence_id = instance.start_time
-                    # Clear the pending parent ID
-                    instance.meta.pop("pending_parent_external_id", None)
-                    instance.save(
-                        update_fields=["parent_recurring_object_fk", "recurrence_id", "meta"]
-                    )
-                except CalendarEvent.DoesNotExist:
-                    # Parent still not synced, leave it for next sync
-                    continue
+            parent_id = parent_ids_by_external_id.get(
+                instance.meta.get("pending_parent_external_id")
+            )
+            if parent_id is None:
+                continue
+            instance.parent_recurring_object_fk_id = parent_id
+            instance.recurrence_id = instance.start_time
+            instance.meta.pop("pending_parent_external_id", None)
+            linked_instances.append(instance)
+        if linked_instances:
+            CalendarEvent.objects.bulk_update(
+                linked_instances, ["parent_recurring_object_fk", "recurrence_id", "meta"]
+            )
 
         # For orphaned BlockedTime instances, we just clear the pending parent ID
         # since BlockedTime doesn't have parent relationships
+        linked_blocked_times = []
         for blocked_time in orphaned_blocked_times:
-            parent_external_id = blocked_time.meta.get("pending_parent_external_id")
-            if parent_external_id:
-                try:
-                    # Check if parent exists now
-                    CalendarEvent.objects.filter_by_organization(context.organization.id).get(
-                        external_id=parent_external_id,
-                    )
-                    # Parent exists, clear the pending flag
-                    blocked_time.meta.pop("pending_parent_external_id", None)
-                    blocked_time.save(update_fields=["meta"])
-                except CalendarEvent.DoesNotExist:
-                    # Parent still not synced, leave it for next sync
-                    continue
+            if blocked_time.meta.get("pending_parent_external_id") in parent_ids_by_external_id:
+                blocked_time.meta.pop("pending_parent_external_id", None)
+                linked_blocked_times.append(blocked_time)
+        if linked_blocked_times:
+            BlockedTime.objects.bulk_update(linked_blocked_times, ["meta"])
+
+        # ``bulk_update`` sends no model signals; a linked instance changes how its
+        # calendars expand.
+        bump_calendar_change_versions(
+            context.organization.id,
+            {
+                calendar_fk_id
+                for row in (*linked_instances, *linked_blocked_times)
+                for calendar_fk_id in (row.calendar_fk_id, row.bundle_calendar_fk_id)
+            },
+        )
 
     # ------------------------------------------------------------------
     # Internal helpers
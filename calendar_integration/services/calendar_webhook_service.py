@@ -38,9 +38,10 @@ extracts the organization and writes ``self.organization = organization`` before
 calling ``_get_webhook_service().handle_webhook()``.  Because
 :meth:`CalendarService._build_context_snapshot` reads live facade attributes,
 the freshly-constructed sub-service already has the correct organization in its
-frozen context.  All downstream sub-service methods (including the fresh sub-service
-instances the host creates for the ``request_webhook_triggered_sync`` callback) also
-see it via ``_build_context_snapshot`` called at that point.
+frozen context, which is all ``handle_webhook`` needs to record the notification.
+The sync it leads to is requested later, by ``process_webhook_events_task``, on a
+facade authenticated as the calendar's owner (see
+``calendar_integration.webhook_ingestion``).
 """
 
 from __future__ import annotations
@@ -48,12 +49,16 @@ from __future__ import annotations
 import datetime
 import json
 import logging
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Protocol, TypedDict, cast
 
 from django.conf import settings
-from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models import QuerySet, Value
+from django.db.models.functions import Greatest, Least
 from django.http import HttpRequest
 from django.urls import reverse
+from django.utils import timezone
 
 from vinta_billing.exceptions import OverLimitError
 
@@ -84,6 +89,18 @@ from calendar_integration.services.type_guards import (
     is_authenticated_calendar_service,
     is_initialized_or_authenticated_calendar_service,
 )
+from calendar_integration.webhook_debounce import (
+    note_webhook_notifications,
+    webhook_calendar_key,
+)
+from calendar_integration.webhook_health import webhook_health_by_organization
+from calendar_integration.webhook_ingestion import schedule_webhook_drain
+from calendar_integration.webhook_renewal import (
+    WEBHOOK_SUBSCRIPTION_TTL,
+    SubscriptionRenewal,
+    WebhookRenewalSummary,
+    renew_subscriptions,
+)
 
 
 if TYPE_CHECKING:
@@ -93,6 +110,30 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# How long a queued webhook-triggered sync may wait for a worker and still be widened
+# by later notifications. Older ones are presumed lost with their task.
+QUEUED_SYNC_REUSE_WINDOW = datetime.timedelta(minutes=15)
+
+
+def _parse_subscription_expiration(
+    provider: str, expiration: str | int | None
+) -> datetime.datetime | None:
+    """A subscription's expiration as the provider's adapter reports it.
+
+    Google reports milliseconds since the epoch, Microsoft an ISO 8601 string.
+    ``None`` when the value is missing or malformed.
+    """
+    if expiration is None:
+        return None
+    try:
+        if provider == CalendarProvider.GOOGLE:
+            return datetime.datetime.fromtimestamp(int(expiration) / 1000, tz=datetime.UTC)
+        if provider == CalendarProvider.MICROSOFT:
+            return datetime.datetime.fromisoformat(str(expiration).replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+    return None
+
 
 class WebhookHealthStatus(TypedDict):
     """Health metrics for the webhook system of an organization."""
@@ -145,6 +186,7 @@ class WebhookServiceHost(Protocol):
         external_calendar_id: str,
         webhook_event: CalendarWebhookEvent,
         sync_window_hours: int = 24,
+        first_notified_at: datetime.datetime | None = None,
     ) -> CalendarSync | None: ...
 
     def _get_calendar_adapter_cls_for_provider(self, provider: CalendarProvider) -> Any: ...
@@ -178,15 +220,22 @@ class CalendarWebhookService:
         external_calendar_id: str,
         webhook_event: CalendarWebhookEvent,
         sync_window_hours: int = 24,
+        first_notified_at: datetime.datetime | None = None,
     ) -> CalendarSync | None:
         """Request calendar sync triggered by webhook notification.
 
         Reuses existing request_calendar_sync with webhook-specific optimizations.
+        Bursts of notifications are debounced before this is called (see
+        ``calendar_integration.webhook_debounce``), so every call requests a sync,
+        save for one already queued for the calendar and not yet started: that one
+        is widened to the requested window instead, and still sees the changes.
 
         Args:
             external_calendar_id: External calendar ID from webhook
             webhook_event: The webhook event that triggered this sync
             sync_window_hours: Hours around current time to sync
+            first_notified_at: Earliest notification the sync answers for; the window
+                is widened to start half of ``sync_window_hours`` before it
 
         Returns:
             CalendarSync instance if sync was triggered, None if skipped
@@ -232,33 +281,46 @@ class CalendarWebhookService:
             logger.warning("Calendar not found for external_id: %s", external_calendar_id)
             return None
 
-        # Check for recent syncs to prevent excessive syncing (deduplication)
+        # Define sync window around current time, widened back to the earliest
+        # notification gathered for this sync
+        half_window = datetime.timedelta(hours=sync_window_hours // 2)
+        start_datetime = min(now, first_notified_at or now) - half_window
+        end_datetime = now + half_window
+
+        # A sync queued for the calendar but not picked up yet fetches the calendar as
+        # it is when it runs; widen it rather than queue a second one. The update is
+        # conditional so a sync a worker starts meanwhile is left alone and a new one
+        # requested below.
         # ``unscoped()``: ``calendar`` is an organization-safe relation, so filtering
         # it by instance puts the calendar's ``organization_id`` in the ``ON`` clause.
-        recent_sync = (
+        queued_sync = (
             CalendarSync.objects.unscoped()
             .filter(
                 calendar=calendar,
-                created__gte=now - datetime.timedelta(minutes=5),
-                status__in=[CalendarSyncStatus.IN_PROGRESS, CalendarSyncStatus.SUCCESS],
+                status=CalendarSyncStatus.NOT_STARTED,
+                created__gte=now - QUEUED_SYNC_REUSE_WINDOW,
             )
+            .order_by("-created")
             .first()
         )
-
-        if recent_sync:
+        if queued_sync and (
+            CalendarSync.objects.unscoped()
+            .filter(pk=queued_sync.pk, status=CalendarSyncStatus.NOT_STARTED)
+            .update(
+                start_datetime=Least("start_datetime", Value(start_datetime)),
+                end_datetime=Greatest("end_datetime", Value(end_datetime)),
+                should_update_events=True,
+            )
+        ):
             logger.info(
-                "Skipping sync for calendar %s, recent sync exists: %s",
+                "Widened queued sync %s for calendar %s instead of requesting another",
+                queued_sync.id,
                 calendar.id,
-                recent_sync.id,
             )
-            webhook_event.calendar_sync = recent_sync
+            webhook_event.calendar_sync = queued_sync
             webhook_event.processing_status = IncomingWebhookProcessingStatus.PROCESSED
             webhook_event.save()
-            return recent_sync
-
-        # Define sync window around current time
-        start_datetime = now - datetime.timedelta(hours=sync_window_hours // 2)
-        end_datetime = now + datetime.timedelta(hours=sync_window_hours // 2)
+            return queued_sync
 
         # Use existing request_calendar_sync method via the host (the sync concern)
         # so the facade's delegation path is preserved.
@@ -358,26 +420,9 @@ class CalendarWebhookService:
                 f"Webhook subscriptions not supported for provider: {calendar.provider}"
             )
 
-        # Calculate expiration datetime
-        expiration_timestamp = subscription_data.get("expiration")
-        expires_at = None
-        if expiration_timestamp is not None:
-            try:
-                if calendar.provider == CalendarProvider.GOOGLE:
-                    # Google returns expiration as milliseconds since epoch
-                    expires_at = datetime.datetime.fromtimestamp(
-                        int(expiration_timestamp) / 1000, tz=datetime.UTC
-                    )
-                elif calendar.provider == CalendarProvider.MICROSOFT:
-                    # Microsoft returns expiration as ISO 8601 string
-                    expires_at = datetime.datetime.fromisoformat(
-                        expiration_timestamp.replace("Z", "+00:00")
-                    )
-            except (ValueError, TypeError):
-                # Log or handle malformed expiration value gracefully
-                expires_at = None
-                # Log or handle malformed expiration value gracefully
-                expires_at = None
+        expires_at = _parse_subscription_expiration(
+            calendar.provider, subscription_data.get("expiration")
+        )
 
         # Create tracking record
         webhook_subscription = CalendarWebhookSubscription.objects.create(
@@ -531,42 +576,78 @@ class CalendarWebhookService:
 
     def handle_webhook(
         self, provider: CalendarProvider, request: HttpRequest
-    ) -> CalendarWebhookEvent | None:
-        """Handle calendar webhook processing with organization context.
+    ) -> list[CalendarWebhookEvent]:
+        """Record an incoming webhook for the background drain and return at once.
 
         The facade's ``handle_webhook`` extracts the organization and writes
         ``self.organization`` *before* constructing this sub-service instance, so
         ``self._context.organization`` is already set when this method is called.
-        This method only needs to parse the provider-specific headers and delegate
-        to ``process_webhook_notification``.
+
+        Only what answers the provider is done here: the notification is validated
+        statically (headers and body, no calendar lookup or adapter), one ``PENDING``
+        ``CalendarWebhookEvent`` is inserted per notified calendar, and once they are
+        committed the calendars are noted for the debounce and a drain is scheduled. The calendar lookup, dedupe and sync
+        request run in ``process_webhook_events_task``; see
+        ``calendar_integration.webhook_ingestion``.
 
         Args:
             provider: Calendar provider enum
             request: HttpRequest object containing webhook data
 
         Returns:
-            CalendarWebhookEvent if processed successfully, None for sync notifications
+            The recorded events; empty for notifications that need no sync (Google's
+            ``sync`` handshake)
 
         Raises:
-            ValueError: If webhook validation fails or organization not found
-            Exception: If processing fails
+            WebhookProcessingFailedError: If the notification is malformed
         """
         calendar_adapter_cls = self._host._get_calendar_adapter_cls_for_provider(provider)
-
         headers = calendar_adapter_cls.parse_webhook_headers(request.headers)
-        calendar_external_id = (
-            calendar_adapter_cls.extract_calendar_external_id_from_webhook_request(request)
-        )
-
-        # Process the webhook notification
+        body = request.body.decode("utf-8", errors="replace")
         try:
-            return self.process_webhook_notification(
-                provider=provider,
-                calendar_external_id=calendar_external_id,
-                headers=headers,
-            )
+            parsed_data = calendar_adapter_cls.validate_webhook_notification_static(headers, body)
         except WebhookIgnoredError:
-            return None
+            return []
+
+        org_context = cast("InitializedOrAuthenticatedCalendarService", self._context)
+        if not org_context.organization:
+            raise ValueError("Organization context not set on calendar service")
+        organization_id = org_context.organization.id
+
+        try:
+            payload = json.loads(body) if body else {}
+        except json.JSONDecodeError:
+            payload = {}
+        raw_payload = payload if isinstance(payload, dict) else {"raw": body}
+
+        # Microsoft batches notifications, possibly for several calendars, in one
+        # request; Google sends one per request.
+        notifications = parsed_data.get("notifications") or [parsed_data]
+        webhook_events = CalendarWebhookEvent.objects.bulk_create(
+            [
+                CalendarWebhookEvent(
+                    organization_id=organization_id,
+                    provider=provider,
+                    event_type=notification.get("event_type", "unknown"),
+                    external_calendar_id=notification.get("calendar_id", ""),
+                    external_event_id=notification.get("event_id") or "",
+                    raw_payload=raw_payload,
+                    headers=headers,
+                    processing_status=IncomingWebhookProcessingStatus.PENDING,
+                )
+                for notification in notifications
+            ]
+        )
+        calendar_keys = [
+            webhook_calendar_key(provider, event.external_calendar_id) for event in webhook_events
+        ]
+
+        def after_commit() -> None:
+            note_webhook_notifications(organization_id, calendar_keys, timezone.now())
+            schedule_webhook_drain(organization_id)
+
+        transaction.on_commit(after_commit)
+        return webhook_events
 
     def list_webhook_subscriptions(self) -> QuerySet[CalendarWebhookSubscription]:
         """List all active webhook subscriptions for the organization.
@@ -627,6 +708,10 @@ class CalendarWebhookService:
     ) -> CalendarWebhookSubscription | None:
         """Refresh/renew a webhook subscription with the provider.
 
+        Renewed through the authenticated account's adapter, for the longest life the
+        provider grants (see ``calendar_integration.webhook_renewal``). Without an
+        authenticated account only the local expiration is moved.
+
         Args:
             subscription_id: ID of the subscription to refresh
 
@@ -634,40 +719,134 @@ class CalendarWebhookService:
             Updated CalendarWebhookSubscription if successful, None if not found
 
         Raises:
-            ValueError: If organization is not set
+            ValueError: If organization is not set, or the provider refused the renewal
         """
         context = cast("InitializedOrAuthenticatedCalendarService", self._context)
         if not context.organization:
             raise ValueError("Organization must be set")
 
         try:
-            subscription = CalendarWebhookSubscription.objects.filter_by_organization(
-                context.organization
-            ).get(
-                id=subscription_id,
-                is_active=True,
+            subscription = (
+                CalendarWebhookSubscription.objects.filter_by_organization(context.organization)
+                .select_related("calendar")
+                .get(
+                    id=subscription_id,
+                    is_active=True,
+                )
             )
         except CalendarWebhookSubscription.DoesNotExist:
             return None
 
-        # TODO: Implement provider-specific subscription renewal
-        # For now, extend expiration by default duration based on provider
-        now = datetime.datetime.now(tz=datetime.UTC)
-        if subscription.provider == CalendarProvider.GOOGLE:
-            # Google allows max 7 days (604800 seconds)
-            new_expiration = now + datetime.timedelta(days=7)
-        elif subscription.provider == CalendarProvider.MICROSOFT:
-            # Microsoft allows max ~70 hours (4230 minutes)
-            new_expiration = now + datetime.timedelta(minutes=4230)
-        else:
-            # Default to 1 day for other providers
-            new_expiration = now + datetime.timedelta(days=1)
+        base_context = cast("BaseCalendarService", self._context)
+        if is_authenticated_calendar_service(base_context, raise_error=False):
+            adapter = cast("AuthenticatedCalendarService", base_context).calendar_adapter
+            (renewal,) = renew_subscriptions(adapter, [subscription])
+            if renewal.error is not None:
+                raise ValueError(
+                    f"Failed to renew webhook subscription: {renewal.error!s}"
+                ) from renewal.error
+            self._store_renewals([renewal])
+            return subscription
 
-        subscription.expires_at = new_expiration
+        # Without an authenticated account nothing can reach the provider: this only
+        # moves the local expiration, by the provider's maximum.
+        now = datetime.datetime.now(tz=datetime.UTC)
+        subscription.expires_at = now + WEBHOOK_SUBSCRIPTION_TTL.get(
+            CalendarProvider(subscription.provider), datetime.timedelta(days=1)
+        )
         subscription.save(update_fields=["expires_at", "modified"])
 
         return subscription
 
+    def renew_webhook_subscriptions(self, subscription_ids: Sequence[int]) -> WebhookRenewalSummary:
+        """Renew subscriptions with their provider, as the authenticated account.
+
+        The renewals run concurrently (see ``calendar_integration.webhook_renewal``),
+        and every renewed subscription's new expiration and channel are stored in one
+        ``bulk_update``. A subscription the provider refused to renew is logged and
+        counted, and keeps its row as it was: it is tried again on the next run while
+        it has not expired.
+
+        Args:
+            subscription_ids: IDs of the subscriptions to renew; those not active, or
+                not the organization's, are skipped
+
+        Returns:
+            WebhookRenewalSummary with how many were renewed and how many failed
+
+        Raises:
+            ValueError: If calendar service not authenticated
+        """
+        context = cast("BaseCalendarService", self._context)
+        if not is_authenticated_calendar_service(context):
+            raise ValueError("Calendar service not authenticated")
+        auth_context = cast("AuthenticatedCalendarService", context)
+
+        subscriptions = list(
+            CalendarWebhookSubscription.objects.filter_by_organization(auth_context.organization)
+            .filter(id__in=subscription_ids, is_active=True)
+            .select_related("calendar")
+            .order_by("id")
+        )
+        renewals = renew_subscriptions(auth_context.calendar_adapter, subscriptions)
+
+        summary = WebhookRenewalSummary()
+        for renewal in renewals:
+            if renewal.error is not None:
+                logger.warning(
+                    "Failed to renew webhook subscription %s: %s",
+                    renewal.subscription.id,
+                    renewal.error,
+                )
+                summary.failed += 1
+        renewed = [renewal for renewal in renewals if renewal.error is None]
+        self._store_renewals(renewed)
+        summary.renewed = len(renewed)
+        return summary
+
+    def _store_renewals(self, renewals: Sequence[SubscriptionRenewal]) -> None:
+        """Store what the provider answered for each renewal, in one statement.
+
+        A Google renewal is a new channel, so the channel and resource ids change
+        with the expiration; a Graph one keeps its id.
+        """
+        now = timezone.now()
+        subscriptions = []
+        for renewal in renewals:
+            subscription = renewal.subscription
+            details = renewal.details or {}
+            subscription.external_subscription_id = (
+                details.get("subscription_id")
+                or details.get("channel_id")
+                or subscription.external_subscription_id
+            )
+            subscription.external_resource_id = (
+                details.get("resource_id") or subscription.external_resource_id
+            )
+            subscription.channel_id = details.get("channel_id") or subscription.channel_id
+            subscription.resource_uri = details.get("resource_uri") or subscription.resource_uri
+            # Without an expiration in the answer the old one stays, and the
+            # subscription is simply renewed again on the next run.
+            subscription.expires_at = (
+                _parse_subscription_expiration(subscription.provider, details.get("expiration"))
+                or subscription.expires_at
+            )
+            # ``bulk_update`` does not touch auto-now fields on its own.
+            subscription.modified = now
+            subscriptions.append(subscription)
+        if subscriptions:
+            CalendarWebhookSubscription.objects.bulk_update(
+                subscriptions,
+                [
+                    "external_subscription_id",
+                    "external_resource_id",
+                    "channel_id",
+                    "resource_uri",
+                    "expires_at",
+                    "modified",
+                ],
+            )
+
     def get_webhook_health_status(self) -> WebhookHealthStatus:
         """Get webhook system health status for the organization.
 
@@ -681,32 +860,15 @@ class CalendarWebhookService:
         if not context.organization:
             raise ValueError("Organization must be set")
 
-        organization = context.organization
+        organization_id = context.organization.id
 
-        # Time boundaries
+        # Every figure in two grouped queries; see ``calendar_integration.webhook_health``.
         now = datetime.datetime.now(tz=datetime.UTC)
-        twenty_four_hours_ago = now - datetime.timedelta(hours=24)
-        expiring_soon_threshold = now + datetime.timedelta(hours=24)
-
-        # Subscription counts
-        subscriptions_qs = CalendarWebhookSubscription.objects.filter_by_organization(organization)
-        total_subscriptions = subscriptions_qs.count()
-        active_subscriptions = subscriptions_qs.filter(is_active=True).count()
-        expired_subscriptions = subscriptions_qs.filter(is_active=True, expires_at__lt=now).count()
-        expiring_soon_subscriptions = subscriptions_qs.filter(
-            is_active=True,
-            expires_at__gte=now,
-            expires_at__lte=expiring_soon_threshold,
-        ).count()
-
-        # Event counts in last 24 hours
-        events_qs = CalendarWebhookEvent.objects.filter_by_organization(organization).filter(
-            created__gte=twenty_four_hours_ago,
-        )
-        recent_events_count = events_qs.count()
-        failed_events_count = events_qs.filter(
-            processing_status=IncomingWebhookProcessingStatus.FAILED
-        ).count()
+        health = webhook_health_by_organization(
+            [organization_id], now=now, events_since=now - datetime.timedelta(hours=24)
+        )[organization_id]
+        recent_events_count = health.total_events
+        failed_events_count = health.failed_events
 
         # Calculate success rate
         if recent_events_count > 0:
@@ -716,10 +878,10 @@ class CalendarWebhookService:
 
         return WebhookHealthStatus(
             {
-                "total_subscriptions": total_subscriptions,
-                "active_subscriptions": active_subscriptions,
-                "expired_subscriptions": expired_subscriptions,
-                "expiring_soon_subscriptions": expiring_soon_subscriptions,
+                "total_subscriptions": health.total_subscriptions,
+                "active_subscriptions": health.active_subscriptions,
+                "expired_subscriptions": health.expired_subscriptions,
+                "expiring_soon_subscriptions": health.expiring_soon_subscriptions,
                 "recent_events_count": recent_events_count,
                 "failed_events_count": failed_events_count,
                 "success_rate": success_rate,
@@ -1,3 +1,4 @@
+import base64
 import datetime
 from collections.abc import Iterable
 from dataclasses import dataclass
@@ -166,6 +167,16 @@ class CalendarEventAdapterOutputData:
     recurring_event_id: str | None = None  # ID of the master recurring event
 
 
+@dataclass
+class RefreshedOAuthToken:
+    """A provider's answer to an OAuth refresh-token grant."""
+
+    token: str
+    expires_at: datetime.datetime | None
+    # Only set when the provider rotated the refresh token (Microsoft does).
+    refresh_token: str | None = None
+
+
 @dataclass
 class CalendarResourceData:
     name: str
@@ -182,6 +193,16 @@ class CalendarResourceData:
     access_role: str | None = None
 
 
+@dataclass
+class CalendarImportCounts:
+    """What an import did to the calendars it discovered, one count per calendar."""
+
+    created: int = 0
+    updated: int = 0
+    # Already stored exactly as discovered: nothing was written.
+    unchanged: int = 0
+
+
 @dataclass
 class EventsSyncChanges:
     events_to_update: list[CalendarEvent] = dataclass_field(default_factory=list)
@@ -192,14 +213,40 @@ class EventsSyncChanges:
     external_attendances_to_create: list[EventExternalAttendance] = dataclass_field(
         default_factory=list
     )
+    attendances_to_update: list[EventAttendance] = dataclass_field(default_factory=list)
+    external_attendances_to_update: list[EventExternalAttendance] = dataclass_field(
+        default_factory=list
+    )
     events_to_delete: list[str] = dataclass_field(default_factory=list)
     blocks_to_delete: list[str] = dataclass_field(default_factory=list)
     matched_event_ids: set[str] = dataclass_field(default_factory=set)
+    # Updated events whose attendees are diffed once for the whole page.
+    attendee_diffs: list[tuple[CalendarEventAdapterOutputData, CalendarEvent]] = dataclass_field(
+        default_factory=list
+    )
     # New fields for recurring events
     recurrence_rules_to_create: list = dataclass_field(
         default_factory=list
     )  # RecurrenceRule objects
 
+    def has_changes(self) -> bool:
+        """Whether applying these changes writes any event, blocked time or attendance."""
+        return any(
+            (
+                self.events_to_update,
+                self.events_to_create,
+                self.blocked_times_to_create,
+                self.blocked_times_to_update,
+                self.attendances_to_create,
+                self.external_attendances_to_create,
+                self.attendances_to_update,
+                self.external_attendances_to_update,
+                self.events_to_delete,
+                self.blocks_to_delete,
+                self.recurrence_rules_to_create,
+            )
+        )
+
 
 @dataclass
 class ApplicationCalendarData:
@@ -215,6 +262,48 @@ class ApplicationCalendarData:
 
 class CalendarEventsSyncTypedDict(TypedDict):
     events: Iterable[CalendarEventAdapterOutputData]
+    # Set by the adapter once ``events`` is exhausted; read it only after iterating.
+    next_sync_token: str | None
+
+
+@dataclass(frozen=True)
+class ResumableSyncToken:
+    """A provider token an incremental sync can resume from.
+
+    :param token: The token.
+    :param window_start: Start of the window of the delta round the token continues;
+        ``None`` when that window is unknown, or the token is bound to none.
+    :param window_end: End of that window.
+    """
+
+    token: str
+    window_start: datetime.datetime | None = None
+    window_end: datetime.datetime | None = None
+
+    def covers(self, start: datetime.datetime, end: datetime.datetime) -> bool:
+        """Whether the token's round spans the whole of ``[start, end]``.
+
+        A round of Microsoft's calendarView delta only ever reports changes within the
+        window it was started over, so resuming it for a wider window misses whatever
+        changes beyond it. A token of unknown window covers nothing.
+        """
+        if self.window_start is None or self.window_end is None:
+            return False
+        return self.window_start <= start and end <= self.window_end
+
+
+@dataclass(frozen=True)
+class PrefetchedCalendarEvents:
+    """A calendar's provider events, fetched before its sync runs.
+
+    :param events: Every event the fetch returned.
+    :param sync_token: The token they were fetched from; ``None`` when they are the
+        whole window, and the sync handles deletions as a full sync does.
+    :param next_sync_token: The token the calendar's next incremental sync resumes.
+    """
+
+    events: list[CalendarEventAdapterOutputData]
+    sync_token: str | None
     next_sync_token: str | None
 
 
@@ -554,3 +643,63 @@ class EffectivePolicy:
             buffer_before=max_buffer_before,
             buffer_after=max_buffer_after,
         )
+
+
+@dataclass(frozen=True, order=True)
+class ExpandedEventCursor:
+    """Keyset position inside a streamed calendar-event expansion.
+
+    Expanded events are ordered by ``(start_time, master_id, occurrence_start)``:
+
+    - ``start_time`` is the event's effective start (a modified occurrence's moved start,
+      not its original one);
+    - ``master_id`` is the recurring master's id for occurrences -- generated or persisted
+      exceptions alike -- and the row's own id for a non-recurring event;
+    - ``occurrence_start`` is the occurrence's original start (``recurrence_id``), which
+      for a non-recurring event is simply its ``start_time`` again.
+
+    The triple is unique within one expansion (a master yields at most one occurrence per
+    original start, and ids are unique across the table), so resuming with
+    ``after=<cursor>`` never repeats or skips an event. The encoded form is opaque to
+    clients: url-safe base64 of the three parts, ``|``-joined.
+    """
+
+    start_time: datetime.datetime
+    master_id: int
+    occurrence_start: datetime.datetime
+
+    def encode(self) -> str:
+        raw = f"{self.start_time.isoformat()}|{self.master_id}|{self.occurrence_start.isoformat()}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @classmethod
+    def decode(cls, value: str) -> "ExpandedEventCursor":
+        """Parse an ``encode()``-d cursor. Raises ``ValueError`` when it is malformed."""
+        try:
+            start_time, master_id, occurrence_start = (
+                base64.urlsafe_b64decode(value.encode()).decode().split("|")
+            )
+            cursor = cls(
+                start_time=datetime.datetime.fromisoformat(start_time),
+                master_id=int(master_id),
+                occurrence_start=datetime.datetime.fromisoformat(occurrence_start),
+            )
+        except ValueError as e:  # binascii.Error / UnicodeDecodeError included
+            raise ValueError(f"Invalid expanded event cursor: {value!r}") from e
+        if cursor.start_time.tzinfo is None or cursor.occurrence_start.tzinfo is None:
+            raise ValueError(f"Invalid expanded event cursor: {value!r}")
+        return cursor
+
+
+@dataclass
+class ExpandedCalendarEventsPage:
+    """One keyset page of an expanded calendar-event range.
+
+    ``end_cursor`` is the cursor of the last event in ``events`` (``None`` for an empty
+    page); pass it back as ``after`` to read the next page. ``has_next_page`` is known
+    without reading the page after: the stream is consumed one event past ``first``.
+    """
+
+    events: list[CalendarEvent]
+    end_cursor: ExpandedEventCursor | None
+    has_next_page: bool
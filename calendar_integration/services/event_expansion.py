@@ -0,0 +1,243 @@
+"""Streaming, keyset-paginated expansion of calendar events.
+
+``CalendarEventService.get_calendar_events_expanded`` used to materialize a range as
+one list: every persisted non-recurring row, plus a full ``CalendarEvent`` copy for
+every generated occurrence of every recurring master, sorted in Python at the end. A
+wide range over a busy calendar allocated tens of thousands of model instances to
+answer a request that renders a page of them.
+
+The functions here produce the same events as a lazy, start-time-ordered stream
+instead. The non-recurring rows are read with a server-side cursor already ordered by
+the database, and each recurring master contributes its own occurrence stream. The
+streams are k-way merged with :func:`heapq.merge`, so an occurrence becomes a model
+instance only once the consumer actually reaches it. A consumer that stops after one
+page (:func:`paginate_expanded_events`) never builds the rest.
+
+With ``materialize=False`` a generated occurrence is streamed as a
+:class:`~calendar_integration.models.RecurringOccurrence` view over its master and is
+never built as a model instance at all; read-only consumers (unavailable windows,
+webhook payloads) take that path.
+
+Every streamed event is paired with its :class:`ExpandedEventCursor`, the
+``(start_time, master_id, occurrence_start)`` key the merge orders by. Passing a cursor
+back as ``after`` resumes strictly after it. The non-recurring query narrows on
+``start_time`` and occurrences before the cursor are discarded by key, before any
+instance is built.
+
+Pure module-level functions, like ``calendar_service_utils``: they take querysets and
+return iterators, so the service owns the tenant-scoped query construction and these
+own only the ordering.
+"""
+
+from __future__ import annotations
+
+import datetime
+import heapq
+import itertools
+from collections.abc import Callable, Iterable, Iterator
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+from calendar_integration.models import (
+    CalendarEvent,
+    RecurringOccurrence,
+    _normalize_occurrence_instants,
+)
+from calendar_integration.services.dataclasses import (
+    ExpandedCalendarEventsPage,
+    ExpandedEventCursor,
+)
+
+
+if TYPE_CHECKING:
+    from calendar_integration.querysets import CalendarEventQuerySet
+
+
+# Rows fetched per round trip while streaming non-recurring events. ``iterator()`` also
+# runs the queryset's ``prefetch_related`` lookups once per chunk, so this bounds both
+# the rows and the prefetched relations held at any one time.
+NON_RECURRING_CHUNK_SIZE = 500
+
+# Upper bound for one page (``first``) of an expanded range, shared by the REST and
+# GraphQL surfaces.
+MAX_EXPANDED_EVENTS_PAGE_SIZE = 500
+
+# A streamed event: a persisted row, or -- without ``materialize`` -- a generated
+# occurrence's read-only view.
+ExpandedEvent = CalendarEvent | RecurringOccurrence
+
+# A merge entry: the ordering key, the master the entry came from (``None`` for a
+# non-recurring row), and either the persisted event itself or the
+# ``(occurrence_start, occurrence_end)`` pair a generated occurrence is built from.
+_Entry = tuple[
+    ExpandedEventCursor,
+    CalendarEvent | None,
+    CalendarEvent | tuple[datetime.datetime, datetime.datetime],
+]
+
+
+def _iter_non_recurring_entries(
+    events: CalendarEventQuerySet, after: ExpandedEventCursor | None
+) -> Iterator[_Entry]:
+    if after is not None:
+        # Coarse narrowing in SQL; same-start ties are settled by the full key below.
+        events = events.filter(start_time__gte=after.start_time)
+    for event in events.order_by("start_time", "id").iterator(chunk_size=NON_RECURRING_CHUNK_SIZE):
+        cursor = ExpandedEventCursor(event.start_time, event.id, event.start_time)
+        if after is not None and cursor <= after:
+            continue
+        yield cursor, None, event
+
+
+def _master_entries(
+    master: CalendarEvent,
+    exceptions_by_id: dict[int, CalendarEvent],
+    after: ExpandedEventCursor | None,
+) -> list[_Entry]:
+    """Order one master's annotated occurrences by cursor, without building any.
+
+    Mirrors ``RecurringMixin._get_occurrences_in_range`` with ``include_self=False`` and
+    ``include_exceptions=True``: cancelled occurrences are dropped, a modified
+    occurrence yields its persisted exception row, everything else is generated. A
+    modified occurrence can move away from its original start, so the list is sorted
+    here rather than trusted to arrive in order.
+    """
+    entries: list[_Entry] = []
+    for occurrence in master.recurring_occurrences or []:  # type: ignore[attr-defined]
+        if occurrence["exception_type"] == "cancelled":
+            continue
+        occurrence_start, occurrence_end = _normalize_occurrence_instants(
+            datetime.datetime.fromisoformat(occurrence["start_time"]),
+            datetime.datetime.fromisoformat(occurrence["end_time"]),
+        )
+        modified_event = (
+            exceptions_by_id.get(occurrence["modified_event_id"])
+            if occurrence.get("modified_event_id")
+            else None
+        )
+        if modified_event is not None:
+            # The annotation reports a modified occurrence at its moved start; the
+            # original one is the exception row's ``recurrence_id``.
+            entry: _Entry = (
+                ExpandedEventCursor(
+                    modified_event.start_time,
+                    master.id,
+                    modified_event.recurrence_id or occurrence_start,
+                ),
+                master,
+                modified_event,
+            )
+        else:
+            entry = (
+                ExpandedEventCursor(occurrence_start, master.id, occurrence_start),
+                master,
+                (occurrence_start, occurrence_end),
+            )
+        if after is not None and entry[0] <= after:
+            continue
+        entries.append(entry)
+    entries.sort(key=itemgetter(0))
+    return entries
+
+
+def iter_expanded_events(
+    non_recurring_events: CalendarEventQuerySet,
+    recurring_masters: CalendarEventQuerySet,
+    organization_id: int,
+    after: ExpandedEventCursor | None = None,
+    optimize_queryset: Callable[[CalendarEventQuerySet], CalendarEventQuerySet] | None = None,
+    materialize: bool = True,
+) -> Iterator[tuple[ExpandedEventCursor, ExpandedEvent]]:
+    """Merge non-recurring rows and master occurrences into one cursor-ordered stream.
+
+    :param non_recurring_events: Persisted non-recurring events of the range, already
+        scoped and filtered by the caller (any ordering is replaced).
+    :param recurring_masters: Recurring masters annotated with
+        ``annotate_recurring_occurrences_on_date_range`` for the range.
+    :param organization_id: Organization the masters belong to; scopes the single
+        query that loads every modified-occurrence exception row of the range.
+    :param after: Only events strictly after this cursor are yielded.
+    :param optimize_queryset: Applied to the exception-row query, so persisted
+        exceptions carry the same prefetches as the rows the caller optimized.
+    :param materialize: Build generated occurrences as model instances. When
+        ``False`` they are yielded as ``RecurringOccurrence`` views instead.
+    :return: ``(cursor, event)`` pairs in cursor order. Generated occurrences are
+        unsaved copies of their master (``pk=None``) sharing its prefetch cache, or
+        views over it without ``materialize``.
+    """
+    masters = list(recurring_masters)
+
+    exception_ids = {
+        occurrence["modified_event_id"]
+        for master in masters
+        for occurrence in master.recurring_occurrences or []  # type: ignore[attr-defined]
+        if occurrence.get("modified_event_id")
+    }
+    exceptions_by_id: dict[int, CalendarEvent] = {}
+    if exception_ids:
+        exceptions = CalendarEvent.objects.filter_by_organization(organization_id).filter(
+            id__in=exception_ids
+        )
+        if optimize_queryset is not None:
+            exceptions = optimize_queryset(exceptions)
+        exceptions_by_id = {event.pk: event for event in exceptions}
+
+    streams: list[Iterable[_Entry]] = [_iter_non_recurring_entries(non_recurring_events, after)]
+    streams.extend(_master_entries(master, exceptions_by_id, after) for master in masters)
+
+    for cursor, master, payload in heapq.merge(*streams, key=itemgetter(0)):
+        event: ExpandedEvent
+        if isinstance(payload, CalendarEvent):
+            event = payload
+        elif not materialize:
+            # ``master`` is always set for a generated entry.
+            yield cursor, RecurringOccurrence(master, *payload)  # type: ignore[arg-type]
+            continue
+        else:
+            # ``master`` is always set for a generated entry.
+            event = master.create_instance_from_occurrence(*payload)  # type: ignore[union-attr]
+            # Reuse the master's prefetched relations so the occurrence serializes
+            # without re-querying attendances/resources (occurrences inherit them).
+            master_cache = getattr(master, "_prefetched_objects_cache", None)
+            if master_cache:
+                event._prefetched_objects_cache = master_cache
+        event._expansion_cursor = cursor  # type: ignore[attr-defined]
+        yield cursor, event
+
+
+def drop_bundle_duplicates(
+    stream: Iterable[tuple[ExpandedEventCursor, ExpandedEvent]],
+    dedupe_persisted: bool = False,
+) -> Iterator[tuple[ExpandedEventCursor, ExpandedEvent]]:
+    """Filter a stream down to one copy of each event, in stream order.
+
+    - ``is_bundle_representation`` events are dropped: the primary carries the
+      canonical copy.
+    - ``is_bundle_primary`` events are kept once per id.
+    - With ``dedupe_persisted``, every other persisted row is also kept once per id
+      (the multi-calendar expansion can reach the same row twice).
+    - Generated occurrences (``pk=None``) are always kept: a master is read once, so
+      its occurrences are distinct by construction.
+    """
+    seen_ids: set[int] = set()
+    for cursor, event in stream:
+        if event.is_bundle_representation:
+            continue
+        if event.id is not None and (event.is_bundle_primary or dedupe_persisted):
+            if event.id in seen_ids:
+                continue
+            seen_ids.add(event.id)
+        yield cursor, event
+
+
+def paginate_expanded_events(
+    stream: Iterable[tuple[ExpandedEventCursor, CalendarEvent]], first: int
+) -> ExpandedCalendarEventsPage:
+    """Take one page of ``first`` events off a stream, reading at most one more."""
+    window = list(itertools.islice(stream, first + 1))
+    page = window[:first]
+    return ExpandedCalendarEventsPage(
+        events=[event for _, event in page],
+        end_cursor=page[-1][0] if page else None,
+        has_next_page=len(window) > first,
+    )
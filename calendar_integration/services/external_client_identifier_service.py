@@ -22,6 +22,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.core.validators import URLValidator
 
+from calendar_integration.change_tracking import bump_identified_object_change_versions
 from calendar_integration.exceptions import (
     CalendarServiceOrganizationNotSetError,
     ExternalClientIdentifierBlankIdentifierError,
@@ -197,6 +198,8 @@ class ExternalClientIdentifierService:
                     for system, identifier in systems_to_upsert.items()
                 ]
             )
+        # Event reads carry the identifiers, so their calendars' cached reads are stale.
+        bump_identified_object_change_versions(self.organization.id, target)  # type: ignore[union-attr]
 
         return old_state, new_state
 
@@ -699,6 +699,10 @@ class ExternalEventChangeRequestService:
           compensates (deletes the just-created provider event) if that local commit fails,
           so a successful create is never orphaned by a DB rollback.
 
+        Must not run inside the adapter's ``batch_writes()`` block: the write would only
+        be queued, and the caller would record the undo (and rebind the external id)
+        before knowing whether the provider took it.
+
         Args:
             event: The live ``CalendarEvent`` whose retained state must be pushed back to
                 the provider.
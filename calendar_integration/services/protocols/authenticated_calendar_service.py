@@ -114,9 +114,10 @@ class AuthenticatedCalendarService(InitializedOrAuthenticatedCalendarService, Pr
     def _handle_deletions_for_full_sync(
         self,
         calendar_id: int,
-        calendar_events_by_external_id: dict,
-        matched_event_ids: set[str],
+        seen_external_ids: set[str],
         start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        stale_external_ids: set[str] | None = None,
     ): ...
 
     def _apply_sync_changes(self, calendar_id: int, changes: EventsSyncChanges): ...
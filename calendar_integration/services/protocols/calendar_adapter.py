@@ -1,5 +1,7 @@
+import contextlib
 import datetime
 from collections.abc import Iterable
+from contextlib import AbstractContextManager
 from typing import Any, Protocol
 
 from django.http import HttpHeaders, HttpRequest
@@ -10,6 +12,7 @@ from calendar_integration.services.dataclasses import (
     CalendarEventAdapterOutputData,
     CalendarEventsSyncTypedDict,
     CalendarResourceData,
+    RefreshedOAuthToken,
 )
 
 
@@ -24,6 +27,15 @@ class CalendarAdapter(Protocol):
     @staticmethod
     def extract_calendar_external_id_from_webhook_request(request: HttpRequest) -> str: ...
 
+    @staticmethod
+    def refresh_access_token(refresh_token: str) -> RefreshedOAuthToken:
+        """
+        Exchange a refresh token for a new access token with the provider.
+        :param refresh_token: The account's OAuth refresh token.
+        :return: The new access token and its expiry.
+        """
+        ...
+
     def create_application_calendar(self, name: str) -> ApplicationCalendarData:
         """
         Create a new application calendar.
@@ -55,7 +67,12 @@ class CalendarAdapter(Protocol):
         Retrieve events within a specified date range.
         :param start_date: Start date for the event search.
         :param end_date: End date for the event search.
-        :return: CalendarEventsSyncTypedDict.
+        :param sync_token: Token from a previous sync; when given, only the changes
+            since it are returned.
+        :return: CalendarEventsSyncTypedDict. Its ``next_sync_token`` is only final once
+            ``events`` has been exhausted: adapters fill it in as they read the last page.
+        :raises SyncTokenExpiredError: While iterating, when the provider no longer
+            accepts ``sync_token``; the caller falls back to a full sync.
         """
         ...
 
@@ -86,6 +103,23 @@ class CalendarAdapter(Protocol):
         """
         ...
 
+    def batch_writes(self) -> AbstractContextManager[None]:
+        """
+        Group the event writes made inside the block into as few provider round trips as
+        the provider allows. Writes may be deferred until the block exits, and then
+        return what was sent instead of the provider's response.
+        Adapters without batch support run every write immediately.
+        """
+        return contextlib.nullcontext()
+
+    def discard_writes(self) -> int:
+        """
+        Drop the writes queued by the ``batch_writes()`` block open on this thread, so
+        the block sends nothing when it exits.
+        :return: How many queued writes were dropped.
+        """
+        return 0
+
     def get_account_calendars(self) -> Iterable[CalendarResourceData]:
         """
         Retrieve account account calendar.
@@ -136,6 +170,26 @@ class CalendarAdapter(Protocol):
         """
         ...
 
+    def renew_webhook_subscription(
+        self,
+        subscription_id: str,
+        resource_id: str,
+        callback_url: str,
+        provider_resource_id: str = "",
+        tracking_params: dict | None = None,
+    ) -> dict[str, Any]:
+        """
+        Extend a webhook subscription's life with the provider.
+        :param subscription_id: The provider's id of the subscription (channel) to renew.
+        :param resource_id: ID of the calendar resource it watches.
+        :param callback_url: URL it delivers notifications to.
+        :param provider_resource_id: The provider's id of the watched resource, if any.
+        :param tracking_params: Optional dictionary of tracking parameters.
+        :return: The renewed subscription's details, shaped as
+            ``create_webhook_subscription_with_tracking``'s.
+        """
+        ...
+
     def validate_webhook_notification(
         self,
         headers: dict[str, str],
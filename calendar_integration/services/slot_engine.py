@@ -72,6 +72,7 @@ from calendar_integration.models import (
     Calendar,
     CalendarEvent,
     CalendarGroupSlotQuotaRule,
+    RecurringOccurrence,
 )
 from calendar_integration.services.dataclasses import (
     BookableSlotProposal,
@@ -427,7 +428,7 @@ def _iter_group_scoped_available_time_occurrences(
     calendar_ids: Iterable[int],
     start_date: datetime.datetime,
     end_date: datetime.datetime,
-) -> Iterator[tuple[int, int, AvailableTime]]:
+) -> Iterator[tuple[int, int, AvailableTime | RecurringOccurrence]]:
     """Yield ``(group_slot_id, calendar_id, occurrence)`` for every group-scoped
     ``AvailableTime`` occurrence overlapping ``[start_date, end_date)`` across
     the given (slot, calendar) universe -- one query for non-recurring rows and
@@ -437,15 +438,14 @@ def _iter_group_scoped_available_time_occurrences(
     Reads through ``AvailableTime.objects.unscoped()`` -- group-scoped rows are
     invisible to the default manager. Occurrence expansion for group-scoped
     masters is safe because (a) no write path creates a group-scoped recurrence
-    exception yet, and (b) ``RecurringMixin._get_occurrences_in_range`` now
+    exception yet, and (b) ``RecurringMixin._get_occurrence_views_in_range``
     routes the exception-instance lookup through ``_base_manager`` when the
     master is group-scoped, ensuring group-scoped exception rows are found if
     one ever becomes reachable.
 
-    ``occurrence`` may be a persisted master/exception row or a synthetic
-    in-memory instance (``AvailableTime.create_instance_from_occurrence``,
-    used for recurring occurrences) -- the latter does not carry its own
-    ``group_slot`` or ``organization``. Callers must attribute spans using the
+    ``occurrence`` may be a persisted master/exception row or, for a generated
+    recurring occurrence, a ``RecurringOccurrence`` view over its master -- the
+    latter exposes no ``group_slot``. Callers must attribute spans using the
     yielded ``group_slot_id`` / ``calendar_id``, not the occurrence's own
     fields.
     """
@@ -480,7 +480,7 @@ def _iter_group_scoped_available_time_occurrences(
         start_time__lte=end_date,
     )
     for master_time in recurring_times:
-        instances = master_time.get_occurrences_in_range(
+        instances = master_time.get_occurrence_views_in_range(
             start_date, end_date, include_self=False, include_exceptions=True, overlap=True
         )
         for instance in instances:
@@ -493,7 +493,7 @@ def expand_group_scoped_available_times(
     calendar_ids: Iterable[int],
     start_date: datetime.datetime,
     end_date: datetime.datetime,
-) -> list[AvailableTime]:
+) -> list[AvailableTime | RecurringOccurrence]:
     """Expand every group-scoped ``AvailableTime`` for the given (slot,
     calendar) universe that overlaps ``[start_date, end_date)``, recurrence
     included, sorted by start time.
@@ -556,7 +556,7 @@ def _iter_group_scoped_blocked_time_occurrences(
     calendar_ids: Iterable[int],
     start_date: datetime.datetime,
     end_date: datetime.datetime,
-) -> Iterator[tuple[int, int, BlockedTime]]:
+) -> Iterator[tuple[int, int, BlockedTime | RecurringOccurrence]]:
     """Yield ``(group_slot_id, calendar_id, occurrence)`` for every group-scoped
     ``BlockedTime`` occurrence overlapping ``[start_date, end_date)`` across
     the given (slot, calendar) universe -- the block analog of
@@ -568,15 +568,14 @@ def _iter_group_scoped_blocked_time_occurrences(
     invisible to the default manager. Occurrence expansion for group-scoped
     masters is safe for the same reason it is for windows: no write path
     creates a group-scoped ``BlockedTimeRecurrenceException`` yet, and
-    ``RecurringMixin._get_occurrences_in_range`` routes the exception-instance
+    ``RecurringMixin._get_occurrence_views_in_range`` routes the exception-instance
     lookup through ``_base_manager`` for any group-scoped master --
     ``AvailableTime`` and ``BlockedTime`` share that mixin, so the fix applies
     to both without further changes.
 
-    ``occurrence`` may be a persisted master/exception row or a synthetic
-    in-memory instance (``BlockedTime.create_instance_from_occurrence``, used
-    for recurring occurrences) -- the latter does not carry its own
-    ``group_slot`` or ``organization``. Callers must attribute spans using the
+    ``occurrence`` may be a persisted master/exception row or, for a generated
+    recurring occurrence, a ``RecurringOccurrence`` view over its master -- the
+    latter exposes no ``group_slot``. Callers must attribute spans using the
     yielded ``group_slot_id`` / ``calendar_id``, not the occurrence's own
     fields.
     """
@@ -611,7 +610,7 @@ def _iter_group_scoped_blocked_time_occurrences(
         start_time__lte=end_date,
     )
     for master_time in recurring_times:
-        instances = master_time.get_occurrences_in_range(
+        instances = master_time.get_occurrence_views_in_range(
             start_date, end_date, include_self=False, include_exceptions=True, overlap=True
         )
         for instance in instances:
@@ -624,7 +623,7 @@ def expand_group_scoped_blocked_times(
     calendar_ids: Iterable[int],
     start_date: datetime.datetime,
     end_date: datetime.datetime,
-) -> list[BlockedTime]:
+) -> list[BlockedTime | RecurringOccurrence]:
     """Expand every group-scoped ``BlockedTime`` for the given (slot,
     calendar) universe that overlaps ``[start_date, end_date)``, recurrence
     included, sorted by start time.
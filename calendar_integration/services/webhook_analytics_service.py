@@ -4,10 +4,11 @@ import datetime
 import logging
 from typing import Any
 
-from django.db.models import Avg, Count, F, Q, QuerySet
+from django.db.models import F, QuerySet
 
 from calendar_integration.constants import IncomingWebhookProcessingStatus
-from calendar_integration.models import CalendarWebhookEvent, CalendarWebhookSubscription
+from calendar_integration.models import CalendarWebhookEvent
+from calendar_integration.webhook_health import webhook_health_by_organization
 from organizations.models import Organization
 
 
@@ -31,71 +32,13 @@ class WebhookAnalyticsService:
         Returns:
             Dictionary with delivery statistics
         """
-        start_time = datetime.datetime.now(tz=datetime.UTC) - datetime.timedelta(hours=hours_back)
-
-        events_qs = CalendarWebhookEvent.objects.filter_by_organization(self.organization).filter(
-            created__gte=start_time,
-        )
-
-        total_events = events_qs.count()
-        if total_events == 0:
-            return {
-                "total_events": 0,
-                "successful_events": 0,
-                "failed_events": 0,
-                "ignored_events": 0,
-                "pending_events": 0,
-                "success_rate": 100.0,
-                "failure_rate": 0.0,
-                "average_processing_time_seconds": 0.0,
-            }
-
-        # Count events by status
-        status_counts = events_qs.aggregate(
-            successful=Count(
-                "id",
-                filter=Q(processing_status=IncomingWebhookProcessingStatus.PROCESSED),
-            ),
-            failed=Count("id", filter=Q(processing_status=IncomingWebhookProcessingStatus.FAILED)),
-            ignored=Count(
-                "id", filter=Q(processing_status=IncomingWebhookProcessingStatus.IGNORED)
-            ),
-            pending=Count(
-                "id", filter=Q(processing_status=IncomingWebhookProcessingStatus.PENDING)
-            ),
-        )
-
-        successful_events = status_counts["successful"] or 0
-        failed_events = status_counts["failed"] or 0
-        ignored_events = status_counts["ignored"] or 0
-        pending_events = status_counts["pending"] or 0
-
-        # Calculate rates
-        success_rate = (successful_events / total_events) * 100 if total_events > 0 else 100.0
-        failure_rate = (failed_events / total_events) * 100 if total_events > 0 else 0.0
-
-        # Calculate average processing time for processed events
-        processed_events = events_qs.filter(
-            processing_status=IncomingWebhookProcessingStatus.PROCESSED,
-            processed_at__isnull=False,
-        ).annotate(processing_time=F("processed_at") - F("created"))
-
-        avg_processing_time = processed_events.aggregate(avg_time=Avg("processing_time"))[
-            "avg_time"
-        ]
-
-        avg_processing_seconds = avg_processing_time.total_seconds() if avg_processing_time else 0.0
-
-        return {
-            "total_events": total_events,
-            "successful_events": successful_events,
-            "failed_events": failed_events,
-            "ignored_events": ignored_events,
-            "pending_events": pending_events,
-            "success_rate": success_rate,
-            "failure_rate": failure_rate,
-            "average_processing_time_seconds": avg_processing_seconds,
-        }
+        now = datetime.datetime.now(tz=datetime.UTC)
+        health = webhook_health_by_organization(
+            [self.organization.id],
+            now=now,
+            events_since=now - datetime.timedelta(hours=hours_back),
+        )[self.organization.id]
+        return health.delivery_stats()
 
     def get_webhook_latency_metrics(self, hours_back: int = 24) -> dict[str, float]:
         """Get webhook processing latency metrics.
@@ -214,40 +157,19 @@ class WebhookAnalyticsService:
             Dictionary with subscription health metrics
         """
         now = datetime.datetime.now(tz=datetime.UTC)
-        expiring_threshold = now + datetime.timedelta(hours=24)
-
-        subscriptions_qs = CalendarWebhookSubscription.objects.filter_by_organization(
-            self.organization
-        )
-
-        # Basic counts
-        total_subscriptions = subscriptions_qs.count()
-        active_subscriptions = subscriptions_qs.filter(is_active=True).count()
-        expired_subscriptions = subscriptions_qs.filter(is_active=True, expires_at__lt=now).count()
-        expiring_soon = subscriptions_qs.filter(
-            is_active=True, expires_at__gte=now, expires_at__lte=expiring_threshold
-        ).count()
-
-        # Subscriptions without recent activity
-        seven_days_ago = now - datetime.timedelta(days=7)
-        stale_subscriptions = (
-            subscriptions_qs.filter(is_active=True)
-            .filter(
-                Q(last_notification_at__isnull=True) | Q(last_notification_at__lt=seven_days_ago)
-            )
-            .count()
-        )
-
-        # Get delivery stats for active subscriptions
-        delivery_stats = self.get_webhook_delivery_stats(hours_back=24)
+        # The subscription counts and the delivery stats come out of the same two
+        # grouped queries (``calendar_integration.webhook_health``).
+        health = webhook_health_by_organization(
+            [self.organization.id], now=now, events_since=now - datetime.timedelta(hours=24)
+        )[self.organization.id]
 
         return {
-            "total_subscriptions": total_subscriptions,
-            "active_subscriptions": active_subscriptions,
-            "expired_subscriptions": expired_subscriptions,
-            "expiring_soon_subscriptions": expiring_soon,
-            "stale_subscriptions": stale_subscriptions,
-            "delivery_stats": delivery_stats,
+            "total_subscriptions": health.total_subscriptions,
+            "active_subscriptions": health.active_subscriptions,
+            "expired_subscriptions": health.expired_subscriptions,
+            "expiring_soon_subscriptions": health.expiring_soon_subscriptions,
+            "stale_subscriptions": health.stale_subscriptions,
+            "delivery_stats": health.delivery_stats(),
             "report_generated_at": now,
         }
 
@@ -0,0 +1,199 @@
+"""Concurrent, per-account provider writes of a bundle event's child calendars.
+
+``CalendarBundleService`` wrote each child calendar's provider copy in turn: a child
+the authenticated account does not own resolved its owner's adapter afresh
+(``CalendarService._get_write_adapter_for_calendar``), and only writes through the
+authenticated account's own adapter were batched, so a bundle of ten provider
+calendars cost ten provider round trips, one after the other, inside the request.
+
+While a :class:`ProviderWriteFanOut` is open on the facade
+(``CalendarService._fan_out_provider_writes``):
+
+- the facade builds one adapter per calendar owner and hands out that same instance
+  for every calendar of the owner, so an account's writes meet in one batch;
+- every adapter a write resolves to is enlisted once: its ``batch_writes()`` block is
+  entered and the calendar is recorded against it;
+- on close, :meth:`ProviderWriteFanOut.flush` sends every account's batch at once, on
+  up to :data:`WRITE_FAN_OUT_MAX_CONCURRENCY` threads, and reports one
+  :class:`ChildWriteResult` per calendar: the outcome of its account's batch.
+
+Only the provider calls are deferred; the rows are still written on the request's
+thread, inside its transaction. A write the provider cannot defer (a Microsoft
+create, whose id Graph assigns) still runs when it is made. When the block raises,
+:meth:`ProviderWriteFanOut.discard` drops the queued writes unsent, as the error rolls
+back the rows they mirror. When a bundle event's create fails,
+:meth:`ProviderWriteFanOut.compensate` deletes the provider copies that did go out,
+the same way, before the error rolls the rows back.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from collections import defaultdict
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from calendar_integration.models import CalendarEvent
+    from calendar_integration.services.protocols.calendar_adapter import CalendarAdapter
+
+
+logger = logging.getLogger(__name__)
+
+#: Accounts whose batches are sent at once. A bundle rarely spans more accounts than
+#: this; the bound keeps one request from holding many provider connections.
+WRITE_FAN_OUT_MAX_CONCURRENCY = 4
+
+
+@dataclasses.dataclass(frozen=True)
+class ChildWriteResult:
+    """The outcome of one calendar's provider writes in a fan-out.
+
+    :param calendar_id: The calendar written to.
+    :param error: Why its account's batch failed; ``None`` when it went through.
+    """
+
+    calendar_id: int
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ProviderWriteFanOut:
+    """The provider batches of one fan-out, one per account written through."""
+
+    def __init__(self, max_concurrency: int = WRITE_FAN_OUT_MAX_CONCURRENCY) -> None:
+        self.max_concurrency = max_concurrency
+        self.results: list[ChildWriteResult] = []
+        # Adapters built for calendar owners, keyed by the caller (see ``cached_adapter``).
+        self._owner_adapters: dict[Hashable, CalendarAdapter] = {}
+        # id(adapter) -> (adapter, its open ``batch_writes()`` block).
+        self._batches: dict[int, tuple[CalendarAdapter, AbstractContextManager[None]]] = {}
+        self._calendar_adapters: dict[int, CalendarAdapter] = {}
+        # id(adapter) of the batches ``discard`` dropped queued writes from.
+        self._discarded: set[int] = set()
+
+    def cached_adapter(
+        self, key: Hashable, build: Callable[[], CalendarAdapter]
+    ) -> CalendarAdapter:
+        """The adapter built for ``key`` in this fan-out, building it on first use."""
+        if key not in self._owner_adapters:
+            self._owner_adapters[key] = build()
+        return self._owner_adapters[key]
+
+    def enlist(self, calendar_id: int, adapter: CalendarAdapter) -> CalendarAdapter:
+        """Queue the writes to ``calendar_id`` in ``adapter``'s batch, opening it once."""
+        if id(adapter) not in self._batches:
+            batch = adapter.batch_writes()
+            batch.__enter__()
+            self._batches[id(adapter)] = (adapter, batch)
+        self._calendar_adapters.setdefault(calendar_id, adapter)
+        return adapter
+
+    def flush(self) -> list[ChildWriteResult]:
+        """Send every account's batch, up to ``max_concurrency`` at once.
+
+        A single batch is sent on the calling thread: there is nothing to overlap it with.
+
+        :return: One result per enlisted calendar, also kept in ``results``.
+        """
+        batches = list(self._batches.values())
+        self._batches = {}
+
+        def send(item: tuple[CalendarAdapter, AbstractContextManager[None]]) -> Exception | None:
+            _, batch = item
+            try:
+                batch.__exit__(None, None, None)
+            except Exception as error:  # noqa: BLE001
+                return error
+            return None
+
+        errors: dict[int, Exception | None] = {}
+        if len(batches) == 1:
+            errors[id(batches[0][0])] = send(batches[0])
+        elif batches:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.max_concurrency, len(batches)))
+            ) as executor:
+                for (adapter, _), error in zip(batches, executor.map(send, batches), strict=True):
+                    errors[id(adapter)] = error
+
+        self.results = [
+            ChildWriteResult(calendar_id=calendar_id, error=errors.get(id(adapter)))
+            for calendar_id, adapter in self._calendar_adapters.items()
+        ]
+        return self.results
+
+    def discard(self, exc: BaseException) -> None:
+        """Drop every account's queued writes and close its batch without sending them.
+
+        Runs on the thread that enlisted the adapters, whose queues they are. A write
+        the provider could not defer has already gone out; ``compensate`` takes it back.
+
+        :param exc: What interrupted the block; the batches are closed with it.
+        """
+        batches = list(self._batches.values())
+        self._batches = {}
+        for adapter, batch in batches:
+            if adapter.discard_writes():
+                self._discarded.add(id(adapter))
+            try:
+                batch.__exit__(type(exc), exc, exc.__traceback__)
+            except Exception as error:
+                if error is not exc:
+                    logger.exception("Could not close a discarded provider write batch.")
+
+    @property
+    def failures(self) -> list[ChildWriteResult]:
+        return [result for result in self.results if not result.ok]
+
+    def raise_for_failures(self) -> None:
+        """Raise the first failure, as a ``batch_writes()`` block does on exit."""
+        if failures := self.failures:
+            raise failures[0].error  # type: ignore[misc]
+
+    def compensate(self, events: Iterable[CalendarEvent]) -> None:
+        """Delete the provider copies of ``events`` written in this fan-out.
+
+        Every copy is deleted, also those of an account whose batch failed: a batch
+        fails on its first rejected call, and the others may have gone through. The
+        copies of an account whose queued writes were discarded never went out and are
+        skipped. Best effort: the deletes are batched and sent per account like the writes, and a
+        delete that fails -- a copy that never went out among them -- is logged; the
+        error that called for the compensation is what the caller raises.
+        """
+        # (calendar external id, event external id) per adapter, resolved here: the
+        # threads below only talk to the providers.
+        deletes: dict[int, list[tuple[str, str]]] = defaultdict(list)
+        adapters: dict[int, CalendarAdapter] = {}
+        for event in events:
+            adapter = self._calendar_adapters.get(event.calendar_fk_id)
+            if adapter is None or id(adapter) in self._discarded or not event.external_id:
+                continue
+            deletes[id(adapter)].append((event.calendar.external_id, event.external_id))
+            adapters[id(adapter)] = adapter
+
+        def delete(key: int) -> None:
+            adapter = adapters[key]
+            try:
+                with adapter.batch_writes():
+                    for calendar_external_id, event_external_id in deletes[key]:
+                        adapter.delete_event(calendar_external_id, event_external_id)
+            except Exception:
+                logger.exception(
+                    "Could not delete %d provider event(s) of a failed bundle write.",
+                    len(deletes[key]),
+                )
+
+        if not deletes:
+            return
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_concurrency, len(deletes)))
+        ) as executor:
+            list(executor.map(delete, deletes))
@@ -0,0 +1,248 @@
+"""Adaptive cadence for provider syncs that nothing else triggers.
+
+Webhooks only cover calendars with a live subscription; everything else waited for
+a manual or admin resync. Polling every calendar on a fixed beat would fix freshness
+at the cost of provider quota: most calendars change a few times a day, a handful
+change every few minutes.
+
+So every calendar carries its own estimate:
+
+- ``Calendar.sync_change_rate`` is an exponentially weighted moving average of the
+  changes per hour observed between two successful syncs. "Changes" is the larger of
+  the rows the sync created or updated and the webhook notifications received for the
+  calendar over the same stretch: a notification is the provider saying something
+  changed even when the sync that followed it found the change already applied.
+- ``Calendar.next_scheduled_sync_at`` is when the scheduler should next look at it,
+  :func:`sync_interval_for_rate` after the last sync: roughly the time it takes the
+  calendar to accumulate one change, clamped between
+  :data:`MIN_SCHEDULED_SYNC_INTERVAL` and :data:`MAX_SCHEDULED_SYNC_INTERVAL`.
+
+:func:`record_sync_outcome` updates both when a sync succeeds, whatever triggered
+it. :func:`plan_scheduled_syncs` runs on the beat
+(``calendar_integration.tasks.schedule_calendar_syncs_task``): it pops the due
+calendars hottest-first off a priority queue and hands out at most
+:data:`SCHEDULED_SYNCS_PER_ACCOUNT` of them per provider account per run, so one
+account with a hundred busy room calendars cannot spend its provider quota -- or
+starve every other account of the run's :data:`SCHEDULED_SYNCS_PER_RUN` slots --
+in a single tick. Calendars left over stay due and go first next tick.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import heapq
+from collections import Counter
+
+from django.db.models import Q
+
+from allauth.socialaccount.models import SocialAccount
+
+from calendar_integration.constants import (
+    CalendarProvider,
+    CalendarSyncStatus,
+    CalendarVisibility,
+)
+from calendar_integration.models import (
+    Calendar,
+    CalendarOwnership,
+    CalendarSync,
+    CalendarWebhookEvent,
+)
+
+
+#: Floor and ceiling of a calendar's scheduled cadence. Webhook-covered calendars
+#: sync within ``webhook_debounce.WEBHOOK_SYNC_MAX_DELAY`` of a change anyway:
+#: syncing more often than the floor buys nothing the webhooks would not deliver.
+MIN_SCHEDULED_SYNC_INTERVAL = datetime.timedelta(minutes=5)
+MAX_SCHEDULED_SYNC_INTERVAL = datetime.timedelta(hours=12)
+
+#: Weight of the newest observation in ``Calendar.sync_change_rate``. High enough
+#: that a calendar turning busy is picked up within a few syncs, low enough that one
+#: bulk edit does not pin it to the floor for the rest of the day.
+CHANGE_RATE_SMOOTHING = 0.3
+
+#: Per-run budgets. The beat runs every five minutes, so an account gets at most
+#: ``SCHEDULED_SYNCS_PER_ACCOUNT`` scheduled syncs (each a handful of list calls
+#: against the provider) per five minutes on top of whatever users trigger.
+SCHEDULED_SYNCS_PER_ACCOUNT = 10
+SCHEDULED_SYNCS_PER_RUN = 500
+
+#: Window a scheduled sync covers. Scheduled syncs resume from the calendar's sync
+#: token, so the window only bounds the full sync a calendar without one falls
+#: back to.
+SCHEDULED_SYNC_LOOKBACK = datetime.timedelta(days=1)
+SCHEDULED_SYNC_LOOKAHEAD = datetime.timedelta(days=90)
+
+
+@dataclasses.dataclass(frozen=True)
+class ScheduledCalendarSync:
+    """A calendar the scheduler picked, and the account that authenticates its sync.
+
+    :param calendar: The due calendar.
+    :param social_account: Its owner's linked account for the calendar's provider.
+    """
+
+    calendar: Calendar
+    social_account: SocialAccount
+
+
+def sync_interval_for_rate(change_rate: float) -> datetime.timedelta:
+    """How long to wait before syncing a calendar changing ``change_rate`` times an hour."""
+    if change_rate <= 0:
+        return MAX_SCHEDULED_SYNC_INTERVAL
+    interval = datetime.timedelta(hours=1 / change_rate)
+    return max(MIN_SCHEDULED_SYNC_INTERVAL, min(MAX_SCHEDULED_SYNC_INTERVAL, interval))
+
+
+def record_sync_outcome(calendar_sync: CalendarSync, now: datetime.datetime) -> None:
+    """Fold a successful ``calendar_sync`` into its calendar's change-rate estimate.
+
+    The observation covers the stretch since the calendar's previous successful sync;
+    a calendar's first sync only schedules the next one, since there is nothing to
+    divide its changes by.
+    """
+    calendar = calendar_sync.calendar
+    previous_sync_at = (
+        CalendarSync.objects.filter_by_organization(calendar_sync.organization_id)
+        .filter(calendar_fk_id=calendar.id, status=CalendarSyncStatus.SUCCESS)
+        .exclude(pk=calendar_sync.pk)
+        .order_by("-created")
+        .values_list("created", flat=True)
+        .first()
+    )
+    change_rate = calendar.sync_change_rate
+    if previous_sync_at is not None:
+        webhook_notifications = (
+            CalendarWebhookEvent.objects.filter_by_organization(calendar.organization_id)
+            .filter(
+                provider=calendar.provider,
+                external_calendar_id=calendar.external_id,
+                created__gt=previous_sync_at,
+                created__lte=now,
+            )
+            .count()
+        )
+        changes = max(
+            calendar_sync.events_created + calendar_sync.events_updated, webhook_notifications
+        )
+        hours = max(
+            (now - previous_sync_at) / datetime.timedelta(hours=1),
+            MIN_SCHEDULED_SYNC_INTERVAL / datetime.timedelta(hours=1),
+        )
+        change_rate = (
+            CHANGE_RATE_SMOOTHING * (changes / hours)
+            + (1 - CHANGE_RATE_SMOOTHING) * calendar.sync_change_rate
+        )
+
+    Calendar.objects.filter_by_organization(calendar.organization_id).filter(id=calendar.id).update(
+        sync_change_rate=change_rate,
+        next_scheduled_sync_at=now + sync_interval_for_rate(change_rate),
+    )
+
+
+def plan_scheduled_syncs(now: datetime.datetime) -> list[ScheduledCalendarSync]:
+    """Pick the calendars to sync this run, across every organization.
+
+    Due calendars are external, active, sync-enabled ones whose
+    ``next_scheduled_sync_at`` has passed or was never set, and that have no sync
+    queued or running already. They are ranked by the changes they are expected to
+    have accumulated -- change rate times hours overdue, never-scheduled calendars
+    first -- and taken in that order subject to the per-account and per-run budgets.
+
+    Each pick is pushed to its next slot right away, so a sync that is slow to be
+    picked up is not planned a second time by the next run. Calendars with no owner
+    or whose owner has no linked account for the provider are pushed back too:
+    nothing could sync them, and re-ranking them every run would be wasted work.
+    """
+    # Bounded so a sync whose worker died without recording a terminal status does
+    # not keep its calendar off the schedule forever.
+    in_flight = CalendarSync.original_manager.filter(
+        status__in=[CalendarSyncStatus.NOT_STARTED, CalendarSyncStatus.IN_PROGRESS],
+        created__gte=now - MAX_SCHEDULED_SYNC_INTERVAL,
+    ).values("calendar_fk_id")
+    due = list(
+        Calendar.original_manager.filter(
+            Q(next_scheduled_sync_at__isnull=True) | Q(next_scheduled_sync_at__lte=now),
+            sync_enabled=True,
+        )
+        .exclude(visibility=CalendarVisibility.INACTIVE)
+        .exclude(provider=CalendarProvider.INTERNAL)
+        .exclude(id__in=in_flight)
+        .select_related("organization")
+    )
+    if not due:
+        return []
+
+    owners = resolve_owner_accounts(due)
+
+    queue: list[tuple[float, int, Calendar]] = []
+    for calendar in due:
+        if calendar.next_scheduled_sync_at is None:
+            priority = float("inf")
+        else:
+            overdue = (now - calendar.next_scheduled_sync_at) / datetime.timedelta(hours=1)
+            priority = calendar.sync_change_rate * overdue
+        heapq.heappush(queue, (-priority, calendar.id, calendar))
+
+    planned: list[ScheduledCalendarSync] = []
+    unsyncable: list[Calendar] = []
+    per_account: Counter[int] = Counter()
+    while queue and len(planned) < SCHEDULED_SYNCS_PER_RUN:
+        _, _, calendar = heapq.heappop(queue)
+        social_account = owners.get(calendar.id)
+        if social_account is None:
+            unsyncable.append(calendar)
+            continue
+        if per_account[social_account.id] >= SCHEDULED_SYNCS_PER_ACCOUNT:
+            continue
+        per_account[social_account.id] += 1
+        planned.append(ScheduledCalendarSync(calendar=calendar, social_account=social_account))
+
+    _push_back([plan.calendar for plan in planned] + unsyncable, now)
+    return planned
+
+
+def resolve_owner_accounts(calendars: list[Calendar]) -> dict[int, SocialAccount]:
+    """Map each calendar id to its owner's linked account for the calendar's provider.
+
+    The same resolution ``OrganizationService.request_all_calendars_sync`` does per
+    calendar (default ownership first, then the owner's ``SocialAccount``), in two
+    queries for the whole batch. Service-account calendars are not covered, the same
+    limitation that method has. Also used to authenticate webhook-triggered syncs
+    (``calendar_integration.webhook_ingestion``) and to plan organization resyncs
+    (``calendar_integration.organization_resync``).
+    """
+    calendars_by_id = {calendar.id: calendar for calendar in calendars}
+    owner_by_calendar: dict[int, int] = {}
+    ownerships = (
+        CalendarOwnership.original_manager.filter(
+            calendar_fk_id__in=calendars_by_id, membership_user_id__isnull=False
+        )
+        .order_by("calendar_fk_id", "-is_default", "id")
+        .values_list("calendar_fk_id", "membership_user_id")
+    )
+    for calendar_id, user_id in ownerships:
+        owner_by_calendar.setdefault(calendar_id, user_id)
+
+    accounts: dict[tuple[int, str], SocialAccount] = {}
+    for social_account in SocialAccount.objects.filter(
+        user_id__in=set(owner_by_calendar.values())
+    ).order_by("-id"):
+        accounts[(social_account.user_id, social_account.provider)] = social_account
+
+    resolved: dict[int, SocialAccount] = {}
+    for calendar_id, user_id in owner_by_calendar.items():
+        social_account = accounts.get((user_id, calendars_by_id[calendar_id].provider))
+        if social_account is not None:
+            resolved[calendar_id] = social_account
+    return resolved
+
+
+def _push_back(calendars: list[Calendar], now: datetime.datetime) -> None:
+    """Move ``calendars`` to their next slot in one statement."""
+    for calendar in calendars:
+        calendar.next_scheduled_sync_at = now + sync_interval_for_rate(calendar.sync_change_rate)
+    # Cross-organization by design: the rows were loaded unscoped above and are
+    # updated by primary key.
+    Calendar.original_manager.bulk_update(calendars, ["next_scheduled_sync_at"])
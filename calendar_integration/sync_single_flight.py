@@ -0,0 +1,170 @@
+"""Single-flight calendar syncs: one sync of a calendar runs at a time.
+
+Webhook, manual, scheduled and resync requests each queue a ``sync_calendar_task``,
+and nothing kept two of them from running ``CalendarSyncService.sync_events`` for the
+same calendar at once: both fetched and diffed the whole window and contended on the
+same event rows inside one long transaction, the second one's work wasted at best.
+
+A sync now runs under a per-calendar lock, :func:`calendar_sync_lock` -- a Postgres
+session advisory lock keyed on the calendar id, so it spans every worker sharing the
+database and is released by Postgres itself when a worker dies mid-sync. A sync that
+finds the lock held does not wait and does not queue another task: it leaves its
+``CalendarSync`` ``NOT_STARTED`` -- the calendar is *dirty* -- and returns. The holder,
+once its pass is done, folds every sync queued for the calendar meanwhile into one
+re-run (:func:`fold_queued_calendar_syncs`): the window they span together, updating
+events if any of them did, full if any of them was. However many requests arrived
+during a sync, the calendar runs once more.
+
+The holder checks for queued syncs again after releasing the lock and goes around
+once more when it finds some: a sync that found the lock held just before the
+release, too late for the fold, is picked up then instead of waiting for the next
+request of the calendar. Every sync claims its row before running it
+(:func:`claim_calendar_sync`), so a row folded into a holder's re-run is not run
+again by its own task once the re-run succeeded.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+from collections.abc import Iterator
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from calendar_integration.constants import CalendarSyncStatus, CalendarSyncTriggerSource
+from calendar_integration.models import CalendarSync
+from calendar_integration.sync_scheduling import MAX_SCHEDULED_SYNC_INTERVAL
+
+
+#: Queued syncs older than this are not folded into a re-run: their task is presumed
+#: lost, as ``sync_scheduling`` presumes for in-flight syncs.
+QUEUED_SYNC_MAX_AGE = MAX_SCHEDULED_SYNC_INTERVAL
+
+# Syncs whose token resumption is skipped (see
+# ``CalendarSyncService._get_resumable_sync_token``); a re-run folding one runs full.
+_FULL_SYNC_TRIGGER_SOURCES = (CalendarSyncTriggerSource.IMPORT, CalendarSyncTriggerSource.ADMIN)
+
+
+@dataclasses.dataclass(frozen=True)
+class FoldedCalendarSync:
+    """The re-run of a calendar standing for every sync queued behind the last one.
+
+    :param rerun: The queued ``CalendarSync`` that runs, widened to cover the others;
+        already claimed (``IN_PROGRESS``).
+    :param folded_ids: The other queued syncs; claimed too, and settled with the
+        outcome of ``rerun`` (:func:`settle_folded_calendar_syncs`).
+    """
+
+    rerun: CalendarSync
+    folded_ids: list[int]
+
+
+@contextlib.contextmanager
+def calendar_sync_lock(calendar_id: int) -> Iterator[bool]:
+    """Try to take the sync lock of ``calendar_id``, without waiting.
+
+    Yields whether it was taken. The lock belongs to the database session rather than
+    to a transaction, so it holds across the transactions of a sync; it is released
+    on exit, or by Postgres when the session ends.
+    """
+    # Keyed on the bare calendar id: nothing else takes advisory locks on this
+    # database. Anything that does must pick keys that cannot meet calendar ids.
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(%s)", [calendar_id])
+        acquired = cursor.fetchone()[0]
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [calendar_id])
+
+
+def claim_calendar_sync(calendar_sync: CalendarSync) -> bool:
+    """Mark ``calendar_sync`` running, unless it is running or done already.
+
+    A failed sync can be claimed again: running it over is how it recovers. A claimed
+    ``calendar_sync`` is reloaded with the window it has now: a queued sync is widened
+    in place by the requests that reuse it (``request_webhook_triggered_sync``) until
+    it is claimed, so the copy its task loaded may be narrower.
+
+    :return: ``False`` when it was folded into another sync's re-run, which is
+        running it or ran it successfully.
+    """
+    claimed = (
+        CalendarSync.objects.filter_by_organization(calendar_sync.organization_id)
+        .filter(pk=calendar_sync.pk)
+        .exclude(status__in=[CalendarSyncStatus.IN_PROGRESS, CalendarSyncStatus.SUCCESS])
+        .update(status=CalendarSyncStatus.IN_PROGRESS)
+    )
+    if claimed:
+        # Nothing widens it once it is running, so this is the window it runs with.
+        calendar_sync.refresh_from_db(
+            fields=["status", "start_datetime", "end_datetime", "should_update_events"]
+        )
+    return bool(claimed)
+
+
+def _queued_calendar_syncs(organization_id: int, calendar_id: int):
+    return CalendarSync.objects.filter_by_organization(organization_id).filter(
+        calendar_fk_id=calendar_id,
+        status=CalendarSyncStatus.NOT_STARTED,
+        created__gte=timezone.now() - QUEUED_SYNC_MAX_AGE,
+    )
+
+
+def has_queued_calendar_syncs(organization_id: int, calendar_id: int) -> bool:
+    """Whether a sync of the calendar is waiting for a run."""
+    return _queued_calendar_syncs(organization_id, calendar_id).exists()
+
+
+def fold_queued_calendar_syncs(organization_id: int, calendar_id: int) -> FoldedCalendarSync | None:
+    """Claim every sync queued for the calendar as one re-run, if there are any.
+
+    The re-run is the first queued sync that runs full, or else the latest one, and
+    is widened to the window every queued sync spans together, updating events if
+    any of them does.
+    """
+    with transaction.atomic():
+        queued = list(
+            _queued_calendar_syncs(organization_id, calendar_id)
+            .order_by("created", "id")
+            .select_for_update(skip_locked=True)
+        )
+        if not queued:
+            return None
+        rerun = next(
+            (sync for sync in queued if sync.trigger_source in _FULL_SYNC_TRIGGER_SOURCES),
+            queued[-1],
+        )
+        rerun.start_datetime = min(sync.start_datetime for sync in queued)
+        rerun.end_datetime = max(sync.end_datetime for sync in queued)
+        rerun.should_update_events = any(sync.should_update_events for sync in queued)
+        rerun.status = CalendarSyncStatus.IN_PROGRESS
+        rerun.save(
+            update_fields=["start_datetime", "end_datetime", "should_update_events", "status"]
+        )
+        folded_ids = [sync.pk for sync in queued if sync.pk != rerun.pk]
+        CalendarSync.objects.filter_by_organization(organization_id).filter(
+            pk__in=folded_ids
+        ).update(status=CalendarSyncStatus.IN_PROGRESS)
+    return FoldedCalendarSync(rerun=rerun, folded_ids=folded_ids)
+
+
+def settle_folded_calendar_syncs(folded: FoldedCalendarSync) -> None:
+    """Give the folded syncs the outcome of the re-run that stood for them."""
+    if not folded.folded_ids:
+        return
+    CalendarSync.objects.filter_by_organization(folded.rerun.organization_id).filter(
+        pk__in=folded.folded_ids
+    ).update(status=folded.rerun.status, error_message=folded.rerun.error_message)
+
+
+def requeue_folded_calendar_syncs(folded: FoldedCalendarSync) -> None:
+    """Put the folded syncs back in the queue, for the re-run's retry to fold again."""
+    if not folded.folded_ids:
+        return
+    CalendarSync.objects.filter_by_organization(folded.rerun.organization_id).filter(
+        pk__in=folded.folded_ids
+    ).update(status=CalendarSyncStatus.NOT_STARTED)
@@ -1,12 +1,32 @@
 from .calendar_sync_tasks import (
     import_account_calendars_task,
     import_organization_calendar_resources_task,
+    maintain_webhook_event_partitions_task,
+    process_webhook_events_task,
+    renew_account_webhook_subscriptions_task,
+    renew_webhook_subscriptions_task,
+    request_scheduled_calendar_syncs_task,
+    resync_account_calendars_task,
+    resync_organization_calendars_task,
+    schedule_calendar_syncs_task,
+    summarize_organization_resync_task,
     sync_calendar_task,
+    sync_outlook_rooms_task,
 )
 
 
 __all__ = [
     "import_account_calendars_task",
     "import_organization_calendar_resources_task",
+    "maintain_webhook_event_partitions_task",
+    "process_webhook_events_task",
+    "renew_account_webhook_subscriptions_task",
+    "renew_webhook_subscriptions_task",
+    "request_scheduled_calendar_syncs_task",
+    "resync_account_calendars_task",
+    "resync_organization_calendars_task",
+    "schedule_calendar_syncs_task",
+    "summarize_organization_resync_task",
     "sync_calendar_task",
+    "sync_outlook_rooms_task",
 ]
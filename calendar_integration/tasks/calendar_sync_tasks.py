@@ -1,26 +1,54 @@
+import dataclasses
 import datetime
 import logging
+from collections import Counter, defaultdict
 from typing import Annotated, Literal
 
+from django.db import transaction
 from django.utils import timezone
 
 from allauth.socialaccount.models import SocialAccount
+from celery import chord, group
 from dependency_injector.wiring import Provide, inject
 from vinta_billing.exceptions import OverLimitError
 from vinta_billing.services.entitlement_service import EntitlementService
 
 from calendar_integration.constants import (
     CalendarOrganizationResourceImportStatus,
+    CalendarSyncStatus,
     CalendarSyncTriggerSource,
+    IncomingWebhookProcessingStatus,
 )
+from calendar_integration.exceptions import ProviderRetryableError
 from calendar_integration.models import (
     Calendar,
     CalendarOrganizationResourcesImport,
-    CalendarOwnership,
     CalendarSync,
     GoogleCalendarServiceAccount,
 )
+from calendar_integration.organization_resync import plan_organization_resync
 from calendar_integration.services.calendar_service import CalendarService
+from calendar_integration.sync_scheduling import (
+    SCHEDULED_SYNC_LOOKAHEAD,
+    SCHEDULED_SYNC_LOOKBACK,
+    plan_scheduled_syncs,
+)
+from calendar_integration.webhook_debounce import (
+    WEBHOOK_SYNC_MAX_DELAY,
+    due_webhook_calendars,
+    next_webhook_sync_due,
+    release_webhook_calendars,
+)
+from calendar_integration.webhook_event_partitions import ensure_webhook_event_partitions
+from calendar_integration.webhook_ingestion import (
+    WEBHOOK_DRAIN_BATCH_SIZE,
+    claim_pending_webhook_events,
+    next_stale_webhook_claim_at,
+    plan_webhook_syncs,
+    schedule_webhook_drain,
+    settle_webhook_events,
+)
+from calendar_integration.webhook_renewal import plan_webhook_renewals
 from common.organization_context import organization_context
 from organizations.models import Organization
 from vinta_schedule_api.celery import app
@@ -134,9 +162,15 @@ def import_account_calendars_task(
         calendar_service.import_account_calendars(sync_after_import=sync_after_import)
 
 
-@app.task
+#: How many times ``sync_calendar_task`` waits out an exhausted provider quota or an
+#: unavailable provider before giving the sync up as failed.
+SYNC_QUOTA_MAX_RETRIES = 5
+
+
+@app.task(bind=True, max_retries=SYNC_QUOTA_MAX_RETRIES)
 @inject
 def sync_calendar_task(
+    self,
     account_type: Literal["social_account", "google_service_account"],
     account_id: int,
     calendar_sync_id: int,
@@ -147,6 +181,14 @@ def sync_calendar_task(
     """
     Celery task to sync a calendar by its ID.
     This task will call the CalendarService to perform the sync operation.
+
+    A provider quota that stays exhausted (``ProviderQuotaExceededError``, see
+    ``calendar_integration.provider_quota``) or a provider that keeps failing
+    transiently (``ProviderUnavailableError``) -- both ``ProviderRetryableError`` --
+    is retried after the error's ``retry_after`` rather than failing the sync or
+    sleeping in the worker; the sync service has already put the ``CalendarSync``
+    back to ``NOT_STARTED`` for the retry to pick up. Once ``SYNC_QUOTA_MAX_RETRIES``
+    is spent the sync is marked failed.
     """
     organization = Organization.objects.filter(id=organization_id).first()
     if not organization:
@@ -161,11 +203,9 @@ def sync_calendar_task(
         # task was handed, and ``.objects`` now scopes to it implicitly.
         calendar_sync = CalendarSync.objects.get_not_started_calendar_sync(calendar_sync_id)
         if account_type == "social_account":
-            social_account = SocialAccount.objects.filter(id=account_id).first()
-            if social_account:
-                account = social_account.user
-            else:
-                account = None
+            # The social account itself, not its user: a user resolves to their newest
+            # account of any provider, which need not be the one that owns this sync.
+            account = SocialAccount.objects.filter(id=account_id).first()
         else:
             # See above on why no explicit organization filter.
             account = GoogleCalendarServiceAccount.objects.filter(id=account_id).first()
@@ -175,7 +215,15 @@ def sync_calendar_task(
 
         if not _authenticate_or_skip(calendar_service, account, organization):
             return
-        calendar_service.sync_events(calendar_sync)
+        try:
+            calendar_service.sync_events(calendar_sync)
+        except ProviderRetryableError as exc:
+            if self.request.retries >= self.max_retries:
+                calendar_sync.status = CalendarSyncStatus.FAILED
+                calendar_sync.error_message = str(exc)
+                calendar_sync.save(update_fields=["status", "error_message"])
+                return
+            raise self.retry(countdown=exc.retry_after, exc=exc) from exc
 
 
 @app.task
@@ -243,7 +291,6 @@ RESYNC_AFTER_RECOVERY_LOOKAHEAD = datetime.timedelta(days=365)
 @inject
 def resync_organization_calendars_task(
     organization_id: int,
-    calendar_service: Annotated[CalendarService, Provide["calendar_service"]],
     entitlement_service: Annotated[EntitlementService, Provide["entitlement_service"]],
 ) -> None:
     """Reconcile ``organization``'s calendars after its billing root recovers out
@@ -260,14 +307,16 @@ def resync_organization_calendars_task(
     a real reconciliation, not just "sync resumes from here forward".
 
     Fanned out **per pooled organization** by the caller
-    (``DunningService``), not per calendar directly, mirroring
-    ``OrganizationService.request_all_calendars_sync``'s per-calendar resolution
-    of the syncing account: only calendars with a resolvable owner (a
-    ``CalendarOwnership`` row with a member) and that member's linked
-    ``SocialAccount`` for the calendar's provider can be resynced here --
-    ``GoogleCalendarServiceAccount``-owned (service-account) calendars are not
-    covered, the same limitation ``request_all_calendars_sync`` already has.
-    Actual per-calendar sync work is queued via ``CalendarSyncService
+    (``DunningService``), and from here per syncing account: the calendars are
+    planned in a few set-based queries (``calendar_integration.organization_resync``)
+    and requested by a chord of :func:`resync_account_calendars_task` batches, with
+    :func:`summarize_organization_resync_task` logging the outcome. The syncing
+    account is resolved as ``OrganizationService.request_all_calendars_sync`` does:
+    only calendars with a resolvable owner (a ``CalendarOwnership`` row with a
+    member) and that member's linked ``SocialAccount`` for the calendar's provider
+    can be resynced here -- ``GoogleCalendarServiceAccount``-owned (service-account)
+    calendars are not covered, the same limitation ``request_all_calendars_sync``
+    already has. Actual per-calendar sync work is queued via ``CalendarSyncService
     .request_calendar_sync`` (through ``CalendarService.request_calendar_sync``),
     which re-checks ``is_billing_root_restricted`` itself -- if the organization
     somehow re-entered RESTRICTED between this task starting and each per-calendar
@@ -285,35 +334,403 @@ def resync_organization_calendars_task(
     with organization_context(organization):
         if _restricted_or_skip(entitlement_service, organization):
             return
+        plan = plan_organization_resync(organization_id)
 
-        now = timezone.now()
-        start_datetime = now - RESYNC_AFTER_RECOVERY_LOOKBACK
-        end_datetime = now + RESYNC_AFTER_RECOVERY_LOOKAHEAD
-
-        calendars = Calendar.objects.filter_by_organization(organization_id).exclude_inactive()
-        for calendar in calendars:
-            ownership = (
-                CalendarOwnership.objects.filter_by_organization(organization_id)
-                .filter(calendar=calendar, membership_user_id__isnull=False)
-                .order_by("-is_default", "id")
-                .first()
-            )
-            if ownership is None:
+    if not plan.batches:
+        logger.info(
+            "Nothing to resync for organization %s: none of its %s calendars has a "
+            "syncing account.",
+            organization_id,
+            len(plan.unresolved_calendar_ids),
+        )
+        return
+
+    # One window for every batch, however late each one starts.
+    now = timezone.now()
+    window = (
+        (now - RESYNC_AFTER_RECOVERY_LOOKBACK).isoformat(),
+        (now + RESYNC_AFTER_RECOVERY_LOOKAHEAD).isoformat(),
+    )
+    batches = group(
+        resync_account_calendars_task.si(organization_id, batch, *window) for batch in plan.batches
+    )
+    logger.info(
+        "Resyncing %s calendars of organization %s in %s batches (%s without a syncing account).",
+        plan.calendar_count,
+        organization_id,
+        len(plan.batches),
+        len(plan.unresolved_calendar_ids),
+    )
+    if app.conf.result_backend or app.conf.task_always_eager:
+        chord(batches)(
+            summarize_organization_resync_task.s(organization_id, len(plan.unresolved_calendar_ids))
+        )
+    else:
+        # A chord needs a result backend to gather the batches' results; without one
+        # the batches still run, only the summary is left out.
+        batches.apply_async()
+
+
+@app.task
+@inject
+def resync_account_calendars_task(
+    organization_id: int,
+    account_calendars: list[tuple[int, list[int]]],
+    window_start: str,
+    window_end: str,
+    calendar_service: Annotated[CalendarService, Provide["calendar_service"]],
+    entitlement_service: Annotated[EntitlementService, Provide["entitlement_service"]],
+) -> dict[str, int]:
+    """Request the recovery resync of one batch of ``resync_organization_calendars_task``.
+
+    :param account_calendars: ``(social_account_id, calendar_ids)`` pairs, as planned.
+    :param window_start: ISO start of the resync window, shared by every batch.
+    :param window_end: ISO end of the resync window.
+    :return: How many syncs were ``requested`` and how many calendars ``skipped`` --
+        gone, sync-disabled, or whose account could not authenticate.
+
+    Authenticates once per account and requests its calendars' syncs one after the
+    other; each sync then runs as its own ``sync_calendar_task``.
+    """
+    summary = {"requested": 0, "skipped": 0}
+    total = sum(len(calendar_ids) for _, calendar_ids in account_calendars)
+    organization = Organization.objects.filter(id=organization_id).first()
+    if not organization:
+        summary["skipped"] = total
+        return summary
+
+    with organization_context(organization):
+        if _restricted_or_skip(entitlement_service, organization):
+            summary["skipped"] = total
+            return summary
+
+        start_datetime = datetime.datetime.fromisoformat(window_start)
+        end_datetime = datetime.datetime.fromisoformat(window_end)
+        calendars = Calendar.objects.filter_by_organization(organization_id).in_bulk(
+            [calendar_id for _, calendar_ids in account_calendars for calendar_id in calendar_ids]
+        )
+        social_accounts = SocialAccount.objects.select_related("user").in_bulk(
+            [social_account_id for social_account_id, _ in account_calendars]
+        )
+        for social_account_id, calendar_ids in account_calendars:
+            social_account = social_accounts.get(social_account_id)
+            if social_account is None or not _authenticate_or_skip(
+                calendar_service, social_account, organization
+            ):
+                summary["skipped"] += len(calendar_ids)
                 continue
 
-            social_account = SocialAccount.objects.filter(
-                user_id=ownership.membership_user_id, provider=calendar.provider
-            ).first()
-            if social_account is None:
+            for calendar_id in calendar_ids:
+                calendar = calendars.get(calendar_id)
+                calendar_sync = calendar and calendar_service.request_calendar_sync(
+                    calendar=calendar,
+                    start_datetime=start_datetime,
+                    end_datetime=end_datetime,
+                    should_update_events=True,
+                    trigger_source=CalendarSyncTriggerSource.ADMIN,
+                )
+                summary["requested" if calendar_sync else "skipped"] += 1
+    return summary
+
+
+@app.task
+def summarize_organization_resync_task(
+    results: list[dict[str, int]], organization_id: int, unresolved: int
+) -> dict[str, int]:
+    """Chord callback of ``resync_organization_calendars_task``: log what it requested.
+
+    :param results: The batches' ``resync_account_calendars_task`` summaries.
+    :param unresolved: Calendars the plan found no syncing account for.
+    """
+    totals: Counter[str] = Counter()
+    for result in results:
+        totals.update(result)
+    summary = {
+        "requested": totals["requested"],
+        "skipped": totals["skipped"],
+        "unresolved": unresolved,
+    }
+    logger.info(
+        "Resync of organization %s done: %s syncs requested, %s calendars skipped, %s "
+        "without a syncing account.",
+        organization_id,
+        summary["requested"],
+        summary["skipped"],
+        summary["unresolved"],
+    )
+    return summary
+
+
+@app.task
+def schedule_calendar_syncs_task() -> None:
+    """Beat entry point for the adaptive sync scheduler.
+
+    Plans this run's syncs across every organization
+    (``calendar_integration.sync_scheduling.plan_scheduled_syncs``) and fans them out
+    onto :func:`request_scheduled_calendar_syncs_task`, one task per organization, so
+    each organization's syncs are requested inside its own ``organization_context``
+    and behind its own restriction check rather than inline in the beat.
+    """
+    by_organization: dict[int, list[tuple[int, int]]] = defaultdict(list)
+    for plan in plan_scheduled_syncs(timezone.now()):
+        by_organization[plan.calendar.organization_id].append(
+            (plan.calendar.id, plan.social_account.id)
+        )
+    for organization_id, calendar_accounts in by_organization.items():
+        request_scheduled_calendar_syncs_task.delay(organization_id, calendar_accounts)
+
+
+@app.task
+@inject
+def request_scheduled_calendar_syncs_task(
+    organization_id: int,
+    calendar_accounts: list[tuple[int, int]],
+    calendar_service: Annotated[CalendarService, Provide["calendar_service"]],
+    entitlement_service: Annotated[EntitlementService, Provide["entitlement_service"]],
+) -> None:
+    """Request the scheduler's syncs for one organization.
+
+    :param calendar_accounts: ``(calendar_id, social_account_id)`` pairs, as planned.
+
+    Each sync is requested through ``CalendarService.request_calendar_sync``, which
+    enqueues ``sync_calendar_task`` and re-checks ``sync_enabled`` and the
+    organization's restriction itself. Scheduled syncs resume from the calendar's
+    sync token, so the window (``SCHEDULED_SYNC_LOOKBACK`` /
+    ``SCHEDULED_SYNC_LOOKAHEAD``) only matters for a calendar that has none yet.
+    """
+    organization = Organization.objects.filter(id=organization_id).first()
+    if not organization:
+        return
+
+    with organization_context(organization):
+        if _restricted_or_skip(entitlement_service, organization):
+            return
+
+        now = timezone.now()
+        calendars = Calendar.objects.filter_by_organization(organization_id).in_bulk(
+            [calendar_id for calendar_id, _ in calendar_accounts]
+        )
+        social_accounts = SocialAccount.objects.select_related("user").in_bulk(
+            [social_account_id for _, social_account_id in calendar_accounts]
+        )
+        for calendar_id, social_account_id in calendar_accounts:
+            calendar = calendars.get(calendar_id)
+            social_account = social_accounts.get(social_account_id)
+            if calendar is None or social_account is None:
                 continue
 
-            if not _authenticate_or_skip(calendar_service, social_account.user, organization):
+            if not _authenticate_or_skip(calendar_service, social_account, organization):
                 continue
 
             calendar_service.request_calendar_sync(
                 calendar=calendar,
-                start_datetime=start_datetime,
-                end_datetime=end_datetime,
+                start_datetime=now - SCHEDULED_SYNC_LOOKBACK,
+                end_datetime=now + SCHEDULED_SYNC_LOOKAHEAD,
                 should_update_events=True,
-                trigger_source=CalendarSyncTriggerSource.ADMIN,
+                trigger_source=CalendarSyncTriggerSource.SCHEDULED,
+            )
+
+
+@app.task
+@inject
+def sync_outlook_rooms_task(
+    social_account_id: int,
+    organization_id: int,
+    calendar_service: Annotated[CalendarService, Provide["calendar_service"]],
+    entitlement_service: Annotated[EntitlementService, Provide["entitlement_service"]],
+) -> dict[str, int] | None:
+    """Sync every Outlook room of an organization, as one Microsoft account.
+
+    See ``calendar_integration.outlook_room_sync``. Rooms resume from their delta
+    tokens, so the window (``SCHEDULED_SYNC_LOOKBACK`` / ``SCHEDULED_SYNC_LOOKAHEAD``)
+    only matters for a room that has none yet.
+
+    :return: How many rooms ``synced``, ``failed``, or were ``deferred`` to another
+        sync; ``None`` when nothing ran.
+    """
+    organization = Organization.objects.filter(id=organization_id).first()
+    if not organization:
+        return None
+
+    with organization_context(organization):
+        if _restricted_or_skip(entitlement_service, organization):
+            return None
+
+        social_account = (
+            SocialAccount.objects.select_related("user").filter(id=social_account_id).first()
+        )
+        if social_account is None:
+            return None
+        if not _authenticate_or_skip(calendar_service, social_account, organization):
+            return None
+
+        now = timezone.now()
+        summary = calendar_service.sync_outlook_rooms(
+            start_datetime=now - SCHEDULED_SYNC_LOOKBACK,
+            end_datetime=now + SCHEDULED_SYNC_LOOKAHEAD,
+        )
+    return dataclasses.asdict(summary)
+
+
+@app.task
+@inject
+def process_webhook_events_task(
+    organization_id: int,
+    calendar_service: Annotated[CalendarService, Provide["calendar_service"]],
+    entitlement_service: Annotated[EntitlementService, Provide["entitlement_service"]],
+) -> None:
+    """Drain one batch of ``organization_id``'s pending webhook events.
+
+    The webhook views only record notifications (see
+    ``calendar_integration.webhook_ingestion``); this turns them into syncs once the
+    notified calendar went quiet (``calendar_integration.webhook_debounce``). Only the
+    events of due calendars are claimed -- as the debounce index says, or as the
+    events themselves say without Redis -- and with ``SKIP LOCKED``, so drains racing
+    each other split the backlog instead of handling the same events twice. Each
+    calendar gets one ``CalendarService.request_webhook_triggered_sync`` covering all
+    of its notifications -- authenticated as its owner's linked account, like the
+    scheduled syncs -- and every event of the calendar is recorded against the
+    resulting sync. Events of unknown calendars, of calendars nobody can sync, and of
+    a restricted organization are ``IGNORED``; a calendar whose sync request fails has
+    its events ``FAILED`` without holding up the rest of the batch. The claim is
+    committed before any of that, so no row lock is held over the providers' round
+    trips. A drain that settled a full batch enqueues the next at once; otherwise the
+    next drain is scheduled for when the first calendar still gathering notifications
+    is due.
+    """
+    organization = Organization.objects.filter(id=organization_id).first()
+    if not organization:
+        return
+
+    now = timezone.now()
+    due_calendars = due_webhook_calendars(organization_id, now)
+    waiting_until: list[datetime.datetime] = []
+    with organization_context(organization):
+        claim = claim_pending_webhook_events(
+            organization_id, due_calendars, now=now, stale_before=now - WEBHOOK_SYNC_MAX_DELAY
+        )
+        events = claim.events
+        if claim.waiting_until is not None:
+            waiting_until.append(claim.waiting_until)
+        if events and _restricted_or_skip(entitlement_service, organization):
+            settle_webhook_events(events, IncomingWebhookProcessingStatus.IGNORED)
+            events = []
+
+        for pending in plan_webhook_syncs(organization_id, events):
+            if pending.social_account is None:
+                settle_webhook_events(pending.events, IncomingWebhookProcessingStatus.IGNORED)
+                continue
+            if not _authenticate_or_skip(calendar_service, pending.social_account, organization):
+                settle_webhook_events(pending.events, IncomingWebhookProcessingStatus.IGNORED)
+                continue
+            try:
+                with transaction.atomic():
+                    calendar_sync = calendar_service.request_webhook_triggered_sync(
+                        external_calendar_id=pending.external_calendar_id,
+                        webhook_event=pending.events[-1],
+                        first_notified_at=pending.first_notified_at,
+                    )
+            except Exception:
+                logger.exception(
+                    "Failed to request webhook-triggered sync for calendar %s",
+                    pending.external_calendar_id,
+                )
+                settle_webhook_events(pending.events, IncomingWebhookProcessingStatus.FAILED)
+                continue
+            settle_webhook_events(
+                pending.events,
+                IncomingWebhookProcessingStatus.PROCESSED
+                if calendar_sync
+                else IncomingWebhookProcessingStatus.IGNORED,
+                calendar_sync,
             )
+
+    if due_calendars:
+        release_webhook_calendars(organization_id, due_calendars)
+    if len(claim.events) == WEBHOOK_DRAIN_BATCH_SIZE:
+        process_webhook_events_task.delay(organization_id)
+        return
+    next_index_due = next_webhook_sync_due(organization_id)
+    if next_index_due is not None:
+        waiting_until.append(next_index_due)
+    next_stale_claim = next_stale_webhook_claim_at(organization_id)
+    if next_stale_claim is not None:
+        waiting_until.append(next_stale_claim)
+    if waiting_until:
+        schedule_webhook_drain(
+            organization_id, countdown=(min(waiting_until) - timezone.now()).total_seconds()
+        )
+
+
+@app.task
+def renew_webhook_subscriptions_task() -> None:
+    """Beat entry point for webhook subscription renewal.
+
+    Plans the renewal of every active subscription about to expire, across
+    organizations (``calendar_integration.webhook_renewal.plan_webhook_renewals``),
+    and fans it out onto :func:`renew_account_webhook_subscriptions_task`, one task
+    per syncing account, so each account authenticates once and its renewals are
+    made inside its organization's context and behind its restriction check.
+    """
+    plan = plan_webhook_renewals(timezone.now())
+    if plan.unresolved_subscription_ids:
+        logger.warning(
+            "No linked account can renew webhook subscriptions %s; they will lapse.",
+            plan.unresolved_subscription_ids,
+        )
+    for organization_id, social_account_id, subscription_ids in plan.batches:
+        renew_account_webhook_subscriptions_task.delay(
+            organization_id, social_account_id, subscription_ids
+        )
+
+
+@app.task
+@inject
+def renew_account_webhook_subscriptions_task(
+    organization_id: int,
+    social_account_id: int,
+    subscription_ids: list[int],
+    calendar_service: Annotated[CalendarService, Provide["calendar_service"]],
+    entitlement_service: Annotated[EntitlementService, Provide["entitlement_service"]],
+) -> dict[str, int] | None:
+    """Renew one account's expiring webhook subscriptions with their provider.
+
+    See ``CalendarService.renew_webhook_subscriptions``: the renewals run
+    concurrently and are stored in one statement. A restricted organization's
+    subscriptions are left to lapse, like its syncs are paused; its calendars are
+    resynced once it recovers.
+
+    :return: How many subscriptions were ``renewed`` and how many ``failed``;
+        ``None`` when nothing ran.
+    """
+    organization = Organization.objects.filter(id=organization_id).first()
+    if not organization:
+        return None
+
+    with organization_context(organization):
+        if _restricted_or_skip(entitlement_service, organization):
+            return None
+
+        social_account = (
+            SocialAccount.objects.select_related("user").filter(id=social_account_id).first()
+        )
+        if social_account is None:
+            return None
+        if not _authenticate_or_skip(calendar_service, social_account, organization):
+            return None
+
+        summary = calendar_service.renew_webhook_subscriptions(subscription_ids)
+    return dataclasses.asdict(summary)
+
+
+@app.task
+def maintain_webhook_event_partitions_task() -> list[str]:
+    """Beat entry point creating the coming days' webhook event partitions.
+
+    See ``calendar_integration.webhook_event_partitions``. Retention -- dropping
+    the expired ones -- is left to ``cleanup_webhook_events``, where the retention
+    period is chosen.
+
+    :return: The partitions created.
+    """
+    return ensure_webhook_event_partitions(timezone.now().date())
@@ -1,5 +1,6 @@
 """Tests for cleanup webhook events management command."""
 
+import datetime
 from io import StringIO
 from unittest.mock import Mock, patch
 
@@ -10,6 +11,7 @@ import pytest
 from model_bakery import baker
 
 from calendar_integration.management.commands.cleanup_webhook_events import Command
+from calendar_integration.webhook_event_partitions import WebhookEventRetention
 from organizations.models import Organization
 
 
@@ -74,21 +76,29 @@ class TestCleanupWebhookEventsCommand(TestCase):
         mock_service_instance.cleanup_old_webhook_events.assert_called_once_with(days_to_keep=30)
 
     @patch(
-        "calendar_integration.management.commands.cleanup_webhook_events.WebhookAnalyticsService"
+        "calendar_integration.management.commands.cleanup_webhook_events.apply_webhook_event_retention"
     )
-    def test_handle_all_organizations(self, mock_analytics_service: Mock) -> None:
-        """Test command with all organizations."""
-        mock_service_instance = Mock()
-        mock_analytics_service.return_value = mock_service_instance
-        mock_service_instance.cleanup_old_webhook_events.return_value = 75
+    def test_handle_all_organizations(self, mock_retention: Mock) -> None:
+        """Without an organization, whole expired partitions are dropped, their events
+        reported from the planner's estimates."""
+        mock_retention.return_value = WebhookEventRetention(
+            dropped_partitions=[("events_p20260901", 100), ("events_p20260902", 40)],
+            deleted_default_events=10,
+            estimated=True,
+        )
 
         out = StringIO()
-        call_command("cleanup_webhook_events", stdout=out)
+        call_command("cleanup_webhook_events", days_to_keep=30, stdout=out)
 
         output = out.getvalue()
-        # Should process both organizations
-        assert "Organization" in output
-        assert "Successfully deleted 150 webhook events in total" in output  # 75 * 2 organizations
+        assert "Dropped partition events_p20260901 (about 100 events)" in output
+        assert "Dropped partition events_p20260902 (about 40 events)" in output
+        assert "Deleted 10 events older than 30 days from the default partition" in output
+        assert "Successfully deleted about 150 webhook events in total" in output
+        (cutoff,), kwargs = mock_retention.call_args
+        assert kwargs == {"dry_run": False}
+        expected_cutoff = datetime.datetime.now(tz=datetime.UTC) - datetime.timedelta(days=30)
+        assert abs(cutoff - expected_cutoff) < datetime.timedelta(minutes=1)
 
     @patch("calendar_integration.models.CalendarWebhookEvent")
     def test_handle_dry_run(self, mock_webhook_event: Mock) -> None:
@@ -176,23 +186,22 @@ class TestCleanupWebhookEventsCommand(TestCase):
             )
 
     @patch(
-        "calendar_integration.management.commands.cleanup_webhook_events.WebhookAnalyticsService"
+        "calendar_integration.management.commands.cleanup_webhook_events.apply_webhook_event_retention"
     )
-    def test_handle_with_multiple_organizations_mixed_results(
-        self, mock_analytics_service: Mock
+    def test_handle_all_organizations_dry_run_and_skipped_partitions(
+        self, mock_retention: Mock
     ) -> None:
-        """Test command with multiple organizations having different results."""
-        # Setup different return values for different calls
-        mock_service_instance = Mock()
-        mock_analytics_service.return_value = mock_service_instance
-
-        # First organization returns 100, second returns 0
-        mock_service_instance.cleanup_old_webhook_events.side_effect = [100, 0]
+        """A dry run reports what would go; a partition it could not lock is reported."""
+        mock_retention.return_value = WebhookEventRetention(
+            dropped_partitions=[("events_p20260901", 100)],
+            skipped_partitions=["events_p20260902"],
+        )
 
         out = StringIO()
-        call_command("cleanup_webhook_events", stdout=out)
+        call_command("cleanup_webhook_events", dry_run=True, stdout=out)
 
         output = out.getvalue()
-        assert "Successfully deleted 100 webhook events in total" in output
-        assert "Deleted 100 webhook events older than 30 days" in output
-        assert "Deleted 0 webhook events older than 30 days" in output
+        assert "Would drop partition events_p20260901 (100 events)" in output
+        assert "Could not drop partition events_p20260902; retry later" in output
+        assert "DRY RUN: Would delete 100 webhook events in total" in output
+        assert mock_retention.call_args.kwargs == {"dry_run": True}
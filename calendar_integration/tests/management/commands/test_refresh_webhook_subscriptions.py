@@ -6,14 +6,23 @@ from unittest.mock import Mock, patch
 
 from django.core.management import call_command
 from django.test import TestCase
-from django.utils import timezone
 
 from model_bakery import baker
 
 from calendar_integration.management.commands.refresh_webhook_subscriptions import Command
+from calendar_integration.webhook_renewal import WebhookRenewalPlan
 from organizations.models import Organization
 
 
+COMMAND = "calendar_integration.management.commands.refresh_webhook_subscriptions"
+
+
+def _plan(
+    *batches: tuple[int, int, list[int]], unresolved: list[int] | None = None
+) -> WebhookRenewalPlan:
+    return WebhookRenewalPlan(batches=list(batches), unresolved_subscription_ids=unresolved or [])
+
+
 class TestRefreshWebhookSubscriptionsCommand(TestCase):
     """Tests for refresh webhook subscriptions command."""
 
@@ -49,19 +58,10 @@ class TestRefreshWebhookSubscriptionsCommand(TestCase):
         output = out.getvalue()
         assert "Organization 99999 not found" in output
 
-    @patch(
-        "calendar_integration.management.commands.refresh_webhook_subscriptions.CalendarWebhookSubscription.original_manager"
-    )
-    def test_handle_single_organization_no_subscriptions(self, mock_qs: Mock) -> None:
+    @patch(f"{COMMAND}.plan_webhook_renewals")
+    def test_handle_single_organization_no_subscriptions(self, mock_plan: Mock) -> None:
         """Test command with single organization that has no expiring subscriptions."""
-        # Mock the complete queryset chain
-        mock_final_qs = Mock()
-        mock_final_qs.select_related.return_value = []
-
-        mock_filtered_qs = Mock()
-        mock_filtered_qs.filter.return_value = mock_final_qs
-
-        mock_qs.filter.return_value = mock_filtered_qs
+        mock_plan.return_value = _plan()
 
         out = StringIO()
         call_command(
@@ -72,48 +72,16 @@ class TestRefreshWebhookSubscriptionsCommand(TestCase):
 
         output = out.getvalue()
         assert "No webhook subscriptions need refreshing" in output
+        assert mock_plan.call_args.kwargs["organization_id"] == self.organization.id
 
-    @patch("di_core.containers.container")
-    @patch(
-        "calendar_integration.management.commands.refresh_webhook_subscriptions.CalendarWebhookSubscription.original_manager"
-    )
+    @patch(f"{COMMAND}.renew_account_webhook_subscriptions_task")
+    @patch(f"{COMMAND}.plan_webhook_renewals")
     def test_handle_single_organization_with_subscriptions(
-        self, mock_qs: Mock, mock_container: Mock
+        self, mock_plan: Mock, mock_renew: Mock
     ) -> None:
         """Test command with single organization that has expiring subscriptions."""
-        # Create mock subscriptions
-        mock_subscription1 = Mock()
-        mock_subscription1.id = 1
-        mock_subscription1.provider = "google"
-        mock_subscription1.expires_at = timezone.now() + datetime.timedelta(hours=12)
-        mock_subscription1.calendar.name = "Test Calendar 1"
-        mock_subscription1.organization = self.organization
-
-        mock_subscription2 = Mock()
-        mock_subscription2.id = 2
-        mock_subscription2.provider = "microsoft"
-        mock_subscription2.expires_at = timezone.now() + datetime.timedelta(hours=6)
-        mock_subscription2.calendar.name = "Test Calendar 2"
-        mock_subscription2.organization = self.organization
-
-        subscriptions = [mock_subscription1, mock_subscription2]
-
-        # Mock the complete queryset chain
-        mock_final_qs = Mock()
-        mock_final_qs.select_related.return_value = subscriptions
-
-        mock_filtered_qs = Mock()
-        mock_filtered_qs.filter.return_value = mock_final_qs
-
-        mock_qs.filter.return_value = mock_filtered_qs
-
-        # Mock DI container and calendar service
-        mock_calendar_service = Mock()
-        mock_calendar_service.refresh_webhook_subscription.side_effect = [
-            mock_subscription1,  # First refresh succeeds
-            None,  # Second refresh fails
-        ]
-        mock_container.calendar_service.return_value = mock_calendar_service
+        mock_plan.return_value = _plan((self.organization.id, 7, [1, 2]))
+        mock_renew.return_value = {"renewed": 1, "failed": 1}
 
         out = StringIO()
         call_command(
@@ -126,35 +94,14 @@ class TestRefreshWebhookSubscriptionsCommand(TestCase):
         assert "Found 2 webhook subscriptions expiring within 24 hours" in output
         assert "Successfully refreshed 1 webhook subscriptions" in output
         assert "Failed to refresh 1 webhook subscriptions" in output
+        # One call for the account, however many subscriptions it renews.
+        mock_renew.assert_called_once_with(self.organization.id, 7, [1, 2])
 
-    @patch("di_core.containers.container")
-    @patch(
-        "calendar_integration.management.commands.refresh_webhook_subscriptions.CalendarWebhookSubscription.original_manager"
-    )
-    def test_handle_dry_run(self, mock_qs: Mock, mock_container: Mock) -> None:
+    @patch(f"{COMMAND}.renew_account_webhook_subscriptions_task")
+    @patch(f"{COMMAND}.plan_webhook_renewals")
+    def test_handle_dry_run(self, mock_plan: Mock, mock_renew: Mock) -> None:
         """Test command with dry run option."""
-        # Create mock subscription
-        mock_subscription = Mock()
-        mock_subscription.id = 1
-        mock_subscription.provider = "google"
-        mock_subscription.expires_at = timezone.now() + datetime.timedelta(hours=12)
-        mock_subscription.calendar.name = "Test Calendar"
-        mock_subscription.organization = self.organization
-
-        subscriptions = [mock_subscription]
-
-        # Mock the complete queryset chain
-        mock_final_qs = Mock()
-        mock_final_qs.select_related.return_value = subscriptions
-
-        mock_filtered_qs = Mock()
-        mock_filtered_qs.filter.return_value = mock_final_qs
-
-        mock_qs.filter.return_value = mock_filtered_qs
-
-        # Mock DI container
-        mock_calendar_service = Mock()
-        mock_container.calendar_service.return_value = mock_calendar_service
+        mock_plan.return_value = _plan((self.organization.id, 7, [1]))
 
         out = StringIO()
         call_command(
@@ -167,43 +114,29 @@ class TestRefreshWebhookSubscriptionsCommand(TestCase):
         output = out.getvalue()
         assert "Found 1 webhook subscriptions expiring within 24 hours" in output
         assert "DRY RUN: Would refresh 1 subscriptions" in output
-        assert "Test Calendar" in output
-        # Verify refresh_subscription was not called in dry run
-        mock_subscription.refresh_subscription.assert_not_called()
-
-    @patch(
-        "calendar_integration.management.commands.refresh_webhook_subscriptions.CalendarWebhookSubscription.original_manager"
-    )
-    def test_handle_all_organizations(self, mock_qs: Mock) -> None:
-        """Test command with all organizations."""
-        # Mock the complete queryset chain for no results
-        mock_final_qs = Mock()
-        mock_final_qs.select_related.return_value = []
-
-        mock_qs.filter.return_value = mock_final_qs
+        mock_renew.assert_not_called()
+
+    @patch(f"{COMMAND}.renew_account_webhook_subscriptions_task")
+    @patch(f"{COMMAND}.plan_webhook_renewals")
+    def test_handle_all_organizations(self, mock_plan: Mock, mock_renew: Mock) -> None:
+        """Test command with all organizations: one renewal per account planned."""
+        mock_plan.return_value = _plan(
+            (self.organization.id, 7, [1]), (self.organization2.id, 8, [2, 3])
+        )
+        mock_renew.side_effect = [{"renewed": 1, "failed": 0}, {"renewed": 2, "failed": 0}]
 
         out = StringIO()
         call_command("refresh_webhook_subscriptions", stdout=out)
 
         output = out.getvalue()
-        assert "No webhook subscriptions need refreshing" in output
+        assert mock_plan.call_args.kwargs["organization_id"] is None
+        assert "Successfully refreshed 3 webhook subscriptions" in output
+        assert "Failed to refresh" not in output
 
-    @patch(
-        "calendar_integration.management.commands.refresh_webhook_subscriptions.CalendarWebhookSubscription.original_manager"
-    )
-    def test_handle_with_provider_filter(self, mock_qs: Mock) -> None:
+    @patch(f"{COMMAND}.plan_webhook_renewals")
+    def test_handle_with_provider_filter(self, mock_plan: Mock) -> None:
         """Test command with specific provider filter."""
-        # Mock the complete queryset chain
-        mock_final_qs = Mock()
-        mock_final_qs.select_related.return_value = []
-
-        mock_provider_filtered_qs = Mock()
-        mock_provider_filtered_qs.filter.return_value = mock_final_qs
-
-        mock_org_filtered_qs = Mock()
-        mock_org_filtered_qs.filter.return_value = mock_provider_filtered_qs
-
-        mock_qs.filter.return_value = mock_org_filtered_qs
+        mock_plan.return_value = _plan()
 
         out = StringIO()
         call_command(
@@ -215,23 +148,12 @@ class TestRefreshWebhookSubscriptionsCommand(TestCase):
 
         output = out.getvalue()
         assert "No webhook subscriptions need refreshing" in output
+        assert mock_plan.call_args.kwargs["provider"] == "google"
 
-        # Verify the initial filter was called (we can't easily verify the provider filter due to chaining)
-        mock_qs.filter.assert_called()
-
-    @patch(
-        "calendar_integration.management.commands.refresh_webhook_subscriptions.CalendarWebhookSubscription.original_manager"
-    )
-    def test_handle_with_custom_hours_before_expiry(self, mock_qs: Mock) -> None:
+    @patch(f"{COMMAND}.plan_webhook_renewals")
+    def test_handle_with_custom_hours_before_expiry(self, mock_plan: Mock) -> None:
         """Test command with custom hours before expiry."""
-        # Mock the complete queryset chain
-        mock_final_qs = Mock()
-        mock_final_qs.select_related.return_value = []
-
-        mock_filtered_qs = Mock()
-        mock_filtered_qs.filter.return_value = mock_final_qs
-
-        mock_qs.filter.return_value = mock_filtered_qs
+        mock_plan.return_value = _plan()
 
         out = StringIO()
         call_command(
@@ -243,36 +165,32 @@ class TestRefreshWebhookSubscriptionsCommand(TestCase):
 
         output = out.getvalue()
         assert "No webhook subscriptions need refreshing" in output
+        assert mock_plan.call_args.kwargs["lead_time"] == datetime.timedelta(hours=48)
 
-    @patch("di_core.containers.container")
-    @patch(
-        "calendar_integration.management.commands.refresh_webhook_subscriptions.CalendarWebhookSubscription.original_manager"
-    )
-    def test_handle_refresh_exception(self, mock_qs: Mock, mock_container: Mock) -> None:
-        """Test command when refresh_subscription raises an exception."""
-        # Create mock subscription that raises exception
-        mock_subscription = Mock()
-        mock_subscription.id = 1
-        mock_subscription.provider = "google"
-        mock_subscription.expires_at = timezone.now() + datetime.timedelta(hours=12)
-        mock_subscription.calendar.name = "Test Calendar"
-        mock_subscription.organization = self.organization
-
-        subscriptions = [mock_subscription]
-
-        # Mock the complete queryset chain
-        mock_final_qs = Mock()
-        mock_final_qs.select_related.return_value = subscriptions
+    @patch(f"{COMMAND}.renew_account_webhook_subscriptions_task")
+    @patch(f"{COMMAND}.plan_webhook_renewals")
+    def test_handle_unresolved_and_skipped_subscriptions_count_as_failed(
+        self, mock_plan: Mock, mock_renew: Mock
+    ) -> None:
+        """Subscriptions no account can renew, and those of a skipped account, fail."""
+        mock_plan.return_value = _plan((self.organization.id, 7, [1, 2]), unresolved=[3])
+        mock_renew.return_value = None
 
-        mock_filtered_qs = Mock()
-        mock_filtered_qs.filter.return_value = mock_final_qs
+        out = StringIO()
+        call_command("refresh_webhook_subscriptions", stdout=out)
 
-        mock_qs.filter.return_value = mock_filtered_qs
+        output = out.getvalue()
+        assert "Found 3 webhook subscriptions expiring within 24 hours" in output
+        assert "No linked account can refresh subscriptions [3]" in output
+        assert "Successfully refreshed 0 webhook subscriptions" in output
+        assert "Failed to refresh 3 webhook subscriptions" in output
 
-        # Mock DI container and calendar service that raises exception
-        mock_calendar_service = Mock()
-        mock_calendar_service.refresh_webhook_subscription.side_effect = Exception("Network error")
-        mock_container.calendar_service.return_value = mock_calendar_service
+    @patch(f"{COMMAND}.renew_account_webhook_subscriptions_task")
+    @patch(f"{COMMAND}.plan_webhook_renewals")
+    def test_handle_refresh_exception(self, mock_plan: Mock, mock_renew: Mock) -> None:
+        """Test command when an account's renewal raises an exception."""
+        mock_plan.return_value = _plan((self.organization.id, 7, [1]))
+        mock_renew.side_effect = Exception("Network error")
 
         out = StringIO()
         call_command(
@@ -285,6 +203,4 @@ class TestRefreshWebhookSubscriptionsCommand(TestCase):
         assert "Found 1 webhook subscriptions expiring within 24 hours" in output
         assert "Successfully refreshed 0 webhook subscriptions" in output
         assert "Failed to refresh 1 webhook subscriptions" in output
-        assert "Network error" in output
         assert "Failed to refresh: Network error" in output
-        assert "Network error" in output
@@ -1,5 +1,6 @@
 """Tests for webhook health check management command."""
 
+import datetime
 import json
 from io import StringIO
 from unittest.mock import Mock, patch
@@ -10,7 +11,10 @@ from django.utils import timezone
 
 from model_bakery import baker
 
+from calendar_integration.constants import IncomingWebhookProcessingStatus
 from calendar_integration.management.commands.webhook_health_check import Command
+from calendar_integration.models import Calendar, CalendarWebhookEvent, CalendarWebhookSubscription
+from calendar_integration.webhook_health import OrganizationWebhookHealth
 from organizations.models import Organization
 
 
@@ -40,27 +44,26 @@ class TestWebhookHealthCheckCommand(TestCase):
     @patch("calendar_integration.management.commands.webhook_health_check.WebhookAnalyticsService")
     def test_handle_single_organization(self, mock_analytics_service: Mock) -> None:
         """Test command with single organization."""
+        calendar = baker.make(Calendar, organization=self.organization)
+        baker.make(
+            CalendarWebhookSubscription,
+            organization=self.organization,
+            calendar=calendar,
+            expires_at=timezone.now() + datetime.timedelta(days=3),
+        )
+        for processing_status in (
+            IncomingWebhookProcessingStatus.PROCESSED,
+            IncomingWebhookProcessingStatus.FAILED,
+        ):
+            baker.make(
+                CalendarWebhookEvent,
+                organization=self.organization,
+                processing_status=processing_status,
+            )
         # Mock analytics service responses
         mock_service_instance = Mock()
         mock_analytics_service.return_value = mock_service_instance
 
-        mock_service_instance.get_subscription_health_report.return_value = {
-            "total_subscriptions": 5,
-            "active_subscriptions": 4,
-            "expired_subscriptions": 1,
-            "expiring_soon_subscriptions": 0,
-            "stale_subscriptions": 0,
-            "delivery_stats": {
-                "total_events": 100,
-                "successful_events": 95,
-                "failed_events": 5,
-                "ignored_events": 0,
-                "pending_events": 0,
-                "success_rate": 95.0,
-                "failure_rate": 5.0,
-            },
-        }
-
         mock_service_instance.get_webhook_latency_metrics.return_value = {
             "avg_latency": 1.5,
             "p95_latency": 2.8,
@@ -79,6 +82,9 @@ class TestWebhookHealthCheckCommand(TestCase):
         output = out.getvalue()
         assert "Webhook System Health Report" in output
         assert "Organizations Checked: 1" in output
+        assert "Subscriptions - Total: 1, Active: 1" in output
+        assert "Events - Total: 2, Success Rate: 50.0%" in output
+        assert "⚠ Failed: 1" in output
 
     def test_handle_organization_not_found(self) -> None:
         """Test command with non-existent organization."""
@@ -98,23 +104,6 @@ class TestWebhookHealthCheckCommand(TestCase):
         mock_service_instance = Mock()
         mock_analytics_service.return_value = mock_service_instance
 
-        mock_service_instance.get_subscription_health_report.return_value = {
-            "total_subscriptions": 2,
-            "active_subscriptions": 2,
-            "expired_subscriptions": 0,
-            "expiring_soon_subscriptions": 0,
-            "stale_subscriptions": 0,
-            "delivery_stats": {
-                "total_events": 50,
-                "successful_events": 50,
-                "failed_events": 0,
-                "ignored_events": 0,
-                "pending_events": 0,
-                "success_rate": 100.0,
-                "failure_rate": 0.0,
-            },
-        }
-
         mock_service_instance.get_webhook_latency_metrics.return_value = {
             "avg_latency": 1.0,
             "p95_latency": 1.5,
@@ -124,10 +113,15 @@ class TestWebhookHealthCheckCommand(TestCase):
         mock_service_instance.generate_webhook_failure_alert.return_value = None
 
         out = StringIO()
-        call_command("webhook_health_check", stdout=out)
+        # The organizations, then every organization's counts in two queries.
+        with self.assertNumQueries(3):
+            call_command("webhook_health_check", stdout=out)
 
         output = out.getvalue()
         assert "Organizations Checked: 2" in output
+        # Neither organization had events: no analytics query ran for them.
+        mock_service_instance.get_webhook_latency_metrics.assert_not_called()
+        mock_service_instance.generate_webhook_failure_alert.assert_not_called()
 
     @patch("calendar_integration.management.commands.webhook_health_check.WebhookAnalyticsService")
     def test_handle_json_output(self, mock_analytics_service: Mock) -> None:
@@ -135,23 +129,6 @@ class TestWebhookHealthCheckCommand(TestCase):
         mock_service_instance = Mock()
         mock_analytics_service.return_value = mock_service_instance
 
-        mock_service_instance.get_subscription_health_report.return_value = {
-            "total_subscriptions": 1,
-            "active_subscriptions": 1,
-            "expired_subscriptions": 0,
-            "expiring_soon_subscriptions": 0,
-            "stale_subscriptions": 0,
-            "delivery_stats": {
-                "total_events": 10,
-                "successful_events": 10,
-                "failed_events": 0,
-                "ignored_events": 0,
-                "pending_events": 0,
-                "success_rate": 100.0,
-                "failure_rate": 0.0,
-            },
-        }
-
         mock_service_instance.get_webhook_latency_metrics.return_value = {
             "avg_latency": 0.5,
             "p95_latency": 1.0,
@@ -189,23 +166,6 @@ class TestWebhookHealthCheckCommand(TestCase):
         mock_service_instance = Mock()
         mock_analytics_service.return_value = mock_service_instance
 
-        mock_service_instance.get_subscription_health_report.return_value = {
-            "total_subscriptions": 3,
-            "active_subscriptions": 2,
-            "expired_subscriptions": 1,
-            "expiring_soon_subscriptions": 1,
-            "stale_subscriptions": 1,
-            "delivery_stats": {
-                "total_events": 200,
-                "successful_events": 180,
-                "failed_events": 20,
-                "ignored_events": 0,
-                "pending_events": 0,
-                "success_rate": 90.0,
-                "failure_rate": 10.0,
-            },
-        }
-
         mock_service_instance.get_webhook_latency_metrics.return_value = {
             "avg_latency": 2.0,
             "p95_latency": 5.0,
@@ -216,13 +176,25 @@ class TestWebhookHealthCheckCommand(TestCase):
             "message": "High failure rate detected"
         }
 
-        report = self.command.check_organization_health(self.organization, 24, True)
+        health = OrganizationWebhookHealth(
+            total_subscriptions=3,
+            active_subscriptions=2,
+            expired_subscriptions=1,
+            expiring_soon_subscriptions=1,
+            stale_subscriptions=1,
+            total_events=200,
+            successful_events=180,
+            failed_events=20,
+        )
+
+        report = self.command.check_organization_health(self.organization, 24, True, health)
 
         assert report["organization_id"] == self.organization.id
         assert report["subscriptions"]["total"] == 3
         assert report["subscriptions"]["expired"] == 1
         assert report["events"]["total"] == 200
         assert report["events"]["failed"] == 20
+        assert report["events"]["success_rate"] == 90.0
         assert report["alert"]["message"] == "High failure rate detected"
         assert "failed_webhook_details" in report
         assert len(report["failed_webhook_details"]) == 1
@@ -361,23 +333,6 @@ class TestWebhookHealthCheckCommand(TestCase):
         mock_service_instance = Mock()
         mock_analytics_service.return_value = mock_service_instance
 
-        mock_service_instance.get_subscription_health_report.return_value = {
-            "total_subscriptions": 1,
-            "active_subscriptions": 1,
-            "expired_subscriptions": 0,
-            "expiring_soon_subscriptions": 0,
-            "stale_subscriptions": 0,
-            "delivery_stats": {
-                "total_events": 5,
-                "successful_events": 5,
-                "failed_events": 0,
-                "ignored_events": 0,
-                "pending_events": 0,
-                "success_rate": 100.0,
-                "failure_rate": 0.0,
-            },
-        }
-
         mock_service_instance.get_webhook_latency_metrics.return_value = {
             "avg_latency": 1.0,
             "p95_latency": 1.5,
@@ -385,6 +340,15 @@ class TestWebhookHealthCheckCommand(TestCase):
 
         mock_service_instance.get_failed_webhooks.return_value = []
         mock_service_instance.generate_webhook_failure_alert.return_value = None
+        # Received a day and a half ago: inside the window asked for, not the default.
+        event = baker.make(
+            CalendarWebhookEvent,
+            organization=self.organization,
+            processing_status=IncomingWebhookProcessingStatus.FAILED,
+        )
+        CalendarWebhookEvent.original_manager.filter(id=event.id).update(
+            created=timezone.now() - datetime.timedelta(hours=36)
+        )
 
         out = StringIO()
         call_command(
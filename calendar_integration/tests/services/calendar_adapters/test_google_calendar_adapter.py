@@ -1,14 +1,20 @@
 import datetime
+import threading
 from unittest.mock import Mock, patch
 
 from django.core.exceptions import ImproperlyConfigured
 
 import pytest
 from allauth.socialaccount.models import SocialAccount, SocialToken
+from googleapiclient.errors import HttpError
 
 from calendar_integration.constants import CalendarProvider
+from calendar_integration.exceptions import ProviderQuotaExceededError, SyncTokenExpiredError
+from calendar_integration.provider_quota import ProviderQuota
+from calendar_integration.services.calendar_adapters import google_calendar_adapter
 from calendar_integration.services.calendar_adapters.google_calendar_adapter import (
     _SA_SCOPES,
+    GOOGLE_FREEBUSY_MAX_CONCURRENCY,
     GoogleCalendarAdapter,
     GoogleCredentialTypedDict,
     GoogleServiceAccountCredentialsTypedDict,
@@ -21,7 +27,6 @@ from calendar_integration.services.dataclasses import (
     CalendarResourceData,
     EventAttendeeData,
 )
-from common.redis import ResilientLimiter
 from users.models import User
 
 
@@ -81,7 +86,7 @@ def mock_credentials():
 def mock_build():
     """Mock Google API client build function."""
     with patch(
-        "calendar_integration.services.calendar_adapters.google_calendar_adapter.build"
+        "calendar_integration.services.calendar_adapters.google_calendar_adapter.build_google_client"
     ) as mock_build:
         mock_client = Mock()
         mock_build.return_value = mock_client
@@ -92,18 +97,18 @@ def mock_build():
 def mock_rate_limiters():
     """Mock rate limiters to avoid Redis dependencies.
 
-    Specced to ResilientLimiter so the adapter can only call methods that
-    actually exist (e.g. try_acquire) — calling a non-existent method like
+    Specced to ProviderQuota so the adapter can only call methods that
+    actually exist (e.g. acquire) — calling a non-existent method like
     ``ratelimit`` raises AttributeError here instead of only blowing up in prod.
     """
     with (
         patch(
             "calendar_integration.services.calendar_adapters.google_calendar_adapter.read_quote_limiter",
-            spec=ResilientLimiter,
+            spec=ProviderQuota,
         ) as mock_read,
         patch(
             "calendar_integration.services.calendar_adapters.google_calendar_adapter.write_quote_limiter",
-            spec=ResilientLimiter,
+            spec=ProviderQuota,
         ) as mock_write,
     ):
         yield mock_read, mock_write
@@ -250,7 +255,7 @@ class TestServiceAccountCredentials:
         mock_sa_creds.with_subject.return_value = mock_delegated_creds
 
         with patch(
-            "calendar_integration.services.calendar_adapters.google_calendar_adapter.build"
+            "calendar_integration.services.calendar_adapters.google_calendar_adapter.build_google_client"
         ) as mock_build:
             mock_calendar_client = Mock()
             mock_admin_client = Mock()
@@ -269,8 +274,13 @@ class TestServiceAccountCredentials:
         assert adapter.account_id == "service-service_123"
         assert adapter.client is mock_calendar_client
         assert adapter.admin_client is mock_admin_client
-        mock_build.assert_any_call("calendar", "v3", credentials=mock_delegated_creds)
-        mock_build.assert_any_call("admin", "directory_v1", credentials=mock_delegated_creds)
+        cache_key = f"service-service_123:{service_account_credentials['admin_email']}"
+        mock_build.assert_any_call(
+            "calendar", "v3", credentials=mock_delegated_creds, cache_key=cache_key
+        )
+        mock_build.assert_any_call(
+            "admin", "directory_v1", credentials=mock_delegated_creds, cache_key=cache_key
+        )
         assert mock_build.call_count == 2
         mock_from_info.assert_called_once_with(
             {
@@ -294,7 +304,9 @@ class TestServiceAccountCredentials:
         mock_from_info.return_value = mock_sa_creds
         mock_sa_creds.with_subject.return_value = Mock()
 
-        with patch("calendar_integration.services.calendar_adapters.google_calendar_adapter.build"):
+        with patch(
+            "calendar_integration.services.calendar_adapters.google_calendar_adapter.build_google_client"
+        ):
             GoogleCalendarAdapter.from_service_account(service_account_credentials)
 
         mock_sa_creds.with_subject.assert_called_once_with(
@@ -327,7 +339,7 @@ class TestCalendarOperations:
         assert result.email == "calendar@example.com"
 
         adapter.client.calendars.assert_called_once()
-        mock_rate_limiters[1].try_acquire.assert_called_once()
+        mock_rate_limiters[1].acquire.assert_called_once()
 
 
 class TestAccountCalendarOperations:
@@ -399,9 +411,7 @@ class TestAccountCalendarOperations:
             showDeleted=False,
             minAccessRole="reader",
         )
-        mock_rate_limiters[0].try_acquire.assert_called_once_with(
-            f"google_calendar_read_{adapter.account_id}"
-        )
+        mock_rate_limiters[0].acquire.assert_called_once_with(adapter.account_id)
 
     def test_get_account_calendars_empty_result(self, adapter, mock_rate_limiters):
         """Test get_account_calendars when no calendars exist."""
@@ -413,7 +423,7 @@ class TestAccountCalendarOperations:
 
         assert len(calendars) == 0
         adapter.client.calendarList.return_value.list.assert_called_once()
-        mock_rate_limiters[0].try_acquire.assert_called_once()
+        mock_rate_limiters[0].acquire.assert_called_once()
 
     def test_get_account_calendars_missing_optional_fields(self, adapter, mock_rate_limiters):
         """Test get_account_calendars with minimal calendar data."""
@@ -452,9 +462,7 @@ class TestAccountCalendarOperations:
         list(adapter.get_account_calendars())
 
         # Verify rate limiter was called with correct account ID
-        mock_rate_limiters[0].try_acquire.assert_called_once_with(
-            "google_calendar_read_test_account_123"
-        )
+        mock_rate_limiters[0].acquire.assert_called_once_with("test_account_123")
 
     def test_get_account_calendars_original_payload_preserved(self, adapter, mock_rate_limiters):
         """Test that original payload is preserved in the result."""
@@ -657,7 +665,120 @@ class TestEventOperations:
         adapter.client.events.return_value.delete.assert_called_once_with(
             calendarId="calendar_123", eventId="event_123"
         )
-        mock_rate_limiters[1].try_acquire.assert_called_once()
+        mock_rate_limiters[1].acquire.assert_called_once()
+
+    def _fake_batches(self, adapter, failures=None):
+        """Stand in for ``new_batch_http_request``: records each batch's requests and
+        reports ``failures[request]`` to the batch callback."""
+        failures = failures or {}
+        batches = []
+
+        def _new_batch(callback):
+            batch = Mock()
+            batch.requests = []
+            batch.add.side_effect = batch.requests.append
+            batch.execute.side_effect = lambda http: [
+                callback(str(i), None, failures.get(request))
+                for i, request in enumerate(batch.requests)
+            ]
+            batches.append(batch)
+            return batch
+
+        adapter.client.new_batch_http_request.side_effect = _new_batch
+        return batches
+
+    def test_batch_writes_sends_queued_writes_in_batches_of_50(self, adapter, mock_rate_limiters):
+        """Writes inside batch_writes are deferred and sent 50 per batch request."""
+        batches = self._fake_batches(adapter)
+        event_data = CalendarEventAdapterInputData(
+            calendar_external_id="calendar_123",
+            title="Event",
+            description="",
+            start_time=datetime.datetime(2025, 6, 22, 10, 0, tzinfo=datetime.UTC),
+            end_time=datetime.datetime(2025, 6, 22, 11, 0, tzinfo=datetime.UTC),
+            timezone="UTC",
+            attendees=[],
+        )
+
+        with adapter.batch_writes():
+            created = adapter.create_event(event_data)
+            for i in range(60):
+                adapter.delete_event("calendar_123", f"event_{i}")
+            assert batches == []
+
+        assert [len(batch.requests) for batch in batches] == [50, 11]
+        insert_body = adapter.client.events.return_value.insert.call_args.kwargs["body"]
+        assert created.external_id == insert_body["id"]
+        assert created.title == "Event"
+        adapter.client.events.return_value.insert.return_value.execute.assert_not_called()
+        assert mock_rate_limiters[1].acquire.call_count == 61
+
+    def test_batch_writes_raises_the_first_failure(self, adapter, mock_rate_limiters):
+        """A write Google rejects inside the batch surfaces when the block exits."""
+        delete_request = adapter.client.events.return_value.delete.return_value
+        self._fake_batches(
+            adapter,
+            failures={
+                delete_request: HttpError(
+                    Mock(status=403, reason="Forbidden"), b'{"reason": "rateLimitExceeded"}'
+                )
+            },
+        )
+
+        mock_rate_limiters[1].name = "google_calendar_write"
+        mock_rate_limiters[1].retry_after = 60.0
+
+        with pytest.raises(ProviderQuotaExceededError) as exc_info:
+            with adapter.batch_writes():
+                adapter.delete_event("calendar_123", "event_123")
+
+        assert exc_info.value.quota_name == "google_calendar_write"
+
+    def test_batch_writes_sends_on_the_sending_thread_s_transport(
+        self, adapter, mock_rate_limiters
+    ):
+        """A fan-out flushes batches on pool threads; httplib2 is not thread-safe, so
+        a batch never goes through the client's shared transport."""
+        batches = self._fake_batches(adapter)
+
+        with patch(
+            "calendar_integration.services.calendar_adapters.google_calendar_adapter.authorized_http"
+        ) as authorized_http:
+            with adapter.batch_writes():
+                adapter.delete_event("calendar_123", "event_123")
+
+        batches[0].execute.assert_called_once_with(http=authorized_http.return_value)
+        authorized_http.assert_called_once_with(adapter._credentials, adapter._transport_key)
+
+    def test_discard_writes_drops_the_queued_writes_unsent(self, adapter, mock_rate_limiters):
+        batches = self._fake_batches(adapter)
+
+        with pytest.raises(RuntimeError):
+            with adapter.batch_writes():
+                adapter.delete_event("calendar_123", "event_1")
+                adapter.delete_event("calendar_123", "event_2")
+                assert adapter.discard_writes() == 2
+                raise RuntimeError("boom")
+
+        assert batches == []
+        assert adapter.discard_writes() == 0
+
+    def test_batch_writes_only_collects_the_opening_thread_s_writes(
+        self, adapter, mock_rate_limiters
+    ):
+        """Another thread writing through the same adapter is not queued in the block."""
+        batches = self._fake_batches(adapter)
+        delete = adapter.client.events.return_value.delete
+
+        with adapter.batch_writes():
+            adapter.delete_event("calendar_123", "queued")
+            worker = threading.Thread(target=adapter.delete_event, args=("calendar_123", "direct"))
+            worker.start()
+            worker.join()
+            delete.return_value.execute.assert_called_once_with()
+
+        assert [len(batch.requests) for batch in batches] == [1]
+        assert adapter._write_batch is None
 
     def test_get_events(self, adapter, mock_rate_limiters):
         """Test retrieving events from a calendar."""
@@ -781,6 +902,73 @@ class TestEventOperations:
         assert "syncToken" in call_args[1]
         assert call_args[1]["syncToken"] == "old_sync_token"
         assert call_args[1]["showDeleted"] is True
+        # Google rejects a sync token combined with the window or ordering.
+        assert not {"timeMin", "timeMax", "orderBy"} & set(call_args[1])
+        assert result["next_sync_token"] == "new_sync_token_456"
+
+    def test_get_events_publishes_next_sync_token_after_the_last_page(
+        self, adapter, mock_rate_limiters
+    ):
+        """The token only arrives with the last page, so it is ``None`` until the
+        stream has been exhausted."""
+        event = {
+            "id": "event_1",
+            "start": {"dateTime": "2025-06-22T10:00:00Z"},
+            "end": {"dateTime": "2025-06-22T11:00:00Z"},
+        }
+        adapter.client.events.return_value.list.return_value.execute.side_effect = [
+            {"items": [event], "nextPageToken": "page_2"},
+            {"items": [{**event, "id": "event_2"}], "nextSyncToken": "token_after_listing"},
+        ]
+        start_date = datetime.datetime(2025, 6, 22, 0, 0, tzinfo=datetime.UTC)
+        end_date = datetime.datetime(2025, 6, 22, 23, 59, tzinfo=datetime.UTC)
+
+        result = adapter.get_events("calendar_123", False, start_date, end_date)
+        assert result["next_sync_token"] is None
+        events = iter(result["events"])
+        assert next(events).external_id == "event_1"
+        assert result["next_sync_token"] is None
+
+        assert [e.external_id for e in events] == ["event_2"]
+        assert result["next_sync_token"] == "token_after_listing"
+
+    def test_get_events_with_expired_sync_token_raises(self, adapter, mock_rate_limiters):
+        """A ``410 Gone`` for the sync token surfaces as ``SyncTokenExpiredError``."""
+        adapter.client.events.return_value.list.return_value.execute.side_effect = HttpError(
+            Mock(status=410), b"Sync token is no longer valid."
+        )
+        start_date = datetime.datetime(2025, 6, 22, 0, 0, tzinfo=datetime.UTC)
+        end_date = datetime.datetime(2025, 6, 22, 23, 59, tzinfo=datetime.UTC)
+
+        result = adapter.get_events("calendar_123", False, start_date, end_date, "stale")
+
+        with pytest.raises(SyncTokenExpiredError):
+            list(result["events"])
+
+    def test_get_events_rate_limited_by_google_raises_retryable(self, adapter, mock_rate_limiters):
+        """Google's own ``403 rateLimitExceeded`` surfaces as a retryable quota error."""
+        mock_rate_limiters[0].name = "google_calendar_read"
+        mock_rate_limiters[0].retry_after = 60.0
+        adapter.client.events.return_value.list.return_value.execute.side_effect = HttpError(
+            Mock(status=403), b'{"error": {"errors": [{"reason": "rateLimitExceeded"}]}}'
+        )
+        start_date = datetime.datetime(2025, 6, 22, 0, 0, tzinfo=datetime.UTC)
+        end_date = datetime.datetime(2025, 6, 22, 23, 59, tzinfo=datetime.UTC)
+
+        result = adapter.get_events("calendar_123", False, start_date, end_date)
+
+        with pytest.raises(ProviderQuotaExceededError) as exc_info:
+            list(result["events"])
+        assert exc_info.value.retry_after == 60.0
+
+    def test_cancelled_tombstone_without_times_converts(self, adapter):
+        """Deleted events in an incremental listing carry no start/end."""
+        event_data = adapter._convert_google_calendar_event_to_event_data(
+            {"id": "event_gone", "status": "cancelled"}, "calendar_123"
+        )
+
+        assert event_data.status == "cancelled"
+        assert event_data.start_time == event_data.end_time
 
 
 def _make_sa_adapter(mock_rate_limiters: tuple[Mock, Mock]) -> GoogleCalendarAdapter:
@@ -792,11 +980,80 @@ def _make_sa_adapter(mock_rate_limiters: tuple[Mock, Mock]) -> GoogleCalendarAda
     """
     adapter = GoogleCalendarAdapter.__new__(GoogleCalendarAdapter)
     adapter.account_id = "service-test_sa"
+    adapter._credentials = Mock()
+    adapter._transport_key = adapter._resource_cache_key = "service-test_sa:admin@example.com"
     adapter.client = Mock()
     adapter.admin_client = Mock()
     return adapter
 
 
+class _FakeWorkspace:
+    """A local stand-in for the Directory and freebusy APIs that counts the calls made.
+
+    Lists ``room_count`` rooms ``page_size`` at a time and reports ``busy_emails``
+    busy in every freebusy window. The first ``rendezvous`` freebusy calls wait for
+    each other, so they only return if that many run at once.
+    """
+
+    def __init__(self, room_count: int, page_size: int, busy_emails: set[str], rendezvous: int):
+        self.rooms = [
+            {
+                "resourceId": f"room_{index}",
+                "resourceName": f"Room {index}",
+                "resourceEmail": f"room{index}@resource.calendar.google.com",
+            }
+            for index in range(room_count)
+        ]
+        self.page_size = page_size
+        self.busy_emails = busy_emails
+        self.directory_calls = 0
+        self.freebusy_calls = 0
+        self.freebusy_items: list[int] = []
+        self._lock = threading.Lock()
+        self._rendezvous = threading.Barrier(rendezvous, timeout=5)
+        self._rendezvous_left = rendezvous
+
+    def attach(self, adapter: GoogleCalendarAdapter) -> None:
+        calendars = adapter.admin_client.resources.return_value.calendars.return_value
+        calendars.list.side_effect = self.list_resources
+        adapter.client.freebusy.return_value.query.side_effect = self.query_freebusy
+
+    def list_resources(self, customer: str, maxResults: int, pageToken: str | None = None):  # noqa: N803
+        start = int(pageToken or 0)
+        end = start + self.page_size
+        page = {"items": self.rooms[start:end]}
+        if end < len(self.rooms):
+            page["nextPageToken"] = str(end)
+
+        def execute():
+            self.directory_calls += 1
+            return page
+
+        return Mock(execute=execute)
+
+    def query_freebusy(self, body: dict):
+        emails = [item["id"] for item in body["items"]]
+
+        def execute(http=None):
+            with self._lock:
+                self.freebusy_calls += 1
+                self.freebusy_items.append(len(emails))
+                wait = self._rendezvous_left > 0
+                self._rendezvous_left -= 1
+            if wait:
+                self._rendezvous.wait()
+            return {
+                "calendars": {
+                    email: {
+                        "busy": [{"start": "x", "end": "y"}] if email in self.busy_emails else []
+                    }
+                    for email in emails
+                }
+            }
+
+        return Mock(execute=execute)
+
+
 class TestResourceOperations:
     """Test calendar resource operations."""
 
@@ -841,7 +1098,7 @@ class TestResourceOperations:
         assert resources[1].external_id == "room_2"
         assert resources[1].email == "room-b@resource.calendar.google.com"
         # Rate limiter called once per page (one page in this test)
-        mock_rate_limiters[0].try_acquire.assert_called_once()
+        mock_rate_limiters[0].acquire.assert_called_once()
 
     def test_get_calendar_resources_paginates(self, mock_rate_limiters):
         """get_calendar_resources exhausts all pages via nextPageToken."""
@@ -877,7 +1134,7 @@ class TestResourceOperations:
         assert "pageToken" not in first_call_kwargs
         assert second_call_kwargs["pageToken"] == "token_abc"
         # Rate limiter acquired once per page request
-        assert mock_rate_limiters[0].try_acquire.call_count == 2
+        assert mock_rate_limiters[0].acquire.call_count == 2
 
     def test_get_calendar_resources_raises_without_admin_client(self, adapter, mock_rate_limiters):
         """get_calendar_resources raises NotImplementedError on non-SA (OAuth) adapters."""
@@ -910,7 +1167,7 @@ class TestResourceOperations:
         sa_adapter.admin_client.resources.return_value.calendars.return_value.get.assert_called_once_with(
             customer="my_customer", calendarResourceId="room_xyz"
         )
-        mock_rate_limiters[0].try_acquire.assert_called_once()
+        mock_rate_limiters[0].acquire.assert_called_once()
 
     def test_get_calendar_resource_raises_without_admin_client(self, adapter, mock_rate_limiters):
         """get_calendar_resource raises NotImplementedError on non-SA (OAuth) adapters."""
@@ -947,8 +1204,7 @@ class TestResourceOperations:
 
         # get_calendar_resources now requires admin_client; mock it at the method level
         # so this test exercises only the availability-checking logic.
-        # Use side_effect to return a fresh iterator on each call (get_available_calendar_resources
-        # calls get_calendar_resources twice internally).
+        # Use side_effect to return a fresh iterator on each call.
         sample_resources = [available_resource, busy_resource]
         with patch.object(
             adapter,
@@ -983,6 +1239,57 @@ class TestResourceOperations:
 
         assert len(available_resources) == 0
 
+    def test_get_available_calendar_resources_empty_range(self, adapter, mock_rate_limiters):
+        """A range that ends where it starts asks freebusy nothing: every resource is
+        available."""
+        resource = CalendarResourceData(
+            external_id="calendar_1",
+            name="Room",
+            description="",
+            email="room@example.com",
+            provider="google",
+        )
+        moment = datetime.datetime(2025, 6, 22, 9, 0, tzinfo=datetime.UTC)
+
+        with patch.object(adapter, "get_calendar_resources", side_effect=lambda: iter([resource])):
+            available_resources = list(adapter.get_available_calendar_resources(moment, moment))
+
+        assert available_resources == [resource]
+        adapter.client.freebusy.assert_not_called()
+
+    def test_get_available_calendar_resources_call_counts(self, mock_rate_limiters):
+        """Benchmark against a local fake Workspace: 120 rooms (3 Directory pages) over
+        a year (5 freebusy windows).
+
+        The Directory list used to be paged once up front and again for every window:
+        18 Directory calls, then 18 more for the next lookup. It is now paged once and
+        reused within the TTL, while freebusy takes 50 rooms per query and runs the 15
+        queries concurrently, each under a read permit.
+        """
+        sa_adapter = _make_sa_adapter(mock_rate_limiters)
+        workspace = _FakeWorkspace(
+            room_count=120,
+            page_size=50,
+            busy_emails={"room7@resource.calendar.google.com"},
+            rendezvous=GOOGLE_FREEBUSY_MAX_CONCURRENCY,
+        )
+        workspace.attach(sa_adapter)
+        start_time = datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+        end_time = start_time + datetime.timedelta(days=365)
+
+        with patch.dict(google_calendar_adapter._resource_lists, clear=True):
+            available = list(sa_adapter.get_available_calendar_resources(start_time, end_time))
+            again = list(sa_adapter.get_available_calendar_resources(start_time, end_time))
+
+        assert [resource.external_id for resource in available] == [
+            f"room_{index}" for index in range(120) if index != 7
+        ]
+        assert again == available
+        assert workspace.directory_calls == 3
+        assert workspace.freebusy_calls == 2 * 15
+        assert set(workspace.freebusy_items) == {50, 20}
+        assert mock_rate_limiters[0].acquire.call_count == 3 + 2 * 15
+
 
 class TestWebhookSubscriptions:
     """Test webhook subscription operations."""
@@ -1002,7 +1309,7 @@ class TestWebhookSubscriptions:
                 "params": {"ttl": 3600},
             },
         )
-        mock_rate_limiters[1].try_acquire.assert_called_once()
+        mock_rate_limiters[1].acquire.assert_called_once()
 
     def test_unsubscribe_from_calendar_events(self, adapter, mock_rate_limiters):
         """Test unsubscribing from calendar events."""
@@ -1013,7 +1320,7 @@ class TestWebhookSubscriptions:
         adapter.client.channels.return_value.stop.assert_called_once_with(
             body={"id": "calendar_123-subscription"}
         )
-        mock_rate_limiters[1].try_acquire.assert_called_once()
+        mock_rate_limiters[1].acquire.assert_called_once()
 
     def test_unsubscribe_from_calendar_events_error(self, adapter, mock_rate_limiters):
         """Test unsubscribe error handling."""
@@ -1024,6 +1331,74 @@ class TestWebhookSubscriptions:
         with pytest.raises(ValueError, match="Failed to unsubscribe from calendar events"):
             adapter.unsubscribe_from_calendar_events("calendar_123")
 
+    def test_renew_webhook_subscription_opens_a_new_channel_then_stops_the_old(
+        self, adapter, mock_rate_limiters
+    ):
+        """Google channels cannot be extended: a new one replaces the old."""
+        adapter.client.events.return_value.watch.return_value.execute.return_value = {
+            "id": "channel-new",
+            "resourceId": "resource-123",
+            "resourceUri": "https://example.com/resource",
+            "expiration": "1700000000000",
+        }
+
+        renewed = adapter.renew_webhook_subscription(
+            subscription_id="channel-old",
+            resource_id="calendar_123",
+            callback_url="https://example.com/webhook",
+            provider_resource_id="resource-123",
+            tracking_params={"ttl_seconds": 604800},
+        )
+
+        assert renewed["channel_id"] == "channel-new"
+        assert renewed["expiration"] == "1700000000000"
+        watch_body = adapter.client.events.return_value.watch.call_args.kwargs["body"]
+        assert watch_body["params"] == {"ttl": "604800"}
+        adapter.client.channels.return_value.stop.assert_called_once_with(
+            body={"id": "channel-old", "resourceId": "resource-123"}
+        )
+
+    def test_renew_webhook_subscription_runs_on_the_calling_thread_s_transport(
+        self, adapter, mock_rate_limiters
+    ):
+        """``renew_subscriptions`` renews on several threads; httplib2 is not
+        thread-safe, so no request may go through the client's shared transport."""
+        watch = adapter.client.events.return_value.watch.return_value
+        watch.execute.return_value = {"id": "channel-new"}
+        stop = adapter.client.channels.return_value.stop.return_value
+
+        with patch(
+            "calendar_integration.services.calendar_adapters.google_calendar_adapter.authorized_http"
+        ) as authorized_http:
+            adapter.renew_webhook_subscription(
+                subscription_id="channel-old",
+                resource_id="calendar_123",
+                callback_url="https://example.com/webhook",
+            )
+
+        watch.execute.assert_called_once_with(http=authorized_http.return_value)
+        stop.execute.assert_called_once_with(http=authorized_http.return_value)
+        assert {c.args for c in authorized_http.call_args_list} == {
+            (adapter._credentials, adapter._transport_key)
+        }
+
+    def test_renew_webhook_subscription_survives_a_failed_stop(self, adapter, mock_rate_limiters):
+        """The old channel lapses on its own; the renewal still counts."""
+        adapter.client.events.return_value.watch.return_value.execute.return_value = {
+            "id": "channel-new"
+        }
+        adapter.client.channels.return_value.stop.return_value.execute.side_effect = HttpError(
+            Mock(status=404), b"Channel not found"
+        )
+
+        renewed = adapter.renew_webhook_subscription(
+            subscription_id="channel-old",
+            resource_id="calendar_123",
+            callback_url="https://example.com/webhook",
+        )
+
+        assert renewed["channel_id"] == "channel-new"
+
 
 class TestEventDataConversion:
     """Test event data conversion methods."""
@@ -1129,31 +1504,6 @@ class TestUtilityMethods:
         assert len(chunks) == 1  # Should not be split
         assert chunks[0] == (start_time, end_time)
 
-    def test_get_paginated_resources(self, adapter, mock_rate_limiters):
-        """Test pagination of calendar resources."""
-        # Mock resources for pagination test
-        mock_resources = [
-            CalendarResourceData(
-                external_id=f"calendar_{i}",
-                name=f"Calendar {i}",
-                description="",
-                email=f"calendar{i}@example.com",
-                capacity=10,
-                original_payload={},
-                provider="google",
-            )
-            for i in range(75)  # 75 resources to test pagination
-        ]
-
-        # Mock get_calendar_resources to return our test data
-        adapter.get_calendar_resources = Mock(return_value=iter(mock_resources))
-
-        paginated_resources = list(adapter._get_paginated_resources(page_size=50))
-
-        assert len(paginated_resources) == 2  # Should have 2 pages
-        assert len(paginated_resources[0]) == 50  # First page has 50 items
-        assert len(paginated_resources[1]) == 25  # Second page has 25 items
-
 
 class TestErrorHandling:
     """Test error handling scenarios."""
@@ -7,12 +7,14 @@ import pytest
 import requests
 
 from calendar_integration.constants import CalendarProvider
+from calendar_integration.exceptions import ProviderUnavailableError
 from calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter import (
     MSOutlookCalendarAdapter,
     MSOutlookCredentialTypedDict,
 )
 from calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client import (
     MSGraphAPIError,
+    MSGraphBatchRequest,
     MSGraphCalendar,
     MSGraphEvent,
     MSGraphRoom,
@@ -22,6 +24,7 @@ from calendar_integration.services.dataclasses import (
     ApplicationCalendarData,
     CalendarEventAdapterInputData,
     CalendarEventAdapterOutputData,
+    CalendarEventsSyncTypedDict,
     CalendarResourceData,
     EventAttendeeData,
 )
@@ -150,7 +153,9 @@ def test_adapter_initialization_success(mock_client_class, mock_settings, mock_c
     assert adapter.refresh_token == "test_refresh_token"
     assert adapter.provider == "microsoft"
 
-    mock_client_class.assert_called_once_with(access_token="test_access_token")
+    mock_client_class.assert_called_once_with(
+        access_token="test_access_token", quota_key="test_account_id"
+    )
     mock_client.test_connection.assert_called_once()
 
 
@@ -513,6 +518,82 @@ def test_delete_event(mock_client_class, mock_settings, mock_credentials):
     mock_client.delete_event.assert_called_once_with("test_event_id", "test_calendar_id")
 
 
+@patch("calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.settings")
+@patch(
+    "calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.MSOutlookCalendarAPIClient"
+)
+def test_batch_writes_sends_one_graph_batch(mock_client_class, mock_settings, mock_credentials):
+    """Updates and deletes inside batch_writes go out together, chained per event."""
+    mock_settings.MS_CLIENT_ID = "test_client_id"
+    mock_settings.MS_CLIENT_SECRET = "test_client_secret"
+
+    mock_client = Mock()
+    mock_client.test_connection.return_value = True
+    mock_client.update_event_request.side_effect = lambda event_id, calendar_id, **kw: (
+        MSGraphBatchRequest(
+            id="1", method="PATCH", url=f"/events/{event_id}", body={"subject": kw["subject"]}
+        )
+    )
+    mock_client.delete_event_request.side_effect = lambda event_id, calendar_id: (
+        MSGraphBatchRequest(id="1", method="DELETE", url=f"/events/{event_id}")
+    )
+    mock_client.batch_request.return_value = {"1": {}, "2": {}, "3": {}}
+    mock_client_class.return_value = mock_client
+
+    adapter = MSOutlookCalendarAdapter(mock_credentials)
+    event_data = CalendarEventAdapterInputData(
+        calendar_external_id="test_calendar_id",
+        title="Updated Event",
+        description="",
+        start_time=datetime.datetime(2025, 6, 22, 10, 0, tzinfo=datetime.UTC),
+        end_time=datetime.datetime(2025, 6, 22, 11, 0, tzinfo=datetime.UTC),
+        timezone="UTC",
+        attendees=[],
+    )
+
+    with adapter.batch_writes():
+        result = adapter.update_event("test_calendar_id", "event_a", event_data)
+        adapter.delete_event("test_calendar_id", "event_b")
+        adapter.delete_event("test_calendar_id", "event_a")
+        mock_client.batch_request.assert_not_called()
+
+    assert result.external_id == "event_a"
+    assert result.title == "Updated Event"
+    mock_client.update_event.assert_not_called()
+    mock_client.delete_event.assert_not_called()
+    (sent,) = mock_client.batch_request.call_args.args
+    assert [(r.id, r.method, r.depends_on) for r in sent] == [
+        ("1", "PATCH", None),
+        ("2", "DELETE", None),
+        ("3", "DELETE", ["1"]),
+    ]
+
+
+@patch("calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.settings")
+@patch(
+    "calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.MSOutlookCalendarAPIClient"
+)
+def test_batch_writes_raises_first_refused_write(
+    mock_client_class, mock_settings, mock_credentials
+):
+    mock_settings.MS_CLIENT_ID = "test_client_id"
+    mock_settings.MS_CLIENT_SECRET = "test_client_secret"
+
+    mock_client = Mock()
+    mock_client.test_connection.return_value = True
+    mock_client.delete_event_request.return_value = MSGraphBatchRequest(
+        id="1", method="DELETE", url="/events/event_a"
+    )
+    mock_client.batch_request.return_value = {"1": MSGraphAPIError("Not found", 404)}
+    mock_client_class.return_value = mock_client
+
+    adapter = MSOutlookCalendarAdapter(mock_credentials)
+
+    with pytest.raises(ValueError, match="Failed to write batched events: Not found"):
+        with adapter.batch_writes():
+            adapter.delete_event("test_calendar_id", "event_a")
+
+
 # Event Listing Tests
 
 
@@ -553,6 +634,48 @@ def test_get_events_non_resource_calendar(
     assert events_list[0].external_id == "test_event_id"
 
 
+@patch("calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.settings")
+@patch(
+    "calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.MSOutlookCalendarAPIClient"
+)
+@patch(
+    "calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client.quote_limiter"
+)
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_get_events_lists_without_a_sync_token_while_delta_is_unavailable(
+    mock_limiter, mock_client_class, mock_settings, status_code, mock_credentials, mock_ms_event
+):
+    """A delta endpoint that keeps throttling or answering 503 is still an
+    ``MSGraphAPIError`` to the adapter: the initial listing goes ahead without a sync
+    token."""
+    mock_settings.MS_CLIENT_ID = "test_client_id"
+    mock_settings.MS_CLIENT_SECRET = "test_client_secret"
+
+    graph_client = MSOutlookCalendarAPIClient(access_token="test_token")
+    unavailable = Mock(status_code=status_code, ok=False, headers={"Retry-After": "60"})
+    unavailable.json.return_value = {"error": {"message": "Unavailable"}}
+    unavailable.content = b'{"error": {"message": "Unavailable"}}'
+
+    mock_client = Mock()
+    mock_client.test_connection.return_value = True
+    mock_client.list_events.return_value = [mock_ms_event]
+    mock_client.get_events_delta.side_effect = lambda **kwargs: graph_client._make_request(
+        "GET", "/me/calendarView/delta"
+    )
+    mock_client_class.return_value = mock_client
+
+    adapter = MSOutlookCalendarAdapter(mock_credentials)
+
+    start_date = datetime.datetime(2025, 6, 22, 0, 0, tzinfo=datetime.UTC)
+    end_date = datetime.datetime(2025, 6, 22, 23, 59, tzinfo=datetime.UTC)
+    with patch.object(graph_client.session, "request", return_value=unavailable):
+        result = adapter.get_events("test_calendar_id", False, start_date, end_date)
+        events_list = list(result["events"])
+
+    assert [event.external_id for event in events_list] == ["test_event_id"]
+    assert result["next_sync_token"] is None
+
+
 @patch("calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.settings")
 @patch(
     "calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.MSOutlookCalendarAPIClient"
@@ -896,6 +1019,66 @@ def test_subscribe_to_calendar_events_api_error(mock_client_class, mock_settings
     assert "Failed to subscribe to calendar events" in str(exc_info.value)
 
 
+@patch("calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.settings")
+@patch(
+    "calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.MSOutlookCalendarAPIClient"
+)
+def test_renew_webhook_subscription_extends_it_in_place(
+    mock_client_class, mock_settings, mock_credentials
+):
+    """Graph subscriptions keep their id; only the expiration moves, capped at 70 hours."""
+    mock_settings.MS_CLIENT_ID = "test_client_id"
+    mock_settings.MS_CLIENT_SECRET = "test_client_secret"
+
+    mock_client = Mock()
+    mock_client.test_connection.return_value = True
+    mock_client.update_subscription.return_value = {"id": "subscription_id"}
+    mock_client_class.return_value = mock_client
+
+    adapter = MSOutlookCalendarAdapter(mock_credentials)
+    before = datetime.datetime.now(datetime.UTC)
+
+    renewed = adapter.renew_webhook_subscription(
+        subscription_id="subscription_id",
+        resource_id="test_calendar_id",
+        callback_url="https://example.com/webhook",
+        tracking_params={"expiration_hours": 100},
+    )
+
+    subscription_id, expiration = mock_client.update_subscription.call_args.args
+    assert subscription_id == "subscription_id"
+    assert (
+        before + datetime.timedelta(hours=70)
+        <= expiration
+        <= datetime.datetime.now(datetime.UTC) + datetime.timedelta(hours=70)
+    )
+    assert renewed["subscription_id"] == "subscription_id"
+    assert renewed["expiration"] == expiration.isoformat().replace("+00:00", "Z")
+
+
+@patch("calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.settings")
+@patch(
+    "calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.MSOutlookCalendarAPIClient"
+)
+def test_renew_webhook_subscription_api_error(mock_client_class, mock_settings, mock_credentials):
+    mock_settings.MS_CLIENT_ID = "test_client_id"
+    mock_settings.MS_CLIENT_SECRET = "test_client_secret"
+
+    mock_client = Mock()
+    mock_client.test_connection.return_value = True
+    mock_client.update_subscription.side_effect = MSGraphAPIError("Subscription not found")
+    mock_client_class.return_value = mock_client
+
+    adapter = MSOutlookCalendarAdapter(mock_credentials)
+
+    with pytest.raises(ValueError, match="Failed to renew Microsoft webhook subscription"):
+        adapter.renew_webhook_subscription(
+            subscription_id="subscription_id",
+            resource_id="test_calendar_id",
+            callback_url="https://example.com/webhook",
+        )
+
+
 @patch("calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.settings")
 @patch(
     "calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.MSOutlookCalendarAPIClient"
@@ -1080,12 +1263,14 @@ def test_make_request_max_retries_exceeded(mock_sleep, mock_limiter):
 
     # Mock the session to always return the failing response
     with patch.object(client.session, "request", return_value=mock_response_fail) as mock_request:
-        with pytest.raises(MSGraphAPIError) as exc_info:
+        with pytest.raises(ProviderUnavailableError) as exc_info:
             client._make_request("GET", "/test/endpoint")
 
-        assert "MS Graph API error: 500" in str(exc_info.value)
-        assert mock_request.call_count == 6  # RETRIES_ON_ERROR + 1 = 5 + 1 = 6
-        assert mock_sleep.call_count == 5  # Called 5 times for retries
+        assert "status 500" in str(exc_info.value)
+        # Backoff of 1s, 2s and 4s slept in place; the next 8s is left to the caller.
+        assert exc_info.value.retry_after == 8
+        assert mock_request.call_count == 4
+        assert mock_sleep.call_count == 3
 
 
 @patch(
@@ -1134,12 +1319,12 @@ def test_make_request_request_exception_max_retries(mock_sleep, mock_limiter):
     with patch.object(
         client.session, "request", side_effect=requests.RequestException("Connection error")
     ) as mock_request:
-        with pytest.raises(MSGraphAPIError) as exc_info:
+        with pytest.raises(ProviderUnavailableError) as exc_info:
             client._make_request("GET", "/test/endpoint")
 
-        assert "Request failed after 6 attempts" in str(exc_info.value)
-        assert mock_request.call_count == 6  # RETRIES_ON_ERROR + 1 = 5 + 1 = 6
-        assert mock_sleep.call_count == 5
+        assert "Connection error" in str(exc_info.value)
+        assert mock_request.call_count == 4
+        assert mock_sleep.call_count == 3
 
 
 def test_make_request_non_retryable_error():
@@ -1338,8 +1523,8 @@ def test_get_room_events_delta_initial_request():
                     "isCancelled": False,
                 }
             ],
-            "@odata.nextLink": "https://graph.microsoft.com/v1.0/places/room@example.com/calendarView/delta?$skiptoken=abc123",
-            "@odata.deltaLink": "https://graph.microsoft.com/v1.0/places/room@example.com/calendarView/delta?$deltatoken=def456",
+            "@odata.nextLink": "https://graph.microsoft.com/v1.0/users/room@example.com/calendarView/delta?$skiptoken=abc123",
+            "@odata.deltaLink": "https://graph.microsoft.com/v1.0/users/room@example.com/calendarView/delta?$deltatoken=def456",
         }
 
         start_time = datetime.datetime(2025, 6, 22, 9, 0, tzinfo=datetime.UTC)
@@ -1354,7 +1539,7 @@ def test_get_room_events_delta_initial_request():
 
         mock_request.assert_called_once_with(
             "GET",
-            "/places/room@example.com/calendarView/delta",
+            "/users/room@example.com/calendarView/delta",
             params={
                 "startDateTime": start_time.isoformat(),
                 "endDateTime": end_time.isoformat(),
@@ -1370,7 +1555,7 @@ def test_get_room_events_delta_with_delta_token():
     with patch.object(client, "_make_request") as mock_request:
         mock_request.return_value = {
             "value": [],
-            "@odata.deltaLink": "https://graph.microsoft.com/v1.0/places/room@example.com/calendarView/delta?$deltatoken=new_token",
+            "@odata.deltaLink": "https://graph.microsoft.com/v1.0/users/room@example.com/calendarView/delta?$deltatoken=new_token",
         }
 
         start_time = datetime.datetime(2025, 6, 22, 9, 0, tzinfo=datetime.UTC)
@@ -1385,7 +1570,7 @@ def test_get_room_events_delta_with_delta_token():
 
         mock_request.assert_called_once_with(
             "GET",
-            "/places/room@example.com/calendarView/delta",
+            "/users/room@example.com/calendarView/delta",
             params={"$deltatoken": "old_token"},
             headers={},
         )
@@ -1398,7 +1583,7 @@ def test_get_room_events_delta_with_skip_token():
     with patch.object(client, "_make_request") as mock_request:
         mock_request.return_value = {
             "value": [],
-            "@odata.deltaLink": "https://graph.microsoft.com/v1.0/places/room@example.com/calendarView/delta?$deltatoken=final_token",
+            "@odata.deltaLink": "https://graph.microsoft.com/v1.0/users/room@example.com/calendarView/delta?$deltatoken=final_token",
         }
 
         start_time = datetime.datetime(2025, 6, 22, 9, 0, tzinfo=datetime.UTC)
@@ -1412,7 +1597,7 @@ def test_get_room_events_delta_with_skip_token():
 
         mock_request.assert_called_once_with(
             "GET",
-            "/places/room@example.com/calendarView/delta",
+            "/users/room@example.com/calendarView/delta",
             params={"$skiptoken": "skip123"},
             headers={},
         )
@@ -1425,7 +1610,7 @@ def test_get_room_events_delta_with_max_page_size():
     with patch.object(client, "_make_request") as mock_request:
         mock_request.return_value = {
             "value": [],
-            "@odata.deltaLink": "https://graph.microsoft.com/v1.0/places/room@example.com/calendarView/delta?$deltatoken=token",
+            "@odata.deltaLink": "https://graph.microsoft.com/v1.0/users/room@example.com/calendarView/delta?$deltatoken=token",
         }
 
         start_time = datetime.datetime(2025, 6, 22, 9, 0, tzinfo=datetime.UTC)
@@ -1435,7 +1620,7 @@ def test_get_room_events_delta_with_max_page_size():
 
         mock_request.assert_called_once_with(
             "GET",
-            "/places/room@example.com/calendarView/delta",
+            "/users/room@example.com/calendarView/delta",
             params={
                 "startDateTime": start_time.isoformat(),
                 "endDateTime": end_time.isoformat(),
@@ -1463,13 +1648,13 @@ def test_adapter_get_room_events_with_pagination(
     mock_client.get_room_events_delta.side_effect = [
         {
             "events": [mock_ms_event],
-            "next_link": "https://graph.microsoft.com/v1.0/places/room@example.com/calendarView/delta?$skiptoken=abc123",
+            "next_link": "https://graph.microsoft.com/v1.0/users/room@example.com/calendarView/delta?$skiptoken=abc123",
             "delta_link": None,
         },
         {
             "events": [mock_ms_event],
             "next_link": None,
-            "delta_link": "https://graph.microsoft.com/v1.0/places/room@example.com/calendarView/delta?$deltatoken=def456",
+            "delta_link": "https://graph.microsoft.com/v1.0/users/room@example.com/calendarView/delta?$deltatoken=def456",
         },
     ]
     mock_client_class.return_value = mock_client
@@ -1491,6 +1676,41 @@ def test_adapter_get_room_events_with_pagination(
     assert mock_client.get_room_events_delta.call_count == 2
 
 
+@patch("calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.settings")
+@patch(
+    "calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.MSOutlookCalendarAPIClient"
+)
+def test_adapter_get_room_events_delta_returns_the_next_delta_token(
+    mock_client_class, mock_settings, mock_credentials, mock_ms_event
+):
+    """A room's first round covers the window and ends with a delta token; the
+    token comes back without its prefix when the next round resumes from it."""
+    mock_settings.MS_CLIENT_ID = "test_client_id"
+    mock_settings.MS_CLIENT_SECRET = "test_client_secret"
+    mock_client = Mock()
+    mock_client.test_connection.return_value = True
+    mock_client.get_room_events_delta.return_value = {
+        "events": [mock_ms_event],
+        "next_link": None,
+        "delta_link": "https://graph.microsoft.com/v1.0/users/room@example.com/calendarView/delta?$deltatoken=def456",
+    }
+    mock_client_class.return_value = mock_client
+    adapter = MSOutlookCalendarAdapter(mock_credentials)
+    start_time = datetime.datetime(2025, 6, 22, 10, 0, tzinfo=datetime.UTC)
+    end_time = datetime.datetime(2025, 6, 22, 11, 0, tzinfo=datetime.UTC)
+
+    first = adapter.get_room_events_delta("room@example.com", start_time, end_time)
+    adapter.get_room_events_delta(
+        "room@example.com", start_time, end_time, first["next_sync_token"]
+    )
+
+    assert len(first["events"]) == 1
+    assert first["next_sync_token"] == "$deltatoken=def456"
+    initial, resumed = mock_client.get_room_events_delta.call_args_list
+    assert "delta_token" not in initial.kwargs
+    assert resumed.kwargs["delta_token"] == "def456"
+
+
 # list_rooms_as_list tests
 def test_list_rooms_as_list():
     """Test list rooms as list."""
@@ -1817,7 +2037,7 @@ def test_get_room_events_with_sync_token(
         room_email="room@example.com",
         start_time=start_time,
         end_time=end_time,
-        delta_token="$deltatoken=abc123",
+        delta_token="abc123",
         max_page_size=250,
     )
 
@@ -2210,8 +2430,9 @@ def test_create_delta_events_iterator_with_deltatoken(
     sync_token = "$deltatoken=oldtoken456"
     max_results = 100
 
+    result = CalendarEventsSyncTypedDict(events=(), next_sync_token=None)
     events_iterator = adapter._create_delta_events_iterator(
-        calendar_id, start_date, end_date, sync_token, max_results
+        calendar_id, start_date, end_date, sync_token, max_results, result
     )
 
     # Convert to list to test
@@ -2225,13 +2446,13 @@ def test_create_delta_events_iterator_with_deltatoken(
     mock_client.get_events_delta.assert_called_once_with(
         start_time=start_date,
         end_time=end_date,
-        delta_token=sync_token,
+        delta_token="oldtoken456",
         calendar_id=calendar_id,
         max_page_size=max_results,
     )
 
-    # Check that next sync token was set
-    assert adapter._next_sync_token == "newtoken123"
+    # Check that next sync token was published once the iterator finished
+    assert result["next_sync_token"] == "$deltatoken=newtoken123"
 
 
 @patch("calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.settings")
@@ -2265,8 +2486,9 @@ def test_create_delta_events_iterator_with_skiptoken(
     sync_token = "skiptoken123"
     max_results = 100
 
+    result = CalendarEventsSyncTypedDict(events=(), next_sync_token=None)
     events_iterator = adapter._create_delta_events_iterator(
-        calendar_id, start_date, end_date, sync_token, max_results
+        calendar_id, start_date, end_date, sync_token, max_results, result
     )
 
     # Convert to list to test
@@ -2338,8 +2560,9 @@ def test_create_delta_events_iterator_with_pagination(
     sync_token = "$deltatoken=starttoken"
     max_results = 100
 
+    result = CalendarEventsSyncTypedDict(events=(), next_sync_token=None)
     events_iterator = adapter._create_delta_events_iterator(
-        calendar_id, start_date, end_date, sync_token, max_results
+        calendar_id, start_date, end_date, sync_token, max_results, result
     )
 
     # Convert to list to test
@@ -2352,8 +2575,8 @@ def test_create_delta_events_iterator_with_pagination(
     # Verify API was called twice (once for initial, once for next page)
     assert mock_client.get_events_delta.call_count == 2
 
-    # Check that final sync token was set
-    assert adapter._next_sync_token == "finaltoken"
+    # Check that final sync token was published once the iterator finished
+    assert result["next_sync_token"] == "$deltatoken=finaltoken"
 
 
 @patch("calendar_integration.services.calendar_adapters.ms_outlook_calendar_adapter.settings")
@@ -2387,15 +2610,16 @@ def test_create_delta_events_iterator_empty_pages(
     sync_token = "$deltatoken=token"
     max_results = 100
 
+    result = CalendarEventsSyncTypedDict(events=(), next_sync_token=None)
     events_iterator = adapter._create_delta_events_iterator(
-        calendar_id, start_date, end_date, sync_token, max_results
+        calendar_id, start_date, end_date, sync_token, max_results, result
     )
 
     # Convert to list to test
     events_list = list(events_iterator)
 
     assert len(events_list) == 0
-    assert adapter._next_sync_token == "emptytoken"
+    assert result["next_sync_token"] == "$deltatoken=emptytoken"
 
 
 class TestRRuleConversion:
@@ -0,0 +1,70 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+from googleapiclient import discovery_cache
+
+from calendar_integration.services.calendar_clients import google_api_clients
+from calendar_integration.services.calendar_clients.google_api_clients import (
+    build_google_client,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    """Start every test from cold process and thread caches."""
+    with (
+        patch.object(google_api_clients, "_discovery_documents", {}),
+        patch.object(google_api_clients, "_transports", threading.local()),
+    ):
+        yield
+
+
+def test_discovery_document_is_parsed_once():
+    with patch.object(
+        discovery_cache, "get_static_doc", wraps=discovery_cache.get_static_doc
+    ) as get_static_doc:
+        first = build_google_client(
+            "calendar", "v3", credentials=Credentials(token="a"), cache_key="oauth:1"
+        )
+        second = build_google_client(
+            "calendar", "v3", credentials=Credentials(token="b"), cache_key="oauth:2"
+        )
+
+    get_static_doc.assert_called_once_with("calendar", "v3")
+    assert first is not second
+    assert second._http.credentials.token == "b"
+
+
+def test_transport_is_reused_per_credential_and_thread():
+    def transport(cache_key, token="token"):
+        client = build_google_client(
+            "calendar", "v3", credentials=Credentials(token=token), cache_key=cache_key
+        )
+        return client._http.http
+
+    same_account = transport("oauth:1")
+    assert transport("oauth:1", token="refreshed") is same_account
+    assert transport("oauth:2") is not same_account
+
+    other_thread = []
+    thread = threading.Thread(target=lambda: other_thread.append(transport("oauth:1")))
+    thread.start()
+    thread.join()
+    assert other_thread[0] is not same_account
+
+
+def test_least_recently_used_transport_is_evicted():
+    with patch.object(google_api_clients, "GOOGLE_TRANSPORT_CACHE_SIZE", 1):
+        first = build_google_client(
+            "calendar", "v3", credentials=Credentials(token="a"), cache_key="oauth:1"
+        )._http.http
+        build_google_client(
+            "calendar", "v3", credentials=Credentials(token="b"), cache_key="oauth:2"
+        )
+        again = build_google_client(
+            "calendar", "v3", credentials=Credentials(token="a"), cache_key="oauth:1"
+        )._http.http
+
+    assert again is not first
@@ -9,8 +9,11 @@ from unittest.mock import Mock, patch
 import pytest
 import requests
 
+from calendar_integration.exceptions import ProviderQuotaExceededError, ProviderUnavailableError
 from calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client import (
+    GRAPH_POOL_MAXSIZE,
     MSGraphAPIError,
+    MSGraphBatchRequest,
     MSGraphCalendar,
     MSGraphEvent,
     MSGraphRoom,
@@ -56,7 +59,7 @@ def mock_sleep():
 def client(mock_session, mock_sleep):
     """Create MSOutlookCalendarAPIClient instance with mocked session."""
     with patch(
-        "calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client.requests.Session",
+        "calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client._graph_session",
         return_value=mock_session,
     ):
         client = MSOutlookCalendarAPIClient(access_token="test_token", user_id="test_user")
@@ -116,7 +119,7 @@ def sample_room_data():
 def test_client_initialization():
     """Test client initialization with and without user_id."""
     with patch(
-        "calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client.requests.Session"
+        "calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client._graph_session"
     ):
         # Test with user_id
         client = MSOutlookCalendarAPIClient(access_token="test_token", user_id="specific_user")
@@ -187,10 +190,95 @@ def test_make_request_max_retries_exceeded(client):
     with patch(
         "calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client.quote_limiter"
     ):
-        with pytest.raises(MSGraphAPIError):
+        with pytest.raises(ProviderUnavailableError):
             client._make_request("GET", "/test/endpoint")
 
 
+def test_make_request_throttled_raises_retryable_error(client):
+    """A 429 is handed back as a retryable quota error honouring ``Retry-After``."""
+    mock_response = create_mock_response(429, {"error": {"message": "Too many requests"}})
+    mock_response.headers = {"Retry-After": "12"}
+    client.session.request.return_value = mock_response
+
+    with pytest.raises(ProviderQuotaExceededError) as exc_info:
+        client._make_request("GET", "/test/endpoint")
+
+    assert exc_info.value.retry_after == 12
+    client.session.request.assert_called_once()
+
+
+def test_make_request_short_retry_after_is_waited_in_place(client):
+    """A ``Retry-After`` within ``MAX_INLINE_RETRY_WAIT`` is slept and retried."""
+    throttled = create_mock_response(429, {"error": {"message": "Too many requests"}})
+    throttled.headers = {"Retry-After": "2"}
+    client.session.request.side_effect = [throttled, create_mock_response(200, {"id": "ok"})]
+
+    with patch("time.sleep") as sleep:
+        result = client._make_request("GET", "/test/endpoint")
+
+    assert result == {"id": "ok"}
+    sleep.assert_called_once_with(2.0)
+
+
+def test_make_request_long_throttling_header_defers_server_error(client):
+    """A 5xx whose throttling header asks for a long wait is not retried in place."""
+    mock_response = create_mock_response(503, {"error": {"message": "Unavailable"}})
+    mock_response.headers = {"RateLimit-Reset": "90"}
+    client.session.request.return_value = mock_response
+
+    with patch("time.sleep") as sleep, pytest.raises(ProviderUnavailableError) as exc_info:
+        client._make_request("GET", "/test/endpoint")
+
+    assert exc_info.value.retry_after == 90
+    sleep.assert_not_called()
+    client.session.request.assert_called_once()
+
+
+def test_clients_share_one_pooled_session():
+    """Every client sends through the process-wide session, with its own credentials."""
+    with patch(
+        "calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client._shared_session",
+        None,
+    ):
+        first = MSOutlookCalendarAPIClient(access_token="token-a")
+        second = MSOutlookCalendarAPIClient(access_token="token-b")
+
+    assert first.session is second.session
+    assert "Authorization" not in first.session.headers
+    assert first.headers["Authorization"] == "Bearer token-a"
+    assert first.session.get_adapter("https://graph.microsoft.com")._pool_maxsize == (
+        GRAPH_POOL_MAXSIZE
+    )
+
+
+def test_refresh_access_token(mock_session):
+    """The refresh-token grant posts to the identity platform and returns its answer."""
+    mock_session.post.return_value = create_mock_response(
+        200, {"access_token": "new", "expires_in": 3599, "refresh_token": "rotated"}
+    )
+
+    with patch(
+        "calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client._graph_session",
+        return_value=mock_session,
+    ):
+        result = MSOutlookCalendarAPIClient.refresh_access_token("id", "secret", "old")
+
+    assert result["refresh_token"] == "rotated"
+    assert mock_session.post.call_args.kwargs["data"]["grant_type"] == "refresh_token"
+
+    mock_session.post.return_value = create_mock_response(
+        400, {"error": "invalid_grant", "error_description": "Token expired"}
+    )
+    with (
+        patch(
+            "calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client._graph_session",
+            return_value=mock_session,
+        ),
+        pytest.raises(MSGraphAPIError, match="Token expired"),
+    ):
+        MSOutlookCalendarAPIClient.refresh_access_token("id", "secret", "old")
+
+
 def test_parse_datetime(client):
     """Test datetime parsing from Microsoft Graph format."""
     # Test with Z suffix
@@ -754,6 +842,27 @@ def test_test_connection_failure(client):
     assert result is False
 
 
+def test_test_connection_failure_when_graph_stays_unavailable(client):
+    """Persistent 5xx answers fail the connection test instead of escaping it."""
+    mock_response = create_mock_response(503, {"error": {"message": "Unavailable"}})
+    mock_response.headers = {"Retry-After": "60"}
+    client.session.request.return_value = mock_response
+
+    assert client.test_connection() is False
+
+
+def test_test_connection_failure_when_the_graph_quota_is_exhausted(client):
+    """An exhausted Graph bucket fails the connection test instead of escaping it."""
+    with patch(
+        "calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client.quote_limiter"
+    ) as limiter:
+        limiter.acquire.side_effect = ProviderQuotaExceededError("ms_outlook_calendar", 30)
+
+        assert client.test_connection() is False
+
+    client.session.request.assert_not_called()
+
+
 def test_parse_event(client, sample_event_data):
     """Test parsing event data into MSGraphEvent object."""
     event = client._parse_event(sample_event_data)
@@ -839,25 +948,102 @@ def test_subscribe_to_room_events(client):
     assert subscription["id"] == "subscription123"
 
 
+def _batch_responses(mock_request, statuses=None):
+    """Answer each ``POST /$batch`` with one response per request it carries."""
+    statuses = statuses or {}
+
+    def _respond(method, url, json=None, **kwargs):
+        return create_mock_response(
+            json_data={
+                "responses": [
+                    {
+                        "id": item["id"],
+                        "status": statuses.get(item["id"], (200, {}))[0],
+                        "headers": {"Retry-After": "7"},
+                        "body": statuses.get(item["id"], (200, {"id": f"result-{item['id']}"}))[1],
+                    }
+                    for item in json["requests"]
+                ]
+            }
+        )
+
+    mock_request.side_effect = _respond
+
+
 def test_subscribe_to_multiple_room_events(client):
-    """Test subscribing to multiple room events."""
-    response_data = {
-        "id": "subscription123",
-        "resource": "/places/room1@example.com/events",
-        "changeType": "created,updated,deleted",
-    }
-    mock_response = Mock()
-    mock_response.json.return_value = response_data
-    client.session.request.return_value = mock_response
+    """Subscriptions for several rooms go out in one batch; refused rooms are left out."""
+    _batch_responses(
+        client.session.request,
+        statuses={"1": (403, {"error": {"message": "Access denied"}})},
+    )
 
     room_emails = ["room1@example.com", "room2@example.com"]
     subscriptions = client.subscribe_to_multiple_room_events(
         room_emails=room_emails, notification_url="https://app.com/webhook"
     )
 
-    assert len(subscriptions) == 2
-    for subscription in subscriptions:
-        assert subscription["id"] == "subscription123"
+    assert subscriptions == [{"id": "result-0"}]
+    client.session.request.assert_called_once()
+    call_kwargs = client.session.request.call_args.kwargs
+    assert call_kwargs["url"].endswith("/$batch")
+    items = call_kwargs["json"]["requests"]
+    assert [item["body"]["resource"] for item in items] == [
+        "/users/room1@example.com/events",
+        "/users/room2@example.com/events",
+    ]
+
+
+def test_batch_request_splits_into_batches_of_20_and_keeps_chains_together(client):
+    """Requests are packed 20 per batch, never splitting a dependsOn chain."""
+    _batch_responses(client.session.request)
+    batch_requests = [
+        MSGraphBatchRequest(id=str(i), method="DELETE", url=f"/me/events/{i}") for i in range(19)
+    ]
+    batch_requests += [
+        MSGraphBatchRequest(id="a", method="PATCH", url="/me/events/x", body={"subject": "A"}),
+        MSGraphBatchRequest(id="b", method="DELETE", url="/me/events/x", depends_on=["a"]),
+    ]
+
+    results = client.batch_request(batch_requests)
+
+    sent = [call.kwargs["json"]["requests"] for call in client.session.request.call_args_list]
+    assert [len(items) for items in sent] == [19, 2]
+    assert sent[1][1]["dependsOn"] == ["a"]
+    assert sent[1][0]["headers"] == {"Content-Type": "application/json"}
+    assert results["b"] == {"id": "result-b"}
+
+
+def test_batch_request_maps_item_errors(client):
+    """A failed item maps to MSGraphAPIError, a throttled one to ProviderQuotaExceededError."""
+    _batch_responses(
+        client.session.request,
+        statuses={
+            "missing": (404, {"error": {"message": "Not found"}}),
+            "throttled": (429, {}),
+        },
+    )
+
+    results = client.batch_request(
+        [
+            MSGraphBatchRequest(id="ok", method="GET", url="/me/events/1"),
+            MSGraphBatchRequest(id="missing", method="GET", url="/me/events/2"),
+            MSGraphBatchRequest(id="throttled", method="GET", url="/me/events/3"),
+        ]
+    )
+
+    assert results["ok"] == {"id": "result-ok"}
+    assert isinstance(results["missing"], MSGraphAPIError)
+    assert results["missing"].status_code == 404
+    assert "Not found" in str(results["missing"])
+    assert isinstance(results["throttled"], ProviderQuotaExceededError)
+    assert results["throttled"].retry_after == 7
+
+
+def test_batch_request_rejects_unknown_dependency(client):
+    with pytest.raises(ValueError, match="unknown request"):
+        client.batch_request(
+            [MSGraphBatchRequest(id="1", method="GET", url="/me", depends_on=["nope"])]
+        )
 
 
 @patch(
@@ -1070,11 +1256,11 @@ def test_make_request_max_retries_exceeded_server_error(client):
     with patch(
         "calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client.quote_limiter"
     ):
-        with pytest.raises(MSGraphAPIError) as exc_info:
+        with pytest.raises(ProviderUnavailableError) as exc_info:
             client._make_request("GET", "/test/endpoint")
 
-    assert "MS Graph API error: 500" in str(exc_info.value)
-    assert client.session.request.call_count == 6  # Initial + 5 retries
+    assert "status 500" in str(exc_info.value)
+    assert client.session.request.call_count == 4  # Initial + 3 retries waited in place
 
 
 def test_make_request_retries_request_exceptions(client):
@@ -1108,11 +1294,11 @@ def test_make_request_max_retries_exceeded_request_exception(client):
     with patch(
         "calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client.quote_limiter"
     ):
-        with pytest.raises(MSGraphAPIError) as exc_info:
+        with pytest.raises(ProviderUnavailableError) as exc_info:
             client._make_request("GET", "/test/endpoint")
 
-    assert "Request failed after 6 attempts" in str(exc_info.value)
-    assert client.session.request.call_count == 6
+    assert "Persistent connection error" in str(exc_info.value)
+    assert client.session.request.call_count == 4
 
 
 def test_make_request_no_retries_for_client_errors(client):
@@ -1345,8 +1531,8 @@ def test_get_room_events_delta_initial_request(client, sample_event_data):
     """Test get_room_events_delta initial request (no tokens)."""
     response_data = {
         "value": [sample_event_data],
-        "@odata.nextLink": "https://graph.microsoft.com/v1.0/places/room@example.com/calendarView/delta?$skiptoken=abc123",
-        "@odata.deltaLink": "https://graph.microsoft.com/v1.0/places/room@example.com/calendarView/delta?$deltatoken=def456",
+        "@odata.nextLink": "https://graph.microsoft.com/v1.0/users/room@example.com/calendarView/delta?$skiptoken=abc123",
+        "@odata.deltaLink": "https://graph.microsoft.com/v1.0/users/room@example.com/calendarView/delta?$deltatoken=def456",
     }
     mock_response = Mock()
     mock_response.status_code = 200
@@ -1377,7 +1563,7 @@ def test_get_room_events_delta_initial_request(client, sample_event_data):
     else:
         url = call_args[1].get("url", "")
 
-    assert "/places/room@example.com/calendarView/delta" in url
+    assert "/users/room@example.com/calendarView/delta" in url
 
     # Check parameters
     params = call_args[1].get("params", {})
@@ -1389,7 +1575,7 @@ def test_get_room_events_delta_with_delta_token(client):
     """Test get_room_events_delta with delta token."""
     response_data = {
         "value": [],
-        "@odata.deltaLink": "https://graph.microsoft.com/v1.0/places/room@example.com/calendarView/delta?$deltatoken=new_token",
+        "@odata.deltaLink": "https://graph.microsoft.com/v1.0/users/room@example.com/calendarView/delta?$deltatoken=new_token",
     }
     mock_response = Mock()
     mock_response.status_code = 200
@@ -1423,7 +1609,7 @@ def test_get_room_events_delta_with_skip_token(client):
     """Test get_room_events_delta with skip token."""
     response_data = {
         "value": [],
-        "@odata.deltaLink": "https://graph.microsoft.com/v1.0/places/room@example.com/calendarView/delta?$deltatoken=final_token",
+        "@odata.deltaLink": "https://graph.microsoft.com/v1.0/users/room@example.com/calendarView/delta?$deltatoken=final_token",
     }
     mock_response = Mock()
     mock_response.status_code = 200
@@ -1454,7 +1640,7 @@ def test_get_room_events_delta_with_max_page_size(client):
     """Test get_room_events_delta with max page size."""
     response_data = {
         "value": [],
-        "@odata.deltaLink": "https://graph.microsoft.com/v1.0/places/room@example.com/calendarView/delta?$deltatoken=token",
+        "@odata.deltaLink": "https://graph.microsoft.com/v1.0/users/room@example.com/calendarView/delta?$deltatoken=token",
     }
     mock_response = Mock()
     mock_response.status_code = 200
@@ -1697,7 +1883,10 @@ def test_list_rooms_in_room_list_missing_optional_fields(client):
 
 
 def test_error_propagation_in_new_methods(client):
-    """Test that API errors are properly propagated in new methods."""
+    """Test that API errors are properly propagated in new methods.
+
+    A persistent 5xx surfaces as the retryable ``ProviderUnavailableError``.
+    """
     fail_response = Mock()
     fail_response.status_code = 500
     fail_response.ok = False
@@ -1712,17 +1901,17 @@ def test_error_propagation_in_new_methods(client):
         "calendar_integration.services.calendar_clients.ms_outlook_calendar_api_client.quote_limiter"
     ):
         # Test get_room_events_delta error handling
-        with pytest.raises(MSGraphAPIError):
+        with pytest.raises(ProviderUnavailableError):
             client.get_room_events_delta("room@example.com", start_time, end_time)
 
         # Test list_calendar_view error handling
-        with pytest.raises(MSGraphAPIError):
+        with pytest.raises(ProviderUnavailableError):
             list(client.list_calendar_view(start_time, end_time))
 
         # Test list_room_lists error handling
-        with pytest.raises(MSGraphAPIError):
+        with pytest.raises(ProviderUnavailableError):
             client.list_room_lists()
 
         # Test list_rooms_in_room_list error handling
-        with pytest.raises(MSGraphAPIError):
+        with pytest.raises(ProviderUnavailableError):
             client.list_rooms_in_room_list("building@example.com")
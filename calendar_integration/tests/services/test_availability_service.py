@@ -2,16 +2,16 @@
 
 Tests construct AvailabilityService directly (bypassing CalendarService facade)
 using a real CalendarServiceContext plus a lightweight fake host for the three
-host-routed concerns (get_calendar_events_expanded, bulk_create_manual_blocked_times,
+host-routed concerns (iter_calendar_events_expanded, bulk_create_manual_blocked_times,
 _create_recurrence_rule_if_needed). All DB-touching tests are marked django_db.
 """
 
 from __future__ import annotations
 
 import datetime
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from allauth.socialaccount.models import SocialAccount
@@ -58,13 +58,15 @@ class FakeHost:
         self._events: list[CalendarEvent] = events or []
         self._organization = organization
 
-    def get_calendar_events_expanded(
+    def iter_calendar_events_expanded(
         self,
         calendar: Calendar,
         start_date: datetime.datetime,
         end_date: datetime.datetime,
-    ) -> list[CalendarEvent]:
-        return self._events
+        *,
+        materialize: bool = True,
+    ) -> Iterator[tuple[None, CalendarEvent]]:
+        return ((None, event) for event in self._events)
 
     def bulk_create_manual_blocked_times(
         self,
@@ -1390,6 +1392,47 @@ def test_get_unavailable_time_windows_in_range_with_blocked_time(
     assert windows[0].end_time == end
 
 
+@pytest.mark.django_db
+def test_get_unavailable_time_windows_in_range_reads_recurring_blocks_as_views(
+    context: CalendarServiceContext,
+    recurrence_manager: RecurrenceManager,
+    calendar: Calendar,
+    organization: Organization,
+) -> None:
+    """Generated blocked-time occurrences become windows without building model instances."""
+    service = make_service(context, recurrence_manager, events=[], organization=organization)
+
+    start = datetime.datetime(2025, 10, 1, 9, 0, tzinfo=datetime.UTC)
+    rule = RecurrenceRule.objects.create(
+        organization=organization, frequency="DAILY", interval=1, count=3
+    )
+    BlockedTime.objects.create(
+        calendar=calendar,
+        start_time_tz_unaware=start,
+        end_time_tz_unaware=start + datetime.timedelta(hours=1),
+        timezone="UTC",
+        reason="Daily focus",
+        external_id="unavail_bt_recurring",
+        organization=organization,
+        recurrence_rule=rule,
+    )
+
+    with patch.object(BlockedTime, "create_instance_from_occurrence") as create_instance:
+        windows = service.get_unavailable_time_windows_in_range(
+            calendar=calendar,
+            start_datetime=start - datetime.timedelta(hours=1),
+            end_datetime=start + datetime.timedelta(days=3),
+        )
+
+    create_instance.assert_not_called()
+    assert [w.start_time for w in windows] == [
+        start + datetime.timedelta(days=day) for day in range(3)
+    ]
+    assert all(w.reason == "blocked_time" and w.id is None for w in windows)
+    assert {w.data.reason for w in windows} == {"Daily focus"}
+    assert {w.data.calendar_external_id for w in windows} == {calendar.external_id}
+
+
 @pytest.mark.django_db
 def test_get_unavailable_time_windows_in_range_with_bundle_events(
     context: CalendarServiceContext,
@@ -15,12 +15,14 @@ against the facade; these assert the extracted service behaves identically in
 isolation and that the facade forwards to it.
 """
 
+import contextlib
 import datetime
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from calendar_integration.constants import CalendarProvider, CalendarType
+from calendar_integration.exceptions import BundleEventWriteError
 from calendar_integration.models import (
     BlockedTime,
     Calendar,
@@ -581,6 +583,142 @@ def test_create_bundle_event_creates_blocked_time_for_provider_children(
     assert bt.calendar == other_google
 
 
+@pytest.mark.django_db
+def test_create_bundle_event_takes_back_the_written_copies_when_a_provider_rejects_one(
+    organization,
+    initialized_facade,
+    bundle_service,
+    bundle_calendar,
+    bundle_event_data,
+    child_calendar_google,
+    child_calendar_internal,
+):
+    """The children's provider writes go out per account once every row is written;
+    when one account's batch fails, the copies are deleted again and the error carries
+    one result per child."""
+    error = ValueError("rejected")
+    primary_adapter = Mock()
+    primary_adapter.batch_writes.return_value = contextlib.nullcontext()
+    child_adapter = Mock()
+    sent = []
+
+    @contextlib.contextmanager
+    def failing_batch():
+        yield
+        if not sent:
+            sent.append(True)
+            raise error
+
+    child_adapter.batch_writes.side_effect = failing_batch
+    adapters = {
+        child_calendar_google.id: primary_adapter,
+        child_calendar_internal.id: child_adapter,
+    }
+
+    def fake_create_event(
+        calendar_id: int, event_data: CalendarEventInputData, **kwargs
+    ) -> CalendarEvent:
+        cal = Calendar.objects.filter_by_organization(organization).get(id=calendar_id)
+        initialized_facade._write_fan_out.enlist(calendar_id, adapters[calendar_id])
+        return CalendarEvent.objects.create(
+            title=event_data.title or "",
+            calendar=cal,
+            organization=organization,
+            start_time_tz_unaware=event_data.start_time,
+            end_time_tz_unaware=event_data.end_time,
+            timezone="UTC",
+            external_id=f"fake-comp-{calendar_id}",
+        )
+
+    availability_window = [
+        AvailableTimeWindow(
+            start_time=bundle_event_data.start_time, end_time=bundle_event_data.end_time
+        )
+    ]
+    with (
+        patch.object(
+            initialized_facade,
+            "get_availability_windows_in_range",
+            return_value=availability_window,
+        ),
+        patch.object(initialized_facade, "create_event", side_effect=fake_create_event),
+        pytest.raises(BundleEventWriteError) as exc_info,
+    ):
+        bundle_service.create_bundle_event(bundle_calendar, bundle_event_data)
+
+    assert exc_info.value.__cause__ is error
+    assert {result.calendar_id: result.ok for result in exc_info.value.results} == {
+        child_calendar_google.id: True,
+        child_calendar_internal.id: False,
+    }
+    primary_adapter.delete_event.assert_called_once_with(
+        child_calendar_google.external_id, f"fake-comp-{child_calendar_google.id}"
+    )
+    child_adapter.delete_event.assert_called_once_with(
+        child_calendar_internal.external_id, f"fake-comp-{child_calendar_internal.id}"
+    )
+
+
+@pytest.mark.django_db
+def test_create_bundle_event_discards_the_queued_copies_when_a_row_fails(
+    organization,
+    initialized_facade,
+    bundle_service,
+    bundle_calendar,
+    bundle_event_data,
+    child_calendar_google,
+):
+    """A local failure after the primary's copy was queued drops it unsent, rather
+    than sending it and deleting it again."""
+    sent = []
+    primary_adapter = Mock()
+
+    @contextlib.contextmanager
+    def batch_writes():
+        try:
+            yield
+        finally:
+            sent.append(primary_adapter.discard_writes.call_count == 0)
+
+    primary_adapter.batch_writes.side_effect = batch_writes
+    primary_adapter.discard_writes.return_value = 1
+
+    def fake_create_event(
+        calendar_id: int, event_data: CalendarEventInputData, **kwargs
+    ) -> CalendarEvent:
+        if calendar_id != child_calendar_google.id:
+            raise RuntimeError("row write failed")
+        initialized_facade._write_fan_out.enlist(calendar_id, primary_adapter)
+        return CalendarEvent.objects.create(
+            title=event_data.title or "",
+            calendar=child_calendar_google,
+            organization=organization,
+            start_time_tz_unaware=event_data.start_time,
+            end_time_tz_unaware=event_data.end_time,
+            timezone="UTC",
+            external_id="queued-primary",
+        )
+
+    availability_window = [
+        AvailableTimeWindow(
+            start_time=bundle_event_data.start_time, end_time=bundle_event_data.end_time
+        )
+    ]
+    with (
+        patch.object(
+            initialized_facade,
+            "get_availability_windows_in_range",
+            return_value=availability_window,
+        ),
+        patch.object(initialized_facade, "create_event", side_effect=fake_create_event),
+        pytest.raises(RuntimeError, match="row write failed"),
+    ):
+        bundle_service.create_bundle_event(bundle_calendar, bundle_event_data)
+
+    assert sent == [False]
+    primary_adapter.delete_event.assert_not_called()
+
+
 # ===========================================================================
 # update_bundle_event (fan-out)
 # ===========================================================================
@@ -402,6 +402,10 @@ def test_update_event_omitting_attendee_identifiers_issues_no_extra_query(
     the deferred closure's own dispatch queries never enter this count. That one
     query is separate from -- and not a regression of -- the attendee-omission
     invariant this test guards.
+
+    It is 30 rather than 29 since calendar change tracking: saving the event bumps
+    its calendar's ``change_version`` (one ``UPDATE``, see
+    ``calendar_integration.change_tracking``).
     See ``test_update_event_on_commit_dispatch_reuses_prefetched_identifiers`` for
     the query cost of the deferred ``on_commit`` dispatches this test does not
     exercise, and how THAT closure avoids paying once per dispatch.
@@ -442,7 +446,7 @@ def test_update_event_omitting_attendee_identifiers_issues_no_extra_query(
         ]
     )
 
-    with django_assert_num_queries(29):
+    with django_assert_num_queries(30):
         event_service.update_event(calendar.id, created.id, updated_input)
 
 
@@ -525,7 +529,10 @@ def test_update_event_on_commit_dispatch_reuses_prefetched_identifiers(
     # ``external_attendances`` explicitly, so it takes the same reconciliation path
     # it always did. The counts that Phase 7 changes are those of callers that OMIT
     # a field -- which now skip their reconciliation entirely.
-    with django_assert_num_queries(78):
+    #
+    # 79 since calendar change tracking: the event save bumps its calendar's
+    # ``change_version`` with one ``UPDATE``.
+    with django_assert_num_queries(79):
         with django_capture_on_commit_callbacks(execute=True):
             event_service.update_event(calendar.id, created.id, updated_input)
 
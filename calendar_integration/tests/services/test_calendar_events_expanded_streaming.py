@@ -0,0 +1,278 @@
+"""Tests for the streamed, keyset-paginated calendar-event expansion.
+
+Covers ``CalendarEventService.iter_calendar_events_expanded`` (and its multi-calendar
+sibling), ``paginate_expanded_events`` and ``ExpandedEventCursor``. Events are created
+directly in the DB and read through the ``CalendarService`` facade initialized with
+``initialize_without_provider``, like ``test_get_calendar_events_expanded_for_calendars``.
+"""
+
+from __future__ import annotations
+
+import datetime
+from unittest.mock import patch
+
+import pytest
+
+from calendar_integration.constants import CalendarProvider
+from calendar_integration.models import Calendar, CalendarEvent, RecurrenceRule
+from calendar_integration.services.calendar_service import CalendarService
+from calendar_integration.services.dataclasses import ExpandedEventCursor
+from calendar_integration.services.event_expansion import paginate_expanded_events
+from organizations.models import Organization
+
+
+START = datetime.datetime(2025, 7, 1, 0, 0, tzinfo=datetime.UTC)
+END = datetime.datetime(2025, 7, 31, 23, 59, tzinfo=datetime.UTC)
+
+
+@pytest.fixture
+def organization(db) -> Organization:
+    return Organization.objects.create(name="Streaming Expansion Org", should_sync_rooms=False)
+
+
+@pytest.fixture
+def calendar(organization: Organization) -> Calendar:
+    return Calendar.objects.create(
+        name="Streaming Calendar",
+        external_id="streaming_cal",
+        provider=CalendarProvider.INTERNAL,
+        organization=organization,
+    )
+
+
+@pytest.fixture
+def service(organization: Organization) -> CalendarService:
+    svc = CalendarService()
+    svc.initialize_without_provider(organization=organization)
+    return svc
+
+
+def _make_event(
+    title: str,
+    calendar: Calendar,
+    start: datetime.datetime,
+    *,
+    recurrence_rule: RecurrenceRule | None = None,
+) -> CalendarEvent:
+    return CalendarEvent.objects.create(
+        title=title,
+        start_time_tz_unaware=start,
+        end_time_tz_unaware=start + datetime.timedelta(hours=1),
+        timezone="UTC",
+        calendar=calendar,
+        organization=calendar.organization,
+        external_id=f"ext_{title.replace(' ', '_').lower()}",
+        recurrence_rule=recurrence_rule,
+    )
+
+
+def _make_daily_master(title: str, calendar: Calendar, start: datetime.datetime, count: int):
+    rule = RecurrenceRule.objects.create(
+        frequency="DAILY", interval=1, count=count, organization=calendar.organization
+    )
+    return _make_event(title, calendar, start, recurrence_rule=rule)
+
+
+@pytest.fixture
+def mixed_calendar(calendar: Calendar) -> Calendar:
+    """Five daily occurrences at 09:00 from July 10, plus one-offs interleaved at 09:00
+    (a start-time tie with an occurrence) and 12:00."""
+    _make_daily_master(
+        "Standup", calendar, datetime.datetime(2025, 7, 10, 9, tzinfo=datetime.UTC), 5
+    )
+    _make_event("Tie", calendar, datetime.datetime(2025, 7, 11, 9, tzinfo=datetime.UTC))
+    _make_event("Lunch", calendar, datetime.datetime(2025, 7, 12, 12, tzinfo=datetime.UTC))
+    _make_event("Early", calendar, datetime.datetime(2025, 7, 2, 8, tzinfo=datetime.UTC))
+    return calendar
+
+
+@pytest.mark.django_db
+def test_stream_is_ordered_by_cursor_and_matches_list(
+    service: CalendarService, mixed_calendar: Calendar
+) -> None:
+    stream = list(service.iter_calendar_events_expanded(mixed_calendar, START, END))
+
+    cursors = [cursor for cursor, _ in stream]
+    assert cursors == sorted(cursors)
+    assert len(set(cursors)) == len(cursors)
+    assert [event.start_time for _, event in stream] == sorted(
+        event.start_time for _, event in stream
+    )
+    assert len(stream) == 8
+
+    listed = service.get_calendar_events_expanded(mixed_calendar, START, END)
+    assert [(e.title, e.start_time) for e in listed] == [(e.title, e.start_time) for _, e in stream]
+
+
+@pytest.mark.django_db
+def test_occurrence_cursor_is_keyed_on_master(service: CalendarService, calendar: Calendar) -> None:
+    master = _make_daily_master(
+        "Standup", calendar, datetime.datetime(2025, 7, 10, 9, tzinfo=datetime.UTC), 2
+    )
+
+    stream = list(service.iter_calendar_events_expanded(calendar, START, END))
+
+    assert [cursor for cursor, _ in stream] == [
+        ExpandedEventCursor(
+            datetime.datetime(2025, 7, 10, 9, tzinfo=datetime.UTC),
+            master.id,
+            datetime.datetime(2025, 7, 10, 9, tzinfo=datetime.UTC),
+        ),
+        ExpandedEventCursor(
+            datetime.datetime(2025, 7, 11, 9, tzinfo=datetime.UTC),
+            master.id,
+            datetime.datetime(2025, 7, 11, 9, tzinfo=datetime.UTC),
+        ),
+    ]
+    assert all(event.pk is None for _, event in stream)
+
+
+@pytest.mark.django_db
+def test_pages_concatenate_to_the_full_range(
+    service: CalendarService, mixed_calendar: Calendar
+) -> None:
+    full = [
+        (e.title, e.start_time)
+        for e in service.get_calendar_events_expanded(mixed_calendar, START, END)
+    ]
+
+    collected: list[tuple[str, datetime.datetime]] = []
+    after: ExpandedEventCursor | None = None
+    pages = 0
+    while True:
+        page = paginate_expanded_events(
+            service.iter_calendar_events_expanded(mixed_calendar, START, END, after=after), 3
+        )
+        pages += 1
+        collected.extend((e.title, e.start_time) for e in page.events)
+        if not page.has_next_page:
+            break
+        after = page.end_cursor
+
+    assert collected == full
+    assert pages == 3
+
+
+@pytest.mark.django_db
+def test_modified_occurrence_is_placed_at_its_moved_start(
+    service: CalendarService, calendar: Calendar
+) -> None:
+    """A modified occurrence moved past a later one-off sorts by its new start, keeps its
+    master-keyed cursor, and the cancelled occurrence is dropped."""
+    first_start = datetime.datetime(2025, 7, 10, 9, tzinfo=datetime.UTC)
+    master = _make_daily_master("Standup", calendar, first_start, 3)
+    one_off = _make_event(
+        "One-off", calendar, datetime.datetime(2025, 7, 11, 10, tzinfo=datetime.UTC)
+    )
+
+    moved = CalendarEvent.objects.create(
+        title="Standup (moved)",
+        start_time_tz_unaware=datetime.datetime(2025, 7, 11, 15, tzinfo=datetime.UTC),
+        end_time_tz_unaware=datetime.datetime(2025, 7, 11, 16, tzinfo=datetime.UTC),
+        timezone="UTC",
+        calendar=calendar,
+        organization=calendar.organization,
+        external_id="ext_moved",
+        parent_recurring_object=master,
+        is_recurring_exception=True,
+        recurrence_id=first_start + datetime.timedelta(days=1),
+    )
+    master.create_exception(
+        exception_date=first_start + datetime.timedelta(days=1),
+        is_cancelled=False,
+        modified_object=moved,
+    )
+    master.create_exception(exception_date=first_start + datetime.timedelta(days=2))
+
+    stream = list(service.iter_calendar_events_expanded(calendar, START, END))
+
+    assert [event.title for _, event in stream][:3] == ["Standup", "One-off", "Standup (moved)"]
+    assert first_start + datetime.timedelta(days=2) not in {event.start_time for _, event in stream}
+    assert stream[1][1].id == one_off.id
+    moved_cursor = stream[2][0]
+    assert moved_cursor.master_id == master.id
+    assert moved_cursor.occurrence_start == first_start + datetime.timedelta(days=1)
+    assert moved_cursor.start_time == moved.start_time
+
+
+@pytest.mark.django_db
+def test_after_cursor_resumes_strictly_after_a_tie(
+    service: CalendarService, mixed_calendar: Calendar
+) -> None:
+    stream = list(service.iter_calendar_events_expanded(mixed_calendar, START, END))
+    tied_start = datetime.datetime(2025, 7, 11, 9, tzinfo=datetime.UTC)
+    tied = [index for index, (cursor, _) in enumerate(stream) if cursor.start_time == tied_start]
+    assert len(tied) == 2
+
+    resumed = list(
+        service.iter_calendar_events_expanded(mixed_calendar, START, END, after=stream[tied[0]][0])
+    )
+
+    assert [cursor for cursor, _ in resumed] == [cursor for cursor, _ in stream[tied[0] + 1 :]]
+
+
+@pytest.mark.django_db
+def test_page_builds_only_the_occurrences_it_reaches(
+    service: CalendarService, calendar: Calendar
+) -> None:
+    _make_daily_master(
+        "Standup", calendar, datetime.datetime(2025, 7, 1, 9, tzinfo=datetime.UTC), 30
+    )
+
+    with patch.object(
+        CalendarEvent,
+        "create_instance_from_occurrence",
+        autospec=True,
+        side_effect=CalendarEvent.create_instance_from_occurrence,
+    ) as create_instance:
+        page = paginate_expanded_events(
+            service.iter_calendar_events_expanded(calendar, START, END), 5
+        )
+
+    assert len(page.events) == 5
+    assert page.has_next_page is True
+    # The page plus the one look-ahead event; the other 24 occurrences are never built.
+    assert create_instance.call_count == 6
+
+
+@pytest.mark.django_db
+def test_for_calendars_stream_dedupes_and_paginates(
+    service: CalendarService, calendar: Calendar, organization: Organization
+) -> None:
+    other = Calendar.objects.create(
+        name="Other",
+        external_id="streaming_other",
+        provider=CalendarProvider.INTERNAL,
+        organization=organization,
+    )
+    _make_daily_master(
+        "Standup", calendar, datetime.datetime(2025, 7, 10, 9, tzinfo=datetime.UTC), 2
+    )
+    _make_event("Other one-off", other, datetime.datetime(2025, 7, 10, 9, tzinfo=datetime.UTC))
+
+    first_page = paginate_expanded_events(
+        service.iter_calendar_events_expanded_for_calendars([calendar.id, other.id], START, END),
+        2,
+    )
+    rest = list(
+        service.iter_calendar_events_expanded_for_calendars(
+            [calendar.id, other.id], START, END, after=first_page.end_cursor
+        )
+    )
+
+    assert first_page.has_next_page is True
+    assert len(first_page.events) + len(rest) == 3
+    assert list(service.iter_calendar_events_expanded_for_calendars([], START, END)) == []
+
+
+def test_cursor_round_trips_and_rejects_garbage() -> None:
+    cursor = ExpandedEventCursor(
+        datetime.datetime(2025, 7, 10, 9, 30, tzinfo=datetime.UTC),
+        42,
+        datetime.datetime(2025, 7, 10, 9, tzinfo=datetime.UTC),
+    )
+
+    assert ExpandedEventCursor.decode(cursor.encode()) == cursor
+    for garbage in ("", "not-a-cursor", "Zm9vfGJhcnxiYXo="):
+        with pytest.raises(ValueError):
+            ExpandedEventCursor.decode(garbage)
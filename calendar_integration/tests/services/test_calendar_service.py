@@ -1,3 +1,4 @@
+import contextlib
 import datetime
 import uuid
 import zoneinfo
@@ -74,6 +75,7 @@ from calendar_integration.services.dataclasses import (
     EventExternalAttendanceInputData,
     EventsSyncChanges,
     ExternalAttendeeInputData,
+    RefreshedOAuthToken,
     ResourceAllocationInputData,
     ResourceData,
     UnavailableTimeWindow,
@@ -192,11 +194,16 @@ def mock_google_adapter():
     ) as mock_adapter_class:
         mock_adapter = Mock()
         mock_adapter.provider = CalendarProvider.GOOGLE
+        mock_adapter.batch_writes.return_value = contextlib.nullcontext()
         # Prevent Django ORM issues by removing problematic attributes
         del mock_adapter.resolve_expression
         del mock_adapter.get_source_expressions
         mock_adapter_class.return_value = mock_adapter
         mock_adapter_class.from_service_account.return_value = mock_adapter
+        mock_adapter_class.refresh_access_token.return_value = RefreshedOAuthToken(
+            token="refreshed_access_token",
+            expires_at=datetime.datetime.now(datetime.UTC) + datetime.timedelta(hours=1),
+        )
         yield mock_adapter
 
 
@@ -529,12 +536,13 @@ def test_get_calendar_adapter_accepts_social_account_directly(
 def test_get_calendar_adapter_resolves_expired_token_for_refresh(
     social_account, mock_google_adapter
 ):
-    """An expired access token is still resolved so the adapter can refresh it.
+    """An expired access token is still resolved, and refreshed before the adapter
+    is built.
 
     Regression: the resolver filtered ``expires_at__gte=now``, hiding expired
     (but refreshable) tokens and raising a false 'reauthenticate' error.
     """
-    SocialToken.objects.create(
+    social_token = SocialToken.objects.create(
         account=social_account,
         token="expired_access_token",
         token_secret="refresh_token_value",
@@ -545,6 +553,8 @@ def test_get_calendar_adapter_resolves_expired_token_for_refresh(
 
     assert adapter == mock_google_adapter
     assert account == social_account
+    social_token.refresh_from_db()
+    assert social_token.token == "refreshed_access_token"
 
 
 @pytest.mark.django_db
@@ -757,6 +767,49 @@ def test_import_account_calendars(social_account, social_token, mock_google_adap
     assert work_ownership.is_default is False
 
 
+@pytest.mark.django_db
+def test_import_account_calendars_reports_created_updated_and_unchanged(
+    social_account, social_token, mock_google_adapter, organization
+):
+    """A re-import writes only what changed, and says so."""
+    calendars_data = [
+        CalendarResourceData(
+            external_id=f"cal_{index}",
+            name=f"Calendar {index}",
+            description="",
+            email=f"cal{index}@example.com",
+            is_default=index == 0,
+            provider="google",
+            original_payload={"id": f"cal_{index}"},
+        )
+        for index in range(3)
+    ]
+    mock_google_adapter.get_account_calendars.return_value = calendars_data
+    OrganizationMembership.objects.get_or_create(
+        user=social_account.user, organization=organization
+    )
+    service = CalendarService()
+    service.authenticate(account=social_account.user, organization=organization)
+
+    first = service.import_account_calendars(sync_after_import=False)
+    calendars_data[1].name = "Renamed"
+    second = service.import_account_calendars(sync_after_import=False)
+
+    assert (first.created, first.updated, first.unchanged) == (3, 0, 0)
+    assert (second.created, second.updated, second.unchanged) == (0, 1, 2)
+    assert (
+        Calendar.objects.filter_by_organization(organization).get(external_id="cal_1").name
+        == "Renamed"
+    )
+    ownerships = CalendarOwnership.objects.filter_by_organization(organization).filter(
+        membership_user_id=social_account.user.id
+    )
+    assert ownerships.count() == 3
+    assert list(
+        ownerships.filter(is_default=True).values_list("calendar_fk__external_id", flat=True)
+    ) == ["cal_0"]
+
+
 @pytest.mark.django_db
 def test_import_with_nonmember_owner_and_preexisting_orphans_does_not_raise(
     social_account, social_token, mock_google_adapter, organization
@@ -4453,21 +4506,16 @@ def test_handle_deletions_for_full_sync(
         organization=calendar.organization,
     )
 
-    calendar_events_by_external_id = {
-        "event_1": event1,
-        "event_2": event2,
-    }
-
-    # Only event_1 was matched during sync
-    matched_event_ids = {"event_1"}
+    # Only event_1 was seen during sync
+    seen_external_ids = {"event_1"}
 
     service = CalendarService()
     service.authenticate(account=social_account.user, organization=calendar.organization)
     service._handle_deletions_for_full_sync(
         calendar.id,
-        calendar_events_by_external_id,
-        matched_event_ids,
+        seen_external_ids,
         datetime.datetime(2025, 6, 22, 0, 0, tzinfo=datetime.UTC),
+        datetime.datetime(2025, 6, 22, 23, 59, tzinfo=datetime.UTC),
     )
 
     # Verify event_2 was deleted (not matched)
@@ -6116,9 +6164,9 @@ def test_handle_deletions_for_full_sync_no_organization(
     # Should return early without doing anything
     result = service._handle_deletions_for_full_sync(
         calendar.id,
-        {},
         set(),
         datetime.datetime(2025, 6, 22, 0, 0, tzinfo=datetime.UTC),
+        datetime.datetime(2025, 6, 22, 23, 59, tzinfo=datetime.UTC),
     )
 
     assert result is None
@@ -8515,6 +8563,52 @@ def test_get_write_adapter_prefers_default_owner(
         assert write_adapter == mock_owner_adapter
 
 
+@pytest.mark.django_db
+def test_get_write_adapter_reuses_the_owner_adapter_inside_a_write_fan_out(
+    unrelated_social_account,
+    calendar_owner_social_account,
+    calendar_owner_social_token,
+    calendar_owner_user,
+    owned_calendar,
+    mock_google_adapter,
+):
+    """Inside ``_fan_out_provider_writes`` an owner's calendars share one adapter, built
+    once and batched once, and every calendar written to gets a result."""
+    other_owned_calendar = Calendar.objects.create(
+        name="Other Owned Calendar",
+        external_id="other_owned_cal_123",
+        provider=CalendarProvider.GOOGLE,
+        organization=owned_calendar.organization,
+        calendar_type=CalendarType.PERSONAL,
+    )
+    create_calendar_ownership(
+        calendar=other_owned_calendar, user=calendar_owner_user, is_default=True
+    )
+
+    service = CalendarService()
+    service.account = unrelated_social_account
+    service.organization = owned_calendar.organization
+    service.calendar_adapter = mock_google_adapter
+
+    with patch.object(CalendarService, "get_calendar_adapter_for_account") as mock_get_adapter:
+        mock_owner_adapter = Mock()
+        mock_owner_adapter.batch_writes.return_value = contextlib.nullcontext()
+        mock_get_adapter.return_value = mock_owner_adapter, calendar_owner_social_account
+
+        with service._fan_out_provider_writes() as fan_out:
+            first = service._get_write_adapter_for_calendar(owned_calendar)
+            second = service._get_write_adapter_for_calendar(other_owned_calendar)
+
+    assert first is second is mock_owner_adapter
+    mock_get_adapter.assert_called_once_with(calendar_owner_user)
+    mock_owner_adapter.batch_writes.assert_called_once_with()
+    assert {result.calendar_id for result in fan_out.results if result.ok} == {
+        owned_calendar.id,
+        other_owned_calendar.id,
+    }
+    assert service._write_fan_out is None
+
+
 @pytest.mark.django_db
 def test_get_write_adapter_returns_self_adapter_when_no_valid_owner(
     unrelated_social_account,
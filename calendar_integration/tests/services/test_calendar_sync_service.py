@@ -10,33 +10,56 @@ lightweight fake host for the concerns routed back to the facade
 The two flows covered are:
 - a full sync diff/merge cycle (adapter returns events -> sync creates a new
   ``BlockedTime`` for an externally-created event, updates an already-stored
-  ``BlockedTime``, and deletes a row that vanished from the provider);
+  ``BlockedTime``, and deletes a row that vanished from the provider), including
+  how the adapter stream is paged, fingerprint skips of unchanged events, the
+  blocked-time upsert, the attendee diff and orphan-instance linking;
+- sync-token handling: resuming from the last token, persisting the one the
+  adapter publishes after iteration, and the full-sync fallback on ``410 Gone``;
 - the organization-resource import path (adapter returns resources -> the import
-  routes one ``request_calendar_sync`` per resource through the host).
+  upserts them in bulk and routes one ``request_calendar_sync`` per resource
+  through the host);
+- the Outlook rooms sync: delta rounds fetched concurrently per chunk, applied
+  through ``sync_events`` and their tokens stored, failures settled per room.
 """
 
 from __future__ import annotations
 
+import contextlib
+import dataclasses
 import datetime
+import threading
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from allauth.socialaccount.models import SocialAccount
 
-from calendar_integration.constants import CalendarProvider, CalendarSyncStatus, CalendarType
+from calendar_integration.constants import (
+    CalendarProvider,
+    CalendarSyncStatus,
+    CalendarSyncTriggerSource,
+    CalendarType,
+)
+from calendar_integration.exceptions import ProviderQuotaExceededError, SyncTokenExpiredError
 from calendar_integration.models import (
     BlockedTime,
     Calendar,
+    CalendarEvent,
+    CalendarOrganizationResourcesImport,
     CalendarSync,
+    EventAttendance,
+    EventExternalAttendance,
+    ExternalAttendee,
 )
 from calendar_integration.services.calendar_service_context import CalendarServiceContext
 from calendar_integration.services.calendar_sync_service import CalendarSyncService
 from calendar_integration.services.dataclasses import (
     CalendarEventAdapterOutputData,
     CalendarResourceData,
+    EventAttendeeData,
+    EventsSyncChanges,
 )
-from organizations.models import Organization
+from organizations.models import ExternalEventUpdatePolicy, Organization, OrganizationMembership
 from users.models import Profile, User
 
 
@@ -268,6 +291,7 @@ def test_execute_calendar_sync_full_cycle_creates_updates_and_deletes(
     # existing block updated in place (no duplicate, reason refreshed)
     existing_block.refresh_from_db()
     assert existing_block.reason == "Updated reason"
+    assert existing_block.start_time == datetime.datetime(2025, 8, 1, 9, 30, tzinfo=datetime.UTC)
     assert (
         BlockedTime.objects.filter_by_organization(organization.id)
         .filter(
@@ -289,6 +313,408 @@ def test_execute_calendar_sync_full_cycle_creates_updates_and_deletes(
     )
 
 
+@pytest.mark.django_db
+def test_execute_calendar_sync_pages_the_adapter_stream(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    fake_adapter: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The adapter iterator is consumed a page at a time: each page is written before
+    the next is pulled, existing rows are looked up by that page's ids only, and the
+    full-sync deletion pass still removes the window's vanished events."""
+    monkeypatch.setattr("calendar_integration.services.calendar_sync_service.SYNC_PAGE_SIZE", 2)
+    window_start = datetime.datetime(2025, 8, 1, 0, 0, tzinfo=datetime.UTC)
+    window_end = datetime.datetime(2025, 8, 1, 23, 59, tzinfo=datetime.UTC)
+    vanished = CalendarEvent.objects.create(
+        calendar=calendar,
+        title="Vanished",
+        start_time_tz_unaware=datetime.datetime(2025, 8, 1, 20, 0),
+        end_time_tz_unaware=datetime.datetime(2025, 8, 1, 21, 0),
+        timezone="UTC",
+        external_id="ext_vanished_event",
+        organization_id=organization.id,
+    )
+
+    blocks = BlockedTime.objects.filter_by_organization(organization.id).filter(calendar=calendar)
+    blocks_written_before_pull: list[int] = []
+
+    def events():
+        for hour in range(9, 14):
+            blocks_written_before_pull.append(blocks.count())
+            yield _adapter_event(
+                f"ext_{hour}",
+                f"Event {hour}",
+                datetime.datetime(2025, 8, 1, hour, 0, tzinfo=datetime.UTC),
+                datetime.datetime(2025, 8, 1, hour, 30, tzinfo=datetime.UTC),
+            )
+
+    fake_adapter.get_events.return_value = {"events": events(), "next_sync_token": None}
+    calendar_sync = CalendarSync.objects.create(
+        calendar=calendar,
+        organization=organization,
+        start_datetime=window_start,
+        end_datetime=window_end,
+        should_update_events=True,
+        status=CalendarSyncStatus.IN_PROGRESS,
+    )
+    service = make_service(context, FakeHost())
+    lookups: list[tuple[set[str], bool]] = []
+    get_existing = service._get_existing_calendar_data
+
+    def spy(calendar_id, start_date, end_date, incoming_external_ids=None, include_window=True):
+        lookups.append((set(incoming_external_ids or ()), include_window))
+        return get_existing(
+            calendar_id, start_date, end_date, incoming_external_ids, include_window
+        )
+
+    monkeypatch.setattr(service, "_get_existing_calendar_data", spy)
+
+    service._execute_calendar_sync(calendar_sync, sync_token=None)
+
+    assert blocks_written_before_pull == [0, 0, 2, 2, 4]
+    assert lookups == [
+        ({"ext_9", "ext_10"}, False),
+        ({"ext_11", "ext_12"}, False),
+        ({"ext_13"}, False),
+    ]
+    assert blocks.count() == 5
+    assert not CalendarEvent.original_manager.filter(pk=vanished.pk).exists()
+
+
+@pytest.mark.django_db
+def test_execute_calendar_sync_skips_events_whose_fingerprint_is_unchanged(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    fake_adapter: MagicMock,
+    django_assert_max_num_queries: Any,
+) -> None:
+    """A resync of an unchanged window loads and writes nothing: every event matches
+    its row's stored fingerprint. Only the event that changed is rewritten, and the
+    counts land on the ``CalendarSync`` row."""
+    window_start = datetime.datetime(2025, 8, 1, 0, 0, tzinfo=datetime.UTC)
+    window_end = datetime.datetime(2025, 8, 1, 23, 59, tzinfo=datetime.UTC)
+
+    def adapter_events(last_title: str) -> list[CalendarEventAdapterOutputData]:
+        return [
+            _adapter_event(
+                f"ext_{hour}",
+                last_title if hour == 11 else f"Event {hour}",
+                datetime.datetime(2025, 8, 1, hour, 0, tzinfo=datetime.UTC),
+                datetime.datetime(2025, 8, 1, hour, 30, tzinfo=datetime.UTC),
+            )
+            for hour in (9, 10, 11)
+        ]
+
+    def run_sync(events: list[CalendarEventAdapterOutputData]) -> CalendarSync:
+        fake_adapter.get_events.return_value = {"events": events, "next_sync_token": None}
+        calendar_sync = CalendarSync.objects.create(
+            calendar=calendar,
+            organization=organization,
+            start_datetime=window_start,
+            end_datetime=window_end,
+            should_update_events=True,
+            status=CalendarSyncStatus.IN_PROGRESS,
+        )
+        make_service(context, FakeHost())._execute_calendar_sync(calendar_sync, sync_token=None)
+        calendar_sync.refresh_from_db()
+        return calendar_sync
+
+    first = run_sync(adapter_events("Event 11"))
+    assert (first.events_created, first.events_updated, first.events_skipped) == (3, 0, 0)
+
+    # The sync row's insert, save and refresh; the two fingerprint lookups; the
+    # full-sync deletion pass. No row is loaded and nothing is written.
+    with django_assert_max_num_queries(6):
+        unchanged = run_sync(adapter_events("Event 11"))
+    assert (unchanged.events_created, unchanged.events_updated) == (0, 0)
+    assert unchanged.events_skipped == 3
+
+    changed = run_sync(adapter_events("Renamed"))
+    assert (changed.events_created, changed.events_updated, changed.events_skipped) == (0, 1, 2)
+    assert (
+        BlockedTime.objects.filter_by_organization(organization.id)
+        .get(calendar=calendar, external_id="ext_11")
+        .reason
+        == "Renamed"
+    )
+
+
+@pytest.mark.django_db
+def test_execute_calendar_sync_reconciles_a_row_edited_locally_since(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    fake_adapter: MagicMock,
+) -> None:
+    """A local save forgets the row's fingerprint, so resyncing the very payload it
+    was synced from still rewrites it instead of skipping the local edit."""
+    event = _adapter_event(
+        "ext_local",
+        "From provider",
+        datetime.datetime(2025, 8, 1, 9, 0, tzinfo=datetime.UTC),
+        datetime.datetime(2025, 8, 1, 9, 30, tzinfo=datetime.UTC),
+    )
+    fake_adapter.get_events.return_value = {"events": [event], "next_sync_token": None}
+
+    def run_sync() -> CalendarSync:
+        calendar_sync = CalendarSync.objects.create(
+            calendar=calendar,
+            organization=organization,
+            start_datetime=datetime.datetime(2025, 8, 1, 0, 0, tzinfo=datetime.UTC),
+            end_datetime=datetime.datetime(2025, 8, 1, 23, 59, tzinfo=datetime.UTC),
+            should_update_events=True,
+            status=CalendarSyncStatus.IN_PROGRESS,
+        )
+        make_service(context, FakeHost())._execute_calendar_sync(calendar_sync, sync_token=None)
+        calendar_sync.refresh_from_db()
+        return calendar_sync
+
+    run_sync()
+    blocked_time = BlockedTime.objects.filter_by_organization(organization.id).get(
+        calendar=calendar, external_id="ext_local"
+    )
+    assert blocked_time.sync_fingerprint
+    blocked_time.reason = "Edited locally"
+    blocked_time.save(update_fields=["reason"])
+    blocked_time.refresh_from_db()
+    assert blocked_time.sync_fingerprint == ""
+
+    resynced = run_sync()
+
+    assert (resynced.events_updated, resynced.events_skipped) == (1, 0)
+    blocked_time.refresh_from_db()
+    assert blocked_time.reason == "From provider"
+    assert blocked_time.sync_fingerprint
+
+
+@pytest.mark.django_db
+def test_apply_sync_changes_upserts_blocked_times_on_calendar_and_external_id(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+) -> None:
+    """A blocked time queued for creation whose ``(calendar, external_id)`` already
+    exists (e.g. written by a racing sync) updates the stored row in place instead of
+    failing the sync on the unique constraint."""
+    stored = BlockedTime.objects.create(
+        calendar=calendar,
+        start_time_tz_unaware=datetime.datetime(2025, 8, 1, 9, 0),
+        end_time_tz_unaware=datetime.datetime(2025, 8, 1, 10, 0),
+        timezone="UTC",
+        reason="Stored",
+        external_id="ext_raced",
+        organization_id=organization.id,
+    )
+    changes = EventsSyncChanges()
+    for reason, hour in (("Stale duplicate", 10), ("Raced", 11)):
+        changes.blocked_times_to_create.append(
+            BlockedTime(
+                calendar_fk=calendar,
+                start_time_tz_unaware=datetime.datetime(2025, 8, 1, hour, 0),
+                end_time_tz_unaware=datetime.datetime(2025, 8, 1, hour + 1, 0),
+                timezone="UTC",
+                reason=reason,
+                external_id="ext_raced",
+                organization_id=organization.id,
+            )
+        )
+
+    make_service(context, FakeHost())._apply_sync_changes(calendar.id, changes)
+
+    stored.refresh_from_db()
+    assert stored.reason == "Raced"
+    assert stored.start_time == datetime.datetime(2025, 8, 1, 11, 0, tzinfo=datetime.UTC)
+    assert BlockedTime.original_manager.filter(external_id="ext_raced").count() == 1
+
+
+@pytest.mark.django_db
+def test_process_event_attendees_diffs_in_a_fixed_number_of_queries(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    user: User,
+    django_assert_num_queries: Any,
+) -> None:
+    """The attendee diff does not issue queries per attendee, and a changed status on
+    an existing attendance is queued for update and persisted."""
+    OrganizationMembership.objects.create(user=user, organization=organization)
+    event = CalendarEvent.objects.create(
+        calendar=calendar,
+        title="Meeting",
+        start_time_tz_unaware=datetime.datetime(2025, 8, 1, 9, 0),
+        end_time_tz_unaware=datetime.datetime(2025, 8, 1, 10, 0),
+        timezone="UTC",
+        external_id="ext_meeting",
+        organization_id=organization.id,
+    )
+    EventAttendance.objects.create(
+        organization_id=organization.id,
+        event=event,
+        membership_user_id=user.id,
+        status="pending",
+    )
+    adapter_event = _adapter_event(
+        "ext_meeting",
+        "Meeting",
+        datetime.datetime(2025, 8, 1, 9, 0, tzinfo=datetime.UTC),
+        datetime.datetime(2025, 8, 1, 10, 0, tzinfo=datetime.UTC),
+    )
+    adapter_event.attendees = [
+        EventAttendeeData(email=user.email, name="Member", status="accepted"),
+        *(
+            EventAttendeeData(email=f"guest{i}@example.com", name=f"Guest {i}", status="pending")
+            for i in range(10)
+        ),
+    ]
+    service = make_service(context, FakeHost())
+    changes = EventsSyncChanges()
+
+    # memberships, member attendances, external attendances, external attendees,
+    # and the one bulk insert of the missing external attendees.
+    with django_assert_num_queries(5):
+        service._process_event_attendees(adapter_event, event, changes)
+
+    assert [a.membership_user_id for a in changes.attendances_to_update] == [user.id]
+    assert not changes.attendances_to_create
+    assert len(changes.external_attendances_to_create) == 10
+
+    service._apply_sync_changes(calendar.id, changes)
+
+    assert EventAttendance.original_manager.get(event=event).status == "accepted"
+    assert EventExternalAttendance.original_manager.filter(event=event).count() == 10
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("event_count", [1, 6])
+def test_page_attendee_diff_query_count_does_not_grow_with_the_page(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    user: User,
+    django_assert_num_queries: Any,
+    event_count: int,
+) -> None:
+    """A page of updated events resolves its attendees with the same queries whether
+    it holds one event or several; each event still gets its own attendances."""
+    organization.external_event_update_policy = ExternalEventUpdatePolicy.ALLOW
+    organization.save(update_fields=["external_event_update_policy"])
+    OrganizationMembership.objects.create(user=user, organization=organization)
+    events_by_external_id = {}
+    adapter_events = []
+    for i in range(event_count):
+        start = datetime.datetime(2025, 8, 1, 9 + i, 0, tzinfo=datetime.UTC)
+        event = CalendarEvent.objects.create(
+            calendar=calendar,
+            title=f"Meeting {i}",
+            start_time_tz_unaware=start.replace(tzinfo=None),
+            end_time_tz_unaware=(start + datetime.timedelta(minutes=30)).replace(tzinfo=None),
+            timezone="UTC",
+            external_id=f"ext_meeting_{i}",
+            organization_id=organization.id,
+        )
+        EventAttendance.objects.create(
+            organization_id=organization.id,
+            event=event,
+            membership_user_id=user.id,
+            status="pending",
+        )
+        events_by_external_id[event.external_id] = event
+        adapter_event = _adapter_event(
+            event.external_id,
+            f"Meeting {i} (moved)",
+            start,
+            start + datetime.timedelta(hours=1),
+        )
+        adapter_event.attendees = [
+            EventAttendeeData(email=user.email, name="Member", status="accepted"),
+            EventAttendeeData(email="guest@example.com", name="Guest", status="pending"),
+            EventAttendeeData(email=f"guest{i}@example.com", name=f"Guest {i}", status="pending"),
+        ]
+        adapter_events.append(adapter_event)
+    service = make_service(context, FakeHost())
+
+    # memberships, member attendances, external attendances, external attendees,
+    # and the one bulk insert of the missing external attendees.
+    with django_assert_num_queries(5):
+        changes = service._process_events_for_sync(
+            adapter_events, events_by_external_id, {}, calendar, update_events=True
+        )
+
+    assert len(changes.attendances_to_update) == event_count
+    assert len(changes.external_attendances_to_create) == 2 * event_count
+
+    service._apply_sync_changes(calendar.id, changes)
+
+    assert set(
+        EventAttendance.original_manager.filter(
+            event__in=events_by_external_id.values()
+        ).values_list("status", flat=True)
+    ) == {"accepted"}
+    assert (
+        ExternalAttendee.original_manager.filter(organization=organization).count()
+        == event_count + 1
+    )
+    for event in events_by_external_id.values():
+        assert EventExternalAttendance.original_manager.filter(event=event).count() == 2
+
+
+@pytest.mark.django_db
+def test_link_orphaned_recurring_instances_runs_in_a_fixed_number_of_queries(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    django_assert_num_queries: Any,
+) -> None:
+    """Orphans left by out-of-order webhooks are linked with one parent lookup and one
+    ``bulk_update`` per model, however many there are; orphans whose parent is still
+    missing keep their pending marker."""
+    parent = CalendarEvent.objects.create(
+        calendar=calendar,
+        title="Series",
+        start_time_tz_unaware=datetime.datetime(2025, 8, 1, 9, 0),
+        end_time_tz_unaware=datetime.datetime(2025, 8, 1, 10, 0),
+        timezone="UTC",
+        external_id="ext_series",
+        organization_id=organization.id,
+    )
+    orphaned_event = CalendarEvent.objects.create(
+        calendar=calendar,
+        title="Moved occurrence",
+        start_time_tz_unaware=datetime.datetime(2025, 8, 2, 11, 0),
+        end_time_tz_unaware=datetime.datetime(2025, 8, 2, 12, 0),
+        timezone="UTC",
+        external_id="ext_series_20250802",
+        meta={"pending_parent_external_id": "ext_series"},
+        organization_id=organization.id,
+    )
+    for day, parent_external_id in ((3, "ext_series"), (4, "ext_series"), (5, "ext_missing")):
+        BlockedTime.objects.create(
+            calendar=calendar,
+            start_time_tz_unaware=datetime.datetime(2025, 8, day, 9, 0),
+            end_time_tz_unaware=datetime.datetime(2025, 8, day, 10, 0),
+            timezone="UTC",
+            external_id=f"ext_instance_{day}",
+            meta={"pending_parent_external_id": parent_external_id},
+            organization_id=organization.id,
+        )
+
+    # two orphan loads, the parent lookup, two bulk updates and the change-version bump
+    with django_assert_num_queries(6):
+        make_service(context, FakeHost())._link_orphaned_recurring_instances(calendar.id)
+
+    orphaned_event.refresh_from_db()
+    assert orphaned_event.parent_recurring_object_fk_id == parent.id
+    assert orphaned_event.recurrence_id == orphaned_event.start_time
+    assert "pending_parent_external_id" not in orphaned_event.meta
+    pending = BlockedTime.objects.filter_by_organization(organization.id).filter(
+        meta__pending_parent_external_id__isnull=False
+    )
+    assert list(pending.values_list("external_id", flat=True)) == ["ext_instance_5"]
+
+
 @pytest.mark.django_db
 def test_sync_events_marks_success(
     context: CalendarServiceContext,
@@ -315,6 +741,270 @@ def test_sync_events_marks_success(
     assert calendar_sync.status == CalendarSyncStatus.SUCCESS
 
 
+def _events_then_token(result: dict[str, Any], events: list, token: str | None):
+    """Adapter-style stream: publishes ``token`` on ``result`` once exhausted."""
+    yield from events
+    result["next_sync_token"] = token
+
+
+def _create_sync(calendar: Calendar, organization: Organization, **kwargs: Any) -> CalendarSync:
+    kwargs = {
+        "start_datetime": datetime.datetime(2025, 8, 2, 0, 0, tzinfo=datetime.UTC),
+        "end_datetime": datetime.datetime(2025, 8, 2, 23, 59, tzinfo=datetime.UTC),
+        "should_update_events": True,
+        **kwargs,
+    }
+    return CalendarSync.objects.create(calendar=calendar, organization=organization, **kwargs)
+
+
+@pytest.mark.django_db
+def test_sync_events_resumes_from_the_last_token_and_persists_the_next(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    fake_adapter: MagicMock,
+) -> None:
+    """An incremental sync starts from the previous successful sync's token, and the
+    token the adapter publishes after iteration is the one stored."""
+    _create_sync(calendar, organization, status=CalendarSyncStatus.SUCCESS, next_sync_token="tok-1")
+    result: dict[str, Any] = {"next_sync_token": None}
+    result["events"] = _events_then_token(result, [], "tok-2")
+    fake_adapter.get_events.return_value = result
+    calendar_sync = _create_sync(calendar, organization)
+
+    make_service(context, FakeHost()).sync_events(calendar_sync)
+
+    assert fake_adapter.get_events.call_args.args[-1] == "tok-1"
+    calendar_sync.refresh_from_db()
+    assert calendar_sync.status == CalendarSyncStatus.SUCCESS
+    assert calendar_sync.next_sync_token == "tok-2"
+
+
+@pytest.mark.django_db
+def test_sync_events_falls_back_to_a_full_sync_when_the_token_expired(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    fake_adapter: MagicMock,
+) -> None:
+    """A ``410 Gone`` token rolls back what the incremental pass applied, reruns the
+    window in full, and stores the fresh token the full pass ends with."""
+    _create_sync(calendar, organization, status=CalendarSyncStatus.SUCCESS, next_sync_token="stale")
+
+    def expired_stream():
+        yield _adapter_event(
+            "ext_partial",
+            "Applied before the 410",
+            datetime.datetime(2025, 8, 2, 9, 0, tzinfo=datetime.UTC),
+            datetime.datetime(2025, 8, 2, 10, 0, tzinfo=datetime.UTC),
+        )
+        raise SyncTokenExpiredError()
+
+    full: dict[str, Any] = {"next_sync_token": None}
+    full["events"] = _events_then_token(
+        full,
+        [
+            _adapter_event(
+                "ext_full",
+                "Full",
+                datetime.datetime(2025, 8, 2, 11, 0, tzinfo=datetime.UTC),
+                datetime.datetime(2025, 8, 2, 12, 0, tzinfo=datetime.UTC),
+            )
+        ],
+        "fresh",
+    )
+    fake_adapter.get_events.side_effect = [
+        {"events": expired_stream(), "next_sync_token": None},
+        full,
+    ]
+    calendar_sync = _create_sync(calendar, organization)
+
+    make_service(context, FakeHost()).sync_events(calendar_sync)
+
+    assert [c.args[-1] for c in fake_adapter.get_events.call_args_list] == ["stale", None]
+    calendar_sync.refresh_from_db()
+    assert calendar_sync.status == CalendarSyncStatus.SUCCESS, calendar_sync.error_message
+    assert calendar_sync.next_sync_token == "fresh"
+    assert calendar_sync.events_created == 1
+    blocks = BlockedTime.objects.filter_by_organization(organization.id).filter(calendar=calendar)
+    assert list(blocks.values_list("external_id", flat=True)) == ["ext_full"]
+
+
+@pytest.mark.django_db
+def test_a_microsoft_token_is_resumed_only_for_a_window_its_round_spans(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    fake_adapter: MagicMock,
+) -> None:
+    """A calendarView delta round reports nothing outside the window it started over:
+    a sync reaching past it runs full, and stores its own window with the new token."""
+    calendar.provider = CalendarProvider.MICROSOFT
+    calendar.save(update_fields=["provider"])
+    _create_sync(
+        calendar,
+        organization,
+        status=CalendarSyncStatus.SUCCESS,
+        next_sync_token="narrow",
+        sync_token_window_start=datetime.datetime(2025, 8, 2, 0, 0, tzinfo=datetime.UTC),
+        sync_token_window_end=datetime.datetime(2025, 8, 2, 12, 0, tzinfo=datetime.UTC),
+    )
+    fake_adapter.get_events.return_value = {"events": [], "next_sync_token": "wide"}
+    calendar_sync = _create_sync(calendar, organization)
+
+    make_service(context, FakeHost()).sync_events(calendar_sync)
+
+    assert fake_adapter.get_events.call_args.args[-1] is None
+    calendar_sync.refresh_from_db()
+    assert calendar_sync.next_sync_token == "wide"
+    assert (calendar_sync.sync_token_window_start, calendar_sync.sync_token_window_end) == (
+        calendar_sync.start_datetime,
+        calendar_sync.end_datetime,
+    )
+
+    # The next sync of the same window resumes it, and keeps the round's window.
+    fake_adapter.get_events.return_value = {"events": [], "next_sync_token": "wide-2"}
+    resumed = _create_sync(calendar, organization)
+
+    make_service(context, FakeHost()).sync_events(resumed)
+
+    assert fake_adapter.get_events.call_args.args[-1] == "wide"
+    resumed.refresh_from_db()
+    assert resumed.sync_token_window_end == calendar_sync.end_datetime
+
+
+@pytest.mark.django_db
+def test_admin_sync_never_resumes_from_a_token(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    fake_adapter: MagicMock,
+) -> None:
+    """Admin (and import) syncs rebuild the calendar, so they always run full."""
+    _create_sync(calendar, organization, status=CalendarSyncStatus.SUCCESS, next_sync_token="t")
+    fake_adapter.get_events.return_value = {"events": [], "next_sync_token": "t2"}
+    calendar_sync = _create_sync(
+        calendar, organization, trigger_source=CalendarSyncTriggerSource.ADMIN
+    )
+
+    make_service(context, FakeHost()).sync_events(calendar_sync)
+
+    assert fake_adapter.get_events.call_args.args[-1] is None
+
+
+@pytest.mark.django_db
+def test_sync_events_requeues_the_sync_when_the_quota_runs_out(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    fake_adapter: MagicMock,
+) -> None:
+    """An exhausted provider quota rolls the pass back and leaves the sync retryable."""
+
+    def throttled_stream():
+        yield _adapter_event(
+            "ext_partial",
+            "Applied before the quota ran out",
+            datetime.datetime(2025, 8, 2, 9, 0, tzinfo=datetime.UTC),
+            datetime.datetime(2025, 8, 2, 10, 0, tzinfo=datetime.UTC),
+        )
+        raise ProviderQuotaExceededError("google_calendar_read", 60)
+
+    fake_adapter.get_events.return_value = {"events": throttled_stream(), "next_sync_token": None}
+    calendar_sync = _create_sync(calendar, organization)
+
+    with pytest.raises(ProviderQuotaExceededError):
+        make_service(context, FakeHost()).sync_events(calendar_sync)
+
+    calendar_sync.refresh_from_db()
+    assert calendar_sync.status == CalendarSyncStatus.NOT_STARTED
+    assert not BlockedTime.objects.filter_by_organization(organization.id).exists()
+
+
+@pytest.mark.django_db
+def test_sync_events_leaves_the_sync_queued_while_the_calendar_syncs(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    fake_adapter: MagicMock,
+) -> None:
+    """A sync finding another sync of its calendar running neither runs nor waits."""
+    calendar_sync = _create_sync(calendar, organization)
+
+    with patch(
+        "calendar_integration.services.calendar_sync_service.calendar_sync_lock",
+        return_value=contextlib.nullcontext(False),
+    ):
+        make_service(context, FakeHost()).sync_events(calendar_sync)
+
+    fake_adapter.get_events.assert_not_called()
+    calendar_sync.refresh_from_db()
+    assert calendar_sync.status == CalendarSyncStatus.NOT_STARTED
+
+
+@pytest.mark.django_db
+def test_sync_events_runs_the_window_the_sync_was_widened_to_before_its_claim(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    fake_adapter: MagicMock,
+) -> None:
+    """A queued sync widened after its task loaded it runs with the widened window."""
+    fake_adapter.get_events.return_value = {"events": [], "next_sync_token": None}
+    calendar_sync = _create_sync(calendar, organization, should_update_events=False)
+    widened_start = datetime.datetime(2025, 7, 30, 0, 0, tzinfo=datetime.UTC)
+    widened_end = datetime.datetime(2025, 8, 5, 0, 0, tzinfo=datetime.UTC)
+    CalendarSync.objects.filter_by_organization(organization.id).filter(pk=calendar_sync.pk).update(
+        start_datetime=widened_start, end_datetime=widened_end, should_update_events=True
+    )
+
+    make_service(context, FakeHost()).sync_events(calendar_sync)
+
+    assert fake_adapter.get_events.call_args.args[2:4] == (widened_start, widened_end)
+    assert calendar_sync.should_update_events is True
+    assert calendar_sync.status == CalendarSyncStatus.SUCCESS
+
+
+@pytest.mark.django_db
+def test_sync_events_reruns_once_for_the_syncs_queued_behind_it(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    fake_adapter: MagicMock,
+) -> None:
+    """Syncs queued while the calendar synced are folded into one re-run over the
+    window they span together, and share its outcome."""
+    fake_adapter.get_events.side_effect = lambda *args: {"events": [], "next_sync_token": None}
+    calendar_sync = _create_sync(calendar, organization)
+    earlier = _create_sync(
+        calendar,
+        organization,
+        should_update_events=False,
+        start_datetime=datetime.datetime(2025, 8, 1, 0, 0, tzinfo=datetime.UTC),
+        end_datetime=datetime.datetime(2025, 8, 1, 23, 59, tzinfo=datetime.UTC),
+    )
+    later = _create_sync(
+        calendar,
+        organization,
+        start_datetime=datetime.datetime(2025, 8, 3, 0, 0, tzinfo=datetime.UTC),
+        end_datetime=datetime.datetime(2025, 8, 3, 23, 59, tzinfo=datetime.UTC),
+    )
+
+    make_service(context, FakeHost()).sync_events(calendar_sync)
+
+    assert fake_adapter.get_events.call_count == 2
+    later.refresh_from_db()
+    assert (later.start_datetime, later.end_datetime) == (
+        earlier.start_datetime,
+        later.end_datetime,
+    )
+    assert later.should_update_events is True
+    statuses = CalendarSync.objects.filter_by_organization(organization.id).values_list(
+        "status", flat=True
+    )
+    assert set(statuses) == {CalendarSyncStatus.SUCCESS}
+
+
 # ---------------------------------------------------------------------------
 # Tests: organization-resource import path
 # ---------------------------------------------------------------------------
@@ -362,3 +1052,211 @@ def test_execute_organization_calendar_resources_import_syncs_each_resource(
     assert call["start_datetime"] == start
     assert call["end_datetime"] == end
     assert call["should_update_events"] is True
+
+
+@pytest.mark.django_db
+def test_execute_organization_calendar_resources_import_upserts_in_bulk(
+    context: CalendarServiceContext,
+    organization: Organization,
+    fake_adapter: MagicMock,
+    django_assert_num_queries: Any,
+) -> None:
+    """Re-importing a room list looks the rooms up in one query, writes only the
+    changed ones, and records the counts on the import state."""
+    start = datetime.datetime(2025, 8, 3, 9, 0, tzinfo=datetime.UTC)
+    end = datetime.datetime(2025, 8, 3, 17, 0, tzinfo=datetime.UTC)
+    Calendar.objects.create(
+        organization=organization,
+        external_id="room_0",
+        provider=CalendarProvider.GOOGLE,
+        name="Room 0",
+        email="room0@example.com",
+        calendar_type=CalendarType.RESOURCE,
+    )
+    Calendar.objects.create(
+        organization=organization,
+        external_id="room_1",
+        provider=CalendarProvider.GOOGLE,
+        name="Old name",
+        email="room1@example.com",
+        calendar_type=CalendarType.RESOURCE,
+    )
+    fake_adapter.get_available_calendar_resources.return_value = [
+        CalendarResourceData(
+            name=f"Room {index}",
+            description="",
+            provider="google",
+            external_id=f"room_{index}",
+            email=f"room{index}@example.com",
+        )
+        for index in range(5)
+    ]
+    import_state = CalendarOrganizationResourcesImport.objects.create(
+        organization=organization, start_time=start, end_time=end
+    )
+    host = FakeHost()
+    service = make_service(context, host)
+
+    # savepoint, lookup, upsert of the 3 new rooms, update of the renamed one,
+    # the counts on the import state, release.
+    with django_assert_num_queries(6):
+        service._execute_organization_calendar_resources_import(
+            start, end, import_workflow_state=import_state, bypass_limits=True
+        )
+
+    import_state.refresh_from_db()
+    assert (
+        import_state.calendars_created,
+        import_state.calendars_updated,
+        import_state.calendars_unchanged,
+    ) == (3, 1, 1)
+    rooms = Calendar.objects.filter_by_organization(organization.id).only_resource_calendars()
+    assert sorted(rooms.values_list("name", flat=True)) == [f"Room {index}" for index in range(5)]
+    assert [call["calendar"].external_id for call in host.request_calendar_sync_calls] == [
+        f"room_{index}" for index in range(5)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Tests: Outlook rooms
+# ---------------------------------------------------------------------------
+
+
+def _outlook_room(organization: Organization, index: int) -> Calendar:
+    return Calendar.objects.create(
+        organization=organization,
+        external_id=f"room{index}@example.com",
+        provider=CalendarProvider.MICROSOFT,
+        name=f"Room {index}",
+        calendar_type=CalendarType.RESOURCE,
+    )
+
+
+@pytest.mark.django_db
+def test_request_outlook_rooms_sync_queues_the_rooms_task_for_a_microsoft_account(
+    context: CalendarServiceContext,
+    organization: Organization,
+    user: User,
+    social_account: SocialAccount,
+    django_capture_on_commit_callbacks: Any,
+) -> None:
+    """The rooms task is queued as the authenticated Microsoft account; any other
+    provider's account is refused."""
+    microsoft_account = SocialAccount.objects.create(
+        user=user, provider=CalendarProvider.MICROSOFT, uid="99999"
+    )
+    google_service = make_service(dataclasses.replace(context, account=social_account), FakeHost())
+    with pytest.raises(NotImplementedError):
+        google_service.request_outlook_rooms_sync()
+
+    service = make_service(dataclasses.replace(context, account=microsoft_account), FakeHost())
+    with (
+        patch("calendar_integration.tasks.sync_outlook_rooms_task.delay") as delay,
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        service.request_outlook_rooms_sync()
+
+    delay.assert_called_once_with(
+        social_account_id=microsoft_account.id, organization_id=organization.id
+    )
+
+
+@pytest.mark.django_db
+def test_sync_outlook_rooms_fetches_each_chunk_concurrently_and_stores_the_delta_tokens(
+    context: CalendarServiceContext,
+    organization: Organization,
+    fake_adapter: MagicMock,
+) -> None:
+    """The rooms of a chunk fetch their delta rounds at once -- each waits for the
+    other at a barrier -- from their own tokens, and each stores the next one."""
+    fake_adapter.provider = CalendarProvider.MICROSOFT
+    rooms = [_outlook_room(organization, index) for index in range(4)]
+    token_window = (
+        datetime.datetime(2025, 8, 1, 0, 0, tzinfo=datetime.UTC),
+        datetime.datetime(2025, 8, 3, 0, 0, tzinfo=datetime.UTC),
+    )
+    _create_sync(
+        rooms[0],
+        organization,
+        status=CalendarSyncStatus.SUCCESS,
+        next_sync_token="t0",
+        sync_token_window_start=token_window[0],
+        sync_token_window_end=token_window[1],
+    )
+    barrier = threading.Barrier(2, timeout=5)
+
+    def room_delta(room_id, start, end, sync_token=None):
+        barrier.wait()
+        event = _adapter_event(
+            f"{room_id}-event",
+            "Booked",
+            datetime.datetime(2025, 8, 2, 9, 0, tzinfo=datetime.UTC),
+            datetime.datetime(2025, 8, 2, 10, 0, tzinfo=datetime.UTC),
+        )
+        return {"events": [event], "next_sync_token": f"$deltatoken={room_id}"}
+
+    fake_adapter.get_room_events_delta.side_effect = room_delta
+    window = (
+        datetime.datetime(2025, 8, 2, 0, 0, tzinfo=datetime.UTC),
+        datetime.datetime(2025, 8, 2, 23, 59, tzinfo=datetime.UTC),
+    )
+
+    summary = make_service(context, FakeHost()).sync_outlook_rooms(
+        *window, chunk_size=2, max_concurrency=2
+    )
+
+    assert (summary.synced, summary.failed, summary.deferred) == (4, 0, 0)
+    fake_adapter.get_events.assert_not_called()
+    tokens = {c.args[0]: c.args[3:] for c in fake_adapter.get_room_events_delta.call_args_list}
+    assert tokens == {"room0@example.com": ("t0",)} | {room.external_id: () for room in rooms[1:]}
+    for room in rooms:
+        latest = (
+            CalendarSync.objects.filter_by_organization(organization.id)
+            .filter(calendar=room)
+            .latest("created")
+        )
+        assert latest.status == CalendarSyncStatus.SUCCESS
+        assert latest.next_sync_token == f"$deltatoken={room.external_id}"
+        # room0 resumed the round its token continues; the others started one.
+        expected_window = token_window if room == rooms[0] else window
+        assert (latest.sync_token_window_start, latest.sync_token_window_end) == expected_window
+    blocks = BlockedTime.objects.filter_by_organization(organization.id)
+    assert blocks.count() == 4
+
+
+@pytest.mark.django_db
+def test_sync_outlook_rooms_settles_failed_and_throttled_rooms_apart(
+    context: CalendarServiceContext,
+    organization: Organization,
+    fake_adapter: MagicMock,
+) -> None:
+    """A room Graph failed for is marked failed, a throttled one is handed to its own
+    task, and neither keeps the others from syncing."""
+    fake_adapter.provider = CalendarProvider.MICROSOFT
+    rooms = [_outlook_room(organization, index) for index in range(3)]
+
+    def room_delta(room_id, start, end, sync_token=None):
+        if room_id == rooms[0].external_id:
+            raise ValueError("Failed to get room events: 404")
+        if room_id == rooms[1].external_id:
+            raise ProviderQuotaExceededError("ms_graph", 30)
+        return {"events": [], "next_sync_token": "$deltatoken=ok"}
+
+    fake_adapter.get_room_events_delta.side_effect = room_delta
+    service = make_service(context, FakeHost())
+
+    with patch.object(service, "_enqueue_calendar_sync") as enqueue:
+        summary = service.sync_outlook_rooms(
+            datetime.datetime(2025, 8, 2, 0, 0, tzinfo=datetime.UTC),
+            datetime.datetime(2025, 8, 2, 23, 59, tzinfo=datetime.UTC),
+        )
+
+    assert (summary.synced, summary.failed, summary.deferred) == (1, 1, 1)
+    syncs = {
+        sync.calendar_fk_id: sync
+        for sync in CalendarSync.objects.filter_by_organization(organization.id)
+    }
+    assert syncs[rooms[0].id].status == CalendarSyncStatus.FAILED
+    assert syncs[rooms[1].id].status == CalendarSyncStatus.NOT_STARTED
+    enqueue.assert_called_once_with(syncs[rooms[1].id], countdown=30)
+    assert syncs[rooms[2].id].status == CalendarSyncStatus.SUCCESS
@@ -274,17 +274,27 @@ def test_refresh_webhook_subscription_google(
     context: CalendarServiceContext,
     calendar: Calendar,
     organization: Organization,
+    fake_adapter: MagicMock,
 ) -> None:
-    """refresh_webhook_subscription extends expires_at by 7 days for Google."""
+    """refresh_webhook_subscription renews a Google channel for 7 days with the
+    provider, and stores the replacement channel."""
     sub = CalendarWebhookSubscription.objects.create(
         calendar=calendar,
         organization=organization,
         provider=CalendarProvider.GOOGLE,
         external_subscription_id="ext-sub-1",
+        external_resource_id="res-1",
         channel_id="ch-1",
         callback_url="https://example.com/wh",
         expires_at=datetime.datetime.now(tz=datetime.UTC) + datetime.timedelta(hours=2),
     )
+    new_expiration = datetime.datetime.now(tz=datetime.UTC) + datetime.timedelta(days=7)
+    fake_adapter.renew_webhook_subscription.return_value = {
+        "channel_id": "ch-2",
+        "resource_id": "res-1",
+        "resource_uri": "https://example.com/resource",
+        "expiration": str(int(new_expiration.timestamp() * 1000)),
+    }
 
     host = FakeHost()
     service = make_service(context, host)
@@ -292,12 +302,122 @@ def test_refresh_webhook_subscription_google(
 
     assert result is not None
     assert result.id == sub.id
+    fake_adapter.renew_webhook_subscription.assert_called_once_with(
+        subscription_id="ext-sub-1",
+        resource_id=calendar.external_id,
+        callback_url="https://example.com/wh",
+        provider_resource_id="res-1",
+        tracking_params={"ttl_seconds": 7 * 24 * 3600},
+    )
+    sub.refresh_from_db()
+    assert sub.channel_id == "ch-2"
+    assert sub.external_subscription_id == "ch-2"
+    assert abs(sub.expires_at - new_expiration) < datetime.timedelta(seconds=1)
+
+
+@pytest.mark.django_db
+def test_refresh_webhook_subscription_raises_when_the_provider_refuses(
+    context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+    fake_adapter: MagicMock,
+) -> None:
+    expires_at = datetime.datetime.now(tz=datetime.UTC) + datetime.timedelta(hours=2)
+    sub = CalendarWebhookSubscription.objects.create(
+        calendar=calendar,
+        organization=organization,
+        provider=CalendarProvider.GOOGLE,
+        external_subscription_id="ext-sub-1",
+        callback_url="https://example.com/wh",
+        expires_at=expires_at,
+    )
+    fake_adapter.renew_webhook_subscription.side_effect = RuntimeError("quota")
+
+    service = make_service(context, FakeHost())
+    with pytest.raises(ValueError, match="Failed to renew webhook subscription"):
+        service.refresh_webhook_subscription(subscription_id=sub.id)
+
+    sub.refresh_from_db()
+    assert sub.expires_at == expires_at
+
+
+@pytest.mark.django_db
+def test_refresh_webhook_subscription_without_an_account_only_moves_the_expiration(
+    unauthenticated_context: CalendarServiceContext,
+    calendar: Calendar,
+    organization: Organization,
+) -> None:
+    sub = CalendarWebhookSubscription.objects.create(
+        calendar=calendar,
+        organization=organization,
+        provider=CalendarProvider.GOOGLE,
+        external_subscription_id="ext-sub-1",
+        callback_url="https://example.com/wh",
+        expires_at=datetime.datetime.now(tz=datetime.UTC) + datetime.timedelta(hours=2),
+    )
+
+    service = make_service(unauthenticated_context, FakeHost())
+    result = service.refresh_webhook_subscription(subscription_id=sub.id)
+
+    assert result is not None
     # Should be approximately 7 days from now
     expected_min = datetime.datetime.now(tz=datetime.UTC) + datetime.timedelta(days=6)
     expected_max = datetime.datetime.now(tz=datetime.UTC) + datetime.timedelta(days=8)
     assert expected_min <= result.expires_at <= expected_max
 
 
+@pytest.mark.django_db
+def test_renew_webhook_subscriptions_stores_every_renewal_in_one_update(
+    context: CalendarServiceContext,
+    organization: Organization,
+    fake_adapter: MagicMock,
+    django_assert_max_num_queries,
+) -> None:
+    """Renewals are stored together; one the provider refused is left as it was."""
+    expires_at = datetime.datetime.now(tz=datetime.UTC) + datetime.timedelta(hours=2)
+    subscriptions = []
+    for index in range(3):
+        subscriptions.append(
+            CalendarWebhookSubscription.objects.create(
+                calendar=Calendar.objects.create(
+                    name=f"Renewal Calendar {index}",
+                    external_id=f"renew_cal_{index}",
+                    provider=CalendarProvider.MICROSOFT,
+                    organization=organization,
+                ),
+                organization=organization,
+                provider=CalendarProvider.MICROSOFT,
+                external_subscription_id=f"graph-sub-{index}",
+                callback_url="https://example.com/wh",
+                expires_at=expires_at,
+            )
+        )
+    new_expiration = datetime.datetime(2030, 1, 1, tzinfo=datetime.UTC)
+
+    def renew(subscription_id, **kwargs):
+        if subscription_id == "graph-sub-1":
+            raise ValueError("Failed to renew Microsoft webhook subscription")
+        return {"subscription_id": subscription_id, "expiration": "2030-01-01T00:00:00Z"}
+
+    fake_adapter.renew_webhook_subscription.side_effect = renew
+
+    service = make_service(context, FakeHost())
+    # The subscriptions, then one update for the two renewed.
+    with django_assert_max_num_queries(2):
+        summary = service.renew_webhook_subscriptions([sub.id for sub in subscriptions])
+
+    assert (summary.renewed, summary.failed) == (2, 1)
+    expirations = {
+        sub.external_subscription_id: sub.expires_at
+        for sub in CalendarWebhookSubscription.objects.filter_by_organization(organization)
+    }
+    assert expirations == {
+        "graph-sub-0": new_expiration,
+        "graph-sub-1": expires_at,
+        "graph-sub-2": new_expiration,
+    }
+
+
 @pytest.mark.django_db
 def test_refresh_webhook_subscription_not_found_returns_none(
     context: CalendarServiceContext,
@@ -411,6 +411,9 @@ def test_forbidden_update_does_not_mutate_local_event_and_calls_update_event(
     # create_event must NOT have been called (this is an update undo, not a delete undo).
     fake_adapter.create_event.assert_not_called()
 
+    # The undo was sent before it was recorded, not queued in a write batch.
+    fake_adapter.batch_writes.assert_not_called()
+
     # Exactly one AUTO_UNDONE change request must exist.
     requests = ExternalEventChangeRequest.objects.filter_by_organization(
         organization_forbidden.id
@@ -35,8 +35,8 @@ from organizations.models import Organization
 class _FakeAvailabilityHost:
     """Minimal AvailabilityServiceHost — no events, no side-effect writes needed here."""
 
-    def get_calendar_events_expanded(self, calendar, start_date, end_date):
-        return []
+    def iter_calendar_events_expanded(self, calendar, start_date, end_date, *, materialize=True):
+        return iter(())
 
     def bulk_create_manual_blocked_times(self, calendar, blocked_times):
         return []
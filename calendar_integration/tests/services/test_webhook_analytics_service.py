@@ -8,12 +8,18 @@ from django.utils import timezone
 
 from model_bakery import baker
 
-from calendar_integration.constants import CalendarSyncStatus, IncomingWebhookProcessingStatus
+from calendar_integration.constants import (
+    CalendarProvider,
+    CalendarSyncStatus,
+    IncomingWebhookProcessingStatus,
+)
 
 # Calendar integration models are accessed via baker.make strings
 from calendar_integration.models import (
+    Calendar,
     CalendarSync,
     CalendarWebhookEvent,
+    CalendarWebhookSubscription,
 )
 from calendar_integration.services.webhook_analytics_service import WebhookAnalyticsService
 from organizations.models import Organization
@@ -289,43 +295,64 @@ class TestWebhookAnalyticsService(TestCase):
 
         assert alert is None
 
-    @patch(
-        "calendar_integration.services.webhook_analytics_service.CalendarWebhookSubscription.objects"
-    )
-    def test_get_subscription_health_report(self, mock_subscription_objects: Mock) -> None:
+    def test_get_subscription_health_report(self) -> None:
         """Test getting subscription health report."""
-        # Mock the queryset chain. The service now enters it through
-        # ``filter_by_organization(...)`` -- the manager method that starts from the
-        # *unscoped* queryset -- rather than ``filter(organization=...)``, so that is
-        # what the mock has to answer.
-        mock_qs = Mock()
-        mock_subscription_objects.filter_by_organization.return_value = mock_qs
-
-        # Mock counts
-        mock_qs.count.return_value = 6  # total subscriptions
-        mock_qs.filter.return_value.count.side_effect = [
-            4,
-            0,
-            1,
-            2,
-        ]  # active, expired, expiring_soon, stale
-
-        # Mock delivery stats by patching the method
-        with patch.object(self.service, "get_webhook_delivery_stats") as mock_delivery_stats:
-            mock_delivery_stats.return_value = {
-                "total_events": 10,
-                "success_rate": 80.0,
-                "failure_rate": 20.0,
-            }
-
-            report = self.service.get_subscription_health_report()
-
-        assert report["total_subscriptions"] == 6
-        assert report["active_subscriptions"] == 4
-        assert report["expired_subscriptions"] == 0
+        now = timezone.now()
+
+        def subscription(calendar_external_id: str, **kwargs) -> CalendarWebhookSubscription:
+            calendar = baker.make(
+                Calendar,
+                organization=self.organization,
+                provider=CalendarProvider.GOOGLE,
+                external_id=calendar_external_id,
+            )
+            return baker.make(
+                CalendarWebhookSubscription,
+                organization=self.organization,
+                calendar=calendar,
+                provider=CalendarProvider.GOOGLE,
+                **kwargs,
+            )
+
+        # Active and healthy, notified an hour ago.
+        subscription(
+            "healthy",
+            expires_at=now + datetime.timedelta(days=3),
+            last_notification_at=now - datetime.timedelta(hours=1),
+        )
+        # Active, expiring soon, never notified: stale.
+        subscription("expiring", expires_at=now + datetime.timedelta(hours=2))
+        # Active, expired, last notified long ago: stale.
+        subscription(
+            "expired",
+            expires_at=now - datetime.timedelta(hours=1),
+            last_notification_at=now - datetime.timedelta(days=8),
+        )
+        # Inactive: only counted in the total.
+        subscription("inactive", is_active=False, expires_at=now - datetime.timedelta(days=1))
+        baker.make(
+            CalendarWebhookEvent,
+            organization=self.organization,
+            processing_status=IncomingWebhookProcessingStatus.FAILED,
+        )
+        # Another organization's subscriptions are not counted.
+        other = baker.make(Organization)
+        baker.make(
+            CalendarWebhookSubscription,
+            organization=other,
+            calendar=baker.make(Calendar, organization=other),
+            expires_at=now - datetime.timedelta(hours=1),
+        )
+
+        report = self.service.get_subscription_health_report()
+
+        assert report["total_subscriptions"] == 4
+        assert report["active_subscriptions"] == 3
+        assert report["expired_subscriptions"] == 1
         assert report["expiring_soon_subscriptions"] == 1
-        assert "delivery_stats" in report
-        assert report["delivery_stats"]["success_rate"] == 80.0
+        assert report["stale_subscriptions"] == 2
+        assert report["delivery_stats"]["total_events"] == 1
+        assert report["delivery_stats"]["failure_rate"] == 100.0
 
     @patch("calendar_integration.services.webhook_analytics_service.CalendarWebhookEvent.objects")
     def test_cleanup_old_webhook_events_with_filter(self, mock_qs: Mock) -> None:
@@ -0,0 +1,87 @@
+import contextlib
+import threading
+from unittest.mock import Mock
+
+from calendar_integration.services.write_fan_out import ProviderWriteFanOut
+
+
+def _adapter(*, barrier: threading.Barrier | None = None, fail_with: Exception | None = None):
+    """A fake adapter whose ``batch_writes()`` block sends on exit: waits on
+    ``barrier``, then raises ``fail_with`` (once) if given."""
+    adapter = Mock()
+    failures = [fail_with] if fail_with else []
+
+    @contextlib.contextmanager
+    def batch_writes():
+        yield
+        if barrier is not None:
+            barrier.wait(timeout=5)
+        if failures:
+            raise failures.pop()
+
+    adapter.batch_writes.side_effect = batch_writes
+    return adapter
+
+
+def test_flush_sends_every_account_batch_at_once_and_reports_per_calendar():
+    """Both accounts' batches are in flight together (the barrier only lets them
+    through together), and each calendar gets its own account's outcome."""
+    barrier = threading.Barrier(2)
+    error = ValueError("rejected")
+    healthy = _adapter(barrier=barrier)
+    failing = _adapter(barrier=barrier, fail_with=error)
+    fan_out = ProviderWriteFanOut(max_concurrency=2)
+
+    fan_out.enlist(1, healthy)
+    fan_out.enlist(2, healthy)
+    fan_out.enlist(3, failing)
+    results = fan_out.flush()
+
+    healthy.batch_writes.assert_called_once_with()
+    assert {result.calendar_id: result.error for result in results} == {1: None, 2: None, 3: error}
+    assert [result.calendar_id for result in fan_out.failures] == [3]
+
+
+def test_discard_closes_the_batches_unsent_and_compensate_skips_their_copies():
+    """Queued writes are dropped rather than sent; an account that had nothing queued
+    (its writes went out as they were made) is still compensated."""
+    queued = _adapter(fail_with=ValueError("would have been sent"))
+    queued.discard_writes.return_value = 1
+    immediate = _adapter()
+    immediate.discard_writes.return_value = 0
+    fan_out = ProviderWriteFanOut()
+    fan_out.enlist(1, queued)
+    fan_out.enlist(2, immediate)
+
+    fan_out.discard(RuntimeError("boom"))
+    fan_out.compensate(
+        [
+            Mock(calendar_fk_id=1, external_id="ev-1", calendar=Mock(external_id="cal-1")),
+            Mock(calendar_fk_id=2, external_id="ev-2", calendar=Mock(external_id="cal-2")),
+        ]
+    )
+
+    queued.discard_writes.assert_called_once_with()
+    queued.delete_event.assert_not_called()
+    immediate.delete_event.assert_called_once_with("cal-2", "ev-2")
+
+
+def test_compensate_deletes_every_copy_through_its_account():
+    first = _adapter()
+    second = _adapter(fail_with=ValueError("rejected"))
+    fan_out = ProviderWriteFanOut()
+    fan_out.enlist(1, first)
+    fan_out.enlist(2, second)
+    fan_out.flush()
+    events = [
+        Mock(calendar_fk_id=1, external_id="ev-1", calendar=Mock(external_id="cal-1")),
+        # Its account's batch failed, but the copy may still have gone out.
+        Mock(calendar_fk_id=2, external_id="ev-2", calendar=Mock(external_id="cal-2")),
+        # Never written to a provider.
+        Mock(calendar_fk_id=3, external_id="ev-3", calendar=Mock(external_id="cal-3")),
+    ]
+
+    fan_out.compensate(events)
+
+    first.delete_event.assert_called_once_with("cal-1", "ev-1")
+    second.delete_event.assert_called_once_with("cal-2", "ev-2")
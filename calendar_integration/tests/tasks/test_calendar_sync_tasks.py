@@ -1,24 +1,50 @@
 import datetime
 from unittest.mock import MagicMock, Mock, patch
 
+from django.utils import timezone
+
 import pytest
 from allauth.socialaccount.models import SocialAccount, SocialToken
+from celery.exceptions import Retry
+from model_bakery import baker
 
-from calendar_integration.constants import CalendarProvider
+from calendar_integration.constants import CalendarProvider, IncomingWebhookProcessingStatus
+from calendar_integration.exceptions import (
+    ProviderQuotaExceededError,
+    ProviderUnavailableError,
+)
 from calendar_integration.models import (
     Calendar,
     CalendarOrganizationResourceImportStatus,
     CalendarOrganizationResourcesImport,
+    CalendarOwnership,
     CalendarSync,
     CalendarSyncStatus,
+    CalendarWebhookEvent,
+    CalendarWebhookSubscription,
     GoogleCalendarServiceAccount,
 )
 from calendar_integration.tasks.calendar_sync_tasks import (
     import_organization_calendar_resources_task,
+    process_webhook_events_task,
+    renew_account_webhook_subscriptions_task,
+    renew_webhook_subscriptions_task,
+    resync_account_calendars_task,
+    resync_organization_calendars_task,
     sync_calendar_task,
 )
+from calendar_integration.webhook_debounce import (
+    WEBHOOK_SYNC_MAX_DELAY,
+    WEBHOOK_SYNC_QUIET_PERIOD,
+    webhook_calendar_key,
+)
+from calendar_integration.webhook_ingestion import (
+    WEBHOOK_CLAIM_LEASE,
+    claim_pending_webhook_events,
+)
+from calendar_integration.webhook_renewal import WebhookRenewalSummary
 from common.organization_context import organization_context
-from organizations.models import Organization
+from organizations.models import Organization, OrganizationMembership
 from users.models import User
 
 
@@ -94,7 +120,7 @@ def test_sync_calendar_task_with_social_account(
         calendar_service=mock_service,
     )
     mock_service.authenticate.assert_called_once_with(
-        account=social_account.user, organization=organization
+        account=social_account, organization=organization
     )
     mock_service.sync_events.assert_called_once_with(calendar_sync)
 
@@ -256,11 +282,79 @@ def test_sync_calendar_task_service_exception(
             calendar_service=mock_service,
         )
     mock_service.authenticate.assert_called_once_with(
-        account=social_account.user, organization=organization
+        account=social_account, organization=organization
     )
     mock_service.sync_events.assert_called_once_with(calendar_sync)
 
 
+@pytest.mark.parametrize(
+    "error",
+    [
+        ProviderQuotaExceededError("google_calendar_read", 60.0),
+        ProviderUnavailableError("MS Graph API", "status 503", 60.0),
+    ],
+)
+def test_sync_calendar_task_retries_on_exhausted_quota(
+    assert_no_unbound_scoped_queries, social_account, social_token, calendar, organization, error
+):
+    """An exhausted quota or unavailable provider becomes a Celery retry after
+    ``retry_after``.
+    """
+    calendar_sync = CalendarSync.objects.create(
+        calendar=calendar,
+        start_datetime=datetime.datetime(2025, 6, 22, 0, 0, tzinfo=datetime.UTC),
+        end_datetime=datetime.datetime(2025, 6, 22, 23, 59, tzinfo=datetime.UTC),
+        should_update_events=True,
+        organization=organization,
+    )
+    mock_service = MagicMock()
+    mock_service.sync_events.side_effect = error
+
+    with (
+        patch.object(sync_calendar_task, "retry", side_effect=Retry()) as retry,
+        pytest.raises(Retry),
+    ):
+        sync_calendar_task(
+            "social_account",
+            social_account.id,
+            calendar_sync.id,
+            organization.id,
+            calendar_service=mock_service,
+        )
+
+    retry.assert_called_once_with(countdown=60.0, exc=error)
+
+
+def test_sync_calendar_task_fails_sync_once_quota_retries_are_spent(
+    assert_no_unbound_scoped_queries, social_account, social_token, calendar, organization
+):
+    calendar_sync = CalendarSync.objects.create(
+        calendar=calendar,
+        start_datetime=datetime.datetime(2025, 6, 22, 0, 0, tzinfo=datetime.UTC),
+        end_datetime=datetime.datetime(2025, 6, 22, 23, 59, tzinfo=datetime.UTC),
+        should_update_events=True,
+        organization=organization,
+    )
+    mock_service = MagicMock()
+    mock_service.sync_events.side_effect = ProviderQuotaExceededError("google_calendar_read", 60)
+
+    # A first run with no retries left behaves like the last of ``max_retries``.
+    with patch.object(sync_calendar_task, "max_retries", 0):
+        sync_calendar_task(
+            "social_account",
+            social_account.id,
+            calendar_sync.id,
+            organization.id,
+            calendar_service=mock_service,
+        )
+
+    calendar_sync = CalendarSync.objects.filter_by_organization(organization.id).get(
+        pk=calendar_sync.pk
+    )
+    assert calendar_sync.status == CalendarSyncStatus.FAILED
+    assert "google_calendar_read" in calendar_sync.error_message
+
+
 # Tests for import_organization_calendar_resources_task
 
 
@@ -448,7 +542,7 @@ def test_sync_calendar_task_with_changes_applied(
 
     # Verify the service was called correctly
     mock_service.authenticate.assert_called_once_with(
-        account=social_account.user, organization=organization
+        account=social_account, organization=organization
     )
     mock_service.sync_events.assert_called_once_with(calendar_sync)
 
@@ -495,7 +589,7 @@ def test_sync_calendar_task_handles_sync_failures(
 
     # Verify the service was called correctly
     mock_service.authenticate.assert_called_once_with(
-        account=social_account.user, organization=organization
+        account=social_account, organization=organization
     )
     mock_service.sync_events.assert_called_once_with(calendar_sync)
 
@@ -666,3 +760,354 @@ def test_sync_calendar_task_tracks_matched_event_ids(
     assert "event_3" in matched_ids
     assert "old_event_1" in deleted_ids
     assert "old_event_2" in deleted_ids
+
+
+# Tests for process_webhook_events_task
+def _webhook_event(organization, external_calendar_id, age=WEBHOOK_SYNC_QUIET_PERIOD * 2):
+    return CalendarWebhookEvent.objects.create(
+        organization=organization,
+        provider=CalendarProvider.GOOGLE,
+        event_type="exists",
+        external_calendar_id=external_calendar_id,
+        raw_payload={},
+        created=timezone.now() - age,
+    )
+
+
+@pytest.fixture
+def owned_calendar(calendar, social_account, organization):
+    baker.make(
+        OrganizationMembership, organization=organization, user=social_account.user, is_active=True
+    )
+    baker.make(
+        CalendarOwnership,
+        organization=organization,
+        calendar=calendar,
+        membership_user_id=social_account.user_id,
+        is_default=True,
+    )
+    return calendar
+
+
+def test_process_webhook_events_task_requests_one_sync_per_calendar(
+    social_account, owned_calendar, organization
+):
+    events = [_webhook_event(organization, owned_calendar.external_id) for _ in range(3)]
+    unknown = _webhook_event(organization, "unknown-calendar")
+    calendar_sync = CalendarSync.objects.create(
+        calendar=owned_calendar,
+        start_datetime=datetime.datetime(2025, 6, 22, 0, 0, tzinfo=datetime.UTC),
+        end_datetime=datetime.datetime(2025, 6, 22, 23, 59, tzinfo=datetime.UTC),
+        should_update_events=True,
+        organization=organization,
+    )
+    mock_service = MagicMock()
+    mock_service.request_webhook_triggered_sync.return_value = calendar_sync
+
+    process_webhook_events_task(organization.id, calendar_service=mock_service)
+
+    mock_service.authenticate.assert_called_once_with(
+        account=social_account, organization=organization
+    )
+    mock_service.request_webhook_triggered_sync.assert_called_once_with(
+        external_calendar_id=owned_calendar.external_id,
+        webhook_event=events[-1],
+        first_notified_at=events[0].created,
+    )
+    with organization_context(organization):
+        settled = {event.id: event for event in CalendarWebhookEvent.objects.all()}
+    assert {settled[event.id].processing_status for event in events} == {
+        IncomingWebhookProcessingStatus.PROCESSED
+    }
+    assert {settled[event.id].calendar_sync for event in events} == {calendar_sync}
+    assert settled[unknown.id].processing_status == IncomingWebhookProcessingStatus.IGNORED
+
+
+def test_process_webhook_events_task_fails_only_the_calendar_that_failed(
+    social_account, owned_calendar, organization
+):
+    other_calendar = Calendar.objects.create(
+        name="Other Calendar",
+        external_id="cal_456",
+        provider=CalendarProvider.GOOGLE,
+        organization=organization,
+    )
+    baker.make(
+        CalendarOwnership,
+        organization=organization,
+        calendar=other_calendar,
+        membership_user_id=social_account.user_id,
+        is_default=True,
+    )
+    failing = _webhook_event(organization, owned_calendar.external_id)
+    skipped = _webhook_event(organization, other_calendar.external_id)
+    mock_service = MagicMock()
+    mock_service.request_webhook_triggered_sync.side_effect = [Exception("boom"), None]
+
+    process_webhook_events_task(organization.id, calendar_service=mock_service)
+
+    assert mock_service.request_webhook_triggered_sync.call_count == 2
+    with organization_context(organization):
+        failing.refresh_from_db()
+        skipped.refresh_from_db()
+    assert failing.processing_status == IncomingWebhookProcessingStatus.FAILED
+    assert skipped.processing_status == IncomingWebhookProcessingStatus.IGNORED
+    assert skipped.processed_at is not None
+
+
+@patch("calendar_integration.tasks.calendar_sync_tasks.schedule_webhook_drain")
+def test_process_webhook_events_task_waits_for_the_calendar_to_go_quiet(
+    mock_schedule_drain, social_account, owned_calendar, organization
+):
+    """A calendar still being notified keeps its events pending until it is due."""
+    _webhook_event(organization, owned_calendar.external_id, age=datetime.timedelta(minutes=1))
+    latest = _webhook_event(
+        organization, owned_calendar.external_id, age=datetime.timedelta(seconds=5)
+    )
+    mock_service = MagicMock()
+
+    process_webhook_events_task(organization.id, calendar_service=mock_service)
+
+    mock_service.request_webhook_triggered_sync.assert_not_called()
+    with organization_context(organization):
+        assert set(CalendarWebhookEvent.objects.values_list("processing_status", flat=True)) == {
+            IncomingWebhookProcessingStatus.PENDING
+        }
+    countdown = mock_schedule_drain.call_args.kwargs["countdown"]
+    expected = (latest.created + WEBHOOK_SYNC_QUIET_PERIOD - timezone.now()).total_seconds()
+    assert countdown == pytest.approx(expected, abs=1)
+
+
+def test_process_webhook_events_task_syncs_a_burst_that_never_goes_quiet(
+    social_account, owned_calendar, organization
+):
+    first = _webhook_event(organization, owned_calendar.external_id, age=WEBHOOK_SYNC_MAX_DELAY)
+    _webhook_event(organization, owned_calendar.external_id, age=datetime.timedelta(seconds=1))
+    mock_service = MagicMock()
+    mock_service.request_webhook_triggered_sync.return_value = None
+
+    process_webhook_events_task(organization.id, calendar_service=mock_service)
+
+    assert (
+        mock_service.request_webhook_triggered_sync.call_args.kwargs["first_notified_at"]
+        == first.created
+    )
+
+
+@patch("calendar_integration.tasks.calendar_sync_tasks.schedule_webhook_drain")
+@patch("calendar_integration.tasks.calendar_sync_tasks.release_webhook_calendars")
+@patch("calendar_integration.tasks.calendar_sync_tasks.due_webhook_calendars")
+def test_process_webhook_events_task_claims_only_calendars_the_index_says_are_due(
+    mock_due, mock_release, mock_schedule_drain, social_account, owned_calendar, organization
+):
+    """With the debounce index, not-yet-due calendars' events are not even claimed."""
+    due_key = webhook_calendar_key(CalendarProvider.GOOGLE, owned_calendar.external_id)
+    mock_due.return_value = {due_key: 1.0}
+    due_event = _webhook_event(organization, owned_calendar.external_id)
+    waiting = _webhook_event(organization, "not-due-yet")
+    mock_service = MagicMock()
+    mock_service.request_webhook_triggered_sync.return_value = None
+
+    process_webhook_events_task(organization.id, calendar_service=mock_service)
+
+    mock_service.request_webhook_triggered_sync.assert_called_once()
+    mock_release.assert_called_once_with(organization.id, {due_key: 1.0})
+    with organization_context(organization):
+        due_event.refresh_from_db()
+        waiting.refresh_from_db()
+    assert due_event.processing_status == IncomingWebhookProcessingStatus.IGNORED
+    assert waiting.processing_status == IncomingWebhookProcessingStatus.PENDING
+    mock_schedule_drain.assert_called_once()
+
+
+def test_process_webhook_events_task_commits_its_claim_before_requesting_syncs(
+    social_account, owned_calendar, organization
+):
+    """The sync requests run with the claim committed: the events are stamped as
+    claimed, and a drain racing this one finds nothing to claim."""
+    event = _webhook_event(organization, owned_calendar.external_id)
+    seen = {}
+
+    def request_sync(**kwargs):
+        with organization_context(organization):
+            seen["claimed_at"] = CalendarWebhookEvent.objects.get(id=event.id).processed_at
+            seen["racing_claim"] = claim_pending_webhook_events(
+                organization.id, now=timezone.now()
+            ).events
+        return None
+
+    mock_service = MagicMock()
+    mock_service.request_webhook_triggered_sync.side_effect = request_sync
+
+    process_webhook_events_task(organization.id, calendar_service=mock_service)
+
+    assert seen["claimed_at"] is not None
+    assert seen["racing_claim"] == []
+    with organization_context(organization):
+        event.refresh_from_db()
+    assert event.processing_status == IncomingWebhookProcessingStatus.IGNORED
+
+
+def test_claim_of_a_drain_that_died_runs_out(organization):
+    event = _webhook_event(organization, "cal_123")
+    now = timezone.now()
+    assert claim_pending_webhook_events(organization.id, now=now).events == [event]
+
+    assert claim_pending_webhook_events(organization.id, now=now).events == []
+    later = now + WEBHOOK_CLAIM_LEASE + datetime.timedelta(seconds=1)
+    assert claim_pending_webhook_events(organization.id, now=later).events == [event]
+
+
+@patch("calendar_integration.tasks.calendar_sync_tasks.schedule_webhook_drain")
+@patch("calendar_integration.tasks.calendar_sync_tasks.WEBHOOK_DRAIN_BATCH_SIZE", 2)
+def test_process_webhook_events_task_waits_out_a_full_batch_of_events_not_due(
+    mock_schedule_drain, social_account, owned_calendar, organization
+):
+    """Only a full batch of settled events calls for the next drain at once."""
+    latest = None
+    for _ in range(2):
+        latest = _webhook_event(
+            organization, owned_calendar.external_id, age=datetime.timedelta(seconds=5)
+        )
+
+    with patch.object(process_webhook_events_task, "delay") as mock_delay:
+        process_webhook_events_task(organization.id, calendar_service=MagicMock())
+
+    mock_delay.assert_not_called()
+    countdown = mock_schedule_drain.call_args.kwargs["countdown"]
+    expected = (latest.created + WEBHOOK_SYNC_QUIET_PERIOD - timezone.now()).total_seconds()
+    assert countdown == pytest.approx(expected, abs=1)
+
+
+def _owned_by(organization, user, external_id):
+    calendar = baker.make(
+        Calendar,
+        organization=organization,
+        provider=CalendarProvider.GOOGLE,
+        external_id=external_id,
+    )
+    baker.make(
+        CalendarOwnership,
+        organization=organization,
+        calendar=calendar,
+        membership_user_id=user.id,
+        is_default=True,
+    )
+    return calendar
+
+
+def test_resync_organization_calendars_task_authenticates_once_per_account(
+    social_account, owned_calendar, organization
+):
+    """Calendars are requested in per-account batches, each account authenticated once."""
+    other_user = User.objects.create_user(email="other@example.com", password="testpass123")
+    other_account = SocialAccount.objects.create(
+        user=other_user, provider=CalendarProvider.GOOGLE, uid="67890"
+    )
+    baker.make(OrganizationMembership, organization=organization, user=other_user, is_active=True)
+    second_calendar = _owned_by(organization, social_account.user, "cal_456")
+    other_calendar = _owned_by(organization, other_user, "cal_789")
+    baker.make(
+        Calendar, organization=organization, provider=CalendarProvider.GOOGLE, external_id="unowned"
+    )
+    mock_service = MagicMock()
+
+    from di_core.containers import container
+
+    with container.calendar_service.override(mock_service):
+        resync_organization_calendars_task(organization.id)
+
+    assert sorted(
+        call.kwargs["account"].id for call in mock_service.authenticate.call_args_list
+    ) == sorted([social_account.id, other_account.id])
+    requested = [
+        call.kwargs["calendar"] for call in mock_service.request_calendar_sync.call_args_list
+    ]
+    assert sorted(calendar.id for calendar in requested) == sorted(
+        [owned_calendar.id, second_calendar.id, other_calendar.id]
+    )
+    windows = {
+        (call.kwargs["start_datetime"], call.kwargs["end_datetime"])
+        for call in mock_service.request_calendar_sync.call_args_list
+    }
+    assert len(windows) == 1
+
+
+def test_resync_account_calendars_task_reports_what_it_requested(
+    social_account, owned_calendar, organization
+):
+    now = timezone.now()
+    mock_service = MagicMock()
+
+    summary = resync_account_calendars_task(
+        organization.id,
+        [[social_account.id, [owned_calendar.id, 999_999]], [999_998, [owned_calendar.id]]],
+        now.isoformat(),
+        (now + datetime.timedelta(days=1)).isoformat(),
+        calendar_service=mock_service,
+    )
+
+    assert summary == {"requested": 1, "skipped": 2}
+    mock_service.authenticate.assert_called_once_with(
+        account=social_account, organization=organization
+    )
+
+
+def test_renew_webhook_subscriptions_task_fans_out_one_task_per_account(
+    social_account, owned_calendar, organization
+):
+    second_calendar = _owned_by(organization, social_account.user, "cal_456")
+    expiring = [
+        baker.make(
+            CalendarWebhookSubscription,
+            organization=organization,
+            calendar=calendar,
+            provider=CalendarProvider.GOOGLE,
+            expires_at=timezone.now() + datetime.timedelta(hours=hours),
+        )
+        for calendar, hours in ((owned_calendar, 2), (second_calendar, 3))
+    ]
+    baker.make(
+        CalendarWebhookSubscription,
+        organization=organization,
+        calendar=_owned_by(organization, social_account.user, "cal_789"),
+        provider=CalendarProvider.GOOGLE,
+        expires_at=timezone.now() + datetime.timedelta(days=5),
+    )
+
+    with patch(
+        "calendar_integration.tasks.calendar_sync_tasks.renew_account_webhook_subscriptions_task"
+    ) as mock_renew:
+        renew_webhook_subscriptions_task()
+
+    mock_renew.delay.assert_called_once_with(
+        organization.id, social_account.id, [subscription.id for subscription in expiring]
+    )
+
+
+def test_renew_account_webhook_subscriptions_task_authenticates_once(social_account, organization):
+    mock_service = MagicMock()
+    mock_service.renew_webhook_subscriptions.return_value = WebhookRenewalSummary(
+        renewed=2, failed=1
+    )
+
+    summary = renew_account_webhook_subscriptions_task(
+        organization.id, social_account.id, [1, 2, 3], calendar_service=mock_service
+    )
+
+    assert summary == {"renewed": 2, "failed": 1}
+    mock_service.authenticate.assert_called_once_with(
+        account=social_account, organization=organization
+    )
+    mock_service.renew_webhook_subscriptions.assert_called_once_with([1, 2, 3])
+
+
+def test_renew_account_webhook_subscriptions_task_skips_a_missing_account(organization):
+    mock_service = MagicMock()
+
+    summary = renew_account_webhook_subscriptions_task(
+        organization.id, 999_999, [1], calendar_service=mock_service
+    )
+
+    assert summary is None
+    mock_service.renew_webhook_subscriptions.assert_not_called()
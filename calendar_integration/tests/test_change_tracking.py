@@ -0,0 +1,270 @@
+import datetime
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from calendar_integration.change_tracking import (
+    batched_calendar_change_versions,
+    bump_calendar_change_versions,
+    calendars_unchanged_since,
+    get_calendar_change_state,
+)
+from calendar_integration.constants import CalendarProvider, CalendarType, RSVPStatus
+from calendar_integration.models import (
+    AvailableTime,
+    BlockedTime,
+    Calendar,
+    CalendarEvent,
+    ChildrenCalendarRelationship,
+    EventExternalAttendance,
+    ExternalAttendee,
+    ResourceAllocation,
+)
+from calendar_integration.services.dataclasses import ExternalClientIdentifierData
+from calendar_integration.services.external_client_identifier_service import (
+    ExternalClientIdentifierService,
+)
+from organizations.models import Organization
+
+
+START = datetime.datetime(2025, 6, 2, 9, 0)
+END = datetime.datetime(2025, 6, 2, 10, 0)
+
+
+@pytest.fixture
+def organization():
+    return Organization.objects.create(name="Change Tracking Org")
+
+
+def _calendar(organization, external_id, calendar_type=CalendarType.PERSONAL):
+    return Calendar.objects.create(
+        name=external_id,
+        external_id=external_id,
+        provider=CalendarProvider.INTERNAL,
+        calendar_type=calendar_type,
+        organization=organization,
+    )
+
+
+def _version(calendar):
+    calendar.refresh_from_db(fields=["change_version", "changed_at"])
+    return calendar.change_version
+
+
+def _event(organization, calendar):
+    return CalendarEvent.objects.create(
+        calendar=calendar,
+        title="Standup",
+        start_time_tz_unaware=START,
+        end_time_tz_unaware=END,
+        timezone="UTC",
+        external_id="evt-1",
+        organization=organization,
+    )
+
+
+@pytest.mark.django_db
+class TestChangeVersionReceivers:
+    def test_event_save_and_delete_bump_the_calendar(self, organization):
+        calendar = _calendar(organization, "cal-1")
+        assert _version(calendar) == 0
+        assert calendar.changed_at is None
+
+        event = CalendarEvent.objects.create(
+            calendar=calendar,
+            title="Standup",
+            start_time_tz_unaware=START,
+            end_time_tz_unaware=END,
+            timezone="UTC",
+            external_id="evt-1",
+            organization=organization,
+        )
+        assert _version(calendar) == 1
+        assert calendar.changed_at is not None
+
+        event.title = "Renamed"
+        event.save()
+        assert _version(calendar) == 2
+
+        event.delete()
+        assert _version(calendar) == 3
+
+    def test_blocked_and_available_times_bump_the_calendar(self, organization):
+        calendar = _calendar(organization, "cal-1")
+
+        BlockedTime.objects.create(
+            calendar=calendar,
+            start_time_tz_unaware=START,
+            end_time_tz_unaware=END,
+            timezone="UTC",
+            organization=organization,
+        )
+        AvailableTime.objects.create(
+            calendar=calendar,
+            start_time_tz_unaware=START,
+            end_time_tz_unaware=END,
+            timezone="UTC",
+            organization=organization,
+        )
+
+        assert _version(calendar) == 2
+
+    def test_attendance_and_resource_allocation_saves_bump_their_calendars(self, organization):
+        calendar = _calendar(organization, "cal-1")
+        room = _calendar(organization, "room-1", CalendarType.RESOURCE)
+        event = _event(organization, calendar)
+        assert (_version(calendar), _version(room)) == (1, 0)
+
+        attendee = ExternalAttendee.objects.create(
+            organization=organization, email="guest@example.com"
+        )
+        attendance = EventExternalAttendance.objects.create(
+            organization=organization, event=event, external_attendee=attendee
+        )
+        assert _version(calendar) == 2
+
+        attendance.status = RSVPStatus.ACCEPTED
+        attendance.save()
+        assert _version(calendar) == 3
+
+        ResourceAllocation.objects.create(organization=organization, event=event, calendar=room)
+        assert (_version(calendar), _version(room)) == (4, 1)
+
+    def test_replacing_external_client_identifiers_bumps_the_calendars_showing_them(
+        self, organization
+    ):
+        calendar = _calendar(organization, "cal-1")
+        event = _event(organization, calendar)
+        attendee = ExternalAttendee.objects.create(
+            organization=organization, email="guest@example.com"
+        )
+        EventExternalAttendance.objects.create(
+            organization=organization, event=event, external_attendee=attendee
+        )
+        service = ExternalClientIdentifierService()
+        service.initialize(organization)
+        identifiers = [
+            ExternalClientIdentifierData(system="https://crm.example.com", identifier="1")
+        ]
+        version = _version(calendar)
+
+        service.replace_for_target(event, identifiers)
+        assert _version(calendar) == version + 1
+
+        service.replace_for_target(attendee, identifiers)
+        assert _version(calendar) == version + 2
+
+        # Nothing changed, nothing to invalidate.
+        service.replace_for_target(attendee, identifiers)
+        assert _version(calendar) == version + 2
+
+    def test_other_calendars_are_untouched(self, organization):
+        calendar = _calendar(organization, "cal-1")
+        other = _calendar(organization, "cal-2")
+
+        bump_calendar_change_versions(organization.id, [calendar.id, None])
+
+        assert _version(calendar) == 1
+        assert _version(other) == 0
+
+    def test_changed_at_is_the_wall_clock_of_each_bump_and_never_goes_back(self, organization):
+        """The whole test is one transaction, where ``Now()`` would barely move; each
+        bump is still stamped when it runs, and a stamp ahead of the clock is kept."""
+        calendar = _calendar(organization, "cal-1")
+
+        bump_calendar_change_versions(organization.id, [calendar.id])
+        _version(calendar)
+        first = calendar.changed_at
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_sleep(0.01)")
+        bump_calendar_change_versions(organization.id, [calendar.id])
+        _version(calendar)
+        assert calendar.changed_at > first
+
+        ahead = calendar.changed_at + datetime.timedelta(hours=1)
+        Calendar.original_manager.filter(id=calendar.id).update(changed_at=ahead)
+        bump_calendar_change_versions(organization.id, [calendar.id])
+        _version(calendar)
+        assert calendar.changed_at == ahead
+
+
+@pytest.mark.django_db
+class TestBatchedChangeVersions:
+    def test_batch_collapses_bumps_into_one_update(self, organization):
+        calendar = _calendar(organization, "cal-1")
+
+        with CaptureQueriesContext(connection) as queries:
+            with batched_calendar_change_versions():
+                for index in range(3):
+                    BlockedTime.objects.create(
+                        calendar=calendar,
+                        start_time_tz_unaware=START,
+                        end_time_tz_unaware=END,
+                        timezone="UTC",
+                        external_id=f"block-{index}",
+                        organization=organization,
+                    )
+                with batched_calendar_change_versions():
+                    bump_calendar_change_versions(organization.id, [calendar.id])
+
+        bumps = [q for q in queries.captured_queries if "change_version" in q["sql"]]
+        assert len(bumps) == 1
+        assert _version(calendar) == 1
+
+    def test_batch_that_raises_does_not_bump(self, organization):
+        calendar = _calendar(organization, "cal-1")
+
+        with pytest.raises(RuntimeError), batched_calendar_change_versions():
+            bump_calendar_change_versions(organization.id, [calendar.id])
+            raise RuntimeError
+
+        assert _version(calendar) == 0
+
+
+@pytest.mark.django_db
+class TestCalendarChangeState:
+    def test_etag_changes_with_version_and_variant(self, organization):
+        calendar = _calendar(organization, "cal-1")
+
+        first = get_calendar_change_state(organization.id, [calendar.id], variant="a")
+        assert first.etag.startswith('W/"')
+        assert first.last_modified is None
+        assert get_calendar_change_state(organization.id, [calendar.id], variant="a") == first
+        assert get_calendar_change_state(organization.id, [calendar.id], "b").etag != first.etag
+
+        bump_calendar_change_versions(organization.id, [calendar.id])
+
+        second = get_calendar_change_state(organization.id, [calendar.id], variant="a")
+        assert second.etag != first.etag
+        assert second.last_modified is not None
+
+    def test_bundle_children_are_part_of_the_state(self, organization):
+        bundle = _calendar(organization, "bundle", calendar_type=CalendarType.BUNDLE)
+        child = _calendar(organization, "child")
+        ChildrenCalendarRelationship.objects.create(
+            bundle_calendar=bundle, child_calendar=child, organization=organization
+        )
+        before = get_calendar_change_state(organization.id, [bundle.id])
+
+        bump_calendar_change_versions(organization.id, [child.id])
+
+        assert get_calendar_change_state(organization.id, [bundle.id]).etag != before.etag
+
+    def test_calendars_unchanged_since(self, organization):
+        calendar = _calendar(organization, "cal-1")
+        # Never written since tracking started: nothing can be promised.
+        assert not calendars_unchanged_since(
+            organization.id, [calendar.id], datetime.datetime.now(datetime.UTC)
+        )
+
+        bump_calendar_change_versions(organization.id, [calendar.id])
+        calendar.refresh_from_db()
+
+        assert calendars_unchanged_since(organization.id, [calendar.id], calendar.changed_at)
+        assert not calendars_unchanged_since(
+            organization.id,
+            [calendar.id],
+            calendar.changed_at - datetime.timedelta(seconds=1),
+        )
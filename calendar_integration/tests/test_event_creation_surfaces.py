@@ -19,6 +19,7 @@ units of headroom, one over five Google children costs 1 -- because a
 """
 
 import base64
+import contextlib
 import datetime
 from unittest.mock import Mock, patch
 
@@ -251,6 +252,7 @@ def mock_google_adapter():
     ) as mock_adapter_class:
         mock_adapter = Mock()
         mock_adapter.provider = CalendarProvider.GOOGLE
+        mock_adapter.batch_writes.return_value = contextlib.nullcontext()
         del mock_adapter.resolve_expression
         del mock_adapter.get_source_expressions
         mock_adapter_class.return_value = mock_adapter
@@ -828,6 +830,7 @@ def _sync_setup(organization: Organization) -> tuple[CalendarSyncService, Calend
     facade.account = Mock(name="fake-social-account")
     facade.calendar_adapter = Mock(name="fake-calendar-adapter")
     facade.calendar_adapter.get_events.return_value = {"events": [], "next_sync_token": None}
+    facade.calendar_adapter.batch_writes.return_value = contextlib.nullcontext()
     sync_service = CalendarSyncService(
         context=facade._build_context_snapshot(), calendar_cache={}, host=facade
     )
@@ -1025,6 +1028,7 @@ class TestBundleEventFanOutHeadroom:
             resources=[],
             original_payload={},
         )
+        fake_adapter.batch_writes.return_value = contextlib.nullcontext()
         facade.calendar_adapter = fake_adapter
 
         start = subscription.current_period_start + datetime.timedelta(days=1)
@@ -32,6 +32,7 @@ from calendar_integration.services.calendar_adapters.google_calendar_adapter imp
     GoogleCalendarAdapter,
 )
 from calendar_integration.services.calendar_service import CalendarService
+from calendar_integration.webhook_ingestion import WEBHOOK_DRAIN_DELAY
 from organizations.models import Organization
 from payments.seams.resource_keys import EXTERNAL_CALENDAR_GOOGLE
 
@@ -47,7 +48,9 @@ class GoogleCalendarAdapterWebhookTest(TestCase):
             "account_id": "test_account",
         }
 
-    @patch("calendar_integration.services.calendar_adapters.google_calendar_adapter.build")
+    @patch(
+        "calendar_integration.services.calendar_adapters.google_calendar_adapter.build_google_client"
+    )
     def test_validate_webhook_notification_valid(self, mock_build):
         """Test validation of valid Google webhook notification."""
         adapter = GoogleCalendarAdapter(self.credentials)
@@ -68,7 +71,9 @@ class GoogleCalendarAdapterWebhookTest(TestCase):
         assert result["event_type"] == "exists"
         assert result["channel_id"] == "test-channel-id"
 
-    @patch("calendar_integration.services.calendar_adapters.google_calendar_adapter.build")
+    @patch(
+        "calendar_integration.services.calendar_adapters.google_calendar_adapter.build_google_client"
+    )
     def test_validate_webhook_notification_missing_headers(self, mock_build):
         """Test validation with missing required headers."""
         adapter = GoogleCalendarAdapter(self.credentials)
@@ -83,7 +88,9 @@ class GoogleCalendarAdapterWebhookTest(TestCase):
         ):
             adapter.validate_webhook_notification(headers, "")
 
-    @patch("calendar_integration.services.calendar_adapters.google_calendar_adapter.build")
+    @patch(
+        "calendar_integration.services.calendar_adapters.google_calendar_adapter.build_google_client"
+    )
     def test_validate_webhook_notification_invalid_resource_uri(self, mock_build):
         """Test validation with invalid resource URI."""
         adapter = GoogleCalendarAdapter(self.credentials)
@@ -128,7 +135,9 @@ class GoogleCalendarAdapterWebhookTest(TestCase):
         with pytest.raises(WebhookIgnoredError, match="Skip sync notification"):
             GoogleCalendarAdapter.validate_webhook_notification_static(headers, "")
 
-    @patch("calendar_integration.services.calendar_adapters.google_calendar_adapter.build")
+    @patch(
+        "calendar_integration.services.calendar_adapters.google_calendar_adapter.build_google_client"
+    )
     @patch(
         "calendar_integration.services.calendar_adapters.google_calendar_adapter.write_quote_limiter"
     )
@@ -223,10 +232,9 @@ class CalendarServiceWebhookTest(TestCase):
         assert webhook_event.calendar_sync == result
 
     @patch("calendar_integration.tasks.sync_calendar_task.delay")
-    def test_request_webhook_triggered_sync_recent_sync_exists(self, mock_sync_task):
-        """Test webhook sync when recent sync already exists."""
-        # Create a recent sync
-        recent_sync = CalendarSync.objects.create(
+    def test_request_webhook_triggered_sync_after_recent_finished_sync(self, mock_sync_task):
+        """A sync that already ran does not answer for changes notified after it."""
+        CalendarSync.objects.create(
             calendar=self.calendar,
             organization=self.organization,
             start_datetime=datetime.datetime.now(tz=datetime.UTC) - datetime.timedelta(hours=12),
@@ -246,25 +254,67 @@ class CalendarServiceWebhookTest(TestCase):
 
         # Mock the calendar service as authenticated
         self.service.account = Mock()
+        self.service.account.id = 1
         self.service.calendar_adapter = Mock()
 
         result = self.service.request_webhook_triggered_sync(
             external_calendar_id="test-calendar-id", webhook_event=webhook_event
         )
 
-        # Should return the existing sync, not create a new one
-        assert result == recent_sync
+        assert result is not None
+        assert result.status == CalendarSyncStatus.NOT_STARTED
+        assert CalendarSync.objects.filter_by_organization(self.organization).count() == 2
 
-        # Check that no new sync was created
+    @patch("calendar_integration.tasks.sync_calendar_task.delay")
+    def test_request_webhook_triggered_sync_widens_queued_sync(self, mock_sync_task):
+        """A sync still queued is widened to the notified window instead of duplicated."""
+        now = datetime.datetime.now(tz=datetime.UTC)
+        queued_sync = CalendarSync.objects.create(
+            calendar=self.calendar,
+            organization=self.organization,
+            start_datetime=now - datetime.timedelta(hours=1),
+            end_datetime=now + datetime.timedelta(hours=1),
+            status=CalendarSyncStatus.NOT_STARTED,
+            should_update_events=False,
+        )
+
+        webhook_event = CalendarWebhookEvent.objects.create(
+            organization=self.organization,
+            provider=CalendarProvider.GOOGLE,
+            event_type="exists",
+            external_calendar_id="test-calendar-id",
+            external_event_id="",
+            raw_payload={"raw": ""},
+        )
+
+        # Mock the calendar service as authenticated
+        self.service.account = Mock()
+        self.service.calendar_adapter = Mock()
+
+        first_notified_at = now - datetime.timedelta(minutes=2)
+        result = self.service.request_webhook_triggered_sync(
+            external_calendar_id="test-calendar-id",
+            webhook_event=webhook_event,
+            first_notified_at=first_notified_at,
+        )
+
+        assert result == queued_sync
         assert CalendarSync.objects.filter_by_organization(self.organization).count() == 1
+        mock_sync_task.assert_not_called()
+        queued_sync.refresh_from_db()
+        assert queued_sync.start_datetime <= first_notified_at - datetime.timedelta(hours=12)
+        assert queued_sync.end_datetime >= now + datetime.timedelta(hours=12)
+        assert queued_sync.should_update_events is True
 
         # Verify webhook event was updated
         webhook_event.refresh_from_db()
         assert webhook_event.processing_status == IncomingWebhookProcessingStatus.PROCESSED
-        assert webhook_event.calendar_sync == recent_sync
+        assert webhook_event.calendar_sync == queued_sync
 
     @override_settings(GOOGLE_CLIENT_ID="test_client_id", GOOGLE_CLIENT_SECRET="test_client_secret")
-    @patch("calendar_integration.services.calendar_adapters.google_calendar_adapter.build")
+    @patch(
+        "calendar_integration.services.calendar_adapters.google_calendar_adapter.build_google_client"
+    )
     @patch(
         "calendar_integration.services.calendar_adapters.google_calendar_adapter.write_quote_limiter"
     )
@@ -392,13 +442,36 @@ class GoogleCalendarWebhookViewTest(TestCase):
 
         response = self.client.post(self.webhook_url, **headers)
 
-        assert response.status_code == 200
+        assert response.status_code == 202
         mock_handle_webhook.assert_called_once()
         # Verify the call was made with "google" as provider and HttpRequest as second argument
         args = mock_handle_webhook.call_args[0]
         assert args[0] == CalendarProvider.GOOGLE
         assert hasattr(args[1], "META")  # Check it's an HttpRequest object
 
+    @patch("calendar_integration.tasks.process_webhook_events_task.apply_async")
+    def test_google_webhook_records_pending_event_and_schedules_drain(self, mock_apply_async):
+        """The notification is only recorded; the drain that syncs it is scheduled."""
+        headers = {
+            "HTTP_X_GOOG_CHANNEL_ID": "test-channel-id",
+            "HTTP_X_GOOG_RESOURCE_ID": "test-resource-id",
+            "HTTP_X_GOOG_RESOURCE_URI": "https://www.googleapis.com/calendar/v3/calendars/test-calendar-id/events",
+            "HTTP_X_GOOG_RESOURCE_STATE": "exists",
+            "HTTP_X_GOOG_CHANNEL_TOKEN": "test-token",
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.webhook_url, **headers)
+
+        assert response.status_code == 202
+        webhook_event = CalendarWebhookEvent.objects.filter_by_organization(self.organization).get()
+        assert webhook_event.external_calendar_id == "test-calendar-id"
+        assert webhook_event.processing_status == IncomingWebhookProcessingStatus.PENDING
+        assert webhook_event.calendar_sync is None
+        mock_apply_async.assert_called_once_with(
+            (self.organization.id,), countdown=WEBHOOK_DRAIN_DELAY
+        )
+
     @patch("calendar_integration.services.calendar_service.CalendarService.handle_webhook")
     def test_google_webhook_missing_headers(self, mock_handle_webhook):
         """Test webhook with missing required headers."""
@@ -482,7 +555,7 @@ class GoogleCalendarWebhookIntegrationTest(TestCase):
 
         response = self.client.post(webhook_url, **headers)
 
-        assert response.status_code == 200
+        assert response.status_code == 202
 
         # Verify service was called correctly
         mock_handle_webhook.assert_called_once()
@@ -549,6 +622,10 @@ class GoogleCalendarWebhookOverLimitEntitlementTest(TestCase):
         (unmocked) calendar looked up, ``_get_write_adapter_for_calendar`` runs for
         real against the real, container-wired ``entitlement_service`` and is what
         raises the ``OverLimitError`` this test asserts does not escape as a 500.
+
+        Since ingestion became fast-ack the view resolves no calendar or adapter at
+        all -- the drain task does -- so this now guards that the lost entitlement
+        still does not keep the notification from being recorded.
         """
         mock_get_calendar.return_value = self.calendar
 
@@ -566,5 +643,5 @@ class GoogleCalendarWebhookOverLimitEntitlementTest(TestCase):
         response = self.client.post(self.webhook_url, **headers)
 
         assert response.status_code != 500
-        assert response.status_code == 200
+        assert response.status_code == 202
         assert CalendarWebhookEvent.objects.filter_by_organization(self.organization).exists()
@@ -24,6 +24,7 @@ def ms_credentials():
     return {
         "token": "test_token",
         "refresh_token": "test_refresh_token",
+        "account_id": "social-1",
     }
 
 
@@ -408,5 +409,34 @@ def test_microsoft_webhook_view_notification_processing(
 
     response = client.post(url, data=json.dumps(payload), content_type="application/json")
 
-    assert response.status_code == 200
+    assert response.status_code == 202
     mock_handle_webhook.assert_called_once_with(CalendarProvider.MICROSOFT, response.wsgi_request)
+
+
+@pytest.mark.django_db
+def test_microsoft_webhook_view_records_one_event_per_notification(client, organization):
+    """A batched Graph notification is recorded per calendar, pending the drain."""
+    url = f"/api/webhooks/microsoft-calendar/{organization.id}/"
+    payload = {
+        "value": [
+            {
+                "subscriptionId": "test-sub-123",
+                "changeType": "created",
+                "resource": f"/me/calendars/calendar{index}/events/event{index}",
+                "clientState": "test-client-state",
+            }
+            for index in range(2)
+        ]
+    }
+
+    response = client.post(url, data=json.dumps(payload), content_type="application/json")
+
+    assert response.status_code == 202
+    events = CalendarWebhookEvent.objects.filter_by_organization(organization).order_by("id")
+    assert [(event.external_calendar_id, event.external_event_id) for event in events] == [
+        ("calendar0", "event0"),
+        ("calendar1", "event1"),
+    ]
+    assert {event.processing_status for event in events} == {
+        IncomingWebhookProcessingStatus.PENDING
+    }
@@ -17,6 +17,7 @@ from calendar_integration.models import (
     EventBulkModification,
     EventRecurrenceException,
     RecurrenceRule,
+    RecurringOccurrence,
 )
 
 
@@ -234,6 +235,85 @@ def test_calendar_event_get_occurrences_in_range_with_modified_exception():
     assert occurrences[1].start_time == _dt(2025, 1, 2, 10)
 
 
+@pytest.mark.django_db
+def test_occurrence_views_read_through_master_and_keep_exception_rows():
+    org = baker.make("organizations.Organization")
+    cal = baker.make(
+        "calendar_integration.Calendar", organization=org, external_id=baker.seq("cal")
+    )
+    start = _dt(2025, 1, 1)
+    rule = baker.make(
+        RecurrenceRule,
+        organization=org,
+        frequency=RecurrenceFrequency.DAILY,
+        interval=1,
+        count=3,
+    )
+    parent = baker.make(
+        CalendarEvent,
+        calendar_fk=cal,
+        organization=org,
+        title="Parent",
+        start_time_tz_unaware=start,
+        end_time_tz_unaware=start + datetime.timedelta(minutes=45),
+        timezone="America/Sao_Paulo",
+        recurrence_rule_fk=rule,
+        external_id="parent",
+        meta={"latest_original_payload": {"id": "parent"}},
+    )
+    modified = baker.make(
+        CalendarEvent,
+        calendar=cal,
+        organization=org,
+        title="Parent (Modified)",
+        start_time_tz_unaware=_dt(2025, 1, 2, 10),
+        end_time_tz_unaware=_dt(2025, 1, 2, 11),
+        timezone="UTC",
+        parent_recurring_object=parent,
+        is_recurring_exception=True,
+        external_id="modified",
+    )
+    parent.create_exception(
+        exception_date=parent.start_time + datetime.timedelta(days=1),
+        is_cancelled=False,
+        modified_object=modified,
+    )
+
+    views = parent.get_occurrence_views_in_range(
+        _dt(2024, 12, 31), _dt(2025, 1, 5), include_self=False
+    )
+    instances = parent.get_occurrences_in_range(
+        _dt(2024, 12, 31), _dt(2025, 1, 5), include_self=False
+    )
+
+    assert [type(v) for v in views] == [RecurringOccurrence, CalendarEvent, RecurringOccurrence]
+    assert views[1].id == modified.id
+    generated = views[0]
+    # Shared fields come from the master; per-row fields keep an unsaved row's defaults.
+    assert generated.master is parent
+    assert generated.title == "Parent"
+    assert generated.calendar_fk_id == cal.id
+    assert generated.recurrence_rule == rule
+    assert generated.id is None
+    assert generated.external_id == ""
+    assert generated.meta == {}
+    assert generated.parent_recurring_object is None
+    with pytest.raises(AttributeError):
+        generated.save  # noqa: B018
+
+    # The view carries the same values as the instance the list API still builds.
+    instance = instances[0]
+    assert isinstance(instance, CalendarEvent)
+    for field in ("start_time", "end_time", "recurrence_id", "timezone", "title"):
+        assert getattr(generated, field) == getattr(instance, field)
+    assert generated.start_time_tz_unaware == instance.start_time_tz_unaware
+    assert generated.end_time_tz_unaware == instance.end_time_tz_unaware
+    built = generated.to_instance()
+    assert isinstance(built, CalendarEvent)
+    assert built.pk is None
+    assert (built.start_time, built.end_time) == (instance.start_time, instance.end_time)
+
+
 @pytest.mark.django_db
 def test_calendar_event_create_exception_updates_existing():
     org = baker.make("organizations.Organization")
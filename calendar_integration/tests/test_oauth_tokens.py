@@ -0,0 +1,92 @@
+import datetime
+from unittest.mock import Mock
+
+from django.db import transaction
+from django.utils import timezone
+
+import pytest
+from allauth.socialaccount.models import SocialAccount, SocialToken
+
+from calendar_integration.constants import CalendarProvider
+from calendar_integration.oauth_tokens import TOKEN_REFRESH_MARGIN, fresh_social_token
+from calendar_integration.services.dataclasses import RefreshedOAuthToken
+from users.models import User
+
+
+@pytest.fixture
+def social_account(db):
+    user = User.objects.create_user(email="oauth@example.com", password="testpass123")
+    return SocialAccount.objects.create(user=user, provider=CalendarProvider.MICROSOFT, uid="1")
+
+
+def _token(social_account, expires_in, token_secret="refresh-1"):
+    return SocialToken.objects.create(
+        account=social_account,
+        token="access-1",
+        token_secret=token_secret,
+        expires_at=timezone.now() + expires_in,
+    )
+
+
+def _refresh(token="access-2", refresh_token="refresh-2"):
+    return Mock(
+        return_value=RefreshedOAuthToken(
+            token=token,
+            expires_at=timezone.now() + datetime.timedelta(hours=1),
+            refresh_token=refresh_token,
+        )
+    )
+
+
+def test_fresh_token_is_used_as_stored(social_account):
+    social_token = _token(social_account, TOKEN_REFRESH_MARGIN + datetime.timedelta(minutes=1))
+    refresh = _refresh()
+
+    assert fresh_social_token(social_token, refresh).token == "access-1"
+    refresh.assert_not_called()
+
+
+def test_expiring_token_is_refreshed_and_stored(social_account):
+    social_token = _token(social_account, datetime.timedelta(minutes=1))
+    refresh = _refresh()
+
+    fresh_social_token(social_token, refresh)
+
+    refresh.assert_called_once_with("refresh-1")
+    stored = SocialToken.objects.get(id=social_token.id)
+    assert (stored.token, stored.token_secret) == ("access-2", "refresh-2")
+    assert stored.expires_at == social_token.expires_at
+
+
+def test_concurrent_callers_refresh_once(social_account):
+    """Callers that loaded the row before the first refresh landed reuse its token."""
+    social_token = _token(social_account, -datetime.timedelta(minutes=5))
+    stale_copies = [SocialToken.objects.get(id=social_token.id) for _ in range(3)]
+    refresh = _refresh()
+
+    tokens = [fresh_social_token(copy, refresh).token for copy in stale_copies]
+
+    assert tokens == ["access-2"] * 3
+    refresh.assert_called_once_with("refresh-1")
+
+
+def test_token_without_refresh_token_is_left_to_the_adapter(social_account):
+    social_token = _token(social_account, -datetime.timedelta(minutes=5), token_secret="")
+    refresh = _refresh()
+
+    assert fresh_social_token(social_token, refresh).token == "access-1"
+    refresh.assert_not_called()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_refreshed_token_is_committed_before_the_callers_transaction(social_account):
+    """Workers waiting on the lock read the token the moment it is released, however
+    long the request that refreshed it goes on -- or if it rolls back."""
+    social_token = _token(social_account, datetime.timedelta(minutes=1))
+
+    with pytest.raises(RuntimeError), transaction.atomic():
+        fresh_social_token(social_token, _refresh())
+        raise RuntimeError("the request fails after building its adapter")
+
+    stored = SocialToken.objects.get(id=social_token.id)
+    assert (stored.token, stored.token_secret) == ("access-2", "refresh-2")
@@ -0,0 +1,62 @@
+import pytest
+from allauth.socialaccount.models import SocialAccount
+from model_bakery import baker
+
+from calendar_integration.constants import CalendarProvider
+from calendar_integration.models import Calendar, CalendarOwnership
+from calendar_integration.organization_resync import plan_organization_resync
+from organizations.models import Organization, OrganizationMembership
+from users.models import User
+
+
+@pytest.fixture
+def organization(db):
+    return Organization.objects.create(name="Resync Org")
+
+
+def _account_owning(organization, email, calendar_count):
+    user = User.objects.create_user(email=email, password="testpass123")
+    account = SocialAccount.objects.create(user=user, provider=CalendarProvider.GOOGLE, uid=email)
+    baker.make(OrganizationMembership, organization=organization, user=user, is_active=True)
+    for index in range(calendar_count):
+        calendar = baker.make(
+            Calendar,
+            organization=organization,
+            provider=CalendarProvider.GOOGLE,
+            external_id=f"{email}-{index}",
+        )
+        baker.make(
+            CalendarOwnership,
+            organization=organization,
+            calendar=calendar,
+            membership_user_id=user.id,
+            is_default=True,
+        )
+    return account
+
+
+def test_plan_keeps_each_account_in_one_batch_and_balances_the_batches(
+    organization, django_assert_max_num_queries
+):
+    busy = _account_owning(organization, "busy@example.com", 4)
+    quiet = [_account_owning(organization, f"q{i}@example.com", 1) for i in range(3)]
+    unowned = baker.make(
+        Calendar, organization=organization, provider=CalendarProvider.GOOGLE, external_id="unowned"
+    )
+
+    with django_assert_max_num_queries(3):
+        plan = plan_organization_resync(organization.id, max_parallel=2)
+
+    assert plan.unresolved_calendar_ids == [unowned.id]
+    assert plan.calendar_count == 7
+    batch_accounts = [{account_id for account_id, _ in batch} for batch in plan.batches]
+    assert batch_accounts == [{busy.id}, {account.id for account in quiet}]
+
+
+def test_plan_runs_no_more_batches_than_accounts(organization):
+    account = _account_owning(organization, "only@example.com", 2)
+
+    plan = plan_organization_resync(organization.id)
+
+    assert len(plan.batches) == 1
+    assert plan.batches[0][0][0] == account.id
@@ -0,0 +1,89 @@
+import datetime
+from unittest.mock import MagicMock
+
+from calendar_integration.exceptions import SyncTokenExpiredError
+from calendar_integration.models import CalendarSync
+from calendar_integration.outlook_room_sync import fetch_room_deltas
+from calendar_integration.services.dataclasses import ResumableSyncToken
+
+
+START = datetime.datetime(2025, 6, 2, 0, 0, tzinfo=datetime.UTC)
+END = datetime.datetime(2025, 6, 3, 0, 0, tzinfo=datetime.UTC)
+
+
+def test_a_room_whose_token_expired_fetches_its_whole_window():
+    adapter = MagicMock()
+    adapter.get_room_events_delta.side_effect = [
+        SyncTokenExpiredError(),
+        {"events": ["event"], "next_sync_token": "$deltatoken=fresh"},
+    ]
+    calendar_sync = CalendarSync(start_datetime=START, end_datetime=END)
+
+    token = ResumableSyncToken("stale", START, END)
+
+    [delta] = fetch_room_deltas(adapter, [(calendar_sync, "room@example.com", token)])
+
+    assert delta.error is None
+    assert delta.prefetched.sync_token is None
+    assert delta.prefetched.events == ["event"]
+    assert delta.prefetched.next_sync_token == "$deltatoken=fresh"
+    assert [c.args for c in adapter.get_room_events_delta.call_args_list] == [
+        ("room@example.com", START, END, "stale"),
+        ("room@example.com", START, END),
+    ]
+
+
+def test_a_room_resumes_its_round_and_carries_the_round_s_window():
+    adapter = MagicMock()
+    adapter.get_room_events_delta.return_value = {"events": [], "next_sync_token": "next"}
+    calendar_sync = CalendarSync(start_datetime=START, end_datetime=END)
+    round_start = START - datetime.timedelta(days=1)
+
+    [delta] = fetch_room_deltas(
+        adapter, [(calendar_sync, "room@example.com", ResumableSyncToken("t", round_start, END))]
+    )
+
+    assert delta.prefetched.sync_token == "t"
+    assert adapter.get_room_events_delta.call_args.args == ("room@example.com", START, END, "t")
+    assert (calendar_sync.sync_token_window_start, calendar_sync.sync_token_window_end) == (
+        round_start,
+        END,
+    )
+
+
+def test_a_room_whose_token_does_not_span_the_window_starts_a_fresh_round():
+    """Graph's delta round reports nothing outside the window it was started over."""
+    adapter = MagicMock()
+    adapter.get_room_events_delta.return_value = {"events": [], "next_sync_token": "fresh"}
+    calendar_sync = CalendarSync(start_datetime=START, end_datetime=END)
+    narrower = ResumableSyncToken("t", START, END - datetime.timedelta(hours=1))
+    unknown = ResumableSyncToken("legacy")
+
+    deltas = fetch_room_deltas(
+        adapter,
+        [(calendar_sync, "a@example.com", narrower), (calendar_sync, "b@example.com", unknown)],
+    )
+
+    assert [delta.prefetched.sync_token for delta in deltas] == [None, None]
+    assert sorted(c.args for c in adapter.get_room_events_delta.call_args_list) == [
+        ("a@example.com", START, END),
+        ("b@example.com", START, END),
+    ]
+
+
+def test_a_failed_fetch_is_reported_with_its_room():
+    adapter = MagicMock()
+    adapter.get_room_events_delta.side_effect = [
+        ValueError("Failed to get room events"),
+        {"events": [], "next_sync_token": "$deltatoken=ok"},
+    ]
+    failing = CalendarSync(start_datetime=START, end_datetime=END)
+    ok = CalendarSync(start_datetime=START, end_datetime=END)
+
+    deltas = fetch_room_deltas(
+        adapter, [(failing, "a@example.com", None), (ok, "b@example.com", None)], max_concurrency=1
+    )
+
+    assert [delta.calendar_sync for delta in deltas] == [failing, ok]
+    assert isinstance(deltas[0].error, ValueError)
+    assert deltas[1].prefetched.next_sync_token == "$deltatoken=ok"
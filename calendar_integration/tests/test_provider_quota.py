@@ -0,0 +1,68 @@
+import pytest
+from pyrate_limiter import Duration, Rate
+
+from calendar_integration.exceptions import ProviderQuotaExceededError
+from calendar_integration.provider_quota import (
+    ProviderQuota,
+    ProviderQuotaMetrics,
+    provider_quota_metrics,
+)
+
+
+def _quota(name, project_limit=10, account_limit=1):
+    return ProviderQuota(
+        name,
+        project_rates=[Rate(project_limit, Duration.MINUTE)],
+        account_rates=[Rate(account_limit, Duration.MINUTE * 10)],
+        max_delay=10,
+    )
+
+
+def test_account_bucket_throttles_only_its_account():
+    quota = _quota("test_quota_per_account")
+
+    quota.acquire("account-a")
+    with pytest.raises(ProviderQuotaExceededError) as exc_info:
+        quota.acquire("account-a")
+    quota.acquire("account-b")
+
+    assert exc_info.value.retry_after == 60
+    assert quota.metrics() == ProviderQuotaMetrics(granted=2, throttled=1, waiting=0)
+
+
+def test_project_bucket_is_shared_by_every_account():
+    quota = _quota("test_quota_per_project", project_limit=1, account_limit=5)
+
+    quota.acquire("account-a")
+    with pytest.raises(ProviderQuotaExceededError):
+        quota.acquire("account-b")
+
+    assert provider_quota_metrics()["test_quota_per_project"].throttled == 1
+
+
+def test_a_call_the_project_refuses_leaves_the_account_bucket_untouched():
+    quota = _quota("test_quota_project_first", project_limit=1, account_limit=1)
+
+    quota.acquire("account-a")
+    with pytest.raises(ProviderQuotaExceededError):
+        quota.acquire("account-b")
+
+    # account-b's single permit was never spent.
+    assert quota._account_limiter("account-b").try_acquire("account-b", 1)
+
+
+def test_account_buckets_are_kept_least_recently_used_first():
+    quota = ProviderQuota(
+        "test_quota_lru",
+        project_rates=[Rate(10, Duration.MINUTE)],
+        account_rates=[Rate(5, Duration.MINUTE)],
+        max_delay=10,
+        max_accounts=2,
+    )
+
+    quota.acquire("account-a")
+    quota.acquire("account-b")
+    quota.acquire("account-a")
+    quota.acquire("account-c")
+
+    assert list(quota._account_limiters) == ["account-a", "account-c"]
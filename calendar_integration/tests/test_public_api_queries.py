@@ -304,6 +304,44 @@ class TestCalendarQueries:
         assert result == []
         mock_dependencies.calendar_service.get_availability_windows_in_range.assert_called_once()
 
+    def test_availability_windows_if_changed_since_skips_unchanged_calendar(
+        self, mock_request, calendar, mock_dependencies
+    ) -> None:
+        """``ifChangedSince`` resolves to null until the calendar changes again."""
+        start_datetime = timezone.now()
+        end_datetime = start_datetime + datetime.timedelta(days=7)
+        mock_dependencies.calendar_service.get_availability_windows_in_range.return_value = []
+        Calendar.objects.filter_by_organization(calendar.organization_id).filter(
+            pk=calendar.pk
+        ).bump_change_version()
+        calendar.refresh_from_db()
+
+        mock_info = Mock()
+        mock_info.context = Mock()
+        mock_info.context.request = mock_request
+        mock_request.public_api_organization = mock_request.organization
+
+        with patch("public_api.queries.get_query_dependencies", return_value=mock_dependencies):
+            query = Query()
+            unchanged = query.availability_windows(
+                info=mock_info,
+                calendar_id=calendar.id,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+                if_changed_since=calendar.changed_at,
+            )
+            changed = query.availability_windows(
+                info=mock_info,
+                calendar_id=calendar.id,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+                if_changed_since=calendar.changed_at - datetime.timedelta(seconds=1),
+            )
+
+        assert unchanged is None
+        assert changed == []
+        mock_dependencies.calendar_service.get_availability_windows_in_range.assert_called_once()
+
     def test_unavailable_windows_query_success(
         self, mock_request, calendar, mock_dependencies
     ) -> None:
@@ -0,0 +1,211 @@
+import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from allauth.socialaccount.models import SocialAccount
+from model_bakery import baker
+
+from calendar_integration import sync_scheduling
+from calendar_integration.constants import (
+    CalendarProvider,
+    CalendarSyncStatus,
+    CalendarSyncTriggerSource,
+)
+from calendar_integration.models import (
+    Calendar,
+    CalendarOwnership,
+    CalendarSync,
+    CalendarWebhookEvent,
+)
+from calendar_integration.sync_scheduling import (
+    MAX_SCHEDULED_SYNC_INTERVAL,
+    MIN_SCHEDULED_SYNC_INTERVAL,
+    plan_scheduled_syncs,
+    record_sync_outcome,
+    sync_interval_for_rate,
+)
+from calendar_integration.tasks.calendar_sync_tasks import (
+    request_scheduled_calendar_syncs_task,
+    schedule_calendar_syncs_task,
+)
+from organizations.models import Organization, OrganizationMembership
+from users.models import User
+
+
+NOW = datetime.datetime(2025, 6, 2, 12, 0, tzinfo=datetime.UTC)
+
+
+@pytest.fixture
+def organization():
+    return Organization.objects.create(name="Scheduling Org")
+
+
+def _owned_calendar(organization, external_id, social_account, **fields):
+    calendar = Calendar.objects.create(
+        name=external_id,
+        external_id=external_id,
+        organization=organization,
+        **{"provider": CalendarProvider.GOOGLE, **fields},
+    )
+    if not OrganizationMembership.objects.filter(
+        organization=organization, user=social_account.user
+    ).exists():
+        baker.make(
+            OrganizationMembership,
+            organization=organization,
+            user=social_account.user,
+            is_active=True,
+        )
+    baker.make(
+        CalendarOwnership,
+        organization=organization,
+        calendar=calendar,
+        membership_user_id=social_account.user_id,
+        is_default=True,
+    )
+    return calendar
+
+
+def _google_account(email):
+    user = User.objects.create_user(email=email, password="testpass123")
+    return SocialAccount.objects.create(user=user, provider=CalendarProvider.GOOGLE, uid=email)
+
+
+def test_sync_interval_for_rate_is_clamped():
+    assert sync_interval_for_rate(0) == MAX_SCHEDULED_SYNC_INTERVAL
+    assert sync_interval_for_rate(1000) == MIN_SCHEDULED_SYNC_INTERVAL
+    assert sync_interval_for_rate(2) == datetime.timedelta(minutes=30)
+
+
+@pytest.mark.django_db
+class TestRecordSyncOutcome:
+    def _successful_sync(self, calendar, created, **counts):
+        sync = CalendarSync.objects.create(
+            calendar=calendar,
+            organization=calendar.organization,
+            start_datetime=NOW,
+            end_datetime=NOW,
+            should_update_events=True,
+            status=CalendarSyncStatus.SUCCESS,
+            **counts,
+        )
+        CalendarSync.objects.filter_by_organization(calendar.organization_id).filter(
+            pk=sync.pk
+        ).update(created=created)
+        return sync
+
+    def test_first_sync_only_schedules_the_next_one(self, organization):
+        calendar = _owned_calendar(organization, "cal-1", _google_account("a@example.com"))
+        sync = self._successful_sync(calendar, NOW, events_created=40)
+
+        record_sync_outcome(sync, NOW)
+
+        calendar.refresh_from_db()
+        assert calendar.sync_change_rate == 0
+        assert calendar.next_scheduled_sync_at == NOW + MAX_SCHEDULED_SYNC_INTERVAL
+
+    def test_changes_and_webhooks_feed_the_rate(self, organization):
+        calendar = _owned_calendar(organization, "cal-1", _google_account("a@example.com"))
+        self._successful_sync(calendar, NOW - datetime.timedelta(hours=2))
+        sync = self._successful_sync(calendar, NOW, events_created=1, events_updated=1)
+        for _ in range(10):
+            webhook_event = baker.make(
+                CalendarWebhookEvent,
+                organization=organization,
+                provider=CalendarProvider.GOOGLE,
+                external_calendar_id="cal-1",
+                raw_payload={},
+            )
+            CalendarWebhookEvent.objects.filter_by_organization(organization.id).filter(
+                pk=webhook_event.pk
+            ).update(created=NOW - datetime.timedelta(hours=1))
+
+        record_sync_outcome(sync, NOW)
+
+        calendar.refresh_from_db()
+        # Ten notifications over two hours outweigh the two rows the sync wrote.
+        assert calendar.sync_change_rate == pytest.approx(0.3 * 5)
+        assert calendar.next_scheduled_sync_at == NOW + sync_interval_for_rate(1.5)
+
+
+@pytest.mark.django_db
+class TestPlanScheduledSyncs:
+    def test_hot_calendars_go_first_within_the_account_budget(self, organization):
+        account = _google_account("a@example.com")
+        overdue = NOW - datetime.timedelta(hours=1)
+        cold = _owned_calendar(
+            organization, "cold", account, sync_change_rate=0.1, next_scheduled_sync_at=overdue
+        )
+        hot = _owned_calendar(
+            organization, "hot", account, sync_change_rate=10, next_scheduled_sync_at=overdue
+        )
+        not_due = _owned_calendar(
+            organization,
+            "not-due",
+            account,
+            sync_change_rate=10,
+            next_scheduled_sync_at=NOW + datetime.timedelta(minutes=1),
+        )
+
+        with patch.object(sync_scheduling, "SCHEDULED_SYNCS_PER_ACCOUNT", 1):
+            planned = plan_scheduled_syncs(NOW)
+
+        assert [(plan.calendar, plan.social_account) for plan in planned] == [(hot, account)]
+        hot.refresh_from_db()
+        cold.refresh_from_db()
+        not_due.refresh_from_db()
+        assert hot.next_scheduled_sync_at == NOW + datetime.timedelta(minutes=6)
+        # Over budget: stays due for the next run.
+        assert cold.next_scheduled_sync_at == overdue
+
+    def test_skips_in_flight_internal_and_ownerless_calendars(self, organization):
+        account = _google_account("a@example.com")
+        in_flight = _owned_calendar(organization, "in-flight", account)
+        CalendarSync.objects.create(
+            calendar=in_flight,
+            organization=organization,
+            start_datetime=NOW,
+            end_datetime=NOW,
+            should_update_events=True,
+            status=CalendarSyncStatus.IN_PROGRESS,
+        )
+        _owned_calendar(organization, "internal", account, provider=CalendarProvider.INTERNAL)
+        ownerless = Calendar.objects.create(
+            name="ownerless",
+            external_id="ownerless",
+            provider=CalendarProvider.GOOGLE,
+            organization=organization,
+        )
+
+        assert plan_scheduled_syncs(NOW) == []
+        ownerless.refresh_from_db()
+        assert ownerless.next_scheduled_sync_at == NOW + MAX_SCHEDULED_SYNC_INTERVAL
+
+
+@pytest.mark.django_db
+class TestScheduledSyncTasks:
+    def test_beat_fans_out_per_organization(self, organization):
+        account = _google_account("a@example.com")
+        calendar = _owned_calendar(organization, "cal-1", account)
+
+        with patch.object(request_scheduled_calendar_syncs_task, "delay") as dispatched:
+            schedule_calendar_syncs_task()
+
+        dispatched.assert_called_once_with(organization.id, [(calendar.id, account.id)])
+
+    def test_requests_a_scheduled_sync(self, organization):
+        account = _google_account("a@example.com")
+        calendar = _owned_calendar(organization, "cal-1", account)
+        mock_service = MagicMock()
+
+        request_scheduled_calendar_syncs_task(
+            organization.id, [[calendar.id, account.id]], calendar_service=mock_service
+        )
+
+        mock_service.authenticate.assert_called_once_with(
+            account=account, organization=organization
+        )
+        kwargs = mock_service.request_calendar_sync.call_args.kwargs
+        assert kwargs["calendar"] == calendar
+        assert kwargs["should_update_events"] is True
+        assert kwargs["trigger_source"] == CalendarSyncTriggerSource.SCHEDULED
@@ -1161,6 +1161,125 @@ class TestCalendarEventExpandedAction:
         assert len(response.data) == 1
         assert response.data[0]["id"] == surviving.id
 
+    def test_expanded_first_pages_with_next_cursor(self, auth_client, calendar, user):
+        """``first`` returns one page plus a cursor that resumes right after it."""
+        CalendarIntegrationTestFactory.create_calendar_ownership(user, calendar)
+
+        start = datetime.datetime(2025, 7, 1, 9, tzinfo=datetime.UTC)
+        for day in range(3):
+            CalendarIntegrationTestFactory.create_calendar_event(
+                calendar=calendar,
+                title=f"Meeting {day}",
+                start_time_tz_unaware=start + datetime.timedelta(days=day),
+                end_time_tz_unaware=start + datetime.timedelta(days=day, hours=1),
+            )
+
+        url = reverse("api:CalendarEvents-expanded")
+        params = {
+            "calendar_id": calendar.id,
+            "start_time": "2025-07-01T00:00:00Z",
+            "end_time": "2025-07-31T00:00:00Z",
+            "first": 2,
+        }
+        response = auth_client.get(url, params)
+
+        assert_response_status_code(response, status.HTTP_200_OK)
+        assert [r["title"] for r in response.data["results"]] == ["Meeting 0", "Meeting 1"]
+        assert response.data["next_cursor"]
+
+        response = auth_client.get(url, {**params, "after": response.data["next_cursor"]})
+
+        assert_response_status_code(response, status.HTTP_200_OK)
+        assert [r["title"] for r in response.data["results"]] == ["Meeting 2"]
+        assert response.data["next_cursor"] is None
+
+    def test_expanded_invalid_after_cursor_returns_400(self, auth_client, calendar, user):
+        CalendarIntegrationTestFactory.create_calendar_ownership(user, calendar)
+
+        url = reverse("api:CalendarEvents-expanded")
+        params = {
+            "calendar_id": calendar.id,
+            "start_time": "2025-07-01T00:00:00Z",
+            "end_time": "2025-07-31T00:00:00Z",
+            "after": "not-a-cursor",
+        }
+        response = auth_client.get(url, params)
+
+        assert_response_status_code(response, status.HTTP_400_BAD_REQUEST)
+        assert "after" in response.data
+
+    def test_expanded_answers_matching_etag_with_304_until_calendar_changes(
+        self, auth_client, calendar, user
+    ):
+        """An unchanged calendar answers ``If-None-Match`` with 304, skipping expansion."""
+        from di_core.containers import container
+
+        CalendarIntegrationTestFactory.create_calendar_ownership(user, calendar)
+        start = datetime.datetime(2025, 7, 1, 9, tzinfo=datetime.UTC)
+        CalendarIntegrationTestFactory.create_calendar_event(
+            calendar=calendar,
+            title="Meeting",
+            start_time_tz_unaware=start,
+            end_time_tz_unaware=start + datetime.timedelta(hours=1),
+        )
+
+        url = reverse("api:CalendarEvents-expanded")
+        params = {
+            "calendar_id": calendar.id,
+            "start_time": "2025-07-01T00:00:00Z",
+            "end_time": "2025-07-31T00:00:00Z",
+        }
+        response = auth_client.get(url, params)
+
+        assert_response_status_code(response, status.HTTP_200_OK)
+        etag = response["ETag"]
+        assert response["Last-Modified"]
+        assert "private" in response["Cache-Control"]
+
+        mock_calendar_service = Mock()
+        with container.calendar_service.override(mock_calendar_service):
+            response = auth_client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        mock_calendar_service.get_calendar_events_expanded.assert_not_called()
+
+        CalendarIntegrationTestFactory.create_calendar_event(
+            calendar=calendar,
+            title="Another meeting",
+            start_time_tz_unaware=start + datetime.timedelta(days=1),
+            end_time_tz_unaware=start + datetime.timedelta(days=1, hours=1),
+        )
+        response = auth_client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+        assert_response_status_code(response, status.HTTP_200_OK)
+        assert response["ETag"] != etag
+        assert len(response.data) == 2
+
+    def test_expanded_does_not_answer_if_modified_since_with_304(self, auth_client, calendar, user):
+        """``Last-Modified`` stops at whole seconds, so a change in the same second as
+        the client's copy would be hidden: only the ETag validates."""
+        CalendarIntegrationTestFactory.create_calendar_ownership(user, calendar)
+        start = datetime.datetime(2025, 7, 1, 9, tzinfo=datetime.UTC)
+        for day in range(2):
+            CalendarIntegrationTestFactory.create_calendar_event(
+                calendar=calendar,
+                title="Meeting",
+                start_time_tz_unaware=start + datetime.timedelta(days=day),
+                end_time_tz_unaware=start + datetime.timedelta(days=day, hours=1),
+            )
+        url = reverse("api:CalendarEvents-expanded")
+        params = {
+            "calendar_id": calendar.id,
+            "start_time": "2025-07-01T00:00:00Z",
+            "end_time": "2025-07-31T00:00:00Z",
+        }
+        last_modified = auth_client.get(url, params)["Last-Modified"]
+
+        response = auth_client.get(url, params, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert_response_status_code(response, status.HTTP_200_OK)
+        assert len(response.data) == 2
+
 
 @pytest.mark.django_db
 class TestRecurringCalendarEventViewSet:
@@ -2776,6 +2895,9 @@ class TestCalendarViewSet:
         mock_calendar_sync.should_update_events = False
         mock_calendar_sync.error_message = ""
         mock_calendar_sync.trigger_source = "manual"
+        mock_calendar_sync.events_created = 0
+        mock_calendar_sync.events_updated = 0
+        mock_calendar_sync.events_skipped = 0
         mock_calendar_service.request_calendar_sync.return_value = mock_calendar_sync
 
         url = reverse("api:Calendars-request-sync", kwargs={"pk": calendar.id})
@@ -2961,6 +3083,9 @@ class TestCalendarViewSet:
         mock_calendar_sync.should_update_events = False
         mock_calendar_sync.error_message = ""
         mock_calendar_sync.trigger_source = "manual"
+        mock_calendar_sync.events_created = 0
+        mock_calendar_sync.events_updated = 0
+        mock_calendar_sync.events_skipped = 0
         mock_calendar_service.request_calendar_sync.return_value = mock_calendar_sync
 
         # Authenticate as admin and make request
@@ -3283,6 +3408,9 @@ class TestCalendarViewSet:
         mock_calendar_sync.should_update_events = False
         mock_calendar_sync.error_message = ""
         mock_calendar_sync.trigger_source = "manual"
+        mock_calendar_sync.events_created = 0
+        mock_calendar_sync.events_updated = 0
+        mock_calendar_sync.events_skipped = 0
         mock_calendar_service.request_calendar_sync.return_value = mock_calendar_sync
 
         client = APIClient()
@@ -0,0 +1,51 @@
+import datetime
+from unittest.mock import MagicMock, patch
+
+from calendar_integration.webhook_debounce import (
+    WEBHOOK_SYNC_MAX_DELAY,
+    WEBHOOK_SYNC_QUIET_PERIOD,
+    due_webhook_calendars,
+    next_webhook_sync_due,
+    note_webhook_notifications,
+    release_webhook_calendars,
+    webhook_sync_due_at,
+)
+
+
+NOW = datetime.datetime(2025, 6, 2, 12, 0, tzinfo=datetime.UTC)
+
+
+def test_calendar_is_due_a_quiet_period_after_its_latest_notification():
+    first = NOW - datetime.timedelta(seconds=30)
+
+    assert webhook_sync_due_at(first, NOW) == NOW + WEBHOOK_SYNC_QUIET_PERIOD
+
+
+def test_a_burst_that_never_goes_quiet_is_due_after_the_max_delay():
+    first = NOW - WEBHOOK_SYNC_MAX_DELAY
+
+    assert webhook_sync_due_at(first, NOW) == NOW
+
+
+@patch("calendar_integration.webhook_debounce.get_redis_connection", return_value=None)
+def test_without_redis_the_index_is_unknown(mock_connection):
+    note_webhook_notifications(1, ["google:cal"], NOW)
+    release_webhook_calendars(1, {"google:cal": 1.0})
+
+    assert due_webhook_calendars(1, NOW) is None
+    assert next_webhook_sync_due(1) is None
+
+
+@patch("calendar_integration.webhook_debounce.get_redis_connection")
+def test_noted_calendar_keeps_the_start_of_its_burst(mock_connection):
+    """A calendar noted again is due from the first notification of its burst."""
+    conn = MagicMock()
+    first = NOW - datetime.timedelta(seconds=110)
+    conn.pipeline.return_value.execute.return_value = [0, [str(first.timestamp()).encode()]]
+    mock_connection.return_value = conn
+
+    note_webhook_notifications(1, ["google:cal", "google:cal"], NOW)
+
+    conn.pipeline.return_value.zadd.assert_called_once_with(
+        "webhook-sync-due:1", {"google:cal": (first + WEBHOOK_SYNC_MAX_DELAY).timestamp()}
+    )
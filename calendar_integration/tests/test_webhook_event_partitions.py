@@ -0,0 +1,279 @@
+"""``CalendarWebhookEvent``'s daily partitions: the ``0053`` rebuild, their upkeep,
+retention by dropping them, and the pruning they exist for.
+
+The partitions are real tables in the test database (pytest-django builds it by
+running ``migrate``), and most tests here create or drop some inside the test's
+transaction, which rolls them back with everything else. How many partitions
+exist, and where ``_legacy`` ends, depends on the day that database was migrated,
+so the tests only reason about partitions relative to today.
+"""
+
+import datetime
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.utils import timezone
+
+import pytest
+from model_bakery import baker
+
+from calendar_integration.constants import CalendarProvider
+from calendar_integration.models import CalendarWebhookEvent
+from calendar_integration.tasks import maintain_webhook_event_partitions_task
+from calendar_integration.webhook_event_partitions import (
+    WEBHOOK_EVENT_DEFAULT_PARTITION,
+    WEBHOOK_EVENT_TABLE,
+    apply_webhook_event_retention,
+    ensure_webhook_event_partitions,
+    list_webhook_event_partitions,
+    partition_name,
+)
+from common.testing.migration_replay import migration_replay, uninterruptible
+from organizations.models import Organization
+
+
+APP_LABEL = "calendar_integration"
+PARTITIONING_MIGRATION = "0053_partition_calendarwebhookevent"
+BEFORE_PARTITIONING = "0052_resources_import_counts"
+
+
+@pytest.fixture
+def organization(db):
+    return Organization.objects.create(name="Partitioned Org")
+
+
+def _today() -> datetime.date:
+    return timezone.now().date()
+
+
+def _midnight(day: datetime.date) -> datetime.datetime:
+    return datetime.datetime.combine(day, datetime.time(), tzinfo=datetime.UTC)
+
+
+def _event(organization, created: datetime.datetime | None = None) -> CalendarWebhookEvent:
+    event = baker.make(
+        CalendarWebhookEvent,
+        organization=organization,
+        provider=CalendarProvider.GOOGLE,
+        raw_payload={},
+    )
+    if created is not None:
+        # ``created`` is ``auto_now_add``; an update moves the row across partitions.
+        CalendarWebhookEvent.original_manager.filter(id=event.id).update(created=created)
+    return event
+
+
+def _partition_of(event: CalendarWebhookEvent) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT tableoid::regclass::text FROM {WEBHOOK_EVENT_TABLE} WHERE id = %s",  # noqa: S608
+            [event.id],
+        )
+        return cursor.fetchone()[0]
+
+
+def _run_deferred_checks() -> None:
+    """Check the rows written so far against their deferred foreign keys now.
+
+    Postgres refuses to drop a table with checks still pending on it, which only
+    happens to rows written in the dropping transaction -- here, the test's.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+
+def _analyze(partition: str) -> None:
+    """Refresh ``partition``'s planner statistics, which retention reports from."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {partition}")
+
+
+def _drop_partitions_before(day: datetime.date) -> None:
+    """Drop every partition ending by ``day``, ``_legacy`` included."""
+    apply_webhook_event_retention(_midnight(day))
+
+
+def test_ensure_creates_the_coming_days_once(db):
+    today = _today()
+    ensure_webhook_event_partitions(today)
+    far = today + datetime.timedelta(days=30)
+
+    assert ensure_webhook_event_partitions(far, days_ahead=1) == [
+        partition_name(far),
+        partition_name(far + datetime.timedelta(days=1)),
+    ]
+    assert ensure_webhook_event_partitions(far, days_ahead=1) == []
+
+    partitions = {partition.name: partition for partition in list_webhook_event_partitions()}
+    assert partitions[partition_name(far)].start == _midnight(far)
+    assert partitions[partition_name(far)].end == _midnight(far + datetime.timedelta(days=1))
+    assert partitions[WEBHOOK_EVENT_DEFAULT_PARTITION].is_default
+    assert list(partitions)[-1] == WEBHOOK_EVENT_DEFAULT_PARTITION
+
+
+def test_creating_a_day_moves_its_rows_out_of_the_default_partition(organization):
+    far = _today() + datetime.timedelta(days=30)
+    event = _event(organization, _midnight(far) + datetime.timedelta(hours=5))
+    assert _partition_of(event) == WEBHOOK_EVENT_DEFAULT_PARTITION
+
+    ensure_webhook_event_partitions(far, days_ahead=0)
+
+    assert _partition_of(event) == partition_name(far)
+    # Attached with the table's indexes and foreign keys.
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT COUNT(*) FROM pg_indexes WHERE tablename = %s", [partition_name(far)]
+        )
+        (indexes,) = cursor.fetchone()
+        cursor.execute(
+            "SELECT COUNT(*) FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'",
+            [partition_name(far)],
+        )
+        (foreign_keys,) = cursor.fetchone()
+    assert indexes == 10
+    assert foreign_keys == 3
+
+
+def test_maintain_task_keeps_a_week_of_partitions_ahead(db):
+    maintain_webhook_event_partitions_task()
+
+    names = {partition.name for partition in list_webhook_event_partitions()}
+    today = _today()
+    assert {partition_name(today + datetime.timedelta(days=n)) for n in range(8)} <= names
+
+
+def test_retention_drops_whole_expired_days_and_keeps_the_rest(organization):
+    today = _today()
+    ensure_webhook_event_partitions(today)
+    kept = _event(organization)
+    expired = _event(organization, _midnight(today) - datetime.timedelta(days=40))
+    _run_deferred_checks()
+    _analyze(_partition_of(expired))
+
+    retention = apply_webhook_event_retention(_midnight(today))
+
+    assert retention.skipped_partitions == []
+    assert retention.estimated
+    assert retention.deleted_events == 1
+    assert f"{WEBHOOK_EVENT_TABLE}_legacy" in dict(retention.dropped_partitions)
+    assert list(CalendarWebhookEvent.original_manager.values_list("id", flat=True)) == [kept.id]
+    assert not CalendarWebhookEvent.original_manager.filter(id=expired.id).exists()
+    assert all(
+        partition.end is None or partition.end > _midnight(today)
+        for partition in list_webhook_event_partitions()
+    )
+
+
+def test_retention_deletes_the_default_partitions_expired_rows(organization):
+    today = _today()
+    ensure_webhook_event_partitions(today)
+    _drop_partitions_before(today)
+    # No partition covers it any more, so it is stored in the default partition.
+    stray = _event(organization, _midnight(today) - datetime.timedelta(days=40))
+    recent_stray = _event(organization, _midnight(today) - datetime.timedelta(days=2))
+    assert _partition_of(stray) == WEBHOOK_EVENT_DEFAULT_PARTITION
+
+    retention = apply_webhook_event_retention(_midnight(today) - datetime.timedelta(days=30))
+
+    assert retention.dropped_partitions == []
+    assert retention.deleted_default_events == 1
+    assert list(CalendarWebhookEvent.original_manager.values_list("id", flat=True)) == [
+        recent_stray.id
+    ]
+
+
+def test_retention_dry_run_counts_without_dropping(organization):
+    today = _today()
+    ensure_webhook_event_partitions(today)
+    _event(organization, _midnight(today) - datetime.timedelta(days=40))
+    partitions_before = list_webhook_event_partitions()
+
+    retention = apply_webhook_event_retention(_midnight(today), dry_run=True)
+
+    assert not retention.estimated
+    assert retention.deleted_events == 1
+    assert list_webhook_event_partitions() == partitions_before
+    assert CalendarWebhookEvent.original_manager.count() == 1
+
+
+def test_windowed_organization_reads_only_scan_the_window_s_partitions(organization):
+    today = _today()
+    ensure_webhook_event_partitions(today)
+    since = _midnight(today) + datetime.timedelta(hours=1)
+
+    plan = (
+        CalendarWebhookEvent.original_manager.filter(organization=organization, created__gte=since)
+        .order_by()
+        .explain()
+    )
+
+    assert partition_name(today) in plan
+    assert partition_name(today - datetime.timedelta(days=1)) not in plan
+    assert f"{WEBHOOK_EVENT_TABLE}_legacy" not in plan
+
+
+@migration_replay
+@pytest.mark.django_db(transaction=True)
+def test_partitioning_migration_keeps_existing_rows_ids_and_schema():
+    """Drives ``0053`` backwards then forwards over rows written before it.
+
+    Restores every app to its leaf node in ``finally``: see
+    ``common.testing.migration_replay``.
+    """
+    organization = Organization.objects.create(name="Replayed Org")
+    executor = MigrationExecutor(connection)
+    now = timezone.now()
+    try:
+        executor.migrate([(APP_LABEL, BEFORE_PARTITIONING)])
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT relkind FROM pg_class WHERE relname = %s", [WEBHOOK_EVENT_TABLE])
+            assert cursor.fetchone()[0] == "r"
+            ids = []
+            for created in (now - datetime.timedelta(days=40), now):
+                cursor.execute(
+                    f"INSERT INTO {WEBHOOK_EVENT_TABLE} "  # noqa: S608
+                    "(created, modified, meta, provider, event_type, external_calendar_id, "
+                    "external_event_id, raw_payload, headers, processing_status, "
+                    "organization_id) "
+                    "VALUES (%s, %s, '{}', 'google', 'sync', 'cal-1', '', '{}', '{}', "
+                    "'pending', %s) RETURNING id",
+                    [created, created, organization.id],
+                )
+                ids.append(cursor.fetchone()[0])
+
+        executor.loader.build_graph()
+        executor.migrate([(APP_LABEL, PARTITIONING_MIGRATION)])
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT relkind FROM pg_class WHERE relname = %s", [WEBHOOK_EVENT_TABLE])
+            assert cursor.fetchone()[0] == "p"
+            cursor.execute(
+                f"SELECT id, tableoid::regclass::text FROM {WEBHOOK_EVENT_TABLE} ORDER BY id"  # noqa: S608
+            )
+            assert cursor.fetchall() == [
+                (ids[0], f"{WEBHOOK_EVENT_TABLE}_legacy"),
+                (ids[1], partition_name(now.date())),
+            ]
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes WHERE tablename = %s", [WEBHOOK_EVENT_TABLE]
+            )
+            indexes = {row[0] for row in cursor.fetchall()}
+            cursor.execute(
+                "SELECT COUNT(*) FROM pg_constraint WHERE conrelid = %s::regclass "
+                "AND contype = 'f'",
+                [WEBHOOK_EVENT_TABLE],
+            )
+            (foreign_keys,) = cursor.fetchone()
+        assert {
+            f"{WEBHOOK_EVENT_TABLE}_pkey",
+            "calendar_in_provide_d5534e_idx",
+            "calendar_in_organiz_5de216_idx",
+            "calendar_in_organiz_2376b8_idx",
+        } <= indexes
+        assert foreign_keys == 3
+        # The sequence carries on past the copied ids.
+        assert _event(organization).id > ids[1]
+    finally:
+        with uninterruptible():
+            executor.loader.build_graph()
+            executor.migrate(executor.loader.graph.leaf_nodes())
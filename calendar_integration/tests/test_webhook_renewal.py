@@ -0,0 +1,141 @@
+import datetime
+import threading
+from unittest.mock import Mock
+
+from django.utils import timezone
+
+import pytest
+from allauth.socialaccount.models import SocialAccount
+from model_bakery import baker
+
+from calendar_integration.constants import CalendarProvider
+from calendar_integration.models import Calendar, CalendarOwnership, CalendarWebhookSubscription
+from calendar_integration.webhook_renewal import plan_webhook_renewals, renew_subscriptions
+from organizations.models import Organization, OrganizationMembership
+from users.models import User
+
+
+@pytest.fixture
+def organization(db):
+    return Organization.objects.create(name="Renewal Org")
+
+
+def _account(organization, email):
+    user = User.objects.create_user(email=email, password="testpass123")
+    baker.make(OrganizationMembership, organization=organization, user=user, is_active=True)
+    return SocialAccount.objects.create(user=user, provider=CalendarProvider.GOOGLE, uid=email)
+
+
+def _subscription(organization, external_id, expires_in, owner=None, **kwargs):
+    calendar = baker.make(
+        Calendar,
+        organization=organization,
+        provider=CalendarProvider.GOOGLE,
+        external_id=external_id,
+    )
+    if owner is not None:
+        baker.make(
+            CalendarOwnership,
+            organization=organization,
+            calendar=calendar,
+            membership_user_id=owner.user_id,
+            is_default=True,
+        )
+    return baker.make(
+        CalendarWebhookSubscription,
+        organization=organization,
+        calendar=calendar,
+        provider=CalendarProvider.GOOGLE,
+        external_subscription_id=f"channel-{external_id}",
+        expires_at=timezone.now() + expires_in,
+        **kwargs,
+    )
+
+
+def test_plan_groups_expiring_subscriptions_per_account_across_organizations(
+    organization, django_assert_max_num_queries
+):
+    first = _account(organization, "first@example.com")
+    second = _account(organization, "second@example.com")
+    other_organization = Organization.objects.create(name="Other Org")
+    other = _account(other_organization, "other@example.com")
+    hour = datetime.timedelta(hours=1)
+    first_subscriptions = [
+        _subscription(organization, "a", 2 * hour, first),
+        _subscription(organization, "b", 3 * hour, first),
+    ]
+    second_subscription = _subscription(organization, "c", 2 * hour, second)
+    other_subscription = _subscription(other_organization, "d", 2 * hour, other)
+    unowned = _subscription(organization, "e", 2 * hour)
+    # Not due yet, already lapsed, or no longer kept up.
+    _subscription(organization, "f", 48 * hour, first)
+    _subscription(organization, "g", -hour, first)
+    _subscription(organization, "h", 2 * hour, first, is_active=False)
+
+    # The subscriptions, their calendars' ownerships, and the owners' accounts.
+    with django_assert_max_num_queries(3):
+        plan = plan_webhook_renewals(timezone.now())
+
+    assert sorted(plan.batches) == sorted(
+        [
+            (organization.id, first.id, [sub.id for sub in first_subscriptions]),
+            (organization.id, second.id, [second_subscription.id]),
+            (other_organization.id, other.id, [other_subscription.id]),
+        ]
+    )
+    assert plan.unresolved_subscription_ids == [unowned.id]
+    assert plan.subscription_count == 4
+
+
+def test_plan_narrows_to_one_organization_and_provider(organization):
+    account = _account(organization, "only@example.com")
+    subscription = _subscription(organization, "a", datetime.timedelta(hours=2), account)
+    other_organization = Organization.objects.create(name="Other Org")
+    _subscription(
+        other_organization,
+        "b",
+        datetime.timedelta(hours=2),
+        _account(other_organization, "other@example.com"),
+    )
+
+    plan = plan_webhook_renewals(timezone.now(), organization_id=organization.id)
+    assert plan.batches == [(organization.id, account.id, [subscription.id])]
+
+    plan = plan_webhook_renewals(
+        timezone.now(), organization_id=organization.id, provider=CalendarProvider.MICROSOFT
+    )
+    assert plan.batches == []
+
+
+def test_renew_subscriptions_runs_the_renewals_at_once_and_reports_each(organization):
+    hour = datetime.timedelta(hours=1)
+    subscriptions = [_subscription(organization, name, hour) for name in ("a", "b", "c")]
+    barrier = threading.Barrier(3)
+    error = ValueError("rejected")
+
+    def renew(subscription_id, **kwargs):
+        # Only passes once every renewal is in flight.
+        barrier.wait(timeout=5)
+        if subscription_id == "channel-b":
+            raise error
+        return {"channel_id": f"{subscription_id}-renewed"}
+
+    adapter = Mock()
+    adapter.renew_webhook_subscription.side_effect = renew
+
+    renewals = renew_subscriptions(adapter, subscriptions, max_concurrency=3)
+
+    assert [renewal.subscription for renewal in renewals] == subscriptions
+    assert [renewal.details for renewal in renewals] == [
+        {"channel_id": "channel-a-renewed"},
+        None,
+        {"channel_id": "channel-c-renewed"},
+    ]
+    assert renewals[1].error is error
+    adapter.renew_webhook_subscription.assert_any_call(
+        subscription_id="channel-a",
+        resource_id="a",
+        callback_url=subscriptions[0].callback_url,
+        provider_resource_id=subscriptions[0].external_resource_id,
+        tracking_params={"ttl_seconds": 7 * 24 * 3600},
+    )
@@ -3,7 +3,9 @@ from collections.abc import Callable
 from typing import Annotated, Any, cast
 
 from django.db.models import Case, IntegerField, Value, When
-from django.http import Http404, HttpResponse
+from django.http import Http404, HttpResponse, HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 
 from allauth.socialaccount.models import SocialAccount
 from dependency_injector.wiring import Provide, inject
@@ -20,6 +22,7 @@ from rest_framework.exceptions import NotFound, PermissionDenied, ValidationErro
 from rest_framework.response import Response
 
 from audit.services import AuditService
+from calendar_integration.change_tracking import CalendarChangeState, get_calendar_change_state
 from calendar_integration.constants import (
     CalendarProvider,
     CalendarSyncTriggerSource,
@@ -107,6 +110,11 @@ from calendar_integration.serializers import (
 from calendar_integration.services.booking_policy_service import BookingPolicyService
 from calendar_integration.services.calendar_group_service import _UNCHANGED, CalendarGroupService
 from calendar_integration.services.calendar_service import CalendarService
+from calendar_integration.services.dataclasses import ExpandedEventCursor
+from calendar_integration.services.event_expansion import (
+    MAX_EXPANDED_EVENTS_PAGE_SIZE,
+    paginate_expanded_events,
+)
 from calendar_integration.services.external_event_change_request_service import (
     ExternalEventChangeRequestService,
 )
@@ -126,6 +134,38 @@ def _parse_bool(value, *, default: bool = True) -> bool:
     return bool(value)
 
 
+def _calendar_read_not_modified(
+    request, organization_id: int, calendar_ids: list[int]
+) -> tuple[HttpResponseBase | None, CalendarChangeState]:
+    """Check a calendar read's conditional headers before the read does any work.
+
+    Returns a 304 response when the client's ``If-None-Match`` still matches, together
+    with the change state the read stamps on its own response otherwise (see
+    ``_set_calendar_read_validators``). The ETag varies with the full path (range,
+    filters, cursor) and the caller, since both shape the body.
+
+    ``If-Modified-Since`` is not honored: HTTP dates stop at whole seconds, so a
+    change made in the second a client's ``Last-Modified`` names would be answered
+    with a stale 304. The ETag, over every calendar's ``change_version``, misses none.
+    """
+    state = get_calendar_change_state(
+        organization_id,
+        calendar_ids,
+        variant=f"{request.get_full_path()}|{request.user.pk}",
+    )
+    return get_conditional_response(request, etag=state.etag), state
+
+
+def _set_calendar_read_validators(response: Response, state: CalendarChangeState) -> Response:
+    """Stamp ``ETag`` / ``Last-Modified`` on a calendar read, and make clients revalidate."""
+    response["ETag"] = state.etag
+    if state.last_modified is not None:
+        response["Last-Modified"] = http_date(state.last_modified.timestamp())
+    # Per-user data: never shared caches, and always revalidated (cheaply, via the ETag).
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
 @extend_schema_view(
     list=extend_schema(
         summary="List calendars",
@@ -781,6 +821,12 @@ class CalendarViewSet(VintaScheduleModelViewSet):
         except (ValueError, CalendarIntegrationError) as e:
             raise ValidationError({"non_field_errors": [str(e)]}) from e
 
+        not_modified, change_state = _calendar_read_not_modified(
+            request, calendar.organization_id, [calendar.id]
+        )
+        if not_modified is not None:
+            return not_modified
+
         # Get social account for authentication
         social_account = SocialAccount.objects.filter(
             user=request.user, provider=calendar.provider
@@ -799,7 +845,7 @@ class CalendarViewSet(VintaScheduleModelViewSet):
             )
 
             serializer = AvailableTimeWindowSerializer(available_windows, many=True)
-            return Response(serializer.data)
+            return _set_calendar_read_validators(Response(serializer.data), change_state)
         except (ValueError, CalendarIntegrationError) as e:
             raise ValidationError({"non_field_errors": [str(e)]}) from e
 
@@ -865,6 +911,12 @@ class CalendarViewSet(VintaScheduleModelViewSet):
                 }
             ) from e
 
+        not_modified, change_state = _calendar_read_not_modified(
+            request, calendar.organization_id, [calendar.id]
+        )
+        if not_modified is not None:
+            return not_modified
+
         try:
             # Get social account for authentication
             social_account = SocialAccount.objects.filter(
@@ -883,7 +935,7 @@ class CalendarViewSet(VintaScheduleModelViewSet):
             )
 
             serializer = UnavailableTimeWindowSerializer(unavailable_windows, many=True)
-            return Response(serializer.data)
+            return _set_calendar_read_validators(Response(serializer.data), change_state)
         except (ValueError, CalendarIntegrationError) as e:
             raise ValidationError({"non_field_errors": [str(e)]}) from e
 
@@ -912,6 +964,27 @@ class CalendarEventViewSet(VintaScheduleModelViewSet):
             return CalendarEvent.original_manager.none()
         return super().get_queryset().filter_by_organization(membership.organization_id)
 
+    def list(self, request, *args, **kwargs):  # noqa: A003
+        """List calendar events.
+
+        When filtered by ``calendar`` the response carries ``ETag`` / ``Last-Modified``,
+        and a request whose ``If-None-Match`` still matches is
+        answered with 304 Not Modified.
+        """
+        # Unfiltered, the listing spans every calendar of the organization, and
+        # validating all of their versions would cost more than it saves.
+        calendar_id = request.query_params.get("calendar")
+        membership = request.organization_membership
+        if not calendar_id or not calendar_id.isdigit() or not membership:
+            return super().list(request, *args, **kwargs)
+
+        not_modified, change_state = _calendar_read_not_modified(
+            request, membership.organization_id, [int(calendar_id)]
+        )
+        if not_modified is not None:
+            return not_modified
+        return _set_calendar_read_validators(super().list(request, *args, **kwargs), change_state)
+
     def perform_create(self, serializer):
         # Surface domain errors (e.g. no available time window, invalid timezone)
         # as a 400 instead of leaking a 500 from the service layer.
@@ -1081,6 +1154,24 @@ class CalendarEventViewSet(VintaScheduleModelViewSet):
                 required=True,
                 description="End datetime for the range (ISO format)",
             ),
+            OpenApiParameter(
+                name="first",
+                type=int,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description=(
+                    "Page size (1-500). When given, the response is an object with "
+                    "`results` (the page) and `next_cursor` (pass it as `after` for the "
+                    "next page; null on the last page) instead of a bare list."
+                ),
+            ),
+            OpenApiParameter(
+                name="after",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Opaque cursor: only events after it are returned.",
+            ),
         ],
         responses={200: CalendarEventSerializer(many=True)},
     )
@@ -1123,18 +1214,45 @@ class CalendarEventViewSet(VintaScheduleModelViewSet):
         except ValueError as e:
             raise ValidationError({"non_field_errors": ["Invalid datetime format"]}) from e
 
+        first, after = self._parse_expanded_page_params(request)
+
+        # Answered before any expansion: an unchanged calendar costs two small queries.
+        not_modified, change_state = _calendar_read_not_modified(
+            request, membership.organization_id, [calendar.id]
+        )
+        if not_modified is not None:
+            return not_modified
+
         calendar_service.initialize_without_provider(organization=membership.organization)
 
         # Pass the serializer's optimizer so recurring masters are prefetched; their
         # generated (pk-less) occurrences reuse that cache (see
         # get_calendar_events_expanded).
         context = self.get_serializer_context()
-        expanded_events = calendar_service.get_calendar_events_expanded(
-            calendar=calendar,
-            start_date=start_dt,
-            end_date=end_dt,
-            optimize_queryset=CalendarEventSerializer(context=context).get_optimized_queryset,
-        )
+        optimize_queryset = CalendarEventSerializer(context=context).get_optimized_queryset
+        page = None
+        if first is None and after is None:
+            expanded_events = calendar_service.get_calendar_events_expanded(
+                calendar=calendar,
+                start_date=start_dt,
+                end_date=end_dt,
+                optimize_queryset=optimize_queryset,
+            )
+        else:
+            # Keyset read: the stream is cursor-ordered and lazy, so with ``first`` only
+            # the page (plus one look-ahead event) is ever expanded.
+            stream = calendar_service.iter_calendar_events_expanded(
+                calendar=calendar,
+                start_date=start_dt,
+                end_date=end_dt,
+                optimize_queryset=optimize_queryset,
+                after=after,
+            )
+            if first is not None:
+                page = paginate_expanded_events(stream, first)
+                expanded_events = page.events
+            else:
+                expanded_events = [event for _, event in stream]
 
         # Real (pk-backed) events are re-fetched through the optimized queryset so
         # their nested relations are prefetched; generated occurrences (pk=None)
@@ -1156,7 +1274,45 @@ class CalendarEventViewSet(VintaScheduleModelViewSet):
             ]
 
         serializer = CalendarEventSerializer(expanded_events, many=True, context=context)
-        return Response(serializer.data)
+        if page is None:
+            return _set_calendar_read_validators(Response(serializer.data), change_state)
+        return _set_calendar_read_validators(
+            Response(
+                {
+                    "results": serializer.data,
+                    "next_cursor": (
+                        page.end_cursor.encode()
+                        if page.has_next_page and page.end_cursor is not None
+                        else None
+                    ),
+                }
+            ),
+            change_state,
+        )
+
+    def _parse_expanded_page_params(self, request) -> tuple[int | None, ExpandedEventCursor | None]:
+        """Validate the optional ``first`` / ``after`` keyset params of ``expanded``."""
+        first_param = request.query_params.get("first")
+        after_param = request.query_params.get("after")
+
+        first: int | None = None
+        if first_param is not None:
+            try:
+                first = int(first_param)
+            except ValueError as e:
+                raise ValidationError({"first": ["Must be an integer."]}) from e
+            if not 1 <= first <= MAX_EXPANDED_EVENTS_PAGE_SIZE:
+                raise ValidationError(
+                    {"first": [f"Must be between 1 and {MAX_EXPANDED_EVENTS_PAGE_SIZE}."]}
+                )
+
+        after: ExpandedEventCursor | None = None
+        if after_param:
+            try:
+                after = ExpandedEventCursor.decode(after_param)
+            except ValueError as e:
+                raise ValidationError({"after": ["Invalid cursor."]}) from e
+        return first, after
 
     @extend_schema(
         summary="Transfer event to another calendar (admin)",
@@ -0,0 +1,175 @@
+"""Debounce of webhook-triggered syncs: one trailing sync per burst of notifications.
+
+Providers notify per change, so a bulk edit or a busy room calendar sends dozens of
+notifications within seconds. The webhook-triggered path used to dedupe them by
+looking for a sync of the calendar started in the last five minutes -- one query per
+push, and every change made after that sync had fetched its events was dropped
+until a later push came along.
+
+Notifications are now gathered per calendar and synced once the calendar goes quiet:
+a calendar is due :data:`WEBHOOK_SYNC_QUIET_PERIOD` after its latest pending
+notification, or :data:`WEBHOOK_SYNC_MAX_DELAY` after its earliest one if the burst
+never stops (:func:`webhook_sync_due_at`). The sync requested then covers every
+notification gathered, however long the burst was.
+
+The pending ``CalendarWebhookEvent`` rows are the record of truth: a calendar's
+notifications stay ``PENDING`` until the drain (``process_webhook_events_task``)
+requests its sync, so nothing is lost whatever happens to Redis. Redis keeps the
+index of when each calendar is due, a sorted set per organization (member
+``"<provider>:<external calendar id>"``, score the due timestamp) plus a hash of
+when each member's burst started, so a drain loads only the events of calendars that
+are due and knows when the next one will be:
+
+- :func:`note_webhook_notifications` (the webhook view, once its events are
+  committed) pushes the notified calendars' due times back.
+- :func:`due_webhook_calendars` reads the calendars due now, and
+  :func:`release_webhook_calendars` drops them once their sync was requested --
+  unless a notification moved one's due time in the meantime, whose event then
+  waits for a later drain.
+- :func:`next_webhook_sync_due` tells the drain when to come back.
+
+Without Redis -- or for events whose notification never made it into the index --
+the drain falls back to the events themselves: any event older than
+:data:`WEBHOOK_SYNC_MAX_DELAY` is claimed regardless of the index, and with Redis
+down every pending event is, its calendar synced when the events say it is due.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+from collections.abc import Iterable
+
+from redis.exceptions import RedisError
+
+from common.redis import CircuitBreakerOpenError, get_redis_connection, redis_breaker
+
+
+logger = logging.getLogger(__name__)
+
+#: How long a calendar must go without notifications before its sync is requested.
+WEBHOOK_SYNC_QUIET_PERIOD = datetime.timedelta(seconds=20)
+#: Longest a notification waits for its sync while the burst it is part of goes on.
+WEBHOOK_SYNC_MAX_DELAY = datetime.timedelta(minutes=2)
+#: Seconds the index outlives its last notification; a member left behind by a
+#: drain that died is forgotten, its events being found again as stale ones.
+WEBHOOK_DEBOUNCE_TTL = 3600
+
+# Drops members whose score is still the one the drain read; a member re-noted since
+# keeps its new due time.
+_RELEASE_SCRIPT = """
+for i = 1, #ARGV, 2 do
+    local score = redis.call('ZSCORE', KEYS[1], ARGV[i])
+    if score and tonumber(score) == tonumber(ARGV[i + 1]) then
+        redis.call('ZREM', KEYS[1], ARGV[i])
+        redis.call('HDEL', KEYS[2], ARGV[i])
+    end
+end
+return 0
+"""
+
+
+def webhook_calendar_key(provider: str, external_calendar_id: str) -> str:
+    """The index member of a notified calendar."""
+    return f"{provider}:{external_calendar_id}"
+
+
+def webhook_sync_due_at(
+    first_notified_at: datetime.datetime, last_notified_at: datetime.datetime
+) -> datetime.datetime:
+    """When the sync of a calendar notified between the two moments is due."""
+    return min(
+        last_notified_at + WEBHOOK_SYNC_QUIET_PERIOD,
+        first_notified_at + WEBHOOK_SYNC_MAX_DELAY,
+    )
+
+
+def _keys(organization_id: int) -> tuple[str, str]:
+    return f"webhook-sync-due:{organization_id}", f"webhook-sync-first:{organization_id}"
+
+
+def note_webhook_notifications(
+    organization_id: int, calendar_keys: Iterable[str], notified_at: datetime.datetime
+) -> None:
+    """Push the due time of the notified calendars back to reflect a new notification.
+
+    Best effort: without Redis the drain finds the events on its own.
+    """
+    conn = get_redis_connection()
+    if conn is None:
+        return
+    due_key, first_key = _keys(organization_id)
+    calendar_keys = list(dict.fromkeys(calendar_keys))
+    now_ts = notified_at.timestamp()
+
+    def note() -> None:
+        pipe = conn.pipeline()
+        for calendar_key in calendar_keys:
+            pipe.hsetnx(first_key, calendar_key, now_ts)
+        pipe.hmget(first_key, calendar_keys)
+        *_, firsts = pipe.execute()
+        pipe = conn.pipeline()
+        for calendar_key, first in zip(calendar_keys, firsts, strict=True):
+            first_at = datetime.datetime.fromtimestamp(float(first or now_ts), tz=datetime.UTC)
+            due_at = webhook_sync_due_at(first_at, notified_at)
+            pipe.zadd(due_key, {calendar_key: due_at.timestamp()})
+        pipe.expire(due_key, WEBHOOK_DEBOUNCE_TTL)
+        pipe.expire(first_key, WEBHOOK_DEBOUNCE_TTL)
+        pipe.execute()
+
+    try:
+        redis_breaker.call(note)
+    except (RedisError, CircuitBreakerOpenError) as exc:
+        logger.warning("Redis unavailable to debounce webhook syncs: %s", exc)
+
+
+def due_webhook_calendars(organization_id: int, now: datetime.datetime) -> dict[str, float] | None:
+    """The calendars due at ``now``, each with the due score read.
+
+    :return: ``None`` when Redis cannot be asked: the caller then decides from the
+        pending events alone.
+    """
+    conn = get_redis_connection()
+    if conn is None:
+        return None
+    due_key, _ = _keys(organization_id)
+    try:
+        due = redis_breaker.call(
+            conn.zrangebyscore, due_key, "-inf", now.timestamp(), withscores=True
+        )
+    except (RedisError, CircuitBreakerOpenError) as exc:
+        logger.warning("Redis unavailable to read due webhook syncs: %s", exc)
+        return None
+    return {member.decode(): score for member, score in due}
+
+
+def release_webhook_calendars(organization_id: int, released: dict[str, float]) -> None:
+    """Drop calendars whose sync was requested, unless re-noted since they were read."""
+    conn = get_redis_connection()
+    if conn is None or not released:
+        return
+    args: list[str] = []
+    for calendar_key, score in released.items():
+        # ``repr`` round-trips the float, so the script compares the exact score.
+        args += [calendar_key, repr(score)]
+    try:
+        redis_breaker.call(conn.eval, _RELEASE_SCRIPT, 2, *_keys(organization_id), *args)
+    except (RedisError, CircuitBreakerOpenError) as exc:
+        # The members stay and are read again; their events are settled already, so
+        # the next drain only finds nothing to sync for them.
+        logger.warning("Redis unavailable to release webhook syncs: %s", exc)
+
+
+def next_webhook_sync_due(organization_id: int) -> datetime.datetime | None:
+    """When the next noted calendar of the organization is due, if any and known."""
+    conn = get_redis_connection()
+    if conn is None:
+        return None
+    due_key, _ = _keys(organization_id)
+    try:
+        head = redis_breaker.call(conn.zrange, due_key, 0, 0, withscores=True)
+    except (RedisError, CircuitBreakerOpenError):
+        return None
+    if not head:
+        return None
+    return datetime.datetime.fromtimestamp(head[0][1], tz=datetime.UTC)
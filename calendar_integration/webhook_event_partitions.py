@@ -0,0 +1,259 @@
+"""Daily partitions of the webhook event log, and retention by dropping them.
+
+``CalendarWebhookEvent`` is stored as ``PARTITION BY RANGE (created)`` (migration
+``0053_partition_calendarwebhookevent``, which documents the layout): one partition
+per UTC day, a ``_legacy`` partition holding the rows that predate partitioning, and
+a ``DEFAULT`` partition for any row no other partition covers.
+
+Two things keep it that way:
+
+- :func:`ensure_webhook_event_partitions` creates the partitions of the coming
+  :data:`WEBHOOK_EVENT_PARTITIONS_AHEAD` days, so inserts always land in their
+  day's partition. ``maintain_webhook_event_partitions_task`` runs it daily; a week
+  of lead means a beat that stops for a few days costs nothing. Should it stop for
+  longer, rows fall into the default partition, and creating their day's partition
+  later moves them into it.
+- :func:`apply_webhook_event_retention` is the retention ``cleanup_webhook_events``
+  runs: every partition whose whole range is older than the cutoff is dropped --
+  one ``DROP TABLE`` however many rows it holds -- and only the default partition's
+  stray old rows are deleted row by row. Retention is therefore by whole days: an
+  event is kept for at least the retention period and less than a day past it.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import logging
+import re
+
+from django.db import DatabaseError, connection, transaction
+
+from calendar_integration.models import CalendarWebhookEvent
+
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_EVENT_TABLE = CalendarWebhookEvent._meta.db_table
+WEBHOOK_EVENT_DEFAULT_PARTITION = f"{WEBHOOK_EVENT_TABLE}_default"
+#: Days of partitions kept past today.
+WEBHOOK_EVENT_PARTITIONS_AHEAD = 7
+#: How long creating or dropping a partition waits for its lock on the table. Both
+#: need a brief exclusive lock; past this they give up rather than have every
+#: webhook delivery queue behind them, and the next run tries again.
+WEBHOOK_EVENT_PARTITION_LOCK_TIMEOUT = "5s"
+
+_BOUNDS = re.compile(r"FROM \((?P<start>[^)]+)\) TO \((?P<end>[^)]+)\)")
+
+
+@dataclasses.dataclass(frozen=True)
+class WebhookEventPartition:
+    """One partition of the webhook event table.
+
+    :param start: Lower bound of its ``created`` range; ``None`` when unbounded below.
+    :param end: Upper bound (exclusive); ``None`` for the default partition.
+    """
+
+    name: str
+    start: datetime.datetime | None
+    end: datetime.datetime | None
+    is_default: bool = False
+
+    def covers(self, start: datetime.datetime, end: datetime.datetime) -> bool:
+        """Whether the whole of ``[start, end)`` falls within this partition."""
+        if self.is_default or self.end is None:
+            return False
+        return (self.start is None or self.start <= start) and end <= self.end
+
+
+@dataclasses.dataclass
+class WebhookEventRetention:
+    """What a retention run dropped, or would drop.
+
+    :param dropped_partitions: ``(partition, events)`` per partition dropped.
+    :param skipped_partitions: Expired partitions left for the next run, because
+        their lock could not be had in time.
+    :param deleted_default_events: Expired rows deleted from the default partition.
+    :param estimated: Whether the partitions' event counts are the planner's
+        estimates (``pg_class.reltuples``) rather than counted. Only a dry run counts.
+    """
+
+    dropped_partitions: list[tuple[str, int]] = dataclasses.field(default_factory=list)
+    skipped_partitions: list[str] = dataclasses.field(default_factory=list)
+    deleted_default_events: int = 0
+    estimated: bool = False
+
+    @property
+    def deleted_events(self) -> int:
+        """Every event removed, dropped or deleted; an estimate when ``estimated``."""
+        return self.deleted_default_events + sum(events for _, events in self.dropped_partitions)
+
+
+def partition_name(day: datetime.date) -> str:
+    """Name of ``day``'s partition."""
+    return f"{WEBHOOK_EVENT_TABLE}_p{day:%Y%m%d}"
+
+
+def _parse_bound(value: str) -> datetime.datetime | None:
+    if value == "MINVALUE":
+        return None
+    # ``'2026-10-19 00:00:00+00'``: Postgres renders it in the session's time zone,
+    # which Django sets to UTC.
+    return datetime.datetime.fromisoformat(value.strip("'"))
+
+
+def _day_range(day: datetime.date) -> tuple[datetime.datetime, datetime.datetime]:
+    start = datetime.datetime.combine(day, datetime.time(), tzinfo=datetime.UTC)
+    return start, start + datetime.timedelta(days=1)
+
+
+# The SQL below interpolates table names: this module's constants, or partition
+# names read back from the catalog. Values go through parameters.
+
+
+def list_webhook_event_partitions() -> list[WebhookEventPartition]:
+    """The table's partitions, oldest first, the default partition last."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = %s::regclass",
+            [WEBHOOK_EVENT_TABLE],
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, bound in rows:
+        match = _BOUNDS.search(bound)
+        if match is None:
+            partitions.append(WebhookEventPartition(name, None, None, is_default=True))
+        else:
+            partitions.append(
+                WebhookEventPartition(
+                    name, _parse_bound(match["start"]), _parse_bound(match["end"])
+                )
+            )
+    oldest = datetime.datetime.min.replace(tzinfo=datetime.UTC)
+    return sorted(partitions, key=lambda p: (p.is_default, p.start or oldest))
+
+
+def ensure_webhook_event_partitions(
+    today: datetime.date, *, days_ahead: int = WEBHOOK_EVENT_PARTITIONS_AHEAD
+) -> list[str]:
+    """Create the partitions of ``today`` and the ``days_ahead`` days after it.
+
+    Days an existing partition already covers are skipped, so running it again is
+    a no-op. A day's rows that landed in the default partition are moved into the
+    new partition in the same transaction.
+
+    :return: The partitions created.
+    """
+    partitions = list_webhook_event_partitions()
+    created = []
+    for offset in range(days_ahead + 1):
+        day = today + datetime.timedelta(days=offset)
+        start, end = _day_range(day)
+        if any(partition.covers(start, end) for partition in partitions):
+            continue
+        _create_partition(partition_name(day), start, end)
+        created.append(partition_name(day))
+    if created:
+        logger.info("Created webhook event partitions %s", created)
+    return created
+
+
+def _create_partition(name: str, start: datetime.datetime, end: datetime.datetime) -> None:
+    # Built detached and then attached, rather than ``CREATE TABLE ... PARTITION
+    # OF``: that refuses to create a range the default partition already holds rows
+    # of, where this moves them over first. Locking the default partition keeps a
+    # row of the range from arriving in it between the move and the attach.
+    bounds = [start, end]
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"SET LOCAL lock_timeout = '{WEBHOOK_EVENT_PARTITION_LOCK_TIMEOUT}'")
+        cursor.execute(f"LOCK TABLE {WEBHOOK_EVENT_DEFAULT_PARTITION} IN SHARE ROW EXCLUSIVE MODE")
+        cursor.execute(
+            f"CREATE TABLE {name} (LIKE {WEBHOOK_EVENT_TABLE} INCLUDING DEFAULTS INCLUDING STORAGE)"
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {WEBHOOK_EVENT_DEFAULT_PARTITION} "  # noqa: S608
+            "WHERE created >= %s AND created < %s RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved",
+            bounds,
+        )
+        # Attaching builds the partition's share of every index and foreign key.
+        cursor.execute(
+            f"ALTER TABLE {WEBHOOK_EVENT_TABLE} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+
+def apply_webhook_event_retention(
+    cutoff: datetime.datetime, *, dry_run: bool = False
+) -> WebhookEventRetention:
+    """Drop every partition whose whole range is older than ``cutoff``.
+
+    Rows of the default partition older than ``cutoff`` are deleted. The partition
+    ``cutoff`` falls in is kept whole, older rows and all, until the next run after
+    its day has passed.
+
+    Cross-organization by nature: a partition holds every organization's events of
+    its day. Per-organization retention is
+    ``WebhookAnalyticsService.cleanup_old_webhook_events``.
+
+    A dropped partition's events are reported from the planner's statistics: counting
+    them would read the whole partition just before dropping it.
+
+    :param dry_run: Count what would go, without dropping or deleting anything.
+    """
+    retention = WebhookEventRetention(estimated=not dry_run)
+    expired = [
+        partition
+        for partition in list_webhook_event_partitions()
+        if not partition.is_default and partition.end is not None and partition.end <= cutoff
+    ]
+    for partition in expired:
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(f"SET LOCAL lock_timeout = '{WEBHOOK_EVENT_PARTITION_LOCK_TIMEOUT}'")
+                if dry_run:
+                    cursor.execute(f"SELECT COUNT(*) FROM {partition.name}")  # noqa: S608
+                else:
+                    # ``reltuples`` is -1 until the table is first analyzed; report 0 then.
+                    cursor.execute(
+                        "SELECT GREATEST(reltuples, 0)::bigint FROM pg_class "
+                        "WHERE oid = %s::regclass",
+                        [partition.name],
+                    )
+                (events,) = cursor.fetchone()
+                if not dry_run:
+                    cursor.execute(f"DROP TABLE {partition.name}")
+        except DatabaseError:
+            logger.warning(
+                "Could not drop webhook event partition %s; retrying on the next run.",
+                partition.name,
+                exc_info=True,
+            )
+            retention.skipped_partitions.append(partition.name)
+            continue
+        retention.dropped_partitions.append((partition.name, events))
+
+    with connection.cursor() as cursor:
+        if dry_run:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {WEBHOOK_EVENT_DEFAULT_PARTITION} WHERE created < %s",  # noqa: S608
+                [cutoff],
+            )
+            (retention.deleted_default_events,) = cursor.fetchone()
+        else:
+            cursor.execute(
+                f"DELETE FROM {WEBHOOK_EVENT_DEFAULT_PARTITION} WHERE created < %s",  # noqa: S608
+                [cutoff],
+            )
+            retention.deleted_default_events = cursor.rowcount
+
+    if retention.dropped_partitions and not dry_run:
+        logger.info(
+            "Dropped webhook event partitions %s",
+            [name for name, _ in retention.dropped_partitions],
+        )
+    return retention
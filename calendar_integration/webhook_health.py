@@ -0,0 +1,166 @@
+"""Set-based webhook health counts, for one organization or all of them.
+
+``CalendarWebhookService.get_webhook_health_status`` counted an organization's
+subscriptions and events in seven queries, and ``WebhookAnalyticsService`` did it
+again in its own for the subscription report -- one ``count()`` per figure. The
+``webhook_health_check`` command ran all of that per organization, so checking the
+whole deployment cost a dozen queries per organization, most of them over tenants
+without a single subscription.
+
+:func:`webhook_health_by_organization` computes every figure of every organization
+asked for in two grouped, conditional-aggregation queries: one over the
+subscriptions (``COUNT(*) FILTER (WHERE ...)`` per figure) and one over the webhook
+events of the window. An organization missing from both gets all zeros, without a
+query of its own.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+from collections.abc import Iterable
+
+from django.db.models import Avg, Count, F, Q
+
+from calendar_integration.constants import IncomingWebhookProcessingStatus
+from calendar_integration.models import CalendarWebhookEvent, CalendarWebhookSubscription
+
+
+#: Active subscriptions expiring within this are "expiring soon".
+EXPIRING_SOON_WINDOW = datetime.timedelta(hours=24)
+#: Active subscriptions without a notification for this long are "stale".
+STALE_SUBSCRIPTION_AFTER = datetime.timedelta(days=7)
+
+
+@dataclasses.dataclass(frozen=True)
+class OrganizationWebhookHealth:
+    """One organization's webhook figures, as of a point in time.
+
+    The subscription counts are of the organization's subscriptions at that time;
+    the event counts are of the webhook events received in the window asked for.
+    ``expired``, ``expiring_soon`` and ``stale`` only count active subscriptions.
+    """
+
+    total_subscriptions: int = 0
+    active_subscriptions: int = 0
+    expired_subscriptions: int = 0
+    expiring_soon_subscriptions: int = 0
+    stale_subscriptions: int = 0
+    total_events: int = 0
+    successful_events: int = 0
+    failed_events: int = 0
+    ignored_events: int = 0
+    pending_events: int = 0
+    average_processing_time_seconds: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        """Processed events per hundred received; 100 without any."""
+        if not self.total_events:
+            return 100.0
+        return self.successful_events / self.total_events * 100
+
+    @property
+    def failure_rate(self) -> float:
+        """Failed events per hundred received; 0 without any."""
+        if not self.total_events:
+            return 0.0
+        return self.failed_events / self.total_events * 100
+
+    def delivery_stats(self) -> dict[str, int | float]:
+        """The event figures, shaped as ``WebhookAnalyticsService.get_webhook_delivery_stats``."""
+        return {
+            "total_events": self.total_events,
+            "successful_events": self.successful_events,
+            "failed_events": self.failed_events,
+            "ignored_events": self.ignored_events,
+            "pending_events": self.pending_events,
+            "success_rate": self.success_rate,
+            "failure_rate": self.failure_rate,
+            "average_processing_time_seconds": self.average_processing_time_seconds,
+        }
+
+
+def webhook_health_by_organization(
+    organization_ids: Iterable[int] | None,
+    *,
+    now: datetime.datetime,
+    events_since: datetime.datetime,
+) -> dict[int, OrganizationWebhookHealth]:
+    """Every webhook figure of the organizations asked for, in two queries.
+
+    :param organization_ids: The organizations to count; ``None`` for all of them.
+        Counting is a deliberate cross-organization scan, so it reads through
+        ``original_manager``; callers scope it with this.
+    :param now: What "expired", "expiring soon" and "stale" are measured from.
+    :param events_since: Start of the event window.
+    :return: The figures per organization id. Every organization asked for is in
+        it, zeros and all; with ``organization_ids=None``, only those with a
+        subscription or an event in the window are.
+    """
+    ids = None if organization_ids is None else list(organization_ids)
+    subscriptions = CalendarWebhookSubscription.original_manager.all()
+    events = CalendarWebhookEvent.original_manager.filter(created__gte=events_since)
+    if ids is not None:
+        subscriptions = subscriptions.filter(organization_id__in=ids)
+        events = events.filter(organization_id__in=ids)
+
+    active = Q(is_active=True)
+    subscription_rows = (
+        subscriptions.order_by()
+        .values("organization_id")
+        .annotate(
+            total_subscriptions=Count("id"),
+            active_subscriptions=Count("id", filter=active),
+            expired_subscriptions=Count("id", filter=active & Q(expires_at__lt=now)),
+            expiring_soon_subscriptions=Count(
+                "id",
+                filter=active & Q(expires_at__gte=now, expires_at__lte=now + EXPIRING_SOON_WINDOW),
+            ),
+            stale_subscriptions=Count(
+                "id",
+                filter=active
+                & (
+                    Q(last_notification_at__isnull=True)
+                    | Q(last_notification_at__lt=now - STALE_SUBSCRIPTION_AFTER)
+                ),
+            ),
+        )
+    )
+    processed = Q(processing_status=IncomingWebhookProcessingStatus.PROCESSED)
+    event_rows = (
+        events.order_by()
+        .values("organization_id")
+        .annotate(
+            total_events=Count("id"),
+            successful_events=Count("id", filter=processed),
+            failed_events=Count(
+                "id", filter=Q(processing_status=IncomingWebhookProcessingStatus.FAILED)
+            ),
+            ignored_events=Count(
+                "id", filter=Q(processing_status=IncomingWebhookProcessingStatus.IGNORED)
+            ),
+            pending_events=Count(
+                "id", filter=Q(processing_status=IncomingWebhookProcessingStatus.PENDING)
+            ),
+            average_processing_time=Avg(
+                F("processed_at") - F("created"),
+                filter=processed & Q(processed_at__isnull=False),
+            ),
+        )
+    )
+
+    figures: dict[int, dict[str, int | float]] = {
+        organization_id: {} for organization_id in ids or ()
+    }
+    for row in subscription_rows:
+        figures.setdefault(row.pop("organization_id"), {}).update(row)
+    for row in event_rows:
+        average = row.pop("average_processing_time")
+        figures.setdefault(row.pop("organization_id"), {}).update(
+            row, average_processing_time_seconds=average.total_seconds() if average else 0.0
+        )
+    return {
+        organization_id: OrganizationWebhookHealth(**counts)  # type: ignore[arg-type]
+        for organization_id, counts in figures.items()
+    }
@@ -0,0 +1,275 @@
+"""Fast-ack ingestion of provider webhook notifications.
+
+Google and Microsoft expect a webhook to be answered within a few seconds and retry
+(Microsoft eventually drops the subscription) when it is not. The views used to do
+all of the work inside the provider's request, under ``ATOMIC_REQUESTS``: calendar
+lookup, adapter resolution, the recent-sync dedupe query and the sync request itself.
+A push burst -- a bulk edit, a busy room calendar -- tied up a web worker per
+notification, and every slow answer came back as a retry.
+
+Ingestion is now split in two:
+
+- The view (``CalendarWebhookService.handle_webhook``) validates the notification
+  statically -- headers and body only, no database -- inserts one ``PENDING``
+  ``CalendarWebhookEvent`` per notified calendar and answers ``202``. Once the rows
+  are committed it notes the calendars in the debounce index
+  (``calendar_integration.webhook_debounce``) and calls
+  :func:`schedule_webhook_drain`.
+- ``calendar_integration.tasks.process_webhook_events_task`` drains an organization's
+  pending events in batches: :func:`claim_pending_webhook_events` leases up to
+  :data:`WEBHOOK_DRAIN_BATCH_SIZE` of those whose calendar is due, in a transaction
+  of its own (``SKIP LOCKED``, so concurrent drains split the backlog), and the rest
+  of the drain -- authenticating, requesting syncs -- holds no lock.
+  :func:`plan_webhook_syncs` groups the claimed events per calendar and resolves each
+  calendar's syncing account in a few set-based queries, and the task requests one
+  webhook-triggered sync per calendar however many notifications it received.
+
+:func:`schedule_webhook_drain` coalesces the drains asked for into one: the first
+request sets a Redis key living as long as its countdown and enqueues the drain,
+later ones find the key and enqueue nothing. The drain cannot start before the key
+expires, so a notification that found the key is already committed when the drain
+it relied on claims its batch; a drain that leaves calendars waiting schedules the
+next one. The view asks for a drain a quiet period out (:data:`WEBHOOK_DRAIN_DELAY`),
+when the calendar it noted is due at the earliest. Without Redis every request
+enqueues a drain; the extra ones find nothing left to claim.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import logging
+import math
+from collections import defaultdict
+from collections.abc import Collection
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from allauth.socialaccount.models import SocialAccount
+from redis.exceptions import RedisError
+
+from calendar_integration.constants import IncomingWebhookProcessingStatus
+from calendar_integration.models import Calendar, CalendarSync, CalendarWebhookEvent
+from calendar_integration.sync_scheduling import resolve_owner_accounts
+from calendar_integration.webhook_debounce import (
+    WEBHOOK_SYNC_MAX_DELAY,
+    WEBHOOK_SYNC_QUIET_PERIOD,
+    webhook_sync_due_at,
+)
+from common.redis import CircuitBreakerOpenError, get_redis_connection, redis_breaker
+
+
+logger = logging.getLogger(__name__)
+
+#: Seconds after a notification that the drain it asks for runs: no sooner could the
+#: notified calendar be due.
+WEBHOOK_DRAIN_DELAY = int(WEBHOOK_SYNC_QUIET_PERIOD.total_seconds())
+#: Pending events one drain claims. A drain that fills its batch enqueues the next.
+WEBHOOK_DRAIN_BATCH_SIZE = 200
+#: How long a drain's claim on its events lasts. A claimed event stays ``PENDING``,
+#: with ``processed_at`` stamped with the claim; should the drain die before settling
+#: it, it is claimed again once this has passed.
+WEBHOOK_CLAIM_LEASE = datetime.timedelta(minutes=10)
+
+
+@dataclasses.dataclass(frozen=True)
+class PendingWebhookSync:
+    """The pending notifications of one calendar, and what can sync it.
+
+    :param external_calendar_id: The calendar's id at the provider, as notified.
+    :param events: The calendar's claimed ``CalendarWebhookEvent`` rows, oldest first.
+    :param calendar: The calendar, ``None`` when no calendar of the organization has
+        that external id.
+    :param social_account: Its owner's linked account for the calendar's provider,
+        ``None`` when there is no one to sync it as.
+    """
+
+    external_calendar_id: str
+    events: list[CalendarWebhookEvent]
+    calendar: Calendar | None
+    social_account: SocialAccount | None
+
+    @property
+    def first_notified_at(self) -> datetime.datetime:
+        return min(event.created for event in self.events)
+
+
+def schedule_webhook_drain(organization_id: int, countdown: float = WEBHOOK_DRAIN_DELAY) -> None:
+    """Make sure a drain of ``organization_id``'s pending events is on its way.
+
+    :param countdown: Seconds until the drain runs. A drain already on its way is
+        relied on instead, even if it runs later -- by at most a quiet period, after
+        which it schedules the next one. See the module docstring.
+    """
+    countdown = max(1, math.ceil(countdown))
+    # Late: ``calendar_integration.tasks`` imports the calendar service, which
+    # imports the webhook service that calls this.
+    from calendar_integration.tasks import process_webhook_events_task
+
+    conn = get_redis_connection()
+    if conn is not None:
+        try:
+            scheduled = redis_breaker.call(
+                conn.set,
+                f"webhook-drain:{organization_id}",
+                1,
+                nx=True,
+                ex=countdown,
+            )
+        except (RedisError, CircuitBreakerOpenError) as exc:
+            logger.warning("Redis unavailable to coalesce webhook drains: %s", exc)
+        else:
+            if not scheduled:
+                return
+
+    process_webhook_events_task.apply_async((organization_id,), countdown=countdown)
+
+
+@dataclasses.dataclass(frozen=True)
+class WebhookEventClaim:
+    """What :func:`claim_pending_webhook_events` leased, and what it left waiting.
+
+    :param events: The claimed events, oldest first.
+    :param waiting_until: When the first calendar it left pending, not due yet, is.
+    """
+
+    events: list[CalendarWebhookEvent]
+    waiting_until: datetime.datetime | None = None
+
+
+def _claimable_webhook_events(organization_id: int, now: datetime.datetime):
+    """Pending events no drain holds a live claim on."""
+    return (
+        CalendarWebhookEvent.objects.filter_by_organization(organization_id)
+        .filter(processing_status=IncomingWebhookProcessingStatus.PENDING)
+        .filter(Q(processed_at__isnull=True) | Q(processed_at__lt=now - WEBHOOK_CLAIM_LEASE))
+    )
+
+
+def claim_pending_webhook_events(
+    organization_id: int,
+    calendar_keys: Collection[str] | None = None,
+    *,
+    now: datetime.datetime,
+    stale_before: datetime.datetime | None = None,
+    limit: int = WEBHOOK_DRAIN_BATCH_SIZE,
+) -> WebhookEventClaim:
+    """Lease up to ``limit`` of the organization's pending events, oldest first.
+
+    The events are locked (``SKIP LOCKED``) and stamped as claimed in a transaction
+    of its own, committed on return: the caller settles them with no lock held.
+
+    :param calendar_keys: Only claim the events of these calendars
+        (``webhook_calendar_key``) -- plus those created before ``stale_before``.
+        ``None`` claims the events of every calendar the events themselves say is due
+        at ``now``; the others are left pending.
+    """
+    with transaction.atomic():
+        events = _claimable_webhook_events(organization_id, now)
+        if calendar_keys is not None:
+            claimed = Q(created__lt=stale_before) if stale_before else Q(pk__in=[])
+            for calendar_key in calendar_keys:
+                provider, external_calendar_id = calendar_key.split(":", 1)
+                claimed |= Q(provider=provider, external_calendar_id=external_calendar_id)
+            events = events.filter(claimed)
+        locked = list(events.order_by("created", "id").select_for_update(skip_locked=True)[:limit])
+
+        waiting_until = None
+        if calendar_keys is None:
+            by_calendar: dict[tuple[str, str], list[CalendarWebhookEvent]] = defaultdict(list)
+            for event in locked:
+                by_calendar[(event.provider, event.external_calendar_id)].append(event)
+            locked = []
+            for calendar_events in by_calendar.values():
+                due_at = webhook_sync_due_at(
+                    calendar_events[0].created, max(event.created for event in calendar_events)
+                )
+                if due_at <= now:
+                    locked += calendar_events
+                elif waiting_until is None or due_at < waiting_until:
+                    waiting_until = due_at
+            locked.sort(key=lambda event: (event.created, event.id))
+
+        if locked:
+            CalendarWebhookEvent.objects.filter_by_organization(organization_id).filter(
+                id__in=[event.id for event in locked]
+            ).update(processed_at=now)
+    return WebhookEventClaim(events=locked, waiting_until=waiting_until)
+
+
+def next_stale_webhook_claim_at(organization_id: int) -> datetime.datetime | None:
+    """When a drain next finds a pending event to claim however the index stands.
+
+    That is when the oldest unclaimed one gets ``WEBHOOK_SYNC_MAX_DELAY`` old, or
+    when the claim on one left by a drain that died runs out.
+    """
+    now = timezone.now()
+    pending = CalendarWebhookEvent.objects.filter_by_organization(organization_id).filter(
+        processing_status=IncomingWebhookProcessingStatus.PENDING
+    )
+    oldest_unclaimed = (
+        _claimable_webhook_events(organization_id, now)
+        .order_by("created")
+        .values_list("created", flat=True)
+        .first()
+    )
+    oldest_claim = (
+        pending.filter(processed_at__gte=now - WEBHOOK_CLAIM_LEASE)
+        .order_by("processed_at")
+        .values_list("processed_at", flat=True)
+        .first()
+    )
+    candidates = []
+    if oldest_unclaimed is not None:
+        candidates.append(oldest_unclaimed + WEBHOOK_SYNC_MAX_DELAY)
+    if oldest_claim is not None:
+        candidates.append(oldest_claim + WEBHOOK_CLAIM_LEASE)
+    return min(candidates, default=None)
+
+
+def plan_webhook_syncs(
+    organization_id: int, events: list[CalendarWebhookEvent]
+) -> list[PendingWebhookSync]:
+    """Group claimed ``events`` per notified calendar and resolve who syncs it.
+
+    Two queries for calendars and their accounts, whatever the batch size.
+    """
+    by_calendar: dict[tuple[str, str], list[CalendarWebhookEvent]] = defaultdict(list)
+    for event in events:
+        by_calendar[(event.provider, event.external_calendar_id)].append(event)
+
+    calendars = {
+        (calendar.provider, calendar.external_id): calendar
+        for calendar in Calendar.objects.filter_by_organization(organization_id).filter(
+            external_id__in={external_id for _, external_id in by_calendar}
+        )
+    }
+    accounts = resolve_owner_accounts(list(calendars.values()))
+
+    plans = []
+    for key, calendar_events in by_calendar.items():
+        calendar = calendars.get(key)
+        plans.append(
+            PendingWebhookSync(
+                external_calendar_id=key[1],
+                events=calendar_events,
+                calendar=calendar,
+                social_account=accounts.get(calendar.id) if calendar else None,
+            )
+        )
+    return plans
+
+
+def settle_webhook_events(
+    events: list[CalendarWebhookEvent],
+    status: IncomingWebhookProcessingStatus,
+    calendar_sync: CalendarSync | None = None,
+) -> None:
+    """Record the outcome of ``events`` in one statement."""
+    if not events:
+        return
+    CalendarWebhookEvent.objects.filter_by_organization(events[0].organization_id).filter(
+        id__in=[event.id for event in events]
+    ).update(processing_status=status, calendar_sync_fk=calendar_sync, processed_at=timezone.now())
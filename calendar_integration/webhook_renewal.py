@@ -0,0 +1,196 @@
+"""Set-based renewal of expiring webhook subscriptions.
+
+``CalendarWebhookService.refresh_webhook_subscription`` only moved a subscription's
+local ``expires_at``: the provider was never told, so the Google channel or Graph
+subscription lapsed at its original expiration all the same and notifications
+stopped while the row claimed otherwise. Nothing ran it on a schedule either; the
+``refresh_webhook_subscriptions`` command walked the expiring subscriptions one by
+one, building a calendar service per subscription.
+
+``renew_webhook_subscriptions_task`` (beat) now keeps them alive:
+
+- :func:`plan_webhook_renewals` finds every active subscription expiring within
+  :data:`WEBHOOK_RENEWAL_LEAD_TIME`, across organizations, and groups them per
+  syncing account (``sync_scheduling.resolve_owner_accounts``) -- three queries
+  however many there are;
+- one ``renew_account_webhook_subscriptions_task`` per account authenticates once and
+  calls ``CalendarWebhookService.renew_webhook_subscriptions``, which renews the
+  account's subscriptions with the provider through :func:`renew_subscriptions` -- on
+  up to :data:`WEBHOOK_RENEWAL_MAX_CONCURRENCY` threads, each call drawing on the
+  account's provider quota -- and stores every new expiration and channel in one
+  ``bulk_update``.
+
+A Google channel cannot be extended, so it is replaced by a new one
+(``GoogleCalendarAdapter.renew_webhook_subscription``); a Graph subscription is
+extended in place. Renewals ask for the longest life each provider grants
+(:data:`WEBHOOK_SUBSCRIPTION_TTL`), so with an hourly beat a subscription is renewed
+once or twice a week, not on every run.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from calendar_integration.constants import CalendarProvider
+from calendar_integration.models import CalendarWebhookSubscription
+from calendar_integration.sync_scheduling import resolve_owner_accounts
+
+
+if TYPE_CHECKING:
+    from calendar_integration.services.protocols.calendar_adapter import CalendarAdapter
+
+
+#: Subscriptions expiring within this are renewed. Longer than the beat's interval
+#: by far, so a run or two that never happened does not let one lapse.
+WEBHOOK_RENEWAL_LEAD_TIME = datetime.timedelta(hours=24)
+#: Renewals of one account in flight at once. Each is a single provider call (two
+#: for Google: the new channel, then stopping the old one), paced by the account's
+#: quota bucket; the bound keeps one account from holding many connections.
+WEBHOOK_RENEWAL_MAX_CONCURRENCY = 4
+#: The life a renewal asks for: the longest each provider grants.
+WEBHOOK_SUBSCRIPTION_TTL = {
+    CalendarProvider.GOOGLE: datetime.timedelta(days=7),
+    CalendarProvider.MICROSOFT: datetime.timedelta(hours=70),
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class WebhookRenewalPlan:
+    """The renewals a run fans out to.
+
+    :param batches: ``(organization_id, social_account_id, subscription_ids)``, one per
+        account; an account's subscriptions are all in one batch.
+    :param unresolved_subscription_ids: Subscriptions of calendars without an owner,
+        or whose owner has no linked account for the provider: nothing can renew them.
+    """
+
+    batches: list[tuple[int, int, list[int]]]
+    unresolved_subscription_ids: list[int]
+
+    @property
+    def subscription_count(self) -> int:
+        """Subscriptions the batches cover."""
+        return sum(len(subscription_ids) for _, _, subscription_ids in self.batches)
+
+
+@dataclasses.dataclass(frozen=True)
+class SubscriptionRenewal:
+    """The outcome of one subscription's renewal with its provider.
+
+    :param subscription: The subscription renewed.
+    :param details: What the provider answered, shaped as
+        ``create_webhook_subscription_with_tracking``'s; ``None`` when it failed.
+    :param error: Why it failed.
+    """
+
+    subscription: CalendarWebhookSubscription
+    details: dict[str, Any] | None = None
+    error: Exception | None = None
+
+
+@dataclasses.dataclass
+class WebhookRenewalSummary:
+    """What a renewal run did, one count per subscription."""
+
+    renewed: int = 0
+    failed: int = 0
+
+
+def plan_webhook_renewals(
+    now: datetime.datetime,
+    *,
+    lead_time: datetime.timedelta = WEBHOOK_RENEWAL_LEAD_TIME,
+    organization_id: int | None = None,
+    provider: str | None = None,
+) -> WebhookRenewalPlan:
+    """Group the active subscriptions expiring within ``lead_time`` per account.
+
+    Subscriptions already expired are left out: the provider dropped them, and only
+    a new subscription brings their calendar's notifications back.
+
+    :param organization_id: Only plan this organization's subscriptions.
+    :param provider: Only plan this provider's subscriptions.
+    """
+    # Cross-organization by design, like the sync scheduler's scan: each batch is
+    # renewed inside its own organization's context by the task it goes to.
+    subscriptions = CalendarWebhookSubscription.original_manager.filter(
+        is_active=True, expires_at__gt=now, expires_at__lte=now + lead_time
+    )
+    if organization_id is not None:
+        subscriptions = subscriptions.filter(organization_id=organization_id)
+    if provider is not None:
+        subscriptions = subscriptions.filter(provider=provider)
+    subscriptions = list(subscriptions.select_related("calendar").order_by("expires_at", "id"))
+
+    accounts = resolve_owner_accounts([subscription.calendar for subscription in subscriptions])
+    by_account: dict[tuple[int, int], list[int]] = defaultdict(list)
+    unresolved: list[int] = []
+    for subscription in subscriptions:
+        social_account = accounts.get(subscription.calendar.id)
+        if social_account is None:
+            unresolved.append(subscription.id)
+        else:
+            by_account[(subscription.organization_id, social_account.id)].append(subscription.id)
+    return WebhookRenewalPlan(
+        batches=[
+            (organization_id, social_account_id, subscription_ids)
+            for (organization_id, social_account_id), subscription_ids in by_account.items()
+        ],
+        unresolved_subscription_ids=unresolved,
+    )
+
+
+def renewal_tracking_params(provider: str) -> dict[str, int]:
+    """The adapter's ``tracking_params`` asking for :data:`WEBHOOK_SUBSCRIPTION_TTL`."""
+    ttl = WEBHOOK_SUBSCRIPTION_TTL.get(CalendarProvider(provider), datetime.timedelta(days=1))
+    if provider == CalendarProvider.MICROSOFT:
+        return {"expiration_hours": int(ttl.total_seconds() // 3600)}
+    return {"ttl_seconds": int(ttl.total_seconds())}
+
+
+def renew_subscriptions(
+    adapter: CalendarAdapter,
+    subscriptions: Sequence[CalendarWebhookSubscription],
+    max_concurrency: int = WEBHOOK_RENEWAL_MAX_CONCURRENCY,
+) -> list[SubscriptionRenewal]:
+    """Renew every subscription with its provider, up to ``max_concurrency`` at once.
+
+    :param subscriptions: Loaded with their ``calendar``; read here, before any
+        thread starts.
+    :return: One ``SubscriptionRenewal`` per subscription, in order. A failed renewal
+        is reported in its ``SubscriptionRenewal`` rather than raised, so it does not
+        cost the others theirs.
+
+    Touches no database: the threads it runs on hold no connection.
+    """
+    calls = [
+        (
+            subscription,
+            {
+                "subscription_id": subscription.external_subscription_id,
+                "resource_id": subscription.calendar.external_id,
+                "callback_url": subscription.callback_url,
+                "provider_resource_id": subscription.external_resource_id,
+                "tracking_params": renewal_tracking_params(subscription.provider),
+            },
+        )
+        for subscription in subscriptions
+    ]
+
+    def renew(call: tuple[CalendarWebhookSubscription, dict[str, Any]]) -> SubscriptionRenewal:
+        subscription, kwargs = call
+        try:
+            details = adapter.renew_webhook_subscription(**kwargs)
+        except Exception as exc:  # noqa: BLE001
+            return SubscriptionRenewal(subscription=subscription, error=exc)
+        return SubscriptionRenewal(subscription=subscription, details=details)
+
+    if not calls:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(calls)))) as executor:
+        return list(executor.map(renew, calls))
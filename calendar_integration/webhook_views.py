@@ -23,8 +23,9 @@ class GoogleCalendarWebhookView(View):
     """
     Webhook endpoint for Google Calendar notifications.
 
-    Handles incoming webhook notifications from Google Calendar and triggers
-    calendar synchronization using the existing CalendarService infrastructure.
+    Records incoming webhook notifications from Google Calendar and acknowledges them
+    right away; the calendar synchronization they trigger runs in the background
+    (see ``calendar_integration.webhook_ingestion``).
     """
 
     @inject
@@ -43,7 +44,8 @@ class GoogleCalendarWebhookView(View):
             calendar_service: Injected calendar service
 
         Returns:
-        - 200: Webhook processed successfully
+        - 202: Notification recorded, sync to follow
+        - 200: Sync notification acknowledged, nothing to record
         - 400: Invalid webhook payload
         - 404: Organization not found
         - 500: Internal server error
@@ -53,14 +55,15 @@ class GoogleCalendarWebhookView(View):
                 "Google Calendar webhook received", extra={"organization_id": organization_id}
             )
 
-            result = calendar_service.handle_webhook(CalendarProvider.GOOGLE, request)
+            webhook_events = calendar_service.handle_webhook(CalendarProvider.GOOGLE, request)
 
-            # None result means sync notification was skipped
-            if result is None:
+            # No events means a sync notification, which needs no processing
+            if not webhook_events:
                 logger.info("Received Google Calendar sync notification, acknowledging")
+                return HttpResponse(status=200)
 
-            logger.info("Google Calendar webhook processed successfully")
-            return HttpResponse(status=200)
+            logger.info("Google Calendar webhook recorded")
+            return HttpResponse(status=202)
 
         except ValueError as e:
             # This handles organization not found errors
@@ -84,7 +87,8 @@ class MicrosoftCalendarWebhookView(View):
     """
     Webhook endpoint for Microsoft Calendar notifications.
 
-    This is not implemented yet.
+    Answers Microsoft Graph's subscription validation, and records notifications and
+    acknowledges them right away like :class:`GoogleCalendarWebhookView`.
     """
 
     @inject
@@ -103,7 +107,8 @@ class MicrosoftCalendarWebhookView(View):
             calendar_service: Injected calendar service
 
         Returns:
-        - 200: Webhook processed successfully or validation token returned
+        - 202: Notification recorded, sync to follow
+        - 200: Validation token returned, or nothing to record
         - 400: Invalid webhook payload or validation token
         - 404: Organization not found
         - 500: Internal server error
@@ -139,14 +144,14 @@ class MicrosoftCalendarWebhookView(View):
                 "Microsoft Calendar webhook received", extra={"organization_id": organization_id}
             )
 
-            result = calendar_service.handle_webhook(CalendarProvider.MICROSOFT, request)
+            webhook_events = calendar_service.handle_webhook(CalendarProvider.MICROSOFT, request)
 
-            # None result means notification was processed but no sync was needed
-            if result is None:
-                logger.info("Microsoft Calendar webhook processed successfully (no sync needed)")
+            if not webhook_events:
+                logger.info("Microsoft Calendar webhook acknowledged (nothing to record)")
+                return HttpResponse(status=200)
 
-            logger.info("Microsoft Calendar webhook processed successfully")
-            return HttpResponse(status=200)
+            logger.info("Microsoft Calendar webhook recorded")
+            return HttpResponse(status=202)
 
         except ValueError as e:
             # This handles organization not found errors and validation failures
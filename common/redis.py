@@ -3,13 +3,16 @@
 Redis is treated as a best-effort dependency: if it is unconfigured or
 unreachable the application keeps working. A process-wide circuit breaker stops
 us from hammering a dead Redis on every request, and rate limiters transparently
-fall back to an in-process bucket while the circuit is open.
+fall back to an in-process bucket while the circuit is open. Locks
+(``resilient_lock``) likewise fall back to an in-process lock.
 """
 
+import contextlib
 import logging
 import threading
 import time
-from collections.abc import Callable, Iterable
+import weakref
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 from django.conf import settings
@@ -263,3 +266,50 @@ def build_resilient_limiter(
         name=name,
         redis_url=redis_url,
     )
+
+
+# Dropped once no thread holds or waits on them, so the lock names seen over a
+# process's life do not pile up.
+_local_locks: weakref.WeakValueDictionary[str, threading.Lock] = weakref.WeakValueDictionary()
+_local_locks_guard = threading.Lock()
+
+
+@contextlib.contextmanager
+def resilient_lock(name: str, *, timeout: float, blocking_timeout: float) -> Iterator[bool]:
+    """Hold the lock ``name`` across processes, or within this process without Redis.
+
+    When Redis is healthy the lock is a Redis lock, so every worker sharing that
+    Redis serializes on it; ``timeout`` (seconds) bounds how long it outlives a holder
+    that died. When Redis is unconfigured, fails, or the circuit breaker is open, a
+    per-process ``threading.Lock`` of the same name stands in.
+
+    Waits up to ``blocking_timeout`` seconds and yields whether the lock was
+    acquired: on ``False`` the caller decides whether to go on unserialized.
+    """
+    conn = get_redis_connection()
+    if conn is not None and redis_breaker.allows_request():
+        redis_lock = conn.lock(name, timeout=timeout, blocking_timeout=blocking_timeout)
+        try:
+            acquired = bool(redis_breaker.call(redis_lock.acquire))
+        except (RedisError, CircuitBreakerOpenError) as exc:
+            logger.warning("Redis unavailable for lock '%s': %s", name, exc)
+        else:
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    try:
+                        redis_lock.release()
+                    except RedisError as exc:
+                        # Expired under a slow holder; whoever took it over keeps it.
+                        logger.warning("Could not release Redis lock '%s': %s", name, exc)
+            return
+
+    with _local_locks_guard:
+        local_lock = _local_locks.setdefault(name, threading.Lock())
+    acquired = local_lock.acquire(timeout=blocking_timeout)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            local_lock.release()
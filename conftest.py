@@ -1,3 +1,4 @@
+import datetime
 import ipaddress as _ipaddress
 import socket as _socket
 from unittest.mock import MagicMock
@@ -103,7 +104,7 @@ def mock_external_calendar_clients(monkeypatch):
     """Globally mock the external calendar provider clients so tests never hit their APIs.
 
     Covers the only external calendar APIs we consume:
-      * Google Calendar  -> googleapiclient ``build`` + OAuth ``Credentials``/``Request``
+      * Google Calendar  -> ``build_google_client`` + OAuth ``Credentials``/``Request``
       * Microsoft Outlook -> ``MSOutlookCalendarAPIClient`` (Graph)
 
     allauth's social-auth HTTP calls are caught by ``block_external_network``; tests that
@@ -113,8 +114,10 @@ def mock_external_calendar_clients(monkeypatch):
         google_calendar_adapter,
         ms_outlook_calendar_adapter,
     )
+    from calendar_integration.services.dataclasses import RefreshedOAuthToken
 
-    # Google: build() returns a mock client; credentials never refresh over the network.
+    # Google: build_google_client() returns a mock client; credentials never refresh over
+    # the network.
     # Configure the paginated list calls to return an empty page (no nextPageToken) so the
     # adapter's `while True` pagination loops terminate instead of spinning forever on a
     # truthy MagicMock token (which would OOM the worker).
@@ -125,13 +128,29 @@ def mock_external_calendar_clients(monkeypatch):
         _empty_google_page
     )
     monkeypatch.setattr(
-        google_calendar_adapter, "build", MagicMock(name="google_build", return_value=google_client)
+        google_calendar_adapter,
+        "build_google_client",
+        MagicMock(name="google_build", return_value=google_client),
     )
     mock_credentials = MagicMock(name="GoogleCredentials")
     mock_credentials.return_value.valid = True
     monkeypatch.setattr(google_calendar_adapter, "Credentials", mock_credentials)
     monkeypatch.setattr(google_calendar_adapter, "Request", MagicMock(name="google_Request"))
 
+    # OAuth refresh (``calendar_integration.oauth_tokens``): expired tokens come back
+    # fresh without reaching either provider's token endpoint.
+    def refresh_access_token(refresh_token):
+        return RefreshedOAuthToken(
+            token="refreshed-access-token",
+            expires_at=datetime.datetime.now(datetime.UTC) + datetime.timedelta(hours=1),
+        )
+
+    for adapter_cls in (
+        google_calendar_adapter.GoogleCalendarAdapter,
+        ms_outlook_calendar_adapter.MSOutlookCalendarAdapter,
+    ):
+        monkeypatch.setattr(adapter_cls, "refresh_access_token", staticmethod(refresh_access_token))
+
     # Microsoft: the Graph API client is fully mocked (no test_connection / Graph calls).
     # Paginated reads return empty so the adapter's pagination loops terminate.
     ms_client = MagicMock(name="ms_outlook_client")
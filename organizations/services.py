@@ -26,6 +26,7 @@ from calendar_integration.models import (
     CalendarOwnership,
     GoogleCalendarServiceAccount,
 )
+from calendar_integration.outlook_room_sync import outlook_rooms_sync_account
 from calendar_integration.services.calendar_service import CalendarService
 from common.utils.authentication_utils import (
     generate_long_lived_token,
@@ -292,34 +293,43 @@ class OrganizationService:
         end_time: datetime.datetime | None = None,
     ) -> None:
         """Authenticate with the org's Google service account and enqueue a
-        calendar resources import for the given organization.
+        calendar resources import for the given organization, then queue a sync of
+        its Outlook rooms.
 
         Resolves the org-level ``GoogleCalendarServiceAccount`` (the one without
-        a ``calendar`` FK).  If none is configured, raises
-        ``NoServiceAccountConfiguredError`` (a DRF ValidationError / 400) so
-        callers can surface a clean error rather than a 500.
+        a ``calendar`` FK).  Outlook rooms sync together from one task
+        (``CalendarService.request_outlook_rooms_sync``) as the Microsoft account
+        of their owner (``outlook_rooms_sync_account``).  If the organization has
+        neither, raises ``NoServiceAccountConfiguredError`` (a DRF
+        ValidationError / 400) so callers can surface a clean error rather than
+        a 500.
 
         :param organization: The organization to sync rooms for.
         :param requested_by: The user (or token) authorizing the sync.
         :param start_time: Import window start; defaults to now.
         :param end_time: Import window end; defaults to now + 365 days.
         :raises NoServiceAccountConfiguredError: When no service account is
-            configured for the organization.
+            configured for the organization and it has no Outlook rooms to sync.
         """
         service_account = (
             GoogleCalendarServiceAccount.objects.filter_by_organization(organization.id)
             .filter(calendar_fk__isnull=True)
             .first()
         )
-        if service_account is None:
+        outlook_account = outlook_rooms_sync_account(organization.id)
+        if service_account is None and outlook_account is None:
             raise NoServiceAccountConfiguredError()
 
-        self.calendar_service.authenticate(account=service_account, organization=organization)
-        now = datetime.datetime.now(tz=datetime.UTC)
-        self.calendar_service.request_organization_calendar_resources_import(
-            start_time=start_time or now,
-            end_time=end_time or (now + datetime.timedelta(days=365)),
-        )
+        if service_account is not None:
+            self.calendar_service.authenticate(account=service_account, organization=organization)
+            now = datetime.datetime.now(tz=datetime.UTC)
+            self.calendar_service.request_organization_calendar_resources_import(
+                start_time=start_time or now,
+                end_time=end_time or (now + datetime.timedelta(days=365)),
+            )
+        if outlook_account is not None:
+            self.calendar_service.authenticate(account=outlook_account, organization=organization)
+            self.calendar_service.request_outlook_rooms_sync()
 
     def request_all_calendars_sync(
         self,
@@ -13,7 +13,7 @@ from calendar_integration.constants import (
     CalendarType,
     CalendarVisibility,
 )
-from calendar_integration.models import Calendar, CalendarOwnership
+from calendar_integration.models import Calendar, CalendarOwnership, GoogleCalendarServiceAccount
 from common.utils.authentication_utils import generate_long_lived_token, hash_long_lived_token
 from organizations.authorization import (
     MEMBERSHIP_ROLE_LABEL_ADMIN,
@@ -22,6 +22,7 @@ from organizations.authorization import (
 from organizations.exceptions import (
     InvalidInvitationTokenError,
     InvitationNotFoundError,
+    NoServiceAccountConfiguredError,
     UserAlreadyHasMembershipError,
 )
 from organizations.models import (
@@ -1869,3 +1870,95 @@ class TestRequestAllCalendarsSync:
 
         assert result == {"synced": [], "skipped": []}
         mock_calendar_service.request_calendar_sync.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestRequestRoomsSync:
+    """OrganizationService.request_rooms_sync — Google import and Outlook rooms sync."""
+
+    @pytest.fixture
+    def mock_calendar_service(self):
+        return Mock()
+
+    @pytest.fixture
+    def organization_service(self, mock_calendar_service):
+        from di_core.containers import container
+
+        with container.calendar_service.override(mock_calendar_service):
+            yield OrganizationService()
+
+    def _owned_outlook_room(self, organization, owner, external_id):
+        room = baker.make(
+            Calendar,
+            organization=organization,
+            name="Room",
+            external_id=external_id,
+            provider=CalendarProvider.MICROSOFT,
+            calendar_type=CalendarType.RESOURCE,
+            visibility=CalendarVisibility.ACTIVE,
+            sync_enabled=True,
+        )
+        baker.make(
+            CalendarOwnership,
+            organization=organization,
+            calendar=room,
+            membership_user_id=owner.id,
+            is_default=True,
+        )
+        return room
+
+    def test_syncs_outlook_rooms_as_their_owner_s_microsoft_account(
+        self, organization_service, mock_calendar_service
+    ):
+        org = baker.make(Organization, name="Outlook Org")
+        owner = baker.make(User, email="rooms-owner@example.com")
+        OrganizationMembership.objects.get_or_create(user=owner, organization=org)
+        SocialAccount.objects.create(user=owner, provider=CalendarProvider.GOOGLE, uid="g-1")
+        microsoft_account = SocialAccount.objects.create(
+            user=owner, provider=CalendarProvider.MICROSOFT, uid="ms-1"
+        )
+        self._owned_outlook_room(org, owner, "room1@example.com")
+        self._owned_outlook_room(org, owner, "room2@example.com")
+
+        organization_service.request_rooms_sync(organization=org, requested_by=None)
+
+        mock_calendar_service.authenticate.assert_called_once_with(
+            account=microsoft_account, organization=org
+        )
+        mock_calendar_service.request_outlook_rooms_sync.assert_called_once_with()
+        mock_calendar_service.request_organization_calendar_resources_import.assert_not_called()
+
+    def test_imports_google_resources_and_syncs_outlook_rooms(
+        self, organization_service, mock_calendar_service
+    ):
+        org = baker.make(Organization, name="Mixed Org")
+        owner = baker.make(User, email="mixed-owner@example.com")
+        OrganizationMembership.objects.get_or_create(user=owner, organization=org)
+        microsoft_account = SocialAccount.objects.create(
+            user=owner, provider=CalendarProvider.MICROSOFT, uid="ms-2"
+        )
+        self._owned_outlook_room(org, owner, "room@example.com")
+        service_account = baker.make(
+            GoogleCalendarServiceAccount,
+            organization=org,
+            calendar_fk=None,
+            email="sa@example.com",
+            admin_email="admin@example.com",
+            private_key_id="kid",
+            private_key="key",
+        )
+
+        organization_service.request_rooms_sync(organization=org, requested_by=None)
+
+        assert [c.kwargs["account"] for c in mock_calendar_service.authenticate.call_args_list] == [
+            service_account,
+            microsoft_account,
+        ]
+        mock_calendar_service.request_organization_calendar_resources_import.assert_called_once()
+        mock_calendar_service.request_outlook_rooms_sync.assert_called_once_with()
+
+    def test_an_organization_with_nothing_to_sync_is_refused(self, organization_service):
+        org = baker.make(Organization, name="Empty Org")
+
+        with pytest.raises(NoServiceAccountConfiguredError):
+            organization_service.request_rooms_sync(organization=org, requested_by=None)
@@ -9,6 +9,7 @@ from django.urls import reverse
 from django.utils import timezone
 
 import pytest
+from allauth.socialaccount.models import SocialAccount
 from model_bakery import baker
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -16,7 +17,8 @@ from rest_framework_simplejwt.tokens import AccessToken
 from vinta_billing.constants import BillingState
 from vinta_billing.models import Subscription
 
-from calendar_integration.models import GoogleCalendarServiceAccount
+from calendar_integration.constants import CalendarProvider, CalendarType
+from calendar_integration.models import Calendar, CalendarOwnership, GoogleCalendarServiceAccount
 from common.organization_context import get_current_organization
 from common.utils.authentication_utils import generate_long_lived_token, hash_long_lived_token
 from organizations.authorization import membership_holds_permission
@@ -3053,6 +3055,44 @@ class TestSyncRoomsTrigger:
         # import must have been called.
         mock_calendar_service.request_organization_calendar_resources_import.assert_called_once()
 
+    def test_sync_rooms_with_only_outlook_rooms_syncs_them(self, user):
+        """Without a service account, an org with Outlook rooms still syncs them."""
+        org = baker.make(Organization, name="Outlook Sync Org", should_sync_rooms=True)
+        client = self._make_admin(user, org)
+        microsoft_account = SocialAccount.objects.create(
+            user=user, provider=CalendarProvider.MICROSOFT, uid="ms-rooms"
+        )
+        room = baker.make(
+            Calendar,
+            organization=org,
+            external_id="room@example.com",
+            provider=CalendarProvider.MICROSOFT,
+            calendar_type=CalendarType.RESOURCE,
+            sync_enabled=True,
+        )
+        baker.make(
+            CalendarOwnership,
+            organization=org,
+            calendar=room,
+            membership_user_id=user.id,
+            is_default=True,
+        )
+
+        mock_calendar_service = MagicMock()
+
+        from di_core.containers import container
+
+        with container.calendar_service.override(mock_calendar_service):
+            url = reverse("api:Organizations-sync-rooms", kwargs={"pk": org.pk})
+            response = client.post(url, {}, format="json")
+
+        assert_response_status_code(response, status.HTTP_202_ACCEPTED)
+        mock_calendar_service.authenticate.assert_called_once_with(
+            account=microsoft_account, organization=org
+        )
+        mock_calendar_service.request_outlook_rooms_sync.assert_called_once_with()
+        mock_calendar_service.request_organization_calendar_resources_import.assert_not_called()
+
     def test_sync_rooms_without_service_account_returns_400(self, user):
         """Without a service account configured, sync-rooms returns 400."""
         org = baker.make(Organization, name="No SA Org", should_sync_rooms=True)
@@ -27,6 +27,7 @@ from audit.constants import AuditAction
 from audit.diff import compute_diff
 from audit.services import AuditService
 from calendar_integration.models import GoogleCalendarServiceAccount
+from calendar_integration.outlook_room_sync import outlook_rooms_sync_account
 from calendar_integration.serializers import CalendarSyncRequestSerializer
 from common.media_storage_backend import MediaStorage
 from common.utils.view_utils import (
@@ -386,6 +387,8 @@ class OrganizationViewSet(NoListVintaScheduleModelViewSet):
         - ``end_time``: ISO 8601 datetime for the import window end.
 
         Defaults (when omitted): ``start_time=now``, ``end_time=now+365d``.
+        The organization's Outlook rooms are synced too, as their owner's
+        Microsoft account.
         Returns HTTP 202 on success.
         """
         org = self.get_object()
@@ -405,14 +408,14 @@ class OrganizationViewSet(NoListVintaScheduleModelViewSet):
         except (ValueError, TypeError) as exc:
             raise ValidationError({"detail": f"Invalid datetime format: {exc}"}) from exc
 
-        # Pre-flight: refuse early (400) if no service account is configured so the
-        # admin gets a clear error instead of a 500.
+        # Pre-flight: refuse early (400) if no service account is configured and no
+        # Outlook room can sync either, so the admin gets a clear error instead of a 500.
         has_sa = (
             GoogleCalendarServiceAccount.objects.filter_by_organization(org.id)
             .filter(calendar_fk__isnull=True)
             .exists()
         )
-        if not has_sa:
+        if not has_sa and outlook_rooms_sync_account(org.id) is None:
             raise NoServiceAccountConfiguredError()
 
         # Call request_rooms_sync directly — the service now owns the on_commit
@@ -2214,6 +2214,7 @@ class Mutation(ExternalEventChangeRequestMutations, CalendarGroupMutations):
         2. Delegates to OrganizationService.request_rooms_sync, which resolves the org-level
            GoogleCalendarServiceAccount, authenticates the calendar service, and enqueues
            the import for the given [start_time, end_time] window (defaults: now / now+365d).
+           It also queues a sync of the organization's Outlook rooms, if any can sync.
         3. Returns success=True on success (async enqueue — no payload), or success=False
            + errorMessage when no service account is configured or input is invalid.
 
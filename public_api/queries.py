@@ -12,6 +12,7 @@ from dependency_injector.wiring import Provide, inject
 from django_virtual_models import QuerySet
 from graphql import GraphQLError
 
+from calendar_integration.change_tracking import calendars_unchanged_since
 from calendar_integration.constants import CalendarType, ExternalEventChangeRequestStatus
 from calendar_integration.exceptions import (
     InvalidTokenError,
@@ -55,6 +56,11 @@ from calendar_integration.models import (
     CalendarWebhookEvent,
     ExternalEventChangeRequest,
 )
+from calendar_integration.services.dataclasses import ExpandedEventCursor
+from calendar_integration.services.event_expansion import (
+    MAX_EXPANDED_EVENTS_PAGE_SIZE,
+    paginate_expanded_events,
+)
 from calendar_integration.services.ics_service import CalendarEventICSService
 from organizations.branding_logo import build_logo_display_url
 from organizations.models import (
@@ -80,6 +86,9 @@ from webhooks.models import WebhookConfiguration, WebhookEvent
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from calendar_integration.querysets import CalendarEventQuerySet
     from calendar_integration.services.bookable_slots_service import BookableSlotsService
     from calendar_integration.services.booking_policy_permission_service import (
         BookingPolicyPermissionService,
@@ -89,6 +98,8 @@ if TYPE_CHECKING:
     from calendar_integration.services.calendar_permission_service import CalendarPermissionService
     from calendar_integration.services.calendar_service import CalendarService
 
+    _ExpandedEventStream = Iterable[tuple[ExpandedEventCursor, CalendarEvent]]
+
 # Uniform error message for all code-gated read failures.  Never disclose whether the
 # code exists, is expired, used, revoked, or bound to the wrong scope.
 _CODE_GATED_ERROR_MESSAGE = "Invalid or expired code."
@@ -198,6 +209,31 @@ def _slice_qs[TQuerySet: QuerySet](qs: TQuerySet, offset: int, limit: int) -> TQ
     return qs[offset : offset + limit]
 
 
+def _prefetch_external_client_identifiers(qs: "CalendarEventQuerySet") -> "CalendarEventQuerySet":
+    return qs.prefetch_related("external_client_identifiers")
+
+
+def _read_expanded_events(
+    read_all: "Callable[[], list[CalendarEvent]]",
+    read_stream: "Callable[[ExpandedEventCursor | None], _ExpandedEventStream]",
+    keep: "Callable[[CalendarEvent], bool]",
+    first: int | None,
+    after: ExpandedEventCursor | None,
+) -> list[CalendarEvent]:
+    """Read an expanded range for ``calendarEvents``, keeping only events ``keep`` accepts.
+
+    An unpaginated read (no ``first``, no ``after``) takes the list path, unchanged.
+    Otherwise the cursor-ordered stream is filtered *before* it is paginated, so a page
+    holds ``first`` matching events, and expansion stops one event past the page.
+    """
+    if first is None and after is None:
+        return [event for event in read_all() if keep(event)]
+    stream = ((cursor, event) for cursor, event in read_stream(after) if keep(event))
+    if first is None:
+        return [event for _, event in stream]
+    return paginate_expanded_events(stream, first).events
+
+
 def _prepare_service_and_calendar(
     info: strawberry.Info, calendar_id: int
 ) -> tuple["CalendarService", Calendar]:
@@ -358,7 +394,10 @@ class Query:
         event_id: int | None = None,
         external_client_identifier_system: str | None = None,
         external_client_identifier_identifier: str | None = None,
-    ) -> list[CalendarEventGraphQLType]:
+        first: int | None = None,
+        after: str | None = None,
+        if_changed_since: datetime.datetime | None = None,
+    ) -> list[CalendarEventGraphQLType] | None:
         """Get calendar events filtered by user's organization.
 
         Supports three lookup modes (in order of precedence):
@@ -384,11 +423,31 @@ class Query:
         occurrence is kept when either its own id or its master's id (persisted
         modified-occurrence exceptions) or its master's recurrence rule (plain
         generated occurrences) is one of the matching events.
+
+        ``first`` / ``after`` keyset-paginate the range modes (2 and 3). Events come back
+        ordered by start time, and each carries an ``expansionCursor``; pass the last
+        one's as ``after`` to read the next page. Only the requested page is expanded,
+        so wide ranges stay cheap. Without ``first`` the whole range after ``after`` (or
+        the whole range) is returned, as before.
+
+        ``ifChangedSince`` is the GraphQL counterpart of a conditional GET for the range
+        modes: pass the newest ``Calendar.changedAt`` seen on the previous poll and the
+        field resolves to ``null`` -- without expanding anything -- while none of the
+        queried calendars (nor their bundle relatives) has changed since.
         """
         # Get the user's organization and request from the GraphQL context.
         org = _get_org(info)
         request: PublicApiHttpRequest = info.context.request
 
+        if first is not None and not 1 <= first <= MAX_EXPANDED_EVENTS_PAGE_SIZE:
+            raise GraphQLError(f"first must be between 1 and {MAX_EXPANDED_EVENTS_PAGE_SIZE}")
+        after_cursor: ExpandedEventCursor | None = None
+        if after:
+            try:
+                after_cursor = ExpandedEventCursor.decode(after)
+            except ValueError as e:
+                raise GraphQLError("Invalid after cursor") from e
+
         if (external_client_identifier_system is None) != (
             external_client_identifier_identifier is None
         ):
@@ -480,25 +539,39 @@ class Query:
             if not owned_ids:
                 return cast(list[CalendarEventGraphQLType], [])
 
+            if if_changed_since is not None and calendars_unchanged_since(
+                org.id, owned_ids, if_changed_since
+            ):
+                return None
+
             # Initialize service for the org (no single Calendar to resolve).
             deps = get_query_dependencies()
             deps.calendar_service.initialize_without_provider(
                 user_or_token=request.public_api_system_user, organization=org
             )
-            events = deps.calendar_service.get_calendar_events_expanded_for_calendars(
-                owned_ids,
-                start_datetime,
-                end_datetime,
-                optimize_queryset=lambda qs: qs.prefetch_related("external_client_identifiers"),
-            )
-            if matching_event_ids is not None:
-                events = [
-                    e
-                    for e in events
-                    if e.id in matching_event_ids
+            events = _read_expanded_events(
+                lambda: deps.calendar_service.get_calendar_events_expanded_for_calendars(
+                    owned_ids,
+                    start_datetime,
+                    end_datetime,
+                    optimize_queryset=_prefetch_external_client_identifiers,
+                ),
+                lambda after: deps.calendar_service.iter_calendar_events_expanded_for_calendars(
+                    owned_ids,
+                    start_datetime,
+                    end_datetime,
+                    optimize_queryset=_prefetch_external_client_identifiers,
+                    after=after,
+                ),
+                keep=lambda e: (
+                    matching_event_ids is None
+                    or e.id in matching_event_ids
                     or e.recurrence_rule_fk_id in matching_recurrence_rule_ids
                     or e.parent_recurring_object_fk_id in matching_event_ids
-                ]
+                ),
+                first=first,
+                after=after_cursor,
+            )
             return cast(list[CalendarEventGraphQLType], events)
 
         # --- Branch 3: calendarId lookup (unchanged) ---
@@ -509,29 +582,44 @@ class Query:
             )
 
         calendar_service, calendar = _prepare_service_and_calendar(info, calendar_id)
-        events = calendar_service.get_calendar_events_expanded(
-            calendar,
-            start_datetime,
-            end_datetime,
-            optimize_queryset=lambda qs: qs.prefetch_related("external_client_identifiers"),
-        )
+
+        if if_changed_since is not None and calendars_unchanged_since(
+            org.id, [calendar.id], if_changed_since
+        ):
+            return None
 
         allowed_ids = (
             scoped_calendar_ids(request.public_api_system_user, org)
             if request.public_api_system_user is not None
             else None
         )
-        if allowed_ids is not None:
-            events = [e for e in events if getattr(e, "calendar_fk_id", None) in allowed_ids]
-
-        if matching_event_ids is not None:
-            events = [
-                e
-                for e in events
-                if e.id in matching_event_ids
-                or e.recurrence_rule_fk_id in matching_recurrence_rule_ids
-                or e.parent_recurring_object_fk_id in matching_event_ids
-            ]
+
+        events = _read_expanded_events(
+            lambda: calendar_service.get_calendar_events_expanded(
+                calendar,
+                start_datetime,
+                end_datetime,
+                optimize_queryset=_prefetch_external_client_identifiers,
+            ),
+            lambda after: calendar_service.iter_calendar_events_expanded(
+                calendar,
+                start_datetime,
+                end_datetime,
+                optimize_queryset=_prefetch_external_client_identifiers,
+                after=after,
+            ),
+            keep=lambda e: (
+                (allowed_ids is None or getattr(e, "calendar_fk_id", None) in allowed_ids)
+                and (
+                    matching_event_ids is None
+                    or e.id in matching_event_ids
+                    or e.recurrence_rule_fk_id in matching_recurrence_rule_ids
+                    or e.parent_recurring_object_fk_id in matching_event_ids
+                )
+            ),
+            first=first,
+            after=after_cursor,
+        )
 
         return cast(
             list[CalendarEventGraphQLType],
@@ -733,9 +821,18 @@ class Query:
         calendar_id: int,
         start_datetime: datetime.datetime,
         end_datetime: datetime.datetime,
-    ) -> list[AvailableTimeWindowGraphQLType]:
-        """Get availability windows for a calendar within a date range."""
+        if_changed_since: datetime.datetime | None = None,
+    ) -> list[AvailableTimeWindowGraphQLType] | None:
+        """Get availability windows for a calendar within a date range.
+
+        Resolves to ``null`` when ``ifChangedSince`` is given and the calendar has not
+        changed since then (see ``calendarEvents``).
+        """
         calendar_service, calendar = _prepare_service_and_calendar(info, calendar_id)
+        if if_changed_since is not None and calendars_unchanged_since(
+            calendar.organization_id, [calendar.id], if_changed_since
+        ):
+            return None
 
         # Get the availability windows
         availability_windows = calendar_service.get_availability_windows_in_range(
@@ -762,9 +859,18 @@ class Query:
         calendar_id: int,
         start_datetime: datetime.datetime,
         end_datetime: datetime.datetime,
-    ) -> list[UnavailableTimeWindowGraphQLType]:
-        """Get unavailable (blocked or event) windows for a calendar within a date range."""
+        if_changed_since: datetime.datetime | None = None,
+    ) -> list[UnavailableTimeWindowGraphQLType] | None:
+        """Get unavailable (blocked or event) windows for a calendar within a date range.
+
+        Resolves to ``null`` when ``ifChangedSince`` is given and the calendar has not
+        changed since then (see ``calendarEvents``).
+        """
         calendar_service, calendar = _prepare_service_and_calendar(info, calendar_id)
+        if if_changed_since is not None and calendars_unchanged_since(
+            calendar.organization_id, [calendar.id], if_changed_since
+        ):
+            return None
 
         unavailable_windows = calendar_service.get_unavailable_time_windows_in_range(
             calendar=calendar, start_datetime=start_datetime, end_datetime=end_datetime
@@ -4359,9 +4359,11 @@ class TestOwnerScopedTokenReadEnforcement:
             assert windows == [], "Cross-owner calendar must return empty windows"
         # If there are errors, they must be Calendar.DoesNotExist-shaped (not existence-leaking)
         # We simply verify the request did NOT succeed with data from the other owner's calendar.
+        # ``availabilityWindows`` is nullable (``ifChangedSince``), so the not-found error
+        # nulls the field itself rather than the whole ``data`` object.
         if response_data.get("data"):
             windows = response_data["data"].get("availabilityWindows", [])
-            assert windows == [], "Cross-owner calendar must return empty windows"
+            assert not windows, "Cross-owner calendar must return empty windows"
 
     def test_scoped_token_sees_own_availability_windows(
         self, mock_rate_limiter, organization, owner, owner_calendar
@@ -4471,7 +4473,7 @@ class TestOwnerScopedTokenReadEnforcement:
         response_data = response.json()
         if response_data.get("data"):
             windows = response_data["data"].get("unavailableWindows", [])
-            assert windows == [], "Cross-owner calendar must return empty unavailable windows"
+            assert not windows, "Cross-owner calendar must return empty unavailable windows"
 
     def test_scoped_token_sees_own_unavailable_windows(
         self, mock_rate_limiter, organization, owner, owner_calendar
@@ -52,4 +52,35 @@ CELERYBEAT_SCHEDULE = {
         "schedule": crontab(minute=30),
         "task": "payments.tasks.close_billing_periods",
     },
+    # Adaptive provider sync. Each tick only syncs the calendars whose own cadence
+    # (`Calendar.next_scheduled_sync_at`, derived from their observed change rate)
+    # has come due, capped per provider account and per run -- see
+    # `calendar_integration.sync_scheduling`. The tick is the floor of that
+    # cadence, not the cadence itself: a calendar that barely changes is synced
+    # every twelve hours however often this runs.
+    "schedule_calendar_syncs": {
+        "schedule": crontab(minute="*/5"),
+        "task": "calendar_integration.tasks.calendar_sync_tasks.schedule_calendar_syncs_task",
+    },
+    # Webhook subscription renewal. Renews, with the provider, every subscription
+    # expiring within a day (`calendar_integration.webhook_renewal`), one task per
+    # syncing account. Renewals ask for the longest life each provider grants --
+    # a week for Google, about three days for Microsoft -- so a subscription is only
+    # renewed every few days; hourly just leaves a day's worth of runs to catch it
+    # before it lapses.
+    "renew_webhook_subscriptions": {
+        "schedule": crontab(minute=20),
+        "task": "calendar_integration.tasks.calendar_sync_tasks.renew_webhook_subscriptions_task",
+    },
+    # Webhook event partitions. `CalendarWebhookEvent` is partitioned by day
+    # (`calendar_integration.webhook_event_partitions`); each run creates the
+    # partitions of the coming week that do not exist yet, so a day's partition
+    # exists a week before its first insert and a stopped beat has days to be
+    # noticed. Idempotent: a repeated run creates nothing.
+    "maintain_webhook_event_partitions": {
+        "schedule": crontab(hour=2, minute=40),
+        "task": (
+            "calendar_integration.tasks.calendar_sync_tasks.maintain_webhook_event_partitions_task"
+        ),
+    },
 }